@@ -133,6 +133,13 @@ async def _restore(database_url: str, input_path: Path, schema: str = "public")
                 typer.echo("  Refreshing materialized views...")
                 await conn.execute(f"REFRESH MATERIALIZED VIEW {_fq_table('memory_units_bm25', schema)}")
 
+                # Running servers drop their cached entities and graph edges for this schema once the restore commits
+                from ..engine.entity_cache import notify_entities_changed
+                from ..engine.search.edge_cache import notify_links_changed
+
+                await notify_entities_changed(conn, schema)
+                await notify_links_changed(conn, schema)
+
         return manifest
     finally:
         await conn.close()
@@ -0,0 +1,52 @@
+"""add_fact_type_hnsw_indexes
+
+Revision ID: m8h9i0j1k2l3
+Revises: l7g8h9i0j1k2
+Create Date: 2026-01-22 00:00:00.000000
+
+This migration adds partial HNSW indexes on memory_units.embedding, one per fact type.
+
+Recall ranks semantic candidates per fact type. With a partial index per fact type, an
+`ORDER BY embedding <=> $1 LIMIT k` probe for one fact type walks a graph that only contains
+that fact type, and the bank filter is applied during the (iterative) index scan.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "m8h9i0j1k2l3"
+down_revision: str | Sequence[str] | None = "l7g8h9i0j1k2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match ANN_INDEXED_FACT_TYPES in engine/search/retrieval.py
+FACT_TYPES = ("world", "experience", "observation")
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create one partial HNSW index per fact type."""
+    schema = _get_schema_prefix()
+
+    for fact_type in FACT_TYPES:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_memory_units_embedding_hnsw_{fact_type} "
+            f"ON {schema}memory_units USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = 16, ef_construction = 64) "
+            f"WHERE fact_type = '{fact_type}'"
+        )
+
+
+def downgrade() -> None:
+    """Drop the per-fact-type HNSW indexes."""
+    schema = _get_schema_prefix()
+
+    for fact_type in FACT_TYPES:
+        op.execute(f"DROP INDEX IF EXISTS {schema}idx_memory_units_embedding_hnsw_{fact_type}")
@@ -0,0 +1,46 @@
+"""add_entity_name_trigram_index
+
+Revision ID: n9i0j1k2l3m4
+Revises: m8h9i0j1k2l3
+Create Date: 2026-01-23 00:00:00.000000
+
+This migration enables pg_trgm and adds a trigram GIN index on LOWER(entities.canonical_name).
+
+Entity resolution looks up existing entities whose name contains a mention
+(`LOWER(canonical_name) LIKE '%mention%'`). The trigram index lets that lookup probe only
+matching names instead of scanning every entity in the bank.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "n9i0j1k2l3m4"
+down_revision: str | Sequence[str] | None = "m8h9i0j1k2l3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and create the entity name trigram index."""
+    schema = _get_schema_prefix()
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_entities_lower_name_trgm "
+        f"ON {schema}entities USING gin (LOWER(canonical_name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the entity name trigram index (the extension is left installed)."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_entities_lower_name_trgm")
@@ -0,0 +1,87 @@
+"""add_token_counts
+
+Revision ID: o0j1k2l3m4n5
+Revises: n9i0j1k2l3m4
+Create Date: 2026-01-24 00:00:00.000000
+
+This migration adds memory_units.text_tokens and chunks.chunk_tokens and backfills them.
+
+Recall packs facts and chunks into token budgets. Counting tokens once at retain time and
+storing the counts lets recall pack its budgets with integers instead of re-encoding every
+candidate's text with tiktoken on every request. Rows are backfilled in batches; recall
+still counts any row it finds without a stored count.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "o0j1k2l3m4n5"
+down_revision: str | Sequence[str] | None = "n9i0j1k2l3m4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Rows counted and updated per backfill round trip
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def _backfill(table: str, key_column: str, key_type: str, text_column: str, count_column: str) -> None:
+    """Fill count_column for every row of table, walking it in key order."""
+    import tiktoken
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    conn = op.get_bind()
+    last_key = None
+    while True:
+        rows = conn.execute(
+            sa.text(f"""
+            SELECT {key_column} AS key, {text_column} AS text
+            FROM {table}
+            WHERE {count_column} IS NULL
+              AND (CAST(:last_key AS {key_type}) IS NULL OR {key_column} > CAST(:last_key AS {key_type}))
+            ORDER BY {key_column}
+            LIMIT :batch_size
+        """),
+            {"last_key": last_key, "batch_size": BACKFILL_BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            return
+
+        counts = encoding.encode_ordinary_batch([row.text or "" for row in rows])
+        conn.execute(
+            sa.text(f"""
+            UPDATE {table} AS t
+            SET {count_column} = c.tokens
+            FROM unnest(CAST(:keys AS {key_type}[]), CAST(:tokens AS integer[])) AS c(key, tokens)
+            WHERE t.{key_column} = c.key
+        """),
+            {"keys": [str(row.key) for row in rows], "tokens": [len(tokens) for tokens in counts]},
+        )
+        last_key = str(rows[-1].key)
+
+
+def upgrade() -> None:
+    """Add token count columns and backfill them for existing rows."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}memory_units ADD COLUMN IF NOT EXISTS text_tokens INTEGER")
+    op.execute(f"ALTER TABLE {schema}chunks ADD COLUMN IF NOT EXISTS chunk_tokens INTEGER")
+
+    _backfill(f"{schema}memory_units", "id", "uuid", "text", "text_tokens")
+    _backfill(f"{schema}chunks", "chunk_id", "text", "chunk_text", "chunk_tokens")
+
+
+def downgrade() -> None:
+    """Drop the token count columns."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}chunks DROP COLUMN IF EXISTS chunk_tokens")
+    op.execute(f"ALTER TABLE {schema}memory_units DROP COLUMN IF EXISTS text_tokens")
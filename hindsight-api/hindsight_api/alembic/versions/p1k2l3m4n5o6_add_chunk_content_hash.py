@@ -0,0 +1,46 @@
+"""add_chunk_content_hash
+
+Revision ID: p1k2l3m4n5o6
+Revises: o0j1k2l3m4n5
+Create Date: 2026-01-25 00:00:00.000000
+
+This migration adds chunks.content_hash (SHA-256 of chunk_text) and backfills it.
+
+Incremental retain compares the hashes of a re-retained document's chunks with the stored
+ones, so only added or changed chunks go through fact extraction again.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "p1k2l3m4n5o6"
+down_revision: str | Sequence[str] | None = "o0j1k2l3m4n5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add and backfill the chunk content hash."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}chunks ADD COLUMN IF NOT EXISTS content_hash TEXT")
+    # Same digest as hashlib.sha256(chunk_text.encode()).hexdigest()
+    op.execute(
+        f"UPDATE {schema}chunks SET content_hash = encode(sha256(convert_to(chunk_text, 'UTF8')), 'hex') "
+        f"WHERE content_hash IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Drop the chunk content hash."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}chunks DROP COLUMN IF EXISTS content_hash")
@@ -0,0 +1,50 @@
+"""add_enrichment_pending
+
+Revision ID: q2l3m4n5o6p7
+Revises: p1k2l3m4n5o6
+Create Date: 2026-01-26 00:00:00.000000
+
+This migration adds memory_units.enrichment_pending.
+
+Retain commits facts and chunks before resolving entities and creating links, which run in
+short transactions of their own. The flag is set on insert and cleared once the unit's last
+enrichment stage commits, so units left behind by an interrupted retain can be found.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "q2l3m4n5o6p7"
+down_revision: str | Sequence[str] | None = "p1k2l3m4n5o6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add the enrichment_pending flag and a partial index over pending units."""
+    schema = _get_schema_prefix()
+
+    # Existing units were enriched in the same transaction that inserted them
+    op.execute(
+        f"ALTER TABLE {schema}memory_units ADD COLUMN IF NOT EXISTS enrichment_pending BOOLEAN NOT NULL DEFAULT FALSE"
+    )
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_memory_units_enrichment_pending "
+        f"ON {schema}memory_units (bank_id, document_id) WHERE enrichment_pending"
+    )
+
+
+def downgrade() -> None:
+    """Drop the enrichment_pending flag."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_memory_units_enrichment_pending")
+    op.execute(f"ALTER TABLE {schema}memory_units DROP COLUMN IF EXISTS enrichment_pending")
@@ -0,0 +1,44 @@
+"""add_async_operations_bank_claim_index
+
+Revision ID: r3m4n5o6p7q8
+Revises: q2l3m4n5o6p7
+Create Date: 2026-01-28 00:00:00.000000
+
+This migration adds a partial index over claimable tasks ordered by bank and creation time.
+
+Fair scheduling ranks pending tasks within their bank, and retain coalescing looks up a bank's
+next pending tasks; both read pending tasks in (bank_id, created_at) order.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "r3m4n5o6p7q8"
+down_revision: str | Sequence[str] | None = "q2l3m4n5o6p7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add the per-bank claim index."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_async_operations_pending_bank_claim "
+        f"ON {schema}async_operations (bank_id, created_at) WHERE status = 'pending' AND task_payload IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-bank claim index."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_async_operations_pending_bank_claim")
@@ -0,0 +1,55 @@
+"""add_async_operation_payloads
+
+Revision ID: s4n5o6p7q8r9
+Revises: r3m4n5o6p7q8
+Create Date: 2026-01-29 00:00:00.000000
+
+This migration adds the async_operation_payloads table (task payload store).
+
+Large task contents (retain items) are written once to this table, optionally compressed, and
+the async_operations row keeps only a reference. Claim scans and status updates then only
+touch small queue rows instead of detoasting multi-megabyte JSONB payloads.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "s4n5o6p7q8r9"
+down_revision: str | Sequence[str] | None = "r3m4n5o6p7q8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Create the task payload store."""
+    schema = _get_schema_prefix()
+
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {schema}async_operation_payloads (
+            operation_id UUID PRIMARY KEY
+                REFERENCES {schema}async_operations (operation_id) ON DELETE CASCADE,
+            encoding TEXT NOT NULL,
+            data BYTEA NOT NULL,
+            raw_bytes INTEGER NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+        """
+    )
+    # Payloads are compressed by the application: store them out of line without compressing again
+    op.execute(f"ALTER TABLE {schema}async_operation_payloads ALTER COLUMN data SET STORAGE EXTERNAL")
+
+
+def downgrade() -> None:
+    """Drop the task payload store."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP TABLE IF EXISTS {schema}async_operation_payloads")
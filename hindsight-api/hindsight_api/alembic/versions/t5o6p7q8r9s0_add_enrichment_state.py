@@ -0,0 +1,42 @@
+"""add_enrichment_state
+
+Revision ID: t5o6p7q8r9s0
+Revises: s4n5o6p7q8r9
+Create Date: 2026-02-02 00:00:00.000000
+
+This migration adds memory_units.enrichment_state.
+
+It holds what a pending unit needs to finish its enrichment (the retain that inserted it and
+its merged entity mentions), so units left enrichment_pending by a retain that died can be
+enriched again on startup. It is cleared together with enrichment_pending.
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "t5o6p7q8r9s0"
+down_revision: str | Sequence[str] | None = "s4n5o6p7q8r9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add the enrichment_state column."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}memory_units ADD COLUMN IF NOT EXISTS enrichment_state JSONB")
+
+
+def downgrade() -> None:
+    """Drop the enrichment_state column."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"ALTER TABLE {schema}memory_units DROP COLUMN IF EXISTS enrichment_state")
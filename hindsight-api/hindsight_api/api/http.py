@@ -304,6 +304,60 @@ class RecallResponse(BaseModel):
     chunks: dict[str, ChunkData] | None = Field(default=None, description="Chunks for facts, keyed by chunk_id")
 
 
+class BatchRecallRequest(BaseModel):
+    """Request model for batch recall endpoint."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "queries": ["What did Alice say about machine learning?", "Where does Bob work?"],
+                "types": ["world", "experience"],
+                "budget": "mid",
+                "max_tokens": 4096,
+                "include": {"entities": {"max_tokens": 500}},
+                "tags": ["user_a"],
+                "tags_match": "any",
+            }
+        }
+    )
+
+    queries: list[str] = Field(
+        min_length=1,
+        max_length=50,
+        description="Queries to recall for. All other options apply to every query.",
+    )
+    types: list[str] | None = Field(
+        default=None,
+        description="List of fact types to recall: 'world', 'experience'. Defaults to both if not specified. "
+        "Note: 'opinion' is accepted but ignored (opinions are excluded from recall).",
+    )
+    budget: Budget = Budget.MID
+    max_tokens: int = 4096
+    trace: bool = False
+    query_timestamp: str | None = Field(
+        default=None, description="ISO format date string (e.g., '2023-05-30T23:40:00')"
+    )
+    include: IncludeOptions = Field(
+        default_factory=IncludeOptions,
+        description="Options for including additional data (entities are included by default)",
+    )
+    tags: list[str] | None = Field(
+        default=None,
+        description="Filter memories by tags. If not specified, all memories are returned.",
+    )
+    tags_match: TagsMatch = Field(
+        default="any",
+        description="How to match tags: 'any' (OR, includes untagged), 'all' (AND, includes untagged), "
+        "'any_strict' (OR, excludes untagged), 'all_strict' (AND, excludes untagged).",
+    )
+
+
+class BatchRecallResponse(BaseModel):
+    """Response model for batch recall endpoint."""
+
+    results: list[RecallResponse] = Field(description="One recall response per query, in request order")
+
+
 class EntityInput(BaseModel):
     """Entity to associate with retained content."""
 
@@ -390,6 +444,13 @@ class RetainRequest(BaseModel):
         default=None,
         description="Tags applied to all items in this request. These are merged with any item-level tags.",
     )
+    update_mode: Literal["replace", "incremental"] = Field(
+        default="replace",
+        description="How items with the document_id of an existing document update it. 'replace' deletes the "
+        "document and its memories and processes the new content from scratch. 'incremental' skips documents "
+        "whose content is unchanged, extracts facts only from added or changed chunks, and deletes the memories "
+        "of removed chunks.",
+    )
 
 
 class RetainResponse(BaseModel):
@@ -1373,6 +1434,57 @@ class AsyncOperationSubmitResponse(BaseModel):
     status: str
 
 
+def _recall_response(core_result) -> RecallResponse:
+    """Convert an engine recall result to the HTTP API response."""
+    # Convert core MemoryFact objects to API RecallResult objects (excluding internal metrics)
+    recall_results = [
+        RecallResult(
+            id=fact.id,
+            text=fact.text,
+            type=fact.fact_type,
+            entities=fact.entities,
+            context=fact.context,
+            occurred_start=fact.occurred_start,
+            occurred_end=fact.occurred_end,
+            mentioned_at=fact.mentioned_at,
+            document_id=fact.document_id,
+            chunk_id=fact.chunk_id,
+            tags=fact.tags,
+        )
+        for fact in core_result.results
+    ]
+
+    # Convert chunks from engine to HTTP API format
+    chunks_response = None
+    if core_result.chunks:
+        chunks_response = {}
+        for chunk_id, chunk_info in core_result.chunks.items():
+            chunks_response[chunk_id] = ChunkData(
+                id=chunk_id,
+                text=chunk_info.chunk_text,
+                chunk_index=chunk_info.chunk_index,
+                truncated=chunk_info.truncated,
+            )
+
+    # Convert core EntityState objects to API EntityStateResponse objects
+    entities_response = None
+    if core_result.entities:
+        entities_response = {}
+        for name, state in core_result.entities.items():
+            entities_response[name] = EntityStateResponse(
+                entity_id=state.entity_id,
+                canonical_name=state.canonical_name,
+                observations=[
+                    EntityObservationResponse(text=obs.text, mentioned_at=obs.mentioned_at)
+                    for obs in state.observations
+                ],
+            )
+
+    return RecallResponse(
+        results=recall_results, trace=core_result.trace, entities=entities_response, chunks=chunks_response
+    )
+
+
 def create_app(
     memory: MemoryEngine,
     initialize_memory: bool = True,
@@ -1412,7 +1524,7 @@ def create_app(
         import socket
 
         from hindsight_api.config import get_config
-        from hindsight_api.worker import WorkerPoller
+        from hindsight_api.worker import WorkerPoller, parse_task_slots
 
         config = get_config()
         poller = None
@@ -1450,7 +1562,15 @@ def create_app(
                 poll_interval_ms=config.worker_poll_interval_ms,
                 batch_size=config.worker_batch_size,
                 max_retries=config.worker_max_retries,
+                task_slots=parse_task_slots(config.worker_task_slots),
+                listen=config.worker_notify_enabled,
+                fallback_poll_interval_ms=config.worker_fallback_poll_interval_ms,
+                fair_scheduling=config.worker_fair_scheduling,
+                retain_coalesce_chars=config.worker_retain_coalesce_chars,
             )
+            metrics_collector = get_metrics_collector()
+            if hasattr(metrics_collector, "set_worker_poller"):
+                metrics_collector.set_worker_poller(poller)
             poller_task = asyncio.create_task(poller.run())
             logging.info(f"Worker poller started (worker_id={worker_id})")
 
@@ -1816,53 +1936,8 @@ def _register_routes(app: FastAPI):
                     tags_match=request.tags_match,
                 )
 
-            # Convert core MemoryFact objects to API RecallResult objects (excluding internal metrics)
-            recall_results = [
-                RecallResult(
-                    id=fact.id,
-                    text=fact.text,
-                    type=fact.fact_type,
-                    entities=fact.entities,
-                    context=fact.context,
-                    occurred_start=fact.occurred_start,
-                    occurred_end=fact.occurred_end,
-                    mentioned_at=fact.mentioned_at,
-                    document_id=fact.document_id,
-                    chunk_id=fact.chunk_id,
-                    tags=fact.tags,
-                )
-                for fact in core_result.results
-            ]
-
-            # Convert chunks from engine to HTTP API format
-            chunks_response = None
-            if core_result.chunks:
-                chunks_response = {}
-                for chunk_id, chunk_info in core_result.chunks.items():
-                    chunks_response[chunk_id] = ChunkData(
-                        id=chunk_id,
-                        text=chunk_info.chunk_text,
-                        chunk_index=chunk_info.chunk_index,
-                        truncated=chunk_info.truncated,
-                    )
-
-            # Convert core EntityState objects to API EntityStateResponse objects
-            entities_response = None
-            if core_result.entities:
-                entities_response = {}
-                for name, state in core_result.entities.items():
-                    entities_response[name] = EntityStateResponse(
-                        entity_id=state.entity_id,
-                        canonical_name=state.canonical_name,
-                        observations=[
-                            EntityObservationResponse(text=obs.text, mentioned_at=obs.mentioned_at)
-                            for obs in state.observations
-                        ],
-                    )
-
-            response = RecallResponse(
-                results=recall_results, trace=core_result.trace, entities=entities_response, chunks=chunks_response
-            )
+            # Convert core result to API response (excluding internal metrics)
+            response = _recall_response(core_result)
 
             handler_duration = time.time() - handler_start
             recall_duration = time.time() - recall_start
@@ -1871,7 +1946,7 @@ def _register_routes(app: FastAPI):
                 logging.info(
                     f"[RECALL HTTP] bank={bank_id} handler_total={handler_duration:.3f}s "
                     f"pre={pre_recall:.3f}s recall={recall_duration:.3f}s post={post_recall:.3f}s "
-                    f"results={len(recall_results)} entities={len(entities_response) if entities_response else 0}"
+                    f"results={len(response.results)} entities={len(response.entities) if response.entities else 0}"
                 )
 
             return response
@@ -1891,6 +1966,90 @@ def _register_routes(app: FastAPI):
             )
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.post(
+        "/v1/default/banks/{bank_id}/memories/recall/batch",
+        response_model=BatchRecallResponse,
+        summary="Recall memory for several queries",
+        description="Run several recalls against the same bank in one request.\n\n"
+        "Each query returns the same results as `recall`, but the queries share retrieval work: "
+        "they are embedded together, their semantic and keyword searches run in one database round-trip, "
+        "graph traversal reuses loaded edges, and reranking scores all queries in one model call.",
+        operation_id="recall_memories_batch",
+        tags=["Memory"],
+    )
+    async def api_recall_batch(
+        bank_id: str, request: BatchRecallRequest, request_context: RequestContext = Depends(get_request_context)
+    ):
+        """Run a batch of recalls and return one response per query."""
+        import time
+
+        handler_start = time.time()
+        metrics = get_metrics_collector()
+
+        try:
+            # Default to world and experience if not specified (exclude observation and opinion)
+            fact_types = request.types if request.types else list(VALID_RECALL_FACT_TYPES)
+            fact_types = [ft for ft in fact_types if ft != "opinion"]
+
+            # Parse query_timestamp if provided
+            question_date = None
+            if request.query_timestamp:
+                try:
+                    question_date = datetime.fromisoformat(request.query_timestamp.replace("Z", "+00:00"))
+                except ValueError as e:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid query_timestamp format. Expected ISO format (e.g., '2023-05-30T23:40:00'): {str(e)}",
+                    )
+
+            include_entities = request.include.entities is not None
+            max_entity_tokens = request.include.entities.max_tokens if include_entities else 500
+            include_chunks = request.include.chunks is not None
+            max_chunk_tokens = request.include.chunks.max_tokens if include_chunks else 8192
+
+            with metrics.record_operation(
+                "recall", bank_id=bank_id, source="api", budget=request.budget.value, max_tokens=request.max_tokens
+            ):
+                core_results = await app.state.memory.recall_batch_async(
+                    bank_id=bank_id,
+                    queries=request.queries,
+                    budget=request.budget,
+                    max_tokens=request.max_tokens,
+                    enable_trace=request.trace,
+                    fact_type=fact_types,
+                    question_date=question_date,
+                    include_entities=include_entities,
+                    max_entity_tokens=max_entity_tokens,
+                    include_chunks=include_chunks,
+                    max_chunk_tokens=max_chunk_tokens,
+                    request_context=request_context,
+                    tags=request.tags,
+                    tags_match=request.tags_match,
+                )
+
+            handler_duration = time.time() - handler_start
+            if handler_duration > 1.0:
+                logging.info(
+                    f"[RECALL HTTP] bank={bank_id} batch={len(request.queries)} handler_total={handler_duration:.3f}s"
+                )
+
+            return BatchRecallResponse(results=[_recall_response(core_result) for core_result in core_results])
+        except HTTPException:
+            raise
+        except OperationValidationError as e:
+            raise HTTPException(status_code=e.status_code, detail=e.reason)
+        except (AuthenticationError, HTTPException):
+            raise
+        except Exception as e:
+            import traceback
+
+            handler_duration = time.time() - handler_start
+            error_detail = f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}"
+            logger.error(
+                f"[RECALL ERROR] bank={bank_id} handler_duration={handler_duration:.3f}s error={str(e)}\n{error_detail}"
+            )
+            raise HTTPException(status_code=500, detail=str(e))
+
     @app.post(
         "/v1/default/banks/{bank_id}/reflect",
         response_model=ReflectResponse,
@@ -3236,7 +3395,8 @@ def _register_routes(app: FastAPI):
         "5. Tracks document metadata\n\n"
         "**When `async=true`:** Returns immediately after queuing. Use the operations endpoint to monitor progress.\n\n"
         "**When `async=false` (default):** Waits for processing to complete.\n\n"
-        "**Note:** If a memory item has a `document_id` that already exists, the old document and its memory units will be deleted before creating new ones (upsert behavior).",
+        "**Note:** If a memory item has a `document_id` that already exists, the old document and its memory units will be deleted before creating new ones (upsert behavior). "
+        "With `update_mode=incremental`, unchanged documents are skipped and only added or changed chunks are re-processed.",
         operation_id="retain_memories",
         tags=["Memory"],
     )
@@ -3268,7 +3428,11 @@ def _register_routes(app: FastAPI):
             if request.async_:
                 # Async processing: queue task and return immediately
                 result = await app.state.memory.submit_async_retain(
-                    bank_id, contents, document_tags=request.document_tags, request_context=request_context
+                    bank_id,
+                    contents,
+                    document_tags=request.document_tags,
+                    update_mode=request.update_mode,
+                    request_context=request_context,
                 )
                 return RetainResponse.model_validate(
                     {
@@ -3286,6 +3450,7 @@ def _register_routes(app: FastAPI):
                         bank_id=bank_id,
                         contents=contents,
                         document_tags=request.document_tags,
+                        update_mode=request.update_mode,
                         request_context=request_context,
                         return_usage=True,
                     )
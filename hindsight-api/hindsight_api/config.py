@@ -25,6 +25,10 @@ ENV_LLM_API_KEY = "HINDSIGHT_API_LLM_API_KEY"
 ENV_LLM_MODEL = "HINDSIGHT_API_LLM_MODEL"
 ENV_LLM_BASE_URL = "HINDSIGHT_API_LLM_BASE_URL"
 ENV_LLM_MAX_CONCURRENT = "HINDSIGHT_API_LLM_MAX_CONCURRENT"
+ENV_LLM_TOKENS_PER_MINUTE = "HINDSIGHT_API_LLM_TOKENS_PER_MINUTE"
+ENV_LLM_PROVIDER_LIMITS = "HINDSIGHT_API_LLM_PROVIDER_LIMITS"
+ENV_LLM_QUEUE_TIMEOUTS = "HINDSIGHT_API_LLM_QUEUE_TIMEOUTS"
+ENV_LLM_PRIORITY_AGING_SECONDS = "HINDSIGHT_API_LLM_PRIORITY_AGING_SECONDS"
 ENV_LLM_TIMEOUT = "HINDSIGHT_API_LLM_TIMEOUT"
 ENV_LLM_GROQ_SERVICE_TIER = "HINDSIGHT_API_LLM_GROQ_SERVICE_TIER"
 
@@ -41,10 +45,18 @@ ENV_REFLECT_LLM_BASE_URL = "HINDSIGHT_API_REFLECT_LLM_BASE_URL"
 
 ENV_EMBEDDINGS_PROVIDER = "HINDSIGHT_API_EMBEDDINGS_PROVIDER"
 ENV_EMBEDDINGS_LOCAL_MODEL = "HINDSIGHT_API_EMBEDDINGS_LOCAL_MODEL"
+ENV_EMBEDDINGS_LOCAL_BACKEND = "HINDSIGHT_API_EMBEDDINGS_LOCAL_BACKEND"
 ENV_EMBEDDINGS_TEI_URL = "HINDSIGHT_API_EMBEDDINGS_TEI_URL"
 ENV_EMBEDDINGS_OPENAI_API_KEY = "HINDSIGHT_API_EMBEDDINGS_OPENAI_API_KEY"
 ENV_EMBEDDINGS_OPENAI_MODEL = "HINDSIGHT_API_EMBEDDINGS_OPENAI_MODEL"
 ENV_EMBEDDINGS_OPENAI_BASE_URL = "HINDSIGHT_API_EMBEDDINGS_OPENAI_BASE_URL"
+ENV_EMBEDDINGS_QUERY_BATCH_WINDOW_MS = "HINDSIGHT_API_EMBEDDINGS_QUERY_BATCH_WINDOW_MS"
+ENV_EMBEDDINGS_QUERY_BATCH_SIZE = "HINDSIGHT_API_EMBEDDINGS_QUERY_BATCH_SIZE"
+ENV_EMBEDDINGS_BATCH_SIZE = "HINDSIGHT_API_EMBEDDINGS_BATCH_SIZE"
+ENV_EMBEDDINGS_WORKERS = "HINDSIGHT_API_EMBEDDINGS_WORKERS"
+ENV_EMBEDDINGS_QUERY_CACHE_SIZE = "HINDSIGHT_API_EMBEDDINGS_QUERY_CACHE_SIZE"
+ENV_EMBEDDINGS_QUERY_CACHE_TTL = "HINDSIGHT_API_EMBEDDINGS_QUERY_CACHE_TTL"
+ENV_EMBEDDINGS_QUERY_CACHE_URL = "HINDSIGHT_API_EMBEDDINGS_QUERY_CACHE_URL"
 
 ENV_COHERE_API_KEY = "HINDSIGHT_API_COHERE_API_KEY"
 ENV_EMBEDDINGS_COHERE_MODEL = "HINDSIGHT_API_EMBEDDINGS_COHERE_MODEL"
@@ -61,12 +73,19 @@ ENV_RERANKER_LITELLM_MODEL = "HINDSIGHT_API_RERANKER_LITELLM_MODEL"
 ENV_RERANKER_PROVIDER = "HINDSIGHT_API_RERANKER_PROVIDER"
 ENV_RERANKER_LOCAL_MODEL = "HINDSIGHT_API_RERANKER_LOCAL_MODEL"
 ENV_RERANKER_LOCAL_MAX_CONCURRENT = "HINDSIGHT_API_RERANKER_LOCAL_MAX_CONCURRENT"
+ENV_RERANKER_LOCAL_BACKEND = "HINDSIGHT_API_RERANKER_LOCAL_BACKEND"
+ENV_LOCAL_ONNX_CACHE_DIR = "HINDSIGHT_API_LOCAL_ONNX_CACHE_DIR"
+ENV_LOCAL_ONNX_THREADS = "HINDSIGHT_API_LOCAL_ONNX_THREADS"
+ENV_INFERENCE_SOCKET = "HINDSIGHT_API_INFERENCE_SOCKET"
 ENV_RERANKER_TEI_URL = "HINDSIGHT_API_RERANKER_TEI_URL"
 ENV_RERANKER_TEI_BATCH_SIZE = "HINDSIGHT_API_RERANKER_TEI_BATCH_SIZE"
 ENV_RERANKER_TEI_MAX_CONCURRENT = "HINDSIGHT_API_RERANKER_TEI_MAX_CONCURRENT"
 ENV_RERANKER_MAX_CANDIDATES = "HINDSIGHT_API_RERANKER_MAX_CANDIDATES"
 ENV_RERANKER_FLASHRANK_MODEL = "HINDSIGHT_API_RERANKER_FLASHRANK_MODEL"
 ENV_RERANKER_FLASHRANK_CACHE_DIR = "HINDSIGHT_API_RERANKER_FLASHRANK_CACHE_DIR"
+ENV_RERANKER_CACHE_SIZE = "HINDSIGHT_API_RERANKER_CACHE_SIZE"
+ENV_RERANKER_CACHE_TTL = "HINDSIGHT_API_RERANKER_CACHE_TTL"
+ENV_RERANKER_CACHE_URL = "HINDSIGHT_API_RERANKER_CACHE_URL"
 
 ENV_HOST = "HINDSIGHT_API_HOST"
 ENV_PORT = "HINDSIGHT_API_PORT"
@@ -76,8 +95,14 @@ ENV_WORKERS = "HINDSIGHT_API_WORKERS"
 ENV_MCP_ENABLED = "HINDSIGHT_API_MCP_ENABLED"
 ENV_GRAPH_RETRIEVER = "HINDSIGHT_API_GRAPH_RETRIEVER"
 ENV_MPFP_TOP_K_NEIGHBORS = "HINDSIGHT_API_MPFP_TOP_K_NEIGHBORS"
+ENV_MPFP_EDGE_CACHE_MAX_EDGES = "HINDSIGHT_API_MPFP_EDGE_CACHE_MAX_EDGES"
 ENV_RECALL_MAX_CONCURRENT = "HINDSIGHT_API_RECALL_MAX_CONCURRENT"
 ENV_RECALL_CONNECTION_BUDGET = "HINDSIGHT_API_RECALL_CONNECTION_BUDGET"
+ENV_RECALL_ANN_ENABLED = "HINDSIGHT_API_RECALL_ANN_ENABLED"
+ENV_RECALL_ANN_MIN_BANK_SIZE = "HINDSIGHT_API_RECALL_ANN_MIN_BANK_SIZE"
+ENV_RECALL_ADAPTIVE = "HINDSIGHT_API_RECALL_ADAPTIVE"
+ENV_RECALL_ADAPTIVE_MIN_OVERLAP = "HINDSIGHT_API_RECALL_ADAPTIVE_MIN_OVERLAP"
+ENV_RECALL_ADAPTIVE_MIN_SCORE_GAP = "HINDSIGHT_API_RECALL_ADAPTIVE_MIN_SCORE_GAP"
 ENV_MCP_LOCAL_BANK_ID = "HINDSIGHT_API_MCP_LOCAL_BANK_ID"
 ENV_MCP_INSTRUCTIONS = "HINDSIGHT_API_MCP_INSTRUCTIONS"
 ENV_MENTAL_MODEL_REFRESH_CONCURRENCY = "HINDSIGHT_API_MENTAL_MODEL_REFRESH_CONCURRENCY"
@@ -92,6 +117,10 @@ ENV_RETAIN_CHUNK_SIZE = "HINDSIGHT_API_RETAIN_CHUNK_SIZE"
 ENV_RETAIN_EXTRACT_CAUSAL_LINKS = "HINDSIGHT_API_RETAIN_EXTRACT_CAUSAL_LINKS"
 ENV_RETAIN_EXTRACTION_MODE = "HINDSIGHT_API_RETAIN_EXTRACTION_MODE"
 ENV_RETAIN_OBSERVATIONS_ASYNC = "HINDSIGHT_API_RETAIN_OBSERVATIONS_ASYNC"
+ENV_RETAIN_DEDUP_MODE = "HINDSIGHT_API_RETAIN_DEDUP_MODE"
+ENV_RETAIN_ENTITY_CACHE_MAX_ENTRIES = "HINDSIGHT_API_RETAIN_ENTITY_CACHE_MAX_ENTRIES"
+ENV_RETAIN_PIPELINE = "HINDSIGHT_API_RETAIN_PIPELINE"
+ENV_RETAIN_PIPELINE_QUEUE_SIZE = "HINDSIGHT_API_RETAIN_PIPELINE_QUEUE_SIZE"
 
 # Optimization flags
 ENV_SKIP_LLM_VERIFICATION = "HINDSIGHT_API_SKIP_LLM_VERIFICATION"
@@ -110,9 +139,16 @@ ENV_DB_ACQUIRE_TIMEOUT = "HINDSIGHT_API_DB_ACQUIRE_TIMEOUT"
 ENV_WORKER_ENABLED = "HINDSIGHT_API_WORKER_ENABLED"
 ENV_WORKER_ID = "HINDSIGHT_API_WORKER_ID"
 ENV_WORKER_POLL_INTERVAL_MS = "HINDSIGHT_API_WORKER_POLL_INTERVAL_MS"
+ENV_WORKER_NOTIFY_ENABLED = "HINDSIGHT_API_WORKER_NOTIFY_ENABLED"
+ENV_WORKER_FALLBACK_POLL_INTERVAL_MS = "HINDSIGHT_API_WORKER_FALLBACK_POLL_INTERVAL_MS"
 ENV_WORKER_MAX_RETRIES = "HINDSIGHT_API_WORKER_MAX_RETRIES"
 ENV_WORKER_BATCH_SIZE = "HINDSIGHT_API_WORKER_BATCH_SIZE"
+ENV_WORKER_TASK_SLOTS = "HINDSIGHT_API_WORKER_TASK_SLOTS"
+ENV_WORKER_FAIR_SCHEDULING = "HINDSIGHT_API_WORKER_FAIR_SCHEDULING"
+ENV_WORKER_RETAIN_COALESCE_CHARS = "HINDSIGHT_API_WORKER_RETAIN_COALESCE_CHARS"
 ENV_WORKER_HTTP_PORT = "HINDSIGHT_API_WORKER_HTTP_PORT"
+ENV_TASK_PAYLOAD_INLINE_MAX_BYTES = "HINDSIGHT_API_TASK_PAYLOAD_INLINE_MAX_BYTES"
+ENV_TASK_PAYLOAD_COMPRESSION = "HINDSIGHT_API_TASK_PAYLOAD_COMPRESSION"
 
 # Reflect agent settings
 ENV_REFLECT_MAX_ITERATIONS = "HINDSIGHT_API_REFLECT_MAX_ITERATIONS"
@@ -122,21 +158,41 @@ DEFAULT_DATABASE_URL = "pg0"
 DEFAULT_LLM_PROVIDER = "openai"
 DEFAULT_LLM_MODEL = "gpt-5-mini"
 DEFAULT_LLM_MAX_CONCURRENT = 32
+DEFAULT_LLM_TOKENS_PER_MINUTE = 0  # Estimated prompt tokens per minute per provider (0 = unlimited)
+DEFAULT_LLM_PROVIDER_LIMITS = ""  # provider=concurrency[:tokens_per_minute],...
+DEFAULT_LLM_QUEUE_TIMEOUTS = ""  # priority_class=seconds,... (no timeout by default)
+DEFAULT_LLM_PRIORITY_AGING_SECONDS = 30.0  # Queued LLM requests move up one priority class after this long
 DEFAULT_LLM_TIMEOUT = 120.0  # seconds
 
 DEFAULT_EMBEDDINGS_PROVIDER = "local"
 DEFAULT_EMBEDDINGS_LOCAL_MODEL = "BAAI/bge-small-en-v1.5"
+DEFAULT_EMBEDDINGS_LOCAL_BACKEND = "torch"  # torch, onnx or onnx-int8
 DEFAULT_EMBEDDINGS_OPENAI_MODEL = "text-embedding-3-small"
 DEFAULT_EMBEDDING_DIMENSION = 384
+DEFAULT_EMBEDDINGS_QUERY_BATCH_WINDOW_MS = 2  # Time window for coalescing concurrent query embeddings
+DEFAULT_EMBEDDINGS_QUERY_BATCH_SIZE = 32  # Max queries per batched encode() call
+DEFAULT_EMBEDDINGS_BATCH_SIZE = 64  # Max retain texts per scheduled encode() call
+DEFAULT_EMBEDDINGS_WORKERS = 1  # Concurrent encode() calls for the in-process (local) model
+DEFAULT_EMBEDDINGS_REMOTE_WORKERS = 8  # Concurrent encode() calls (HTTP requests) for the other providers
+DEFAULT_EMBEDDINGS_QUERY_CACHE_SIZE = 10000  # Max cached query embeddings per process (0 disables)
+DEFAULT_EMBEDDINGS_QUERY_CACHE_TTL = 3600  # Seconds a cached query embedding stays valid
+DEFAULT_EMBEDDINGS_QUERY_CACHE_URL = None  # Optional Redis URL for a cache shared across replicas
 
 DEFAULT_RERANKER_PROVIDER = "local"
 DEFAULT_RERANKER_LOCAL_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 DEFAULT_RERANKER_LOCAL_MAX_CONCURRENT = 4  # Limit concurrent CPU-bound reranking to prevent thrashing
+DEFAULT_RERANKER_LOCAL_BACKEND = "torch"  # torch, onnx or onnx-int8
+DEFAULT_LOCAL_ONNX_CACHE_DIR = None  # Use ~/.cache/hindsight/onnx
+DEFAULT_LOCAL_ONNX_THREADS = 0  # ONNX Runtime intra-op threads per model (0 = ONNX Runtime default)
+DEFAULT_INFERENCE_SOCKET = "/tmp/hindsight-inference.sock"  # Unix socket of the local inference sidecar
 DEFAULT_RERANKER_TEI_BATCH_SIZE = 128
 DEFAULT_RERANKER_TEI_MAX_CONCURRENT = 8
 DEFAULT_RERANKER_MAX_CANDIDATES = 300
 DEFAULT_RERANKER_FLASHRANK_MODEL = "ms-marco-MiniLM-L-12-v2"  # Best balance of speed and quality
 DEFAULT_RERANKER_FLASHRANK_CACHE_DIR = None  # Use default cache directory
+DEFAULT_RERANKER_CACHE_SIZE = 100000  # Max cached (query, document) cross-encoder scores per process (0 disables)
+DEFAULT_RERANKER_CACHE_TTL = 3600  # Seconds a cached cross-encoder score stays valid
+DEFAULT_RERANKER_CACHE_URL = None  # Optional Redis URL for a score cache shared across replicas
 
 DEFAULT_EMBEDDINGS_COHERE_MODEL = "embed-english-v3.0"
 DEFAULT_RERANKER_COHERE_MODEL = "rerank-english-v3.0"
@@ -154,8 +210,14 @@ DEFAULT_WORKERS = 1
 DEFAULT_MCP_ENABLED = True
 DEFAULT_GRAPH_RETRIEVER = "link_expansion"  # Options: "link_expansion", "mpfp", "bfs"
 DEFAULT_MPFP_TOP_K_NEIGHBORS = 20  # Fan-out limit per node in MPFP graph traversal
+DEFAULT_MPFP_EDGE_CACHE_MAX_EDGES = 200000  # Edges kept in the shared MPFP adjacency cache (0 = disabled)
 DEFAULT_RECALL_MAX_CONCURRENT = 32  # Max concurrent recall operations per worker
 DEFAULT_RECALL_CONNECTION_BUDGET = 4  # Max concurrent DB connections per recall operation
+DEFAULT_RECALL_ANN_ENABLED = True  # Use HNSW index-ordered probes for semantic recall on large banks
+DEFAULT_RECALL_ANN_MIN_BANK_SIZE = 20000  # Banks smaller than this use exact (sequential) semantic search
+DEFAULT_RECALL_ADAPTIVE = False  # Skip or shrink graph/temporal retrieval when semantic + BM25 already agree
+DEFAULT_RECALL_ADAPTIVE_MIN_OVERLAP = 0.5  # Fraction of the semantic top-k also in the BM25 top-k that counts as stable
+DEFAULT_RECALL_ADAPTIVE_MIN_SCORE_GAP = 0.1  # Similarity margin between fused top-k and the rest that counts as stable
 DEFAULT_MCP_LOCAL_BANK_ID = "mcp"
 DEFAULT_MENTAL_MODEL_REFRESH_CONCURRENCY = 8  # Max concurrent mental model refreshes
 
@@ -169,6 +231,11 @@ DEFAULT_RETAIN_CHUNK_SIZE = 3000  # Max chars per chunk for fact extraction
 DEFAULT_RETAIN_EXTRACT_CAUSAL_LINKS = True  # Extract causal links between facts
 DEFAULT_RETAIN_EXTRACTION_MODE = "concise"  # Extraction mode: "concise" or "verbose"
 RETAIN_EXTRACTION_MODES = ("concise", "verbose")  # Allowed extraction modes
+DEFAULT_RETAIN_DEDUP_MODE = "index"  # Duplicate detection: "index" (nearest neighbour in SQL) or "exact"
+RETAIN_DEDUP_MODES = ("index", "exact")  # Allowed dedup modes
+DEFAULT_RETAIN_ENTITY_CACHE_MAX_ENTRIES = 100000  # Entity resolution cache size per process (0 disables)
+DEFAULT_RETAIN_PIPELINE = False  # Stream extracted facts to embedding and storage per chunk
+DEFAULT_RETAIN_PIPELINE_QUEUE_SIZE = 4  # Batches buffered between pipelined retain stages
 DEFAULT_RETAIN_OBSERVATIONS_ASYNC = False  # Run observation generation async (after retain completes)
 
 # Database migrations
@@ -184,9 +251,17 @@ DEFAULT_DB_ACQUIRE_TIMEOUT = 30  # seconds
 DEFAULT_WORKER_ENABLED = True  # API runs worker by default (standalone mode)
 DEFAULT_WORKER_ID = None  # Will use hostname if not specified
 DEFAULT_WORKER_POLL_INTERVAL_MS = 500  # Poll database every 500ms
+DEFAULT_WORKER_NOTIFY_ENABLED = True  # Wake workers with LISTEN/NOTIFY on task submit
+DEFAULT_WORKER_FALLBACK_POLL_INTERVAL_MS = 10000  # Poll interval while LISTEN is active (missed notifications)
 DEFAULT_WORKER_MAX_RETRIES = 3  # Max retries before marking task failed
-DEFAULT_WORKER_BATCH_SIZE = 10  # Tasks to claim per poll cycle
+DEFAULT_WORKER_BATCH_SIZE = 10  # Tasks in flight in the shared slot pool
+DEFAULT_WORKER_TASK_SLOTS = "refresh_mental_models=2,refresh_mental_model=2"  # Dedicated slot pools per task type
+DEFAULT_WORKER_FAIR_SCHEDULING = True  # Claim tasks round-robin across banks
+DEFAULT_WORKER_RETAIN_COALESCE_CHARS = 100_000  # Merge a bank's queued retains up to this many chars (0 = off)
 DEFAULT_WORKER_HTTP_PORT = 8889  # HTTP port for worker metrics/health
+DEFAULT_TASK_PAYLOAD_INLINE_MAX_BYTES = 8192  # Larger task contents go to the payload store
+DEFAULT_TASK_PAYLOAD_COMPRESSION = "zlib"  # none, zlib or zstd (needs the zstandard package)
+TASK_PAYLOAD_COMPRESSIONS = ("none", "zlib", "zstd")  # Allowed payload store encodings
 
 # Reflect agent settings
 DEFAULT_REFLECT_MAX_ITERATIONS = 10  # Max tool call iterations before forcing response
@@ -257,6 +332,35 @@ def _validate_extraction_mode(mode: str) -> str:
     return mode_lower
 
 
+def _validate_dedup_mode(mode: str) -> str:
+    """Validate and normalize duplicate detection mode."""
+    mode_lower = mode.lower()
+    if mode_lower not in RETAIN_DEDUP_MODES:
+        logger.warning(
+            f"Invalid dedup mode '{mode}', must be one of {RETAIN_DEDUP_MODES}. "
+            f"Defaulting to '{DEFAULT_RETAIN_DEDUP_MODE}'."
+        )
+        return DEFAULT_RETAIN_DEDUP_MODE
+    return mode_lower
+
+
+def _validate_payload_compression(compression: str) -> str:
+    """Validate and normalize task payload compression."""
+    compression_lower = compression.lower()
+    if compression_lower not in TASK_PAYLOAD_COMPRESSIONS:
+        logger.warning(
+            f"Invalid task payload compression '{compression}', must be one of {TASK_PAYLOAD_COMPRESSIONS}. "
+            f"Defaulting to '{DEFAULT_TASK_PAYLOAD_COMPRESSION}'."
+        )
+        return DEFAULT_TASK_PAYLOAD_COMPRESSION
+    return compression_lower
+
+
+def _default_embeddings_workers(provider: str) -> int:
+    """The local model computes one batch at a time; remote providers overlap their HTTP requests."""
+    return DEFAULT_EMBEDDINGS_WORKERS if provider.lower() == "local" else DEFAULT_EMBEDDINGS_REMOTE_WORKERS
+
+
 @dataclass
 class HindsightConfig:
     """Configuration container for Hindsight API."""
@@ -270,6 +374,10 @@ class HindsightConfig:
     llm_model: str
     llm_base_url: str | None
     llm_max_concurrent: int
+    llm_tokens_per_minute: int
+    llm_provider_limits: str
+    llm_queue_timeouts: str
+    llm_priority_aging_seconds: float
     llm_timeout: float
 
     # Per-operation LLM configuration (None = use default LLM config)
@@ -289,6 +397,13 @@ class HindsightConfig:
     embeddings_tei_url: str | None
     embeddings_openai_base_url: str | None
     embeddings_cohere_base_url: str | None
+    embeddings_query_batch_window_ms: int
+    embeddings_query_batch_size: int
+    embeddings_batch_size: int
+    embeddings_workers: int
+    embeddings_query_cache_size: int
+    embeddings_query_cache_ttl: int
+    embeddings_query_cache_url: str | None
 
     # Reranker
     reranker_provider: str
@@ -298,6 +413,9 @@ class HindsightConfig:
     reranker_tei_max_concurrent: int
     reranker_max_candidates: int
     reranker_cohere_base_url: str | None
+    reranker_cache_size: int
+    reranker_cache_ttl: int
+    reranker_cache_url: str | None
 
     # Server
     host: str
@@ -309,8 +427,14 @@ class HindsightConfig:
     # Recall
     graph_retriever: str
     mpfp_top_k_neighbors: int
+    mpfp_edge_cache_max_edges: int
     recall_max_concurrent: int
     recall_connection_budget: int
+    recall_ann_enabled: bool
+    recall_ann_min_bank_size: int
+    recall_adaptive: bool
+    recall_adaptive_min_overlap: float
+    recall_adaptive_min_score_gap: float
     mental_model_refresh_concurrency: int
 
     # Observation thresholds
@@ -323,6 +447,10 @@ class HindsightConfig:
     retain_extract_causal_links: bool
     retain_extraction_mode: str
     retain_observations_async: bool
+    retain_dedup_mode: str
+    retain_entity_cache_max_entries: int
+    retain_pipeline: bool
+    retain_pipeline_queue_size: int
 
     # Optimization flags
     skip_llm_verification: bool
@@ -341,9 +469,16 @@ class HindsightConfig:
     worker_enabled: bool
     worker_id: str | None
     worker_poll_interval_ms: int
+    worker_notify_enabled: bool
+    worker_fallback_poll_interval_ms: int
     worker_max_retries: int
     worker_batch_size: int
+    worker_task_slots: str
+    worker_fair_scheduling: bool
+    worker_retain_coalesce_chars: int
     worker_http_port: int
+    task_payload_inline_max_bytes: int
+    task_payload_compression: str
 
     # Reflect agent settings
     reflect_max_iterations: int
@@ -360,6 +495,12 @@ class HindsightConfig:
             llm_model=os.getenv(ENV_LLM_MODEL, DEFAULT_LLM_MODEL),
             llm_base_url=os.getenv(ENV_LLM_BASE_URL) or None,
             llm_max_concurrent=int(os.getenv(ENV_LLM_MAX_CONCURRENT, str(DEFAULT_LLM_MAX_CONCURRENT))),
+            llm_tokens_per_minute=int(os.getenv(ENV_LLM_TOKENS_PER_MINUTE, str(DEFAULT_LLM_TOKENS_PER_MINUTE))),
+            llm_provider_limits=os.getenv(ENV_LLM_PROVIDER_LIMITS, DEFAULT_LLM_PROVIDER_LIMITS),
+            llm_queue_timeouts=os.getenv(ENV_LLM_QUEUE_TIMEOUTS, DEFAULT_LLM_QUEUE_TIMEOUTS),
+            llm_priority_aging_seconds=float(
+                os.getenv(ENV_LLM_PRIORITY_AGING_SECONDS, str(DEFAULT_LLM_PRIORITY_AGING_SECONDS))
+            ),
             llm_timeout=float(os.getenv(ENV_LLM_TIMEOUT, str(DEFAULT_LLM_TIMEOUT))),
             # Per-operation LLM config (None = use default)
             retain_llm_provider=os.getenv(ENV_RETAIN_LLM_PROVIDER) or None,
@@ -376,6 +517,24 @@ class HindsightConfig:
             embeddings_tei_url=os.getenv(ENV_EMBEDDINGS_TEI_URL),
             embeddings_openai_base_url=os.getenv(ENV_EMBEDDINGS_OPENAI_BASE_URL) or None,
             embeddings_cohere_base_url=os.getenv(ENV_EMBEDDINGS_COHERE_BASE_URL) or None,
+            embeddings_query_batch_window_ms=int(
+                os.getenv(ENV_EMBEDDINGS_QUERY_BATCH_WINDOW_MS, str(DEFAULT_EMBEDDINGS_QUERY_BATCH_WINDOW_MS))
+            ),
+            embeddings_query_batch_size=int(
+                os.getenv(ENV_EMBEDDINGS_QUERY_BATCH_SIZE, str(DEFAULT_EMBEDDINGS_QUERY_BATCH_SIZE))
+            ),
+            embeddings_batch_size=int(os.getenv(ENV_EMBEDDINGS_BATCH_SIZE, str(DEFAULT_EMBEDDINGS_BATCH_SIZE))),
+            embeddings_workers=int(
+                os.getenv(ENV_EMBEDDINGS_WORKERS)
+                or _default_embeddings_workers(os.getenv(ENV_EMBEDDINGS_PROVIDER, DEFAULT_EMBEDDINGS_PROVIDER))
+            ),
+            embeddings_query_cache_size=int(
+                os.getenv(ENV_EMBEDDINGS_QUERY_CACHE_SIZE, str(DEFAULT_EMBEDDINGS_QUERY_CACHE_SIZE))
+            ),
+            embeddings_query_cache_ttl=int(
+                os.getenv(ENV_EMBEDDINGS_QUERY_CACHE_TTL, str(DEFAULT_EMBEDDINGS_QUERY_CACHE_TTL))
+            ),
+            embeddings_query_cache_url=os.getenv(ENV_EMBEDDINGS_QUERY_CACHE_URL) or None,
             # Reranker
             reranker_provider=os.getenv(ENV_RERANKER_PROVIDER, DEFAULT_RERANKER_PROVIDER),
             reranker_local_model=os.getenv(ENV_RERANKER_LOCAL_MODEL, DEFAULT_RERANKER_LOCAL_MODEL),
@@ -386,6 +545,9 @@ class HindsightConfig:
             ),
             reranker_max_candidates=int(os.getenv(ENV_RERANKER_MAX_CANDIDATES, str(DEFAULT_RERANKER_MAX_CANDIDATES))),
             reranker_cohere_base_url=os.getenv(ENV_RERANKER_COHERE_BASE_URL) or None,
+            reranker_cache_size=int(os.getenv(ENV_RERANKER_CACHE_SIZE, str(DEFAULT_RERANKER_CACHE_SIZE))),
+            reranker_cache_ttl=int(os.getenv(ENV_RERANKER_CACHE_TTL, str(DEFAULT_RERANKER_CACHE_TTL))),
+            reranker_cache_url=os.getenv(ENV_RERANKER_CACHE_URL) or None,
             # Server
             host=os.getenv(ENV_HOST, DEFAULT_HOST),
             port=int(os.getenv(ENV_PORT, DEFAULT_PORT)),
@@ -395,10 +557,24 @@ class HindsightConfig:
             # Recall
             graph_retriever=os.getenv(ENV_GRAPH_RETRIEVER, DEFAULT_GRAPH_RETRIEVER),
             mpfp_top_k_neighbors=int(os.getenv(ENV_MPFP_TOP_K_NEIGHBORS, str(DEFAULT_MPFP_TOP_K_NEIGHBORS))),
+            mpfp_edge_cache_max_edges=int(
+                os.getenv(ENV_MPFP_EDGE_CACHE_MAX_EDGES, str(DEFAULT_MPFP_EDGE_CACHE_MAX_EDGES))
+            ),
             recall_max_concurrent=int(os.getenv(ENV_RECALL_MAX_CONCURRENT, str(DEFAULT_RECALL_MAX_CONCURRENT))),
             recall_connection_budget=int(
                 os.getenv(ENV_RECALL_CONNECTION_BUDGET, str(DEFAULT_RECALL_CONNECTION_BUDGET))
             ),
+            recall_ann_enabled=os.getenv(ENV_RECALL_ANN_ENABLED, str(DEFAULT_RECALL_ANN_ENABLED)).lower() == "true",
+            recall_ann_min_bank_size=int(
+                os.getenv(ENV_RECALL_ANN_MIN_BANK_SIZE, str(DEFAULT_RECALL_ANN_MIN_BANK_SIZE))
+            ),
+            recall_adaptive=os.getenv(ENV_RECALL_ADAPTIVE, str(DEFAULT_RECALL_ADAPTIVE)).lower() == "true",
+            recall_adaptive_min_overlap=float(
+                os.getenv(ENV_RECALL_ADAPTIVE_MIN_OVERLAP, str(DEFAULT_RECALL_ADAPTIVE_MIN_OVERLAP))
+            ),
+            recall_adaptive_min_score_gap=float(
+                os.getenv(ENV_RECALL_ADAPTIVE_MIN_SCORE_GAP, str(DEFAULT_RECALL_ADAPTIVE_MIN_SCORE_GAP))
+            ),
             mental_model_refresh_concurrency=int(
                 os.getenv(ENV_MENTAL_MODEL_REFRESH_CONCURRENCY, str(DEFAULT_MENTAL_MODEL_REFRESH_CONCURRENCY))
             ),
@@ -426,6 +602,14 @@ class HindsightConfig:
                 ENV_RETAIN_OBSERVATIONS_ASYNC, str(DEFAULT_RETAIN_OBSERVATIONS_ASYNC)
             ).lower()
             == "true",
+            retain_dedup_mode=_validate_dedup_mode(os.getenv(ENV_RETAIN_DEDUP_MODE, DEFAULT_RETAIN_DEDUP_MODE)),
+            retain_entity_cache_max_entries=int(
+                os.getenv(ENV_RETAIN_ENTITY_CACHE_MAX_ENTRIES, str(DEFAULT_RETAIN_ENTITY_CACHE_MAX_ENTRIES))
+            ),
+            retain_pipeline=os.getenv(ENV_RETAIN_PIPELINE, str(DEFAULT_RETAIN_PIPELINE)).lower() == "true",
+            retain_pipeline_queue_size=int(
+                os.getenv(ENV_RETAIN_PIPELINE_QUEUE_SIZE, str(DEFAULT_RETAIN_PIPELINE_QUEUE_SIZE))
+            ),
             # Database migrations
             run_migrations_on_startup=os.getenv(ENV_RUN_MIGRATIONS_ON_STARTUP, "true").lower() == "true",
             # Database connection pool
@@ -437,9 +621,26 @@ class HindsightConfig:
             worker_enabled=os.getenv(ENV_WORKER_ENABLED, str(DEFAULT_WORKER_ENABLED)).lower() == "true",
             worker_id=os.getenv(ENV_WORKER_ID) or DEFAULT_WORKER_ID,
             worker_poll_interval_ms=int(os.getenv(ENV_WORKER_POLL_INTERVAL_MS, str(DEFAULT_WORKER_POLL_INTERVAL_MS))),
+            worker_notify_enabled=os.getenv(ENV_WORKER_NOTIFY_ENABLED, str(DEFAULT_WORKER_NOTIFY_ENABLED)).lower()
+            == "true",
+            worker_fallback_poll_interval_ms=int(
+                os.getenv(ENV_WORKER_FALLBACK_POLL_INTERVAL_MS, str(DEFAULT_WORKER_FALLBACK_POLL_INTERVAL_MS))
+            ),
             worker_max_retries=int(os.getenv(ENV_WORKER_MAX_RETRIES, str(DEFAULT_WORKER_MAX_RETRIES))),
             worker_batch_size=int(os.getenv(ENV_WORKER_BATCH_SIZE, str(DEFAULT_WORKER_BATCH_SIZE))),
+            worker_task_slots=os.getenv(ENV_WORKER_TASK_SLOTS, DEFAULT_WORKER_TASK_SLOTS),
+            worker_fair_scheduling=os.getenv(ENV_WORKER_FAIR_SCHEDULING, str(DEFAULT_WORKER_FAIR_SCHEDULING)).lower()
+            == "true",
+            worker_retain_coalesce_chars=int(
+                os.getenv(ENV_WORKER_RETAIN_COALESCE_CHARS, str(DEFAULT_WORKER_RETAIN_COALESCE_CHARS))
+            ),
             worker_http_port=int(os.getenv(ENV_WORKER_HTTP_PORT, str(DEFAULT_WORKER_HTTP_PORT))),
+            task_payload_inline_max_bytes=int(
+                os.getenv(ENV_TASK_PAYLOAD_INLINE_MAX_BYTES, str(DEFAULT_TASK_PAYLOAD_INLINE_MAX_BYTES))
+            ),
+            task_payload_compression=_validate_payload_compression(
+                os.getenv(ENV_TASK_PAYLOAD_COMPRESSION, DEFAULT_TASK_PAYLOAD_COMPRESSION)
+            ),
             # Reflect agent settings
             reflect_max_iterations=int(os.getenv(ENV_REFLECT_MAX_ITERATIONS, str(DEFAULT_REFLECT_MAX_ITERATIONS))),
         )
@@ -7,6 +7,7 @@ Configuration via environment variables - see hindsight_api.config for all env v
 """
 
 import asyncio
+import hashlib
 import logging
 import os
 from abc import ABC, abstractmethod
@@ -15,24 +16,32 @@ from concurrent.futures import ThreadPoolExecutor
 import httpx
 
 from ..config import (
+    DEFAULT_INFERENCE_SOCKET,
     DEFAULT_LITELLM_API_BASE,
+    DEFAULT_LOCAL_ONNX_CACHE_DIR,
+    DEFAULT_LOCAL_ONNX_THREADS,
     DEFAULT_RERANKER_COHERE_MODEL,
     DEFAULT_RERANKER_FLASHRANK_CACHE_DIR,
     DEFAULT_RERANKER_FLASHRANK_MODEL,
     DEFAULT_RERANKER_LITELLM_MODEL,
+    DEFAULT_RERANKER_LOCAL_BACKEND,
     DEFAULT_RERANKER_LOCAL_MAX_CONCURRENT,
     DEFAULT_RERANKER_LOCAL_MODEL,
     DEFAULT_RERANKER_PROVIDER,
     DEFAULT_RERANKER_TEI_BATCH_SIZE,
     DEFAULT_RERANKER_TEI_MAX_CONCURRENT,
     ENV_COHERE_API_KEY,
+    ENV_INFERENCE_SOCKET,
     ENV_LITELLM_API_BASE,
     ENV_LITELLM_API_KEY,
+    ENV_LOCAL_ONNX_CACHE_DIR,
+    ENV_LOCAL_ONNX_THREADS,
     ENV_RERANKER_COHERE_BASE_URL,
     ENV_RERANKER_COHERE_MODEL,
     ENV_RERANKER_FLASHRANK_CACHE_DIR,
     ENV_RERANKER_FLASHRANK_MODEL,
     ENV_RERANKER_LITELLM_MODEL,
+    ENV_RERANKER_LOCAL_BACKEND,
     ENV_RERANKER_LOCAL_MAX_CONCURRENT,
     ENV_RERANKER_LOCAL_MODEL,
     ENV_RERANKER_PROVIDER,
@@ -40,6 +49,8 @@ from ..config import (
     ENV_RERANKER_TEI_MAX_CONCURRENT,
     ENV_RERANKER_TEI_URL,
 )
+from .local_onnx import default_cache_dir, load_onnx_model, validate_backend
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -92,14 +103,23 @@ class LocalSTCrossEncoder(CrossEncoderModel):
     - Small model (80MB)
     - Trained for passage re-ranking
 
-    Uses a dedicated thread pool to limit concurrent CPU-bound work.
+    Uses a dedicated thread pool to limit concurrent CPU-bound work. With backend "onnx" or
+    "onnx-int8" the model runs through ONNX Runtime instead of PyTorch (see local_onnx.py),
+    which is considerably faster on CPU-only nodes.
     """
 
     # Shared executor across all instances (one model loaded anyway)
     _executor: ThreadPoolExecutor | None = None
     _max_concurrent: int = 4  # Limit concurrent CPU-bound reranking calls
 
-    def __init__(self, model_name: str | None = None, max_concurrent: int = 4):
+    def __init__(
+        self,
+        model_name: str | None = None,
+        max_concurrent: int = 4,
+        backend: str = "torch",
+        onnx_cache_dir: str | None = None,
+        onnx_threads: int = 0,
+    ):
         """
         Initialize local SentenceTransformers cross-encoder.
 
@@ -108,8 +128,14 @@ class LocalSTCrossEncoder(CrossEncoderModel):
                        Default: cross-encoder/ms-marco-MiniLM-L-6-v2
             max_concurrent: Maximum concurrent reranking calls (default: 2).
                            Higher values may cause CPU thrashing under load.
+            backend: Inference backend: "torch", "onnx" or "onnx-int8"
+            onnx_cache_dir: Directory for exported ONNX artifacts (default: ~/.cache/hindsight/onnx)
+            onnx_threads: ONNX Runtime intra-op threads per call (0 = ONNX Runtime default)
         """
         self.model_name = model_name or DEFAULT_RERANKER_LOCAL_MODEL
+        self.backend = validate_backend(backend)
+        self.onnx_cache_dir = onnx_cache_dir or default_cache_dir()
+        self.onnx_threads = onnx_threads
         self._model = None
         LocalSTCrossEncoder._max_concurrent = max_concurrent
 
@@ -130,39 +156,46 @@ class LocalSTCrossEncoder(CrossEncoderModel):
                 "Install it with: pip install sentence-transformers"
             )
 
-        logger.info(f"Reranker: initializing local provider with model {self.model_name}")
-
-        # Determine device and device_map based on hardware and installed packages.
-        # When accelerate is installed but no GPU/MPS is available, transformers can
-        # incorrectly use lazy loading (meta tensors) which fails on .to(device).
-        # We use device_map="cpu" in that case to force direct CPU loading.
-        import torch
-
-        try:
-            import accelerate  # type: ignore[import-not-found]  # noqa: F401
-
-            accelerate_available = True
-        except ImportError:
-            accelerate_available = False
-
-        # Check for GPU (CUDA) or Apple Silicon (MPS)
-        has_gpu = torch.cuda.is_available() or (hasattr(torch.backends, "mps") and torch.backends.mps.is_available())
+        logger.info(f"Reranker: initializing local provider with model {self.model_name} ({self.backend})")
 
-        if has_gpu:
-            device = None  # Let sentence-transformers auto-detect GPU/MPS
-            device_map = None
-        elif accelerate_available:
-            device = "cpu"
-            device_map = "cpu"  # Force direct CPU loading to avoid meta tensors
+        if self.backend != "torch":
+            self._model = load_onnx_model(
+                CrossEncoder, self.model_name, self.backend, self.onnx_cache_dir, self.onnx_threads
+            )
         else:
-            device = "cpu"
-            device_map = None
+            # Determine device and device_map based on hardware and installed packages.
+            # When accelerate is installed but no GPU/MPS is available, transformers can
+            # incorrectly use lazy loading (meta tensors) which fails on .to(device).
+            # We use device_map="cpu" in that case to force direct CPU loading.
+            import torch
+
+            try:
+                import accelerate  # type: ignore[import-not-found]  # noqa: F401
+
+                accelerate_available = True
+            except ImportError:
+                accelerate_available = False
+
+            # Check for GPU (CUDA) or Apple Silicon (MPS)
+            has_gpu = torch.cuda.is_available() or (
+                hasattr(torch.backends, "mps") and torch.backends.mps.is_available()
+            )
 
-        self._model = CrossEncoder(
-            self.model_name,
-            device=device,
-            model_kwargs={"low_cpu_mem_usage": False, "device_map": device_map},
-        )
+            if has_gpu:
+                device = None  # Let sentence-transformers auto-detect GPU/MPS
+                device_map = None
+            elif accelerate_available:
+                device = "cpu"
+                device_map = "cpu"  # Force direct CPU loading to avoid meta tensors
+            else:
+                device = "cpu"
+                device_map = None
+
+            self._model = CrossEncoder(
+                self.model_name,
+                device=device,
+                model_kwargs={"low_cpu_mem_usage": False, "device_map": device_map},
+            )
 
         # Initialize shared executor (limited workers naturally limits concurrency)
         if LocalSTCrossEncoder._executor is None:
@@ -191,10 +224,13 @@ class LocalSTCrossEncoder(CrossEncoderModel):
 
         # Use dedicated executor - limited workers naturally limits concurrency
         loop = asyncio.get_event_loop()
-        scores = await loop.run_in_executor(
-            LocalSTCrossEncoder._executor,
-            lambda: self._model.predict(pairs, show_progress_bar=False),
-        )
+        return await loop.run_in_executor(LocalSTCrossEncoder._executor, self.score, pairs)
+
+    def score(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Score query-document pairs synchronously, in the calling thread (raw logits)."""
+        if self._model is None:
+            raise RuntimeError("Reranker not initialized. Call initialize() first.")
+        scores = self._model.predict(pairs, show_progress_bar=False)
         return scores.tolist() if hasattr(scores, "tolist") else list(scores)
 
 
@@ -223,6 +259,7 @@ class RemoteTEICrossEncoder(CrossEncoderModel):
         max_concurrent: int = DEFAULT_RERANKER_TEI_MAX_CONCURRENT,
         max_retries: int = 3,
         retry_delay: float = 0.5,
+        socket_path: str | None = None,
     ):
         """
         Initialize remote TEI cross-encoder client.
@@ -235,8 +272,10 @@ class RemoteTEICrossEncoder(CrossEncoderModel):
                            This is a GLOBAL limit across all parallel recall operations.
             max_retries: Maximum number of retries for failed requests (default: 3)
             retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            socket_path: Connect over this Unix socket instead of TCP (the local inference sidecar)
         """
         self.base_url = base_url.rstrip("/")
+        self.socket_path = socket_path
         self.timeout = timeout
         self.batch_size = batch_size
         self.max_concurrent = max_concurrent
@@ -308,10 +347,11 @@ class RemoteTEICrossEncoder(CrossEncoderModel):
             return
 
         logger.info(
-            f"Reranker: initializing TEI provider at {self.base_url} "
+            f"Reranker: initializing TEI provider at {self.socket_path or self.base_url} "
             f"(batch_size={self.batch_size}, max_concurrent={self.max_concurrent})"
         )
-        self._async_client = httpx.AsyncClient(timeout=self.timeout)
+        transport = httpx.AsyncHTTPTransport(uds=self.socket_path) if self.socket_path else None
+        self._async_client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
 
         # Verify server is reachable and get model info
         # Use a temporary semaphore for initialization
@@ -792,6 +832,118 @@ class LiteLLMCrossEncoder(CrossEncoderModel):
         return all_scores
 
 
+class CachedCrossEncoder(CrossEncoderModel):
+    """
+    Caching wrapper around any CrossEncoderModel implementation.
+
+    Scores are keyed by (provider, model, normalized query, document text) and kept in a
+    ResultCache: an in-process LRU with a TTL, optionally backed by Redis to share scores
+    across API replicas. Agent loops and reflect iterations rerank largely the same
+    candidates for the same query, so most pairs after the first call never reach the model.
+    """
+
+    def __init__(
+        self,
+        inner: CrossEncoderModel,
+        max_entries: int = 100000,
+        ttl_seconds: int = 3600,
+        shared_url: str | None = None,
+    ):
+        """
+        Initialize the score cache.
+
+        Args:
+            inner: CrossEncoderModel implementation to delegate cache misses to
+            max_entries: Maximum number of scores kept in process
+            ttl_seconds: Seconds before a cached score expires (0 = never)
+            shared_url: Optional Redis URL for a cache shared across processes
+        """
+        self.inner = inner
+        self.cache: ResultCache[float] = ResultCache(
+            "reranker_score",
+            serialize=lambda score: repr(float(score)),
+            deserialize=float,
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            shared_url=shared_url,
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    async def initialize(self) -> None:
+        await self.inner.initialize()
+
+    def _model_id(self) -> str:
+        for attr in ("model_name", "model", "_model_id", "base_url"):
+            value = getattr(self.inner, attr, None)
+            if isinstance(value, str) and value:
+                return value
+        return type(self.inner).__name__
+
+    def cache_key(self, query: str, document: str) -> str:
+        """Build the cache key for a pair (provider, model, whitespace-normalized query and document, hashed)."""
+        normalized_query = " ".join(query.split())
+        raw = f"{self.provider_name}\x00{self._model_id()}\x00{normalized_query}\x00{document}"
+        return "hindsight:rerank:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_cached(self, query: str, document: str) -> float | None:
+        """Return the in-process cached score for a pair, or None. Never calls the model."""
+        return self.cache.get(self.cache_key(query, document))
+
+    async def predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """
+        Score query-document pairs, serving repeated pairs from the cache.
+
+        Args:
+            pairs: List of (query, document) tuples to score
+
+        Returns:
+            List of relevance scores (higher = more relevant)
+        """
+        keys = [self.cache_key(query, document) for query, document in pairs]
+        found = self.cache.get_many(keys)
+        hits = len(found)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self.cache.shared_url:
+            shared = await asyncio.to_thread(self.cache.get_shared_many, missing)
+            found.update(shared)
+            hits += len(shared)
+            missing = [key for key in missing if key not in shared]
+        if missing:
+            pair_by_key = dict(zip(keys, pairs))
+            computed = dict(zip(missing, await self.inner.predict([pair_by_key[key] for key in missing])))
+            if self.cache.shared_url:
+                await asyncio.to_thread(self.cache.put_many, computed)
+            else:
+                self.cache.put_many(computed)
+            found.update(computed)
+
+        self.cache.record(hits=hits, misses=len(missing))
+        return [found[key] for key in keys]
+
+
+def create_cross_encoder_cache(cross_encoder: CrossEncoderModel) -> CrossEncoderModel:
+    """
+    Wrap a CrossEncoderModel instance with the score cache, if enabled in config.
+
+    Returns the instance unchanged when HINDSIGHT_API_RERANKER_CACHE_SIZE is 0, and for the
+    RRF passthrough, which has no model to save calls to.
+    """
+    from ..config import get_config
+
+    config = get_config()
+    if config.reranker_cache_size <= 0 or isinstance(cross_encoder, (CachedCrossEncoder, RRFPassthroughCrossEncoder)):
+        return cross_encoder
+    return CachedCrossEncoder(
+        cross_encoder,
+        max_entries=config.reranker_cache_size,
+        ttl_seconds=config.reranker_cache_ttl,
+        shared_url=config.reranker_cache_url,
+    )
+
+
 def create_cross_encoder_from_env() -> CrossEncoderModel:
     """
     Create a CrossEncoderModel instance based on environment variables.
@@ -811,12 +963,18 @@ def create_cross_encoder_from_env() -> CrossEncoderModel:
         max_concurrent = int(os.environ.get(ENV_RERANKER_TEI_MAX_CONCURRENT, str(DEFAULT_RERANKER_TEI_MAX_CONCURRENT)))
         return RemoteTEICrossEncoder(base_url=url, batch_size=batch_size, max_concurrent=max_concurrent)
     elif provider == "local":
-        model = os.environ.get(ENV_RERANKER_LOCAL_MODEL)
-        model_name = model or DEFAULT_RERANKER_LOCAL_MODEL
-        max_concurrent = int(
-            os.environ.get(ENV_RERANKER_LOCAL_MAX_CONCURRENT, str(DEFAULT_RERANKER_LOCAL_MAX_CONCURRENT))
+        return create_local_cross_encoder_from_env()
+    elif provider == "sidecar":
+        # The sidecar speaks the TEI API; the host name is ignored over a Unix socket
+        socket_path = os.environ.get(ENV_INFERENCE_SOCKET, DEFAULT_INFERENCE_SOCKET)
+        batch_size = int(os.environ.get(ENV_RERANKER_TEI_BATCH_SIZE, str(DEFAULT_RERANKER_TEI_BATCH_SIZE)))
+        max_concurrent = int(os.environ.get(ENV_RERANKER_TEI_MAX_CONCURRENT, str(DEFAULT_RERANKER_TEI_MAX_CONCURRENT)))
+        return RemoteTEICrossEncoder(
+            base_url="http://localhost/reranker",
+            batch_size=batch_size,
+            max_concurrent=max_concurrent,
+            socket_path=socket_path,
         )
-        return LocalSTCrossEncoder(model_name=model_name, max_concurrent=max_concurrent)
     elif provider == "cohere":
         api_key = os.environ.get(ENV_COHERE_API_KEY)
         if not api_key:
@@ -837,5 +995,25 @@ def create_cross_encoder_from_env() -> CrossEncoderModel:
         return RRFPassthroughCrossEncoder()
     else:
         raise ValueError(
-            f"Unknown reranker provider: {provider}. Supported: 'local', 'tei', 'cohere', 'flashrank', 'litellm', 'rrf'"
+            f"Unknown reranker provider: {provider}. "
+            "Supported: 'local', 'tei', 'sidecar', 'cohere', 'flashrank', 'litellm', 'rrf'"
         )
+
+
+def create_local_cross_encoder_from_env() -> LocalSTCrossEncoder:
+    """
+    Create the local SentenceTransformers cross-encoder configured in the environment.
+
+    Used by the "local" provider and by the inference sidecar, which hosts the local model
+    for the processes configured with the "sidecar" provider.
+    """
+    model = os.environ.get(ENV_RERANKER_LOCAL_MODEL)
+    model_name = model or DEFAULT_RERANKER_LOCAL_MODEL
+    max_concurrent = int(os.environ.get(ENV_RERANKER_LOCAL_MAX_CONCURRENT, str(DEFAULT_RERANKER_LOCAL_MAX_CONCURRENT)))
+    return LocalSTCrossEncoder(
+        model_name=model_name,
+        max_concurrent=max_concurrent,
+        backend=os.environ.get(ENV_RERANKER_LOCAL_BACKEND, DEFAULT_RERANKER_LOCAL_BACKEND),
+        onnx_cache_dir=os.environ.get(ENV_LOCAL_ONNX_CACHE_DIR, DEFAULT_LOCAL_ONNX_CACHE_DIR),
+        onnx_threads=int(os.environ.get(ENV_LOCAL_ONNX_THREADS, str(DEFAULT_LOCAL_ONNX_THREADS))),
+    )
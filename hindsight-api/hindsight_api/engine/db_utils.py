@@ -103,3 +103,28 @@ async def acquire_with_retry(pool: asyncpg.Pool, max_retries: int = DEFAULT_MAX_
         yield conn
     finally:
         await pool.release(conn)
+
+
+# Cached per process: whether the installed pgvector supports hnsw.iterative_scan (>= 0.8.0)
+_pgvector_iterative_scan: bool | None = None
+
+
+async def supports_hnsw_iterative_scan(conn) -> bool:
+    """
+    Check (once per process) whether pgvector supports iterative HNSW index scans.
+
+    Iterative scans keep walking the index until LIMIT rows survive the WHERE clause,
+    so filtered `ORDER BY embedding <=> $1 LIMIT k` queries return k rows. Older
+    pgvector versions stop after hnsw.ef_search candidates.
+    """
+    global _pgvector_iterative_scan
+    if _pgvector_iterative_scan is None:
+        version = await conn.fetchval("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        try:
+            parts = tuple(int(p) for p in (version or "0").split(".")[:2])
+        except ValueError:
+            parts = (0, 0)
+        _pgvector_iterative_scan = parts >= (0, 8)
+        if not _pgvector_iterative_scan:
+            logger.info(f"pgvector {version} does not support iterative HNSW scans; filtered ANN queries may be short")
+    return _pgvector_iterative_scan
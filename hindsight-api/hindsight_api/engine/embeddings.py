@@ -9,33 +9,46 @@ The database schema is automatically adjusted to match the model's dimension.
 Configuration via environment variables - see hindsight_api.config for all env var names.
 """
 
+import hashlib
 import logging
 import os
+import time
 from abc import ABC, abstractmethod
+from array import array
 
 import httpx
 
 from ..config import (
     DEFAULT_EMBEDDINGS_COHERE_MODEL,
     DEFAULT_EMBEDDINGS_LITELLM_MODEL,
+    DEFAULT_EMBEDDINGS_LOCAL_BACKEND,
     DEFAULT_EMBEDDINGS_LOCAL_MODEL,
     DEFAULT_EMBEDDINGS_OPENAI_MODEL,
     DEFAULT_EMBEDDINGS_PROVIDER,
+    DEFAULT_INFERENCE_SOCKET,
     DEFAULT_LITELLM_API_BASE,
+    DEFAULT_LOCAL_ONNX_CACHE_DIR,
+    DEFAULT_LOCAL_ONNX_THREADS,
     ENV_COHERE_API_KEY,
     ENV_EMBEDDINGS_COHERE_BASE_URL,
     ENV_EMBEDDINGS_COHERE_MODEL,
     ENV_EMBEDDINGS_LITELLM_MODEL,
+    ENV_EMBEDDINGS_LOCAL_BACKEND,
     ENV_EMBEDDINGS_LOCAL_MODEL,
     ENV_EMBEDDINGS_OPENAI_API_KEY,
     ENV_EMBEDDINGS_OPENAI_BASE_URL,
     ENV_EMBEDDINGS_OPENAI_MODEL,
     ENV_EMBEDDINGS_PROVIDER,
     ENV_EMBEDDINGS_TEI_URL,
+    ENV_INFERENCE_SOCKET,
     ENV_LITELLM_API_BASE,
     ENV_LITELLM_API_KEY,
     ENV_LLM_API_KEY,
+    ENV_LOCAL_ONNX_CACHE_DIR,
+    ENV_LOCAL_ONNX_THREADS,
 )
+from .local_onnx import default_cache_dir, load_onnx_model, validate_backend
+from .result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -90,17 +103,32 @@ class LocalSTEmbeddings(Embeddings):
 
     Call initialize() during startup to load the model and avoid cold starts.
     The embedding dimension is auto-detected from the model.
+
+    With backend "onnx" or "onnx-int8" the model runs through ONNX Runtime instead of
+    PyTorch (see local_onnx.py).
     """
 
-    def __init__(self, model_name: str | None = None):
+    def __init__(
+        self,
+        model_name: str | None = None,
+        backend: str = "torch",
+        onnx_cache_dir: str | None = None,
+        onnx_threads: int = 0,
+    ):
         """
         Initialize local SentenceTransformers embeddings.
 
         Args:
             model_name: Name of the SentenceTransformer model to use.
                        Default: BAAI/bge-small-en-v1.5
+            backend: Inference backend: "torch", "onnx" or "onnx-int8"
+            onnx_cache_dir: Directory for exported ONNX artifacts (default: ~/.cache/hindsight/onnx)
+            onnx_threads: ONNX Runtime intra-op threads (0 = ONNX Runtime default)
         """
         self.model_name = model_name or DEFAULT_EMBEDDINGS_LOCAL_MODEL
+        self.backend = validate_backend(backend)
+        self.onnx_cache_dir = onnx_cache_dir or default_cache_dir()
+        self.onnx_threads = onnx_threads
         self._model = None
         self._dimension: int | None = None
 
@@ -127,7 +155,15 @@ class LocalSTEmbeddings(Embeddings):
                 "Install it with: pip install sentence-transformers"
             )
 
-        logger.info(f"Embeddings: initializing local provider with model {self.model_name}")
+        logger.info(f"Embeddings: initializing local provider with model {self.model_name} ({self.backend})")
+
+        if self.backend != "torch":
+            self._model = load_onnx_model(
+                SentenceTransformer, self.model_name, self.backend, self.onnx_cache_dir, self.onnx_threads
+            )
+            self._dimension = self._model.get_sentence_embedding_dimension()
+            logger.info(f"Embeddings: local provider initialized (dim: {self._dimension})")
+            return
 
         # Determine device and device_map based on hardware and installed packages.
         # When accelerate is installed but no GPU/MPS is available, transformers can
@@ -197,6 +233,7 @@ class RemoteTEIEmbeddings(Embeddings):
         batch_size: int = 32,
         max_retries: int = 3,
         retry_delay: float = 0.5,
+        socket_path: str | None = None,
     ):
         """
         Initialize remote TEI embeddings client.
@@ -207,8 +244,10 @@ class RemoteTEIEmbeddings(Embeddings):
             batch_size: Maximum batch size for embedding requests (default: 32)
             max_retries: Maximum number of retries for failed requests (default: 3)
             retry_delay: Initial delay between retries in seconds, doubles each retry (default: 0.5)
+            socket_path: Connect over this Unix socket instead of TCP (the local inference sidecar)
         """
         self.base_url = base_url.rstrip("/")
+        self.socket_path = socket_path
         self.timeout = timeout
         self.batch_size = batch_size
         self.max_retries = max_retries
@@ -269,8 +308,9 @@ class RemoteTEIEmbeddings(Embeddings):
         if self._client is not None:
             return
 
-        logger.info(f"Embeddings: initializing TEI provider at {self.base_url}")
-        self._client = httpx.Client(timeout=self.timeout)
+        logger.info(f"Embeddings: initializing TEI provider at {self.socket_path or self.base_url}")
+        transport = httpx.HTTPTransport(uds=self.socket_path) if self.socket_path else None
+        self._client = httpx.Client(timeout=self.timeout, transport=transport)
 
         # Verify server is reachable and get model info
         try:
@@ -697,6 +737,120 @@ class LiteLLMEmbeddings(Embeddings):
         return all_embeddings
 
 
+class CachedEmbeddings(Embeddings):
+    """
+    Caching wrapper around any Embeddings implementation.
+
+    Vectors are keyed by (provider, model, text) and kept in a ResultCache: an in-process LRU
+    with a TTL, optionally backed by Redis so several API replicas reuse each other's vectors.
+    Intended for recall queries, which repeat often (agent loops, reflect iterations), not for
+    retain content, which is mostly unique.
+    """
+
+    def __init__(
+        self,
+        inner: Embeddings,
+        max_entries: int = 10000,
+        ttl_seconds: int = 3600,
+        shared_url: str | None = None,
+    ):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            inner: Embeddings implementation to delegate cache misses to
+            max_entries: Maximum number of vectors kept in process
+            ttl_seconds: Seconds before a cached vector expires (0 = never)
+            shared_url: Optional Redis URL for a cache shared across processes
+        """
+        self.inner = inner
+        self.cache: ResultCache[list[float]] = ResultCache(
+            "query_embedding",
+            serialize=lambda vector: array("f", vector).tobytes(),
+            deserialize=lambda raw: array("f", raw).tolist(),
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            shared_url=shared_url,
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return self.inner.provider_name
+
+    @property
+    def dimension(self) -> int:
+        return self.inner.dimension
+
+    async def initialize(self) -> None:
+        await self.inner.initialize()
+
+    def _model_id(self) -> str:
+        for attr in ("model_name", "model", "_model_id", "base_url"):
+            value = getattr(self.inner, attr, None)
+            if isinstance(value, str) and value:
+                return value
+        return type(self.inner).__name__
+
+    def cache_key(self, text: str) -> str:
+        """Build the cache key for a text (provider, model and text, hashed)."""
+        raw = f"{self.provider_name}\x00{self._model_id()}\x00{text}"
+        return "hindsight:emb:" + hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_cached(self, text: str) -> list[float] | None:
+        """Return the in-process cached vector for a text, or None. Never calls the model."""
+        vector = self.cache.get(self.cache_key(text))
+        if vector is not None:
+            self.cache.record(hits=1)
+        return vector
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings, serving repeated texts from the cache.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            List of embedding vectors
+        """
+        keys = [self.cache_key(text) for text in texts]
+        found = self.cache.get_many(keys)
+        hits = len(found)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            shared = self.cache.get_shared_many(missing)
+            found.update(shared)
+            hits += len(shared)
+            missing = [key for key in missing if key not in shared]
+        if missing:
+            text_by_key = dict(zip(keys, texts))
+            computed = dict(zip(missing, self.inner.encode([text_by_key[key] for key in missing])))
+            self.cache.put_many(computed)
+            found.update(computed)
+
+        self.cache.record(hits=hits, misses=len(missing))
+        return [found[key] for key in keys]
+
+
+def create_query_embeddings_cache(embeddings: Embeddings) -> Embeddings:
+    """
+    Wrap an Embeddings instance with the query embedding cache, if enabled in config.
+
+    Returns the instance unchanged when HINDSIGHT_API_EMBEDDINGS_QUERY_CACHE_SIZE is 0.
+    """
+    from ..config import get_config
+
+    config = get_config()
+    if config.embeddings_query_cache_size <= 0:
+        return embeddings
+    return CachedEmbeddings(
+        embeddings,
+        max_entries=config.embeddings_query_cache_size,
+        ttl_seconds=config.embeddings_query_cache_ttl,
+        shared_url=config.embeddings_query_cache_url,
+    )
+
+
 def create_embeddings_from_env() -> Embeddings:
     """
     Create an Embeddings instance based on environment variables.
@@ -714,9 +868,11 @@ def create_embeddings_from_env() -> Embeddings:
             raise ValueError(f"{ENV_EMBEDDINGS_TEI_URL} is required when {ENV_EMBEDDINGS_PROVIDER} is 'tei'")
         return RemoteTEIEmbeddings(base_url=url)
     elif provider == "local":
-        model = os.environ.get(ENV_EMBEDDINGS_LOCAL_MODEL)
-        model_name = model or DEFAULT_EMBEDDINGS_LOCAL_MODEL
-        return LocalSTEmbeddings(model_name=model_name)
+        return create_local_embeddings_from_env()
+    elif provider == "sidecar":
+        # The sidecar speaks the TEI API; the host name is ignored over a Unix socket
+        socket_path = os.environ.get(ENV_INFERENCE_SOCKET, DEFAULT_INFERENCE_SOCKET)
+        return RemoteTEIEmbeddings(base_url="http://localhost/embeddings", socket_path=socket_path)
     elif provider == "openai":
         # Use dedicated embeddings API key, or fall back to LLM API key
         api_key = os.environ.get(ENV_EMBEDDINGS_OPENAI_API_KEY) or os.environ.get(ENV_LLM_API_KEY)
@@ -742,5 +898,23 @@ def create_embeddings_from_env() -> Embeddings:
         return LiteLLMEmbeddings(api_base=api_base, api_key=api_key, model=model)
     else:
         raise ValueError(
-            f"Unknown embeddings provider: {provider}. Supported: 'local', 'tei', 'openai', 'cohere', 'litellm'"
+            f"Unknown embeddings provider: {provider}. "
+            "Supported: 'local', 'tei', 'sidecar', 'openai', 'cohere', 'litellm'"
         )
+
+
+def create_local_embeddings_from_env() -> LocalSTEmbeddings:
+    """
+    Create the local SentenceTransformers embeddings configured in the environment.
+
+    Used by the "local" provider and by the inference sidecar, which hosts the local model
+    for the processes configured with the "sidecar" provider.
+    """
+    model = os.environ.get(ENV_EMBEDDINGS_LOCAL_MODEL)
+    model_name = model or DEFAULT_EMBEDDINGS_LOCAL_MODEL
+    return LocalSTEmbeddings(
+        model_name=model_name,
+        backend=os.environ.get(ENV_EMBEDDINGS_LOCAL_BACKEND, DEFAULT_EMBEDDINGS_LOCAL_BACKEND),
+        onnx_cache_dir=os.environ.get(ENV_LOCAL_ONNX_CACHE_DIR, DEFAULT_LOCAL_ONNX_CACHE_DIR),
+        onnx_threads=int(os.environ.get(ENV_LOCAL_ONNX_THREADS, str(DEFAULT_LOCAL_ONNX_THREADS))),
+    )
@@ -0,0 +1,366 @@
+"""
+Per-bank cache for batch entity resolution.
+
+Resolving a retain batch needs, for every mention, the bank's entities whose name equals,
+contains or is contained in the mention, plus the co-occurrence neighbours of those entities.
+EntityCache keeps that data in memory for recently active banks, so bursts of retains into
+the same bank resolve entities without querying the entity tables.
+
+Consistency across processes uses LISTEN/NOTIFY on ENTITY_CHANGES_CHANNEL:
+- Writers publish their entity and co-occurrence changes with a NOTIFY sent inside the
+  writing transaction. Postgres delivers it only on commit, so every process (including the
+  writer) applies the change write-through once it is durable, and never for a rollback.
+- Changes too large for a NOTIFY payload are applied from memory by the writing process and
+  drop the bank from every other process's cache.
+- Deletions (bank delete, restore) send a notification without changes, which drops the
+  bank (or the whole schema) everywhere.
+- The cache is bypassed while its LISTEN connection is down.
+"""
+
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+import asyncpg
+
+from .memory_engine import fq_table, get_current_schema
+
+logger = logging.getLogger(__name__)
+
+ENTITY_CHANGES_CHANNEL = "hindsight_entity_changes"
+
+# Mentions shorter than this have no trigrams, so they only match names equal to or
+# contained in them (mirrors the pg_trgm index used by the database lookup).
+TRIGRAM_MIN_LENGTH = 3
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_MAX_NOTIFY_PAYLOAD = 7900
+# Oversized change sets waiting for their commit notification
+_MAX_PENDING_CHANGES = 1000
+# Seconds between attempts to re-establish a lost LISTEN connection
+_LISTENER_RETRY_SECONDS = 30.0
+
+
+def name_substrings(text: str) -> set[str]:
+    """All non-empty substrings of text."""
+    return {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)}
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class CachedEntity:
+    """An entity as needed for resolution."""
+
+    id: uuid.UUID
+    canonical_name: str
+    last_seen: datetime | None
+
+
+class BankEntities:
+    """In-memory name index and co-occurrence adjacency for one bank's entities."""
+
+    def __init__(self):
+        self._by_name: dict[str, CachedEntity] = {}  # lowercase name -> entity
+        self._names: dict[uuid.UUID, str] = {}  # entity id -> lowercase name
+        self._trigrams: dict[str, set[str]] = {}  # trigram -> lowercase names
+        self._neighbours: dict[uuid.UUID, set[uuid.UUID]] = {}  # entity id -> co-occurring entity ids
+        self.size = 0  # entities + co-occurrence pairs
+
+    def add_entity(self, entity_id: uuid.UUID, canonical_name: str, last_seen: datetime | None) -> None:
+        name = canonical_name.lower()
+        existing = self._by_name.get(name)
+        if existing is not None and existing.id == entity_id:
+            existing.last_seen = last_seen
+            return
+        if existing is not None:
+            self._names.pop(existing.id, None)
+        else:
+            self.size += 1
+            for trigram in _trigrams(name):
+                self._trigrams.setdefault(trigram, set()).add(name)
+        self._by_name[name] = CachedEntity(entity_id, canonical_name, last_seen)
+        self._names[entity_id] = name
+
+    def add_cooccurrence(self, entity_id_1: uuid.UUID, entity_id_2: uuid.UUID) -> None:
+        neighbours = self._neighbours.setdefault(entity_id_1, set())
+        if entity_id_2 in neighbours:
+            return
+        neighbours.add(entity_id_2)
+        self._neighbours.setdefault(entity_id_2, set()).add(entity_id_1)
+        self.size += 1
+
+    def candidates(self, entity_texts: list[str]) -> list[CachedEntity]:
+        """Entities whose lowercase name equals, contains or is contained in one of the texts."""
+        found: set[str] = set()
+        for text in {t.lower() for t in entity_texts}:
+            found.update(s for s in name_substrings(text) if s in self._by_name)
+            if len(text) >= TRIGRAM_MIN_LENGTH:
+                postings = [self._trigrams.get(trigram, set()) for trigram in _trigrams(text)]
+                found.update(name for name in set.intersection(*postings) if text in name)
+        return [self._by_name[name] for name in found]
+
+    def cooccurring_names(self, entity_id: uuid.UUID) -> set[str]:
+        """Lowercase names of the entities that co-occurred with entity_id."""
+        return {self._names[n] for n in self._neighbours.get(entity_id, ()) if n in self._names}
+
+
+def _changes_payload(
+    schema: str,
+    bank_id: str | None,
+    origin: str | None = None,
+    token: str | None = None,
+    entities: list[CachedEntity] | None = None,
+    cooccurrences: list[tuple[uuid.UUID, uuid.UUID]] | None = None,
+) -> str:
+    payload: dict = {"schema": schema, "bank_id": bank_id, "origin": origin, "token": token}
+    if entities is not None or cooccurrences is not None:
+        payload["entities"] = [
+            [str(e.id), e.canonical_name, e.last_seen.isoformat() if e.last_seen else None] for e in entities or []
+        ]
+        payload["cooccurrences"] = [[str(e1), str(e2)] for e1, e2 in cooccurrences or []]
+    return json.dumps(payload)
+
+
+async def notify_entities_changed(conn, schema: str, bank_id: str | None = None) -> None:
+    """
+    Tell every process to drop its cached entities for a bank (or a whole schema).
+
+    Call inside the transaction that deletes or replaces entities; the notification is
+    delivered when it commits.
+    """
+    await conn.execute("SELECT pg_notify($1, $2)", ENTITY_CHANGES_CHANNEL, _changes_payload(schema, bank_id))
+
+
+class EntityCache:
+    """
+    Memory-bounded LRU of BankEntities, kept current through LISTEN/NOTIFY.
+
+    max_entries bounds the total number of cached entities and co-occurrence pairs across all
+    banks. Banks larger than the whole budget are never cached and resolve through the database.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._banks: OrderedDict[tuple[str, str], BankEntities] = OrderedDict()
+        self._size = 0
+        self._oversized: set[tuple[str, str]] = set()
+        self._loading: dict[tuple[str, str], bool] = {}  # key -> changed while loading
+        self._pending: OrderedDict[str, tuple[list[CachedEntity], list[tuple[uuid.UUID, uuid.UUID]]]] = OrderedDict()
+        self._origin = uuid.uuid4().hex
+        self._tokens = itertools.count()
+        self._db_url: str | None = None
+        self._listener: asyncpg.Connection | None = None
+        self._last_connect_attempt: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self._listener is not None
+
+    async def start(self, db_url: str) -> None:
+        """Open the LISTEN connection. The cache stays bypassed if it cannot connect."""
+        if self.max_entries <= 0:
+            return
+        self._db_url = db_url
+        await self._ensure_listener()
+
+    async def stop(self) -> None:
+        self._db_url = None
+        listener, self._listener = self._listener, None
+        self.clear()
+        if listener is not None and not listener.is_closed():
+            listener.remove_termination_listener(self._on_listener_terminated)
+            await listener.close()
+
+    def clear(self) -> None:
+        self._banks.clear()
+        self._size = 0
+        self._oversized.clear()
+        self._pending.clear()
+        for key in self._loading:
+            self._loading[key] = True
+
+    async def _ensure_listener(self) -> bool:
+        if self._listener is not None:
+            return True
+        if self._db_url is None:
+            return False
+        if (
+            self._last_connect_attempt is not None
+            and time.monotonic() - self._last_connect_attempt < _LISTENER_RETRY_SECONDS
+        ):
+            return False
+        self._last_connect_attempt = time.monotonic()
+        try:
+            listener = await asyncpg.connect(self._db_url)
+            await listener.add_listener(ENTITY_CHANGES_CHANNEL, self._on_notification)
+            listener.add_termination_listener(self._on_listener_terminated)
+        except Exception as e:
+            logger.warning(f"Entity cache disabled: could not LISTEN on {ENTITY_CHANGES_CHANNEL}: {e}")
+            return False
+        self._listener = listener
+        return True
+
+    def _on_listener_terminated(self, connection) -> None:
+        # Notifications may have been missed; nothing cached can be trusted any more
+        logger.warning("Entity cache LISTEN connection lost, clearing cache")
+        self._listener = None
+        self.clear()
+
+    async def get_or_load(self, conn, bank_id: str) -> BankEntities | None:
+        """
+        Return the cached entities of a bank, loading them on a miss.
+
+        Returns None when the cache is disabled, the bank does not fit, or the bank changed
+        while it was being loaded; the caller then resolves through the database.
+        """
+        if self.max_entries <= 0 or not await self._ensure_listener():
+            return None
+
+        from ..metrics import get_metrics_collector
+
+        key = (get_current_schema(), bank_id)
+        bank = self._banks.get(key)
+        if bank is not None:
+            self._banks.move_to_end(key)
+            get_metrics_collector().record_cache_access("entity", hits=1)
+            return bank
+        get_metrics_collector().record_cache_access("entity", misses=1)
+        if key in self._oversized or key in self._loading:
+            return None
+
+        self._loading[key] = False
+        try:
+            bank = await self._load(conn, bank_id)
+        finally:
+            changed = self._loading.pop(key)
+        if bank is None:
+            self._oversized.add(key)
+            return None
+        if changed or not self.enabled:
+            return None
+
+        self._banks[key] = bank
+        self._size += bank.size
+        self._evict()
+        return bank
+
+    async def _load(self, conn, bank_id: str) -> BankEntities | None:
+        bank = BankEntities()
+        rows = await conn.fetch(
+            f"""
+            SELECT id, canonical_name, last_seen
+            FROM {fq_table("entities")}
+            WHERE bank_id = $1
+            LIMIT $2
+            """,
+            bank_id,
+            self.max_entries + 1,
+        )
+        if len(rows) > self.max_entries:
+            return None
+        for row in rows:
+            bank.add_entity(row["id"], row["canonical_name"], row["last_seen"])
+
+        remaining = self.max_entries - bank.size
+        rows = await conn.fetch(
+            f"""
+            SELECT ec.entity_id_1, ec.entity_id_2
+            FROM {fq_table("entity_cooccurrences")} ec
+            JOIN {fq_table("entities")} e ON e.id = ec.entity_id_1
+            WHERE e.bank_id = $1
+            LIMIT $2
+            """,
+            bank_id,
+            remaining + 1,
+        )
+        if len(rows) > remaining:
+            return None
+        for row in rows:
+            bank.add_cooccurrence(row["entity_id_1"], row["entity_id_2"])
+        return bank
+
+    def _evict(self) -> None:
+        while self._size > self.max_entries and self._banks:
+            _, bank = self._banks.popitem(last=False)
+            self._size -= bank.size
+
+    def invalidate(self, bank_id: str | None = None, schema: str | None = None) -> None:
+        """Drop a bank (or every bank of a schema) from this process's cache."""
+        schema = schema or get_current_schema()
+        keys = [k for k in [*self._banks, *self._loading, *self._oversized] if k[0] == schema]
+        for key in keys:
+            if bank_id is not None and key[1] != bank_id:
+                continue
+            bank = self._banks.pop(key, None)
+            if bank is not None:
+                self._size -= bank.size
+            self._oversized.discard(key)
+            if key in self._loading:
+                self._loading[key] = True
+
+    async def publish(
+        self,
+        conn,
+        bank_id: str,
+        entities: list[CachedEntity] | None = None,
+        cooccurrences: list[tuple[uuid.UUID, uuid.UUID]] | None = None,
+    ) -> None:
+        """
+        Publish entity changes made on conn, applied to every cache once the transaction commits.
+        """
+        if not self.enabled:
+            return
+        schema = get_current_schema()
+        payload = _changes_payload(schema, bank_id, self._origin, None, entities or [], cooccurrences or [])
+        if len(payload.encode()) > _MAX_NOTIFY_PAYLOAD:
+            token = str(next(self._tokens))
+            self._pending[token] = (entities or [], cooccurrences or [])
+            while len(self._pending) > _MAX_PENDING_CHANGES:
+                self._pending.popitem(last=False)
+            payload = _changes_payload(schema, bank_id, self._origin, token)
+        await conn.execute("SELECT pg_notify($1, $2)", ENTITY_CHANGES_CHANNEL, payload)
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self._apply(message)
+        except Exception as e:
+            logger.warning(f"Entity cache: bad notification {payload!r} ({e}), clearing cache")
+            self.clear()
+
+    def _apply(self, message: dict) -> None:
+        schema, bank_id = message["schema"], message.get("bank_id")
+        key = (schema, bank_id)
+
+        if "entities" in message:
+            entities = [
+                CachedEntity(uuid.UUID(e[0]), e[1], datetime.fromisoformat(e[2]) if e[2] else None)
+                for e in message["entities"]
+            ]
+            cooccurrences = [(uuid.UUID(e1), uuid.UUID(e2)) for e1, e2 in message["cooccurrences"]]
+        elif message.get("origin") == self._origin and message.get("token") in self._pending:
+            entities, cooccurrences = self._pending.pop(message["token"])
+        else:
+            self.invalidate(bank_id, schema)
+            return
+
+        if key in self._loading:
+            self._loading[key] = True
+        bank = self._banks.get(key)
+        if bank is None:
+            return
+        size_before = bank.size
+        for entity in entities:
+            bank.add_entity(entity.id, entity.canonical_name, entity.last_seen)
+        for entity_id_1, entity_id_2 in cooccurrences:
+            bank.add_cooccurrence(entity_id_1, entity_id_2)
+        self._size += bank.size - size_before
+        self._evict()
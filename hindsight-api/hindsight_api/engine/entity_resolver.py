@@ -11,25 +11,85 @@ from difflib import SequenceMatcher
 import asyncpg
 
 from .db_utils import acquire_with_retry
-from .memory_engine import fq_table
+from .entity_cache import (
+    TRIGRAM_MIN_LENGTH,
+    CachedEntity,
+    EntityCache,
+    name_substrings,
+    notify_entities_changed,
+)
+from .memory_engine import fq_table, get_current_schema
 
 # Load spaCy model (singleton)
 _nlp = None
 
 
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards so text is matched literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def fetch_entity_candidates(conn, bank_id: str, entity_texts: list[str]) -> list:
+    """
+    Fetch the entities of a bank that can match any of the given mention texts.
+
+    A mention matches an entity when the lowercase names are equal or one contains the other.
+    Both directions are index-backed, so the cost scales with the mentions, not the bank size:
+    - names contained in a mention are looked up as exact matches against every substring of the
+      mention (unique index on bank_id, LOWER(canonical_name))
+    - names containing a mention are found with a LIKE '%mention%' probe on the pg_trgm GIN index
+
+    Args:
+        conn: Database connection
+        bank_id: Bank whose entities to search
+        entity_texts: Mention texts from the batch being resolved
+
+    Returns:
+        Entity rows (id, canonical_name, metadata, last_seen, mention_count)
+    """
+    if not entity_texts:
+        return []
+
+    lowered = {text.lower() for text in entity_texts}
+    substrings: set[str] = set()
+    for text in lowered:
+        substrings |= name_substrings(text)
+    patterns = [f"%{_like_escape(text)}%" for text in lowered if len(text) >= TRIGRAM_MIN_LENGTH]
+
+    return await conn.fetch(
+        f"""
+        SELECT id, canonical_name, metadata, last_seen, mention_count
+        FROM {fq_table("entities")}
+        WHERE id IN (
+            SELECT id FROM {fq_table("entities")}
+            WHERE bank_id = $1 AND LOWER(canonical_name) = ANY($2::text[])
+            UNION
+            SELECT e.id
+            FROM unnest($3::text[]) AS p(pattern)
+            JOIN {fq_table("entities")} e ON e.bank_id = $1 AND LOWER(e.canonical_name) LIKE p.pattern
+        )
+        """,
+        bank_id,
+        list(substrings),
+        patterns,
+    )
+
+
 class EntityResolver:
     """
     Resolves entities to canonical IDs with disambiguation.
     """
 
-    def __init__(self, pool: asyncpg.Pool):
+    def __init__(self, pool: asyncpg.Pool, cache: EntityCache | None = None):
         """
         Initialize entity resolver.
 
         Args:
             pool: asyncpg connection pool
+            cache: Optional per-bank entity cache used by batch resolution
         """
         self.pool = pool
+        self.cache = cache
 
     async def resolve_entities_batch(
         self,
@@ -67,72 +127,37 @@ class EntityResolver:
     async def _resolve_entities_batch_impl(
         self, conn, bank_id: str, entities_data: list[dict], context: str, unit_event_date
     ) -> list[str]:
-        # Query ALL candidates for this bank
-        all_entities = await conn.fetch(
-            f"""
-            SELECT canonical_name, id, metadata, last_seen, mention_count
-            FROM {fq_table("entities")}
-            WHERE bank_id = $1
-            """,
-            bank_id,
-        )
-
-        # Build entity ID to name mapping for co-occurrence lookups
-        entity_id_to_name = {row["id"]: row["canonical_name"].lower() for row in all_entities}
-
-        # Query ALL co-occurrences for this bank's entities in one query
-        # This builds a map of entity_id -> set of co-occurring entity names
-        all_cooccurrences = await conn.fetch(
-            f"""
-            SELECT ec.entity_id_1, ec.entity_id_2, ec.cooccurrence_count
-            FROM {fq_table("entity_cooccurrences")} ec
-            WHERE ec.entity_id_1 IN (SELECT id FROM {fq_table("entities")} WHERE bank_id = $1)
-               OR ec.entity_id_2 IN (SELECT id FROM {fq_table("entities")} WHERE bank_id = $1)
-            """,
-            bank_id,
-        )
+        entity_texts = list(set(e["text"] for e in entities_data))
 
-        # Build co-occurrence map: entity_id -> set of co-occurring entity names (lowercase)
-        cooccurrence_map: dict[str, set[str]] = {}
-        for row in all_cooccurrences:
-            eid1, eid2 = row["entity_id_1"], row["entity_id_2"]
-            # Add both directions
-            if eid1 not in cooccurrence_map:
-                cooccurrence_map[eid1] = set()
-            if eid2 not in cooccurrence_map:
-                cooccurrence_map[eid2] = set()
-            # Map to canonical names for comparison with nearby_entities
-            if eid2 in entity_id_to_name:
-                cooccurrence_map[eid1].add(entity_id_to_name[eid2])
-            if eid1 in entity_id_to_name:
-                cooccurrence_map[eid2].add(entity_id_to_name[eid1])
+        bank_entities = await self.cache.get_or_load(conn, bank_id) if self.cache else None
+        if bank_entities is not None:
+            candidate_entities = bank_entities.candidates(entity_texts)
+            cooccurrence_map = {e.id: bank_entities.cooccurring_names(e.id) for e in candidate_entities}
+        else:
+            candidate_entities, cooccurrence_map = await self._fetch_candidates(conn, bank_id, entity_texts)
 
         # Build candidate map for each entity text
+        # Name similarity depends only on the two names, so it is scored once per unique mention
         all_candidates = {}  # Maps entity_text -> list of candidates
-        entity_texts = list(set(e["text"] for e in entities_data))
-
         for entity_text in entity_texts:
             matching = []
             entity_text_lower = entity_text.lower()
-            for row in all_entities:
-                canonical_name = row["canonical_name"]
-                ent_id = row["id"]
-                metadata = row["metadata"]
-                last_seen = row["last_seen"]
-                mention_count = row["mention_count"]
-                canonical_lower = canonical_name.lower()
+            for entity in candidate_entities:
+                canonical_lower = entity.canonical_name.lower()
                 # Match if exact or substring match
                 if (
                     entity_text_lower == canonical_lower
                     or entity_text_lower in canonical_lower
                     or canonical_lower in entity_text_lower
                 ):
-                    matching.append((ent_id, canonical_name, metadata, last_seen, mention_count))
+                    name_similarity = SequenceMatcher(None, entity_text_lower, canonical_lower).ratio()
+                    matching.append((entity, name_similarity))
             all_candidates[entity_text] = matching
 
         # Resolve each entity using pre-fetched candidates
         entity_ids = [None] * len(entities_data)
         entities_to_update = []  # (entity_id, event_date)
+        changed_entities: dict = {}  # entity_id -> CachedEntity as written, for the entity cache
         entities_to_create = []  # (idx, entity_data, event_date)
 
         for idx, entity_data in enumerate(entities_data):
@@ -150,15 +175,17 @@ class EntityResolver:
 
             # Score candidates
             best_candidate = None
+            best_entity = None
             best_score = 0.0
 
             nearby_entity_set = {e["text"].lower() for e in nearby_entities if e["text"] != entity_text}
 
-            for candidate_id, canonical_name, metadata, last_seen, mention_count in candidates:
+            for candidate, name_similarity in candidates:
+                candidate_id = candidate.id
+                last_seen = candidate.last_seen
                 score = 0.0
 
                 # 1. Name similarity (0-0.5)
-                name_similarity = SequenceMatcher(None, entity_text.lower(), canonical_name.lower()).ratio()
                 score += name_similarity * 0.5
 
                 # 2. Co-occurring entities (0-0.3)
@@ -183,6 +210,7 @@ class EntityResolver:
                 if score > best_score:
                     best_score = score
                     best_candidate = candidate_id
+                    best_entity = candidate
 
             # Apply unified threshold
             threshold = 0.6
@@ -190,6 +218,9 @@ class EntityResolver:
             if best_score > threshold:
                 entity_ids[idx] = best_candidate
                 entities_to_update.append((best_candidate, entity_event_date))
+                changed_entities[best_candidate] = CachedEntity(
+                    best_candidate, best_entity.canonical_name, entity_event_date
+                )
             else:
                 entities_to_create.append((idx, entity_data, entity_event_date))
 
@@ -243,7 +274,7 @@ class EntityResolver:
                 DO UPDATE SET
                     mention_count = {fq_table("entities")}.mention_count + EXCLUDED.mention_count,
                     last_seen = EXCLUDED.last_seen
-                RETURNING id
+                RETURNING id, canonical_name, last_seen
                 """,
                 bank_id,
                 entity_names,
@@ -256,9 +287,53 @@ class EntityResolver:
                 entity_id = row["id"]
                 for original_idx in indices_map[result_idx]:
                     entity_ids[original_idx] = entity_id
+                changed_entities[entity_id] = CachedEntity(entity_id, row["canonical_name"], row["last_seen"])
+
+        # Write-through to the entity cache (applied when this transaction commits)
+        if self.cache:
+            await self.cache.publish(conn, bank_id, entities=list(changed_entities.values()))
 
         return entity_ids
 
+    async def _fetch_candidates(
+        self, conn, bank_id: str, entity_texts: list[str]
+    ) -> tuple[list[CachedEntity], dict[str, set[str]]]:
+        """
+        Fetch candidate entities and their co-occurring entity names from the database.
+
+        Returns:
+            Tuple of (candidate entities, entity_id -> set of co-occurring entity names (lowercase))
+        """
+        # Fetch only the entities that can match one of this batch's mentions
+        candidate_rows = await fetch_entity_candidates(conn, bank_id, entity_texts)
+        candidate_ids = [row["id"] for row in candidate_rows]
+
+        # Query co-occurrences for the candidates only
+        candidate_cooccurrences = []
+        if candidate_ids:
+            candidate_cooccurrences = await conn.fetch(
+                f"""
+                SELECT ec.entity_id_1, ec.entity_id_2, e1.canonical_name AS name_1, e2.canonical_name AS name_2
+                FROM {fq_table("entity_cooccurrences")} ec
+                JOIN {fq_table("entities")} e1 ON e1.id = ec.entity_id_1
+                JOIN {fq_table("entities")} e2 ON e2.id = ec.entity_id_2
+                WHERE ec.entity_id_1 = ANY($1::uuid[])
+                   OR ec.entity_id_2 = ANY($1::uuid[])
+                """,
+                candidate_ids,
+            )
+
+        # Build co-occurrence map: entity_id -> set of co-occurring entity names (lowercase)
+        cooccurrence_map: dict[str, set[str]] = {}
+        for row in candidate_cooccurrences:
+            eid1, eid2 = row["entity_id_1"], row["entity_id_2"]
+            # Add both directions
+            cooccurrence_map.setdefault(eid1, set()).add(row["name_2"].lower())
+            cooccurrence_map.setdefault(eid2, set()).add(row["name_1"].lower())
+
+        candidates = [CachedEntity(row["id"], row["canonical_name"], row["last_seen"]) for row in candidate_rows]
+        return candidates, cooccurrence_map
+
     async def resolve_entity(
         self,
         bank_id: str,
@@ -378,6 +453,8 @@ class EntityResolver:
                     unit_event_date,
                     best_candidate,
                 )
+                if self.cache:
+                    await notify_entities_changed(conn, get_current_schema(), bank_id)
                 return best_candidate
             else:
                 # Not confident - create new entity
@@ -420,6 +497,8 @@ class EntityResolver:
             event_date,
             event_date,
         )
+        if self.cache:
+            await notify_entities_changed(conn, get_current_schema(), bank_id)
         return entity_id
 
     async def link_unit_to_entity(self, unit_id: str, entity_id: str):
@@ -488,7 +567,9 @@ class EntityResolver:
             entity_id_2,
         )
 
-    async def link_units_to_entities_batch(self, unit_entity_pairs: list[tuple[str, str]], conn=None):
+    async def link_units_to_entities_batch(
+        self, unit_entity_pairs: list[tuple[str, str]], conn=None, bank_id: str | None = None
+    ):
         """
         Link multiple memory units to entities in batch (MUCH faster than sequential).
 
@@ -497,17 +578,20 @@ class EntityResolver:
         Args:
             unit_entity_pairs: List of (unit_id, entity_id) tuples
             conn: Optional connection to use (if None, acquires from pool)
+            bank_id: Bank of the entities, used to update the entity cache's co-occurrences
         """
         if not unit_entity_pairs:
             return
 
         if conn is None:
             async with acquire_with_retry(self.pool) as conn:
-                return await self._link_units_to_entities_batch_impl(conn, unit_entity_pairs)
+                return await self._link_units_to_entities_batch_impl(conn, unit_entity_pairs, bank_id)
         else:
-            return await self._link_units_to_entities_batch_impl(conn, unit_entity_pairs)
+            return await self._link_units_to_entities_batch_impl(conn, unit_entity_pairs, bank_id)
 
-    async def _link_units_to_entities_batch_impl(self, conn, unit_entity_pairs: list[tuple[str, str]]):
+    async def _link_units_to_entities_batch_impl(
+        self, conn, unit_entity_pairs: list[tuple[str, str]], bank_id: str | None = None
+    ):
         # Batch insert all unit-entity links
         await conn.executemany(
             f"""
@@ -556,6 +640,10 @@ class EntityResolver:
                 [(e1, e2, 1, now) for e1, e2 in cooccurrence_pairs],
             )
 
+            # Write-through to the entity cache (applied when this transaction commits)
+            if self.cache and bank_id is not None:
+                await self.cache.publish(conn, bank_id, cooccurrences=list(cooccurrence_pairs))
+
     async def get_units_by_entity(self, entity_id: str, limit: int = 100) -> list[str]:
         """
         Get all units that mention an entity.
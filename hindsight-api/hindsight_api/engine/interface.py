@@ -102,6 +102,36 @@ class MemoryEngineInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def recall_batch_async(
+        self,
+        bank_id: str,
+        queries: list[str],
+        *,
+        budget: "Budget | None" = None,
+        max_tokens: int = 4096,
+        enable_trace: bool = False,
+        fact_type: list[str] | None = None,
+        question_date: datetime | None = None,
+        include_entities: bool = False,
+        max_entity_tokens: int = 500,
+        include_chunks: bool = False,
+        max_chunk_tokens: int = 8192,
+        request_context: "RequestContext",
+    ) -> list["RecallResult"]:
+        """
+        Recall memories for several queries against the same bank in one call.
+
+        Args:
+            bank_id: The memory bank ID.
+            queries: The search queries.
+            (remaining arguments as in recall_async, applied to every query)
+
+        Returns:
+            One RecallResult per query, in input order.
+        """
+        ...
+
     @abstractmethod
     async def reflect_async(
         self,
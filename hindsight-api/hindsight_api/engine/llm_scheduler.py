@@ -0,0 +1,340 @@
+"""
+Priority-aware admission of LLM requests.
+
+Every LLM call waits for a slot of its provider's scheduler. Requests are classed by the
+scope they pass to LLMProvider.call()/call_with_tools(): interactive reflect calls are
+admitted before retain extraction and mental model refreshes, so a bulk import does not
+add its whole backlog to the latency of user-facing calls.
+
+Each provider has its own concurrency limit and, optionally, a tokens-per-minute budget
+(charged with an estimate of the prompt size). Within a class, requests with the earliest
+deadline go first; a request that is still queued at its deadline is rejected. A request
+queued for `aging_seconds` moves up one class (once, and never into interactive), so
+background work keeps making progress behind a bulk import without delaying reflect calls.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..metrics import get_metrics_collector
+
+logger = logging.getLogger(__name__)
+
+# Priority classes, highest priority first
+PRIORITY_CLASSES = ("interactive", "default", "ingest", "background")
+
+# Scope prefix -> priority class (first match wins; unmatched scopes are "default")
+SCOPE_PRIORITY_CLASSES = (
+    ("reflect", "interactive"),
+    ("memory_think", "interactive"),
+    ("memory_extract_facts", "ingest"),
+    ("bank_mission", "ingest"),
+    ("mm_", "background"),
+    ("mental_model", "background"),
+)
+
+# Rough prompt size estimate used for tokens-per-minute budgets
+CHARS_PER_TOKEN = 4
+
+
+class LLMQueueTimeoutError(TimeoutError):
+    """Raised when an LLM request is still queued at its deadline."""
+
+    pass
+
+
+def priority_class(scope: str) -> str:
+    """Get the priority class of an LLM call scope."""
+    for prefix, priority_class_name in SCOPE_PRIORITY_CLASSES:
+        if scope.startswith(prefix):
+            return priority_class_name
+    return "default"
+
+
+def estimate_prompt_tokens(messages: list[dict[str, Any]]) -> int:
+    """Estimate the prompt size of a request from its message contents."""
+    chars = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            chars += sum(len(part.get("text") or "") for part in content if isinstance(part, dict))
+    return chars // CHARS_PER_TOKEN + 1
+
+
+def parse_provider_limits(value: str | None) -> dict[str, tuple[int, int]]:
+    """
+    Parse per-provider limits from "provider=concurrency[:tokens_per_minute],..." (e.g. "ollama=1,groq=64:300000").
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits: dict[str, tuple[int, int]] = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        provider, sep, spec = entry.partition("=")
+        concurrency, _, tokens_per_minute = spec.partition(":")
+        if (
+            not sep
+            or not provider.strip()
+            or not concurrency.strip().isdigit()
+            or int(concurrency) < 1
+            or (tokens_per_minute and not tokens_per_minute.strip().isdigit())
+        ):
+            raise ValueError(f"Invalid LLM provider limit '{entry}', expected provider=concurrency[:tokens_per_minute]")
+        limits[provider.strip().lower()] = (int(concurrency), int(tokens_per_minute or 0))
+    return limits
+
+
+def parse_queue_timeouts(value: str | None) -> dict[str, float]:
+    """
+    Parse per-class queue timeouts from "class=seconds,..." (e.g. "interactive=30").
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown class
+    """
+    timeouts: dict[str, float] = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, seconds = entry.partition("=")
+        name = name.strip()
+        try:
+            timeout = float(seconds)
+        except ValueError:
+            timeout = -1.0
+        if not sep or name not in PRIORITY_CLASSES or timeout < 0:
+            raise ValueError(
+                f"Invalid LLM queue timeout '{entry}', expected class=seconds with class in {PRIORITY_CLASSES}"
+            )
+        timeouts[name] = timeout
+    return timeouts
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    priority_class: str
+    tokens: int
+    enqueued_at: float
+    deadline: float | None
+    seq: int
+    future: asyncio.Future = field(repr=False)
+
+
+class LLMScheduler:
+    """Admits the LLM requests of one provider by priority class, within its concurrency and token budget."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        tokens_per_minute: int = 0,
+        queue_timeouts: dict[str, float] | None = None,
+        aging_seconds: float = 0.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            name: Provider name (metrics and logs)
+            max_concurrent: Maximum concurrent requests
+            tokens_per_minute: Estimated prompt tokens admitted per minute (0 = unlimited)
+            queue_timeouts: Default queue timeout (seconds) per priority class (0 or missing = wait forever)
+            aging_seconds: Queued requests move up one class (at most, never into interactive) after
+                waiting this many seconds (0 = never)
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.tokens_per_minute = tokens_per_minute
+        self.queue_timeouts = queue_timeouts or {}
+        self.aging_seconds = aging_seconds
+
+        self._in_flight = 0
+        self._waiters: list[_Waiter] = []
+        self._seq = 0
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._refill_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _take_tokens(self, tokens: int) -> bool:
+        """Charge the token budget if it covers `tokens` (requests larger than the budget wait for a full one)."""
+        if self.tokens_per_minute <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.tokens_per_minute), self._tokens + (now - self._refilled_at) * self.tokens_per_minute / 60
+        )
+        self._refilled_at = now
+        tokens = min(tokens, self.tokens_per_minute)
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def _rank(self, waiter: _Waiter, now: float) -> tuple:
+        priority = waiter.priority
+        if self.aging_seconds > 0 and priority > 1 and now - waiter.enqueued_at >= self.aging_seconds:
+            # Bounded so an aged backlog can never outrank interactive requests (class 0)
+            priority -= 1
+        return (priority, waiter.deadline if waiter.deadline is not None else math.inf, waiter.seq)
+
+    def _dispatch(self):
+        """Admit queued requests, best rank first, while slots and budget allow."""
+        while self._waiters and self._in_flight < self.max_concurrent:
+            self._waiters = [waiter for waiter in self._waiters if not waiter.future.done()]
+            if not self._waiters:
+                return
+            now = time.monotonic()
+            waiter = min(self._waiters, key=lambda w: self._rank(w, now))
+            if not self._take_tokens(waiter.tokens):
+                # Keep the budget for this request rather than letting smaller, lower-priority ones through
+                self._schedule_refill(waiter.tokens)
+                return
+            self._waiters.remove(waiter)
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _schedule_refill(self, tokens: int):
+        if self._refill_handle is not None:
+            return
+        missing = min(tokens, self.tokens_per_minute) - self._tokens
+        delay = max(missing * 60 / self.tokens_per_minute, 0.01)
+        self._refill_handle = asyncio.get_running_loop().call_later(delay, self._on_refill)
+
+    def _on_refill(self):
+        self._refill_handle = None
+        self._dispatch()
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    async def acquire(self, scope: str, tokens: int = 0, queue_timeout: float | None = None) -> float:
+        """
+        Wait for a slot.
+
+        Args:
+            scope: LLM call scope (selects the priority class)
+            tokens: Estimated prompt tokens, charged to the tokens-per-minute budget
+            queue_timeout: Maximum seconds to wait (default: the class's queue timeout)
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            LLMQueueTimeoutError: If no slot was granted before the deadline
+        """
+        priority_class_name = priority_class(scope)
+        start = time.monotonic()
+
+        if not self._waiters and self._in_flight < self.max_concurrent and self._take_tokens(tokens):
+            self._in_flight += 1
+            get_metrics_collector().record_llm_queue_wait(self.name, priority_class_name, 0.0, admitted=True)
+            return 0.0
+
+        if queue_timeout is None:
+            queue_timeout = self.queue_timeouts.get(priority_class_name) or None
+        self._seq += 1
+        waiter = _Waiter(
+            priority=PRIORITY_CLASSES.index(priority_class_name),
+            priority_class=priority_class_name,
+            tokens=tokens,
+            enqueued_at=start,
+            deadline=start + queue_timeout if queue_timeout else None,
+            seq=self._seq,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+
+        try:
+            if waiter.deadline is None:
+                await waiter.future
+            else:
+                await asyncio.wait_for(waiter.future, timeout=max(waiter.deadline - time.monotonic(), 0.0))
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted as the caller was cancelled: hand the slot on
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._dispatch()
+            if isinstance(e, asyncio.TimeoutError):
+                waited = time.monotonic() - start
+                get_metrics_collector().record_llm_queue_wait(self.name, priority_class_name, waited, admitted=False)
+                raise LLMQueueTimeoutError(
+                    f"LLM request (scope={scope}, class={priority_class_name}) queued for {waited:.1f}s "
+                    f"on {self.name} without a slot"
+                ) from None
+            raise
+
+        waited = time.monotonic() - start
+        get_metrics_collector().record_llm_queue_wait(self.name, priority_class_name, waited, admitted=True)
+        return waited
+
+    @asynccontextmanager
+    async def slot(self, scope: str, tokens: int = 0, queue_timeout: float | None = None) -> AsyncIterator[float]:
+        """Hold a slot for the duration of the block; yields the seconds waited."""
+        waited = await self.acquire(scope, tokens, queue_timeout)
+        try:
+            yield waited
+        finally:
+            self._release()
+
+
+# Schedulers per provider (created on first use from config)
+_schedulers: dict[str, LLMScheduler] = {}
+
+
+def get_llm_scheduler(provider: str) -> LLMScheduler:
+    """Get the scheduler shared by every LLMProvider of a provider type."""
+    scheduler = _schedulers.get(provider)
+    if scheduler is None:
+        from ..config import get_config
+
+        config = get_config()
+        try:
+            provider_limits = parse_provider_limits(config.llm_provider_limits)
+        except ValueError as e:
+            logger.warning(f"{e}; using HINDSIGHT_API_LLM_MAX_CONCURRENT for every provider")
+            provider_limits = {}
+        try:
+            queue_timeouts = parse_queue_timeouts(config.llm_queue_timeouts)
+        except ValueError as e:
+            logger.warning(f"{e}; LLM requests will wait for a slot without timeout")
+            queue_timeouts = {}
+        max_concurrent, tokens_per_minute = provider_limits.get(
+            provider, (config.llm_max_concurrent, config.llm_tokens_per_minute)
+        )
+        scheduler = LLMScheduler(
+            name=provider,
+            max_concurrent=max_concurrent,
+            tokens_per_minute=tokens_per_minute,
+            queue_timeouts=queue_timeouts,
+            aging_seconds=config.llm_priority_aging_seconds,
+        )
+        _schedulers[provider] = scheduler
+        logger.info(
+            f"LLM scheduler for {provider}: {max_concurrent} concurrent, "
+            f"{f'{tokens_per_minute:,} tokens/min' if tokens_per_minute else 'no token budget'}"
+        )
+    return scheduler
@@ -17,13 +17,12 @@ from google.genai import types as genai_types
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, LengthFinishReasonError
 
 from ..config import (
-    DEFAULT_LLM_MAX_CONCURRENT,
     DEFAULT_LLM_TIMEOUT,
     ENV_LLM_GROQ_SERVICE_TIER,
-    ENV_LLM_MAX_CONCURRENT,
     ENV_LLM_TIMEOUT,
 )
 from ..metrics import get_metrics_collector
+from .llm_scheduler import estimate_prompt_tokens, get_llm_scheduler
 from .response_models import TokenUsage
 
 # Seed applied to every Groq request for deterministic behavior.
@@ -34,11 +33,6 @@ logger = logging.getLogger(__name__)
 # Disable httpx logging
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
-# Global semaphore to limit concurrent LLM requests across all instances
-# Set HINDSIGHT_API_LLM_MAX_CONCURRENT=1 for local LLMs (LM Studio, Ollama)
-_llm_max_concurrent = int(os.getenv(ENV_LLM_MAX_CONCURRENT, str(DEFAULT_LLM_MAX_CONCURRENT)))
-_global_llm_semaphore = asyncio.Semaphore(_llm_max_concurrent)
-
 
 class OutputTooLongError(Exception):
     """
@@ -184,6 +178,7 @@ class LLMProvider:
         skip_validation: bool = False,
         strict_schema: bool = False,
         return_usage: bool = False,
+        queue_timeout: float | None = None,
     ) -> Any:
         """
         Make an LLM API call with retry logic.
@@ -200,6 +195,7 @@ class LLMProvider:
             skip_validation: Return raw JSON without Pydantic validation.
             strict_schema: Use strict JSON schema enforcement (OpenAI only). Guarantees all required fields.
             return_usage: If True, return tuple (result, TokenUsage) instead of just result.
+            queue_timeout: Maximum seconds to wait for a scheduler slot (default: per priority class).
 
         Returns:
             If return_usage=False: Parsed response if response_format is provided, otherwise text content.
@@ -207,11 +203,11 @@ class LLMProvider:
 
         Raises:
             OutputTooLongError: If output exceeds token limits.
+            LLMQueueTimeoutError: If no scheduler slot was granted before the queue timeout.
             Exception: Re-raises API errors after retries exhausted.
         """
-        semaphore_start = time.time()
-        async with _global_llm_semaphore:
-            semaphore_wait_time = time.time() - semaphore_start
+        scheduler = get_llm_scheduler(self.provider)
+        async with scheduler.slot(scope, estimate_prompt_tokens(messages), queue_timeout) as semaphore_wait_time:
             start_time = time.time()
 
             # Handle Mock provider (for testing)
@@ -553,6 +549,7 @@ class LLMProvider:
         initial_backoff: float = 1.0,
         max_backoff: float = 30.0,
         tool_choice: str | dict[str, Any] = "auto",
+        queue_timeout: float | None = None,
     ) -> "LLMToolCallResult":
         """
         Make an LLM API call with tool/function calling support.
@@ -567,13 +564,15 @@ class LLMProvider:
             initial_backoff: Initial backoff time in seconds.
             max_backoff: Maximum backoff time in seconds.
             tool_choice: How to choose tools - "auto", "none", "required", or {"type": "function", "function": {"name": "..."}}
+            queue_timeout: Maximum seconds to wait for a scheduler slot (default: per priority class).
 
         Returns:
             LLMToolCallResult with content and/or tool_calls.
         """
         from .response_models import LLMToolCall, LLMToolCallResult
 
-        async with _global_llm_semaphore:
+        scheduler = get_llm_scheduler(self.provider)
+        async with scheduler.slot(scope, estimate_prompt_tokens(messages), queue_timeout):
             start_time = time.time()
 
             # Handle Mock provider
@@ -1453,7 +1452,9 @@ class LLMProvider:
         logger.debug(f"Mock LLM call recorded: scope={scope}, model={self.model}")
 
         # Return mock response
-        if self._mock_response is not None:
+        if callable(self._mock_response):
+            result = self._mock_response(messages)
+        elif self._mock_response is not None:
             result = self._mock_response
         elif response_format is not None:
             # Try to create a minimal valid instance of the response format
@@ -1471,7 +1472,12 @@ class LLMProvider:
         return result
 
     def set_mock_response(self, response: Any) -> None:
-        """Set the response to return from mock calls."""
+        """
+        Set the response to return from mock calls.
+
+        A callable is called with the messages of each call and its return value is used,
+        so the response can depend on the prompt (e.g. facts derived from the retained text).
+        """
         self._mock_response = response
 
     def get_mock_calls(self) -> list[dict]:
@@ -0,0 +1,131 @@
+"""
+ONNX Runtime loading for the local SentenceTransformers providers.
+
+The local embedding and reranker models are exported to ONNX (optionally with int8 dynamic
+quantization) the first time they are loaded, and the exported artifact is cached on disk
+so later startups load it directly. Requires sentence-transformers>=4.1 and
+optimum[onnxruntime] (pip install "optimum[onnxruntime]").
+"""
+
+import logging
+import os
+import platform
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+LOCAL_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def validate_backend(backend: str) -> str:
+    """Normalize and validate a local inference backend name."""
+    backend = backend.lower()
+    if backend not in LOCAL_BACKENDS:
+        raise ValueError(f"Unknown local inference backend: {backend}. Supported: {', '.join(LOCAL_BACKENDS)}")
+    return backend
+
+
+def _quantization_config() -> str:
+    """Dynamic quantization preset for this CPU (avx2 is the broadly available x86 baseline)."""
+    return "arm64" if platform.machine().lower() in ("arm64", "aarch64") else "avx2"
+
+
+def artifact_dir(cache_dir: str, model_name: str, backend: str) -> Path:
+    """Directory holding the exported artifact of a model for a backend."""
+    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "--", model_name)
+    return Path(cache_dir).expanduser() / safe_name / backend
+
+
+def _int8_file_suffix() -> str:
+    """Suffix of the quantized model file, passed to the export so the load path matches it."""
+    return f"qint8_{_quantization_config()}"
+
+
+def _onnx_file_name(backend: str) -> str:
+    if backend == "onnx-int8":
+        return f"onnx/model_{_int8_file_suffix()}.onnx"
+    return "onnx/model.onnx"
+
+
+def _export(model_cls, model_name: str, backend: str, target: Path) -> None:
+    """Export a model to ONNX (and quantize it) into target, atomically."""
+    logger.info(f"Exporting {model_name} to ONNX ({backend}), cached at {target}")
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        # Loading a hub model with backend="onnx" exports it when the repo has no ONNX file
+        model = model_cls(model_name, backend="onnx", device="cpu")
+        model.save_pretrained(str(staging))
+        if backend == "onnx-int8":
+            from sentence_transformers import export_dynamic_quantized_onnx_model
+
+            export_dynamic_quantized_onnx_model(
+                model,
+                quantization_config=_quantization_config(),
+                model_name_or_path=str(staging),
+                file_suffix=_int8_file_suffix(),
+            )
+        try:
+            staging.rename(target)
+        except OSError:
+            # Another process finished the same export first
+            if not (target / _onnx_file_name(backend)).exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def load_onnx_model(model_cls, model_name: str, backend: str, cache_dir: str, threads: int = 0):
+    """
+    Load a SentenceTransformer or CrossEncoder through ONNX Runtime.
+
+    The model is exported (and for onnx-int8, quantized) on first use and cached under
+    cache_dir; later calls load the cached artifact without touching the original weights.
+
+    Args:
+        model_cls: sentence_transformers.SentenceTransformer or CrossEncoder
+        model_name: Hugging Face model name or local path
+        backend: "onnx" or "onnx-int8"
+        cache_dir: Directory for exported artifacts
+        threads: ONNX Runtime intra-op threads (0 = let ONNX Runtime decide)
+
+    Returns:
+        Loaded model instance
+    """
+    try:
+        import onnxruntime
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "optimum[onnxruntime] is required for the ONNX local inference backend. "
+            'Install it with: pip install "optimum[onnxruntime]"'
+        )
+
+    target = artifact_dir(cache_dir, model_name, backend)
+    file_name = _onnx_file_name(backend)
+    if not (target / file_name).exists():
+        _export(model_cls, model_name, backend, target)
+
+    session_options = onnxruntime.SessionOptions()
+    if threads > 0:
+        session_options.intra_op_num_threads = threads
+        session_options.inter_op_num_threads = 1
+    logger.info(f"Loading ONNX model {target / file_name} (threads={threads or 'auto'})")
+    return model_cls(
+        str(target),
+        backend="onnx",
+        device="cpu",
+        model_kwargs={
+            "file_name": file_name,
+            "provider": "CPUExecutionProvider",
+            "session_options": session_options,
+        },
+    )
+
+
+def default_cache_dir() -> str:
+    """Default directory for exported ONNX artifacts."""
+    return os.path.join(os.path.expanduser("~"), ".cache", "hindsight", "onnx")
@@ -123,8 +123,8 @@ import asyncpg
 import numpy as np
 from pydantic import BaseModel, Field
 
-from .cross_encoder import CrossEncoderModel
-from .embeddings import Embeddings, create_embeddings_from_env
+from .cross_encoder import CrossEncoderModel, create_cross_encoder_cache, create_cross_encoder_from_env
+from .embeddings import Embeddings, create_embeddings_from_env, create_query_embeddings_cache
 from .interface import MemoryEngineInterface
 
 if TYPE_CHECKING:
@@ -136,6 +136,7 @@ from enum import Enum
 
 from ..metrics import get_metrics_collector
 from ..pg0 import EmbeddedPostgres, parse_pg0_url
+from .entity_cache import EntityCache, notify_entities_changed
 from .entity_resolver import EntityResolver
 from .llm_wrapper import LLMConfig
 from .query_analyzer import QueryAnalyzer
@@ -157,9 +158,19 @@ from .response_models import RecallResult as RecallResultModel
 from .retain import bank_utils, embedding_utils
 from .retain.types import RetainContentDict
 from .search import think_utils
+from .search.edge_cache import get_shared_edge_cache, notify_links_changed
 from .search.reranking import CrossEncoderReranker
 from .search.tags import TagsMatch
-from .task_backend import BrokerTaskBackend, SyncTaskBackend, TaskBackend
+from .search.types import ScoredResult
+from .task_backend import (
+    COALESCED_RETAIN_TASK_TYPE,
+    PAYLOAD_TABLE,
+    BrokerTaskBackend,
+    CoalescedTaskError,
+    SyncTaskBackend,
+    TaskBackend,
+    decode_task_contents,
+)
 
 
 class Budget(str, Enum):
@@ -178,20 +189,8 @@ def utcnow():
 # Logger for memory system
 logger = logging.getLogger(__name__)
 
-import tiktoken
-
-from .db_utils import acquire_with_retry
-
-# Cache tiktoken encoding for token budget filtering (module-level singleton)
-_TIKTOKEN_ENCODING = None
-
-
-def _get_tiktoken_encoding():
-    """Get cached tiktoken encoding (cl100k_base for GPT-4/3.5)."""
-    global _TIKTOKEN_ENCODING
-    if _TIKTOKEN_ENCODING is None:
-        _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
-    return _TIKTOKEN_ENCODING
+from .db_utils import acquire_with_retry, supports_hnsw_iterative_scan
+from .tokens import count_tokens, get_tiktoken_encoding
 
 
 class MemoryEngine(MemoryEngineInterface):
@@ -327,12 +326,18 @@ class MemoryEngine(MemoryEngineInterface):
 
         # Initialize entity resolver (will be created in initialize())
         self.entity_resolver = None
+        # Per-bank entity cache shared by batch entity resolution (listens once initialized)
+        self._entity_cache = EntityCache(get_config().retain_entity_cache_max_entries)
+        # Startup pass over units left enrichment_pending by interrupted retains
+        self._enrichment_sweep: asyncio.Task | None = None
 
         # Initialize embeddings (from env vars if not provided)
         if embeddings is not None:
             self.embeddings = embeddings
         else:
             self.embeddings = create_embeddings_from_env()
+        # Recall queries repeat often; serve them through a bounded cache
+        self._query_embeddings = create_query_embeddings_cache(self.embeddings)
 
         # Initialize query analyzer
         if query_analyzer is not None:
@@ -398,7 +403,10 @@ class MemoryEngine(MemoryEngineInterface):
         )
 
         # Initialize cross-encoder reranker (cached for performance)
-        self._cross_encoder_reranker = CrossEncoderReranker(cross_encoder=cross_encoder)
+        if cross_encoder is None:
+            cross_encoder = create_cross_encoder_from_env()
+        # Agent loops and reflect rerank mostly the same candidates for the same query
+        self._cross_encoder_reranker = CrossEncoderReranker(cross_encoder=create_cross_encoder_cache(cross_encoder))
 
         # Initialize task backend
         # If no custom backend provided, use BrokerTaskBackend which stores tasks in PostgreSQL
@@ -415,7 +423,7 @@ class MemoryEngine(MemoryEngineInterface):
         self._put_semaphore = asyncio.Semaphore(5)
 
         # initialize encoding eagerly to avoid delaying the first time
-        _get_tiktoken_encoding()
+        get_tiktoken_encoding()
 
         # Store operation validator extension (optional)
         self._operation_validator = operation_validator
@@ -473,12 +481,33 @@ class MemoryEngine(MemoryEngineInterface):
         _current_schema.set(tenant_context.schema_name)
         return tenant_context.schema_name
 
+    async def _load_task_contents(self, task_dict: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Get a task's contents, reading them from the payload store if the task holds a reference.
+
+        Raises:
+            ValueError: If the referenced payload does not exist
+        """
+        contents_ref = task_dict.get("contents_ref")
+        if not contents_ref:
+            return task_dict.get("contents", [])
+
+        pool = await self._get_pool()
+        async with acquire_with_retry(pool) as conn:
+            row = await conn.fetchrow(
+                f"SELECT encoding, data FROM {fq_table(PAYLOAD_TABLE)} WHERE operation_id = $1",
+                uuid.UUID(contents_ref),
+            )
+        if row is None:
+            raise ValueError(f"Task contents {contents_ref} not found in the payload store")
+        return await asyncio.to_thread(decode_task_contents, row["encoding"], row["data"])
+
     async def _handle_batch_retain(self, task_dict: dict[str, Any]):
         """
         Handler for batch retain tasks.
 
         Args:
-            task_dict: Dict with 'bank_id', 'contents'
+            task_dict: Dict with 'bank_id', 'contents' (or 'contents_ref' into the payload store)
 
         Raises:
             ValueError: If bank_id is missing
@@ -487,7 +516,7 @@ class MemoryEngine(MemoryEngineInterface):
         bank_id = task_dict.get("bank_id")
         if not bank_id:
             raise ValueError("bank_id is required for batch retain task")
-        contents = task_dict.get("contents", [])
+        contents = await self._load_task_contents(task_dict)
 
         logger.info(
             f"[BATCH_RETAIN_TASK] Starting background batch retain for bank_id={bank_id}, {len(contents)} items"
@@ -497,10 +526,79 @@ class MemoryEngine(MemoryEngineInterface):
         from hindsight_api.models import RequestContext
 
         internal_context = RequestContext()
-        await self.retain_batch_async(bank_id=bank_id, contents=contents, request_context=internal_context)
+        await self.retain_batch_async(
+            bank_id=bank_id,
+            contents=contents,
+            request_context=internal_context,
+            update_mode=task_dict.get("update_mode", "replace"),
+        )
 
         logger.info(f"[BATCH_RETAIN_TASK] Completed background batch retain for bank_id={bank_id}")
 
+    async def _execute_coalesced_batch_retain(self, task_dict: dict[str, Any]):
+        """
+        Execute adjacent batch_retain tasks of one bank (merged by the worker) as one retain.
+
+        Each original operation is completed individually. If the merged retain fails, the
+        tasks are retained one by one, so a bad item only fails (and retries) its own operation.
+
+        Args:
+            task_dict: Dict with 'bank_id' and 'tasks' (the original batch_retain task dicts)
+
+        Raises:
+            CoalescedTaskError: If some operations failed on their own; the worker retries or
+                fails each of them, and completes the others
+        """
+        tasks = task_dict.get("tasks", [])
+
+        # Drop cancelled operations
+        pool = await self._get_pool()
+        async with acquire_with_retry(pool) as conn:
+            rows = await conn.fetch(
+                f"SELECT operation_id FROM {fq_table('async_operations')} WHERE operation_id = ANY($1::uuid[])",
+                [uuid.UUID(task["operation_id"]) for task in tasks],
+            )
+        live_ids = {str(row["operation_id"]) for row in rows}
+        tasks = [task for task in tasks if task["operation_id"] in live_ids]
+        if len(tasks) > 1:
+            contents = []
+            for task in tasks:
+                # Contents without a document get one per operation, as they would when retained alone
+                generated_document_id = str(uuid.uuid4())
+                for item in await self._load_task_contents(task):
+                    if not item.get("document_id"):
+                        item = {**item, "document_id": generated_document_id}
+                    contents.append(item)
+            merged = {
+                key: value
+                for key, value in tasks[0].items()
+                if key not in ("operation_id", "retry_count", "contents_ref")
+            }
+            merged["contents"] = contents
+
+            try:
+                await self._handle_batch_retain(merged)
+            except Exception as e:
+                logger.warning(f"Coalesced retain of {len(tasks)} operations failed, retrying them one by one: {e}")
+            else:
+                for task in tasks:
+                    await self._mark_operation_completed(task["operation_id"])
+                return
+
+        failures = {}
+        for task in tasks:
+            try:
+                await self._handle_batch_retain(task)
+            except Exception as e:
+                import traceback
+
+                logger.error(f"Retain of coalesced operation {task['operation_id']} failed: {e}")
+                failures[task["operation_id"]] = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+                continue
+            await self._mark_operation_completed(task["operation_id"])
+        if failures:
+            raise CoalescedTaskError(failures)
+
     async def _handle_refresh_mental_models(self, task_dict: dict[str, Any]):
         """
         Handler for refresh mental models tasks.
@@ -781,6 +879,11 @@ class MemoryEngine(MemoryEngineInterface):
         retry_count = task_dict.get("retry_count", 0)
         max_retries = 3
 
+        if task_type == COALESCED_RETAIN_TASK_TYPE:
+            # Completes each merged operation itself; the worker retries the ones it raises for
+            await self._execute_coalesced_batch_retain(task_dict)
+            return
+
         # Check if operation was cancelled (only for tasks with operation_id)
         if operation_id:
             try:
@@ -871,15 +974,19 @@ class MemoryEngine(MemoryEngineInterface):
             logger.error(f"Failed to mark operation as failed {operation_id}: {e}")
 
     async def _mark_operation_completed(self, operation_id: str):
-        """Helper to mark an operation as completed in the database."""
+        """Helper to mark an operation as completed in the database (and drop its stored contents)."""
         try:
             pool = await self._get_pool()
             async with acquire_with_retry(pool) as conn:
                 await conn.execute(
                     f"""
-                    UPDATE {fq_table("async_operations")}
-                    SET status = 'completed', updated_at = NOW(), completed_at = NOW()
-                    WHERE operation_id = $1
+                    WITH completed AS (
+                        UPDATE {fq_table("async_operations")}
+                        SET status = 'completed', updated_at = NOW(), completed_at = NOW()
+                        WHERE operation_id = $1
+                        RETURNING operation_id
+                    )
+                    DELETE FROM {fq_table(PAYLOAD_TABLE)} WHERE operation_id IN (SELECT operation_id FROM completed)
                     """,
                     uuid.UUID(operation_id),
                 )
@@ -1006,15 +1113,47 @@ class MemoryEngine(MemoryEngineInterface):
         )
 
         # Initialize entity resolver with pool
-        self.entity_resolver = EntityResolver(self._pool)
+        await self._entity_cache.start(self.db_url)
+        self.entity_resolver = EntityResolver(self._pool, cache=self._entity_cache)
+
+        # Process-wide MPFP adjacency cache (only MPFP reads it)
+        if get_config().graph_retriever == "mpfp":
+            await get_shared_edge_cache().start(self.db_url)
 
         # Set executor for task backend and initialize
         self._task_backend.set_executor(self.execute_task)
         await self._task_backend.initialize()
 
+        self._enrichment_sweep = asyncio.create_task(self._resume_pending_enrichment())
+
         self._initialized = True
         logger.info("Memory system initialized (pool and task backend started)")
 
+    async def _resume_pending_enrichment(self) -> None:
+        """
+        Finish the enrichment of units whose retain died before finishing.
+
+        Sweeps the default schema and every tenant schema at startup, then every
+        ENRICHMENT_SWEEP_INTERVAL_SECONDS, until the engine is closed.
+        """
+        from .retain import orchestrator
+
+        while True:
+            try:
+                async with acquire_with_retry(self._pool) as conn:
+                    schemas = await orchestrator.list_memory_schemas(conn)
+                for schema in schemas:
+                    _current_schema.set(schema)
+                    enriched = await orchestrator.resume_pending_enrichment(self._pool, self.entity_resolver)
+                    if enriched:
+                        logger.info(
+                            f"Resumed the enrichment of {enriched} units left pending by interrupted retains "
+                            f"(schema {schema})"
+                        )
+            except Exception as e:
+                logger.warning(f"Resuming pending retain enrichment failed: {e}")
+            await asyncio.sleep(orchestrator.ENRICHMENT_SWEEP_INTERVAL_SECONDS)
+
     async def _get_pool(self) -> asyncpg.Pool:
         """Get the connection pool (must call initialize() first)."""
         if not self._initialized:
@@ -1067,6 +1206,14 @@ class MemoryEngine(MemoryEngineInterface):
         # Shutdown task backend
         await self._task_backend.shutdown()
 
+        if self._enrichment_sweep is not None:
+            self._enrichment_sweep.cancel()
+            await asyncio.gather(self._enrichment_sweep, return_exceptions=True)
+            self._enrichment_sweep = None
+
+        await self._entity_cache.stop()
+        await get_shared_edge_cache().stop()
+
         # Close pool
         if self._pool is not None:
             self._pool.terminate()
@@ -1157,10 +1304,19 @@ class MemoryEngine(MemoryEngineInterface):
         except OverflowError:
             time_upper = datetime.max
 
-        # Fetch ALL existing facts in time window ONCE (much faster than N queries)
-        import time as time_mod
+        # The index probe is only reliable when its scan can run past rows of other banks
+        # (iterative scans, set per transaction); otherwise it may find no match and let
+        # duplicates through, so use the exact check instead.
+        if (
+            get_config().retain_dedup_mode == "index"
+            and conn.is_in_transaction()
+            and await supports_hnsw_iterative_scan(conn)
+        ):
+            return await self._find_duplicate_facts_indexed(
+                conn, bank_id, embeddings, time_lower, time_upper, similarity_threshold
+            )
 
-        fetch_start = time_mod.time()
+        # Exact mode: fetch ALL existing facts in time window ONCE (much faster than N queries)
         existing_facts = await conn.fetch(
             f"""
             SELECT id, text, embedding
@@ -1177,9 +1333,6 @@ class MemoryEngine(MemoryEngineInterface):
         if not existing_facts:
             return [False] * len(texts)
 
-        # Compute similarities in Python (vectorized with numpy)
-        is_duplicate = []
-
         # Convert existing embeddings to numpy for faster computation
         embedding_arrays = []
         for row in existing_facts:
@@ -1197,27 +1350,57 @@ class MemoryEngine(MemoryEngineInterface):
                 emb = np.array(raw_emb, dtype=np.float32)
             embedding_arrays.append(emb)
 
-        if not embedding_arrays:
-            existing_embeddings = np.array([])
-        elif len(embedding_arrays) == 1:
-            # Single embedding: reshape to (1, dim)
-            existing_embeddings = embedding_arrays[0].reshape(1, -1)
-        else:
-            # Multiple embeddings: vstack
-            existing_embeddings = np.vstack(embedding_arrays)
+        existing_embeddings = np.vstack(embedding_arrays)
+
+        # Cosine similarity of every new fact against every existing fact in one product
+        # (for normalized vectors: cosine_sim = dot product), then the best match per new fact
+        similarities = np.array(embeddings, dtype=np.float32) @ existing_embeddings.T
+        max_similarities = similarities.max(axis=1)
+        return [bool(s > similarity_threshold) for s in max_similarities]
 
-        comp_start = time_mod.time()
-        for embedding in embeddings:
-            # Compute cosine similarity with all existing facts
-            emb_array = np.array(embedding)
-            # Cosine similarity = 1 - cosine distance
-            # For normalized vectors: cosine_sim = dot product
-            similarities = np.dot(existing_embeddings, emb_array)
+    async def _find_duplicate_facts_indexed(
+        self,
+        conn,
+        bank_id: str,
+        embeddings: list[list[float]],
+        time_lower: datetime,
+        time_upper: datetime,
+        similarity_threshold: float,
+    ) -> list[bool]:
+        """
+        Index-backed duplicate check: ask the database for each fact's nearest neighbour.
 
-            # Check if any existing fact is too similar
-            max_similarity = np.max(similarities) if len(similarities) > 0 else 0
-            is_duplicate.append(max_similarity > similarity_threshold)
+        One LATERAL probe per new fact returns only the best similarity within the time
+        window, so no existing vectors are transferred. Postgres serves each probe from the
+        HNSW index or from the (bank_id, event_date) range, whichever is cheaper.
 
+        Must run inside a transaction, on pgvector with iterative scans (0.8+).
+        """
+        # An index scan must keep going until it finds a row in this bank and window
+        await conn.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+        rows = await conn.fetch(
+            f"""
+            SELECT q.idx, n.similarity
+            FROM unnest($1::text[]) WITH ORDINALITY AS q(embedding, idx)
+            CROSS JOIN LATERAL (
+                SELECT 1 - (mu.embedding <=> q.embedding::vector) AS similarity
+                FROM {fq_table("memory_units")} mu
+                WHERE mu.bank_id = $2
+                  AND mu.event_date BETWEEN $3 AND $4
+                  AND mu.embedding IS NOT NULL
+                ORDER BY mu.embedding <=> q.embedding::vector
+                LIMIT 1
+            ) n
+            """,
+            [str(e) for e in embeddings],
+            bank_id,
+            time_lower,
+            time_upper,
+        )
+
+        is_duplicate = [False] * len(embeddings)
+        for row in rows:
+            is_duplicate[row["idx"] - 1] = row["similarity"] > similarity_threshold
         return is_duplicate
 
     def retain(
@@ -1310,6 +1493,7 @@ class MemoryEngine(MemoryEngineInterface):
         confidence_score: float | None = None,
         document_tags: list[str] | None = None,
         return_usage: bool = False,
+        update_mode: str = "replace",
     ):
         """
         Store multiple content items as memory units in ONE batch operation.
@@ -1332,6 +1516,11 @@ class MemoryEngine(MemoryEngineInterface):
             fact_type_override: Override fact type for all facts ('world', 'experience', 'opinion')
             confidence_score: Confidence score for opinions (0.0 to 1.0)
             return_usage: If True, returns tuple of (unit_ids, TokenUsage). Default False for backward compatibility.
+            update_mode: How contents with the document_id of a stored document update it:
+                - "replace" (default): delete the document and its memories, then process everything
+                - "incremental": skip the document if its content is unchanged, otherwise process only
+                  added or changed chunks and delete the memories of removed chunks. Only units created
+                  by this call are returned.
 
         Returns:
             If return_usage=False: List of lists of unit IDs (one list per content item)
@@ -1402,6 +1591,9 @@ class MemoryEngine(MemoryEngineInterface):
             logger.info(
                 f"Large batch detected ({total_chars:,} chars from {len(contents)} items). Splitting into sub-batches of ~{CHARS_PER_BATCH:,} chars each..."
             )
+            if update_mode != "replace":
+                # A document can span sub-batches, so no single sub-batch sees its full content to compare
+                logger.info("Incremental update is not supported for split batches, replacing documents instead")
 
             sub_batches = []
             current_batch = []
@@ -1461,6 +1653,7 @@ class MemoryEngine(MemoryEngineInterface):
                 fact_type_override=fact_type_override,
                 confidence_score=confidence_score,
                 document_tags=document_tags,
+                update_mode=update_mode,
             )
 
         # Call post-operation hook if validator is configured
@@ -1496,6 +1689,7 @@ class MemoryEngine(MemoryEngineInterface):
         fact_type_override: str | None = None,
         confidence_score: float | None = None,
         document_tags: list[str] | None = None,
+        update_mode: str = "replace",
     ) -> tuple[list[list[str]], "TokenUsage"]:
         """
         Internal method for batch processing without chunking logic.
@@ -1513,6 +1707,7 @@ class MemoryEngine(MemoryEngineInterface):
             fact_type_override: Override fact type for all facts
             confidence_score: Confidence score for opinions
             document_tags: Tags applied to all items in this batch
+            update_mode: "replace" or "incremental" (see retain_batch_async)
 
         Returns:
             Tuple of (unit ID lists, token usage for fact extraction)
@@ -1537,6 +1732,7 @@ class MemoryEngine(MemoryEngineInterface):
                 fact_type_override=fact_type_override,
                 confidence_score=confidence_score,
                 document_tags=document_tags,
+                update_mode=update_mode,
             )
 
     def recall(
@@ -1814,6 +2010,183 @@ class MemoryEngine(MemoryEngineInterface):
 
         return result
 
+    async def recall_batch_async(
+        self,
+        bank_id: str,
+        queries: list[str],
+        *,
+        budget: Budget | None = None,
+        max_tokens: int = 4096,
+        enable_trace: bool = False,
+        fact_type: list[str] | None = None,
+        question_date: datetime | None = None,
+        include_entities: bool = False,
+        max_entity_tokens: int = 500,
+        include_chunks: bool = False,
+        max_chunk_tokens: int = 8192,
+        request_context: "RequestContext",
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = "any",
+    ) -> list[RecallResultModel]:
+        """
+        Recall memories for several queries against the same bank, sharing retrieval work.
+
+        Each query gets the same result as recall_async, but the batch:
+        - embeds all queries in one encode() call
+        - runs semantic + BM25 for all queries in one SQL round-trip
+        - shares one MPFP edge cache across the queries' graph traversals
+        - scores all (query, candidate) pairs in one cross-encoder call
+
+        Args:
+            bank_id: bank ID to recall for
+            queries: Recall queries
+            (remaining arguments as in recall_async, applied to every query)
+
+        Returns:
+            One RecallResultModel per query, in input order
+        """
+        # Authenticate tenant and set schema in context (for fq_table())
+        await self._authenticate_tenant(request_context)
+
+        if not queries:
+            return []
+
+        # Default to all fact types if not specified
+        if fact_type is None:
+            fact_type = list(VALID_RECALL_FACT_TYPES)
+
+        # Validate fact types early
+        invalid_types = set(fact_type) - VALID_RECALL_FACT_TYPES
+        if invalid_types:
+            raise ValueError(
+                f"Invalid fact type(s): {', '.join(sorted(invalid_types))}. "
+                f"Must be one of: {', '.join(sorted(VALID_RECALL_FACT_TYPES))}"
+            )
+
+        # Filter out 'opinion' - opinions are no longer returned from recall
+        fact_type = [ft for ft in fact_type if ft != "opinion"]
+        if not fact_type:
+            return [RecallResultModel(results=[], entities={}, chunks={}) for _ in queries]
+
+        # Validate every query if validator is configured
+        if self._operation_validator:
+            from hindsight_api.extensions import RecallContext
+
+            for query in queries:
+                ctx = RecallContext(
+                    bank_id=bank_id,
+                    query=query,
+                    request_context=request_context,
+                    budget=budget,
+                    max_tokens=max_tokens,
+                    enable_trace=enable_trace,
+                    fact_types=list(fact_type),
+                    question_date=question_date,
+                    include_entities=include_entities,
+                    max_entity_tokens=max_entity_tokens,
+                    include_chunks=include_chunks,
+                    max_chunk_tokens=max_chunk_tokens,
+                )
+                await self._validate_operation(self._operation_validator.validate_recall(ctx))
+
+        # Map budget enum to thinking_budget number (default to MID if None)
+        budget_mapping = {Budget.LOW: 100, Budget.MID: 300, Budget.HIGH: 1000}
+        effective_budget = budget if budget is not None else Budget.MID
+        thinking_budget = budget_mapping[effective_budget]
+
+        logger.info(f"[RECALL {bank_id[:8]}] Starting batch recall for {len(queries)} queries")
+
+        from .search.mpfp_retrieval import EdgeCache
+        from .search.reranking import RerankBatch
+        from .search.retrieval import retrieve_semantic_bm25_batch, should_use_ann
+
+        # The batch counts as one recall against the backpressure limit: its shared
+        # queries replace the per-recall ones rather than adding to them
+        semaphore_wait_start = time.time()
+        async with self._search_semaphore:
+            semaphore_wait = time.time() - semaphore_wait_start
+
+            # One encode() for every query
+            query_embeddings = await embedding_utils.generate_query_embeddings(self._query_embeddings, queries)
+
+            # One round-trip for semantic + BM25 of every query
+            pool = await self._get_pool()
+            async with acquire_with_retry(pool) as conn:
+                use_ann = await should_use_ann(conn, bank_id, fact_type)
+                semantic_bm25_by_query = await retrieve_semantic_bm25_batch(
+                    conn,
+                    [str(embedding) for embedding in query_embeddings],
+                    queries,
+                    bank_id,
+                    fact_type,
+                    thinking_budget,
+                    tags=tags,
+                    tags_match=tags_match,
+                    use_ann=use_ann,
+                )
+
+            edge_cache = EdgeCache()
+            rerank_batch = RerankBatch(self._cross_encoder_reranker, participants=len(queries))
+
+            async def recall_one(index: int) -> RecallResultModel:
+                async with rerank_batch.participant() as reranker:
+                    return await self._search_with_retries(
+                        bank_id,
+                        queries[index],
+                        fact_type,
+                        thinking_budget,
+                        max_tokens,
+                        enable_trace,
+                        question_date,
+                        include_entities,
+                        max_entity_tokens,
+                        include_chunks,
+                        max_chunk_tokens,
+                        request_context,
+                        semaphore_wait=semaphore_wait,
+                        tags=tags,
+                        tags_match=tags_match,
+                        query_embedding=query_embeddings[index],
+                        semantic_bm25_results=semantic_bm25_by_query[index],
+                        edge_cache=edge_cache,
+                        reranker=reranker,
+                    )
+
+            outcomes = await asyncio.gather(*(recall_one(i) for i in range(len(queries))), return_exceptions=True)
+
+        # Call post-operation hooks per query
+        if self._operation_validator:
+            from hindsight_api.extensions.operation_validator import RecallResult
+
+            for query, outcome in zip(queries, outcomes):
+                failed = isinstance(outcome, BaseException)
+                result_ctx = RecallResult(
+                    bank_id=bank_id,
+                    query=query,
+                    request_context=request_context,
+                    budget=budget,
+                    max_tokens=max_tokens,
+                    enable_trace=enable_trace,
+                    fact_types=list(fact_type),
+                    question_date=question_date,
+                    include_entities=include_entities,
+                    max_entity_tokens=max_entity_tokens,
+                    include_chunks=include_chunks,
+                    max_chunk_tokens=max_chunk_tokens,
+                    result=None if failed else outcome,
+                    success=not failed,
+                    error=str(outcome) if failed else None,
+                )
+                try:
+                    await self._operation_validator.on_recall_complete(result_ctx)
+                except Exception as e:
+                    logger.warning(f"Post-recall hook error (non-fatal): {e}")
+
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return list(outcomes)
+
     async def _search_with_retries(
         self,
         bank_id: str,
@@ -1832,6 +2205,10 @@ class MemoryEngine(MemoryEngineInterface):
         tags: list[str] | None = None,
         tags_match: TagsMatch = "any",
         connection_budget: int | None = None,
+        query_embedding: list[float] | None = None,
+        semantic_bm25_results: dict | None = None,
+        edge_cache=None,
+        reranker=None,
     ) -> RecallResultModel:
         """
         Search implementation with modular retrieval and reranking.
@@ -1854,6 +2231,10 @@ class MemoryEngine(MemoryEngineInterface):
             max_entity_tokens: Maximum tokens for entity observations
             include_chunks: Whether to include raw chunks
             max_chunk_tokens: Maximum tokens for chunks
+            query_embedding: Pre-computed query embedding (batch recall)
+            semantic_bm25_results: Pre-computed semantic + BM25 results (batch recall)
+            edge_cache: MPFP edge cache shared across a batch of recalls on the same bank
+            reranker: Cross-encoder reranker to use instead of the engine's (batch recall)
 
         Returns:
             RecallResultModel with results, trace, optional entities, and optional chunks
@@ -1881,7 +2262,8 @@ class MemoryEngine(MemoryEngineInterface):
         try:
             # Step 1: Generate query embedding (for semantic search)
             step_start = time.time()
-            query_embedding = embedding_utils.generate_embedding(self.embeddings, query)
+            if query_embedding is None:
+                query_embedding = await embedding_utils.generate_query_embedding(self._query_embeddings, query)
             step_duration = time.time() - step_start
             log_buffer.append(f"  [1] Generate query embedding: {step_duration:.3f}s")
 
@@ -1926,6 +2308,10 @@ class MemoryEngine(MemoryEngineInterface):
                     self.query_analyzer,
                     tags=tags,
                     tags_match=tags_match,
+                    semantic_bm25_results=semantic_bm25_results,
+                    edge_cache=edge_cache,
+                    adaptive=config.recall_adaptive,
+                    max_tokens=max_tokens,
                 )
                 parallel_duration = time.time() - parallel_start
 
@@ -2001,6 +2387,13 @@ class MemoryEngine(MemoryEngineInterface):
             log_buffer.append(
                 f"  [2] Parallel retrieval ({len(fact_type)} fact_types): {', '.join(timing_parts)} in {parallel_duration:.3f}s{temporal_info}"
             )
+            adaptive_decision = multi_result.adaptive
+            if adaptive_decision:
+                log_buffer.append(
+                    f"      [ADAPTIVE] {adaptive_decision.reason}: target={adaptive_decision.target_results}, "
+                    f"graph_budget={adaptive_decision.graph_budget}, "
+                    f"temporal_budget={adaptive_decision.temporal_budget}"
+                )
 
             # Log graph retriever timing breakdown if available
             if all_mpfp_timings:
@@ -2008,6 +2401,7 @@ class MemoryEngine(MemoryEngineInterface):
                 mpfp_total = all_mpfp_timings[0]  # Take first fact type's timing as representative
                 mpfp_parts = [
                     f"db_queries={mpfp_total.db_queries}",
+                    f"cache_hits={mpfp_total.cache_hits}",
                     f"edge_load={mpfp_total.edge_load_time:.3f}s",
                     f"edges={mpfp_total.edge_count}",
                     f"patterns={mpfp_total.pattern_count}",
@@ -2029,6 +2423,9 @@ class MemoryEngine(MemoryEngineInterface):
                             f"edges={hd.get('edges_loaded', 0)}"
                         )
 
+            if tracer and adaptive_decision:
+                tracer.record_adaptive_decision(adaptive_decision.to_dict())
+
             # Record temporal constraint in tracer if detected
             if tracer and detected_temporal_constraint:
                 start_dt, end_dt = detected_temporal_constraint
@@ -2067,19 +2464,26 @@ class MemoryEngine(MemoryEngineInterface):
                     )
 
                     # Add graph retrieval results for this fact type
+                    graph_metadata = {
+                        "budget": adaptive_decision.graph_budget if adaptive_decision else thinking_budget
+                    }
+                    if adaptive_decision and adaptive_decision.graph_budget == 0:
+                        graph_metadata["skipped"] = adaptive_decision.reason
                     tracer.add_retrieval_results(
                         method_name="graph",
                         results=to_tuple_format(rr.graph),
                         duration_seconds=rr.timings.get("graph", 0.0),
                         score_field="activation",
-                        metadata={"budget": thinking_budget},
+                        metadata=graph_metadata,
                         fact_type=ft_name,
                     )
 
                     # Add temporal retrieval results for this fact type
                     # Show temporal even with 0 results if constraint was detected
                     if rr.temporal is not None or rr.temporal_constraint is not None:
-                        temporal_metadata = {"budget": thinking_budget}
+                        temporal_metadata = {
+                            "budget": adaptive_decision.temporal_budget if adaptive_decision else thinking_budget
+                        }
                         if rr.temporal_constraint:
                             start_dt, end_dt = rr.temporal_constraint
                             temporal_metadata["constraint"] = {
@@ -2136,7 +2540,7 @@ class MemoryEngine(MemoryEngineInterface):
 
             # Step 4: Rerank using cross-encoder (MergedCandidate -> ScoredResult)
             step_start = time.time()
-            reranker_instance = self._cross_encoder_reranker
+            reranker_instance = reranker or self._cross_encoder_reranker
 
             # Ensure reranker is initialized (for lazy initialization mode)
             await reranker_instance.ensure_initialized()
@@ -2234,13 +2638,7 @@ class MemoryEngine(MemoryEngineInterface):
             # Step 6: Token budget filtering
             step_start = time.time()
 
-            # Convert to dict for token filtering (backward compatibility)
-            top_dicts = [sr.to_dict() for sr in top_scored]
-            filtered_dicts, total_tokens = self._filter_by_token_budget(top_dicts, max_tokens)
-
-            # Convert back to list of IDs and filter scored_results
-            filtered_ids = {d["id"] for d in filtered_dicts}
-            top_scored = [sr for sr in top_scored if sr.id in filtered_ids]
+            top_scored, total_tokens = self._filter_by_token_budget(top_scored, max_tokens)
 
             step_duration = time.time() - step_start
             log_buffer.append(
@@ -2401,7 +2799,7 @@ class MemoryEngine(MemoryEngineInterface):
                     async with acquire_with_retry(pool) as conn:
                         chunks_rows = await conn.fetch(
                             f"""
-                            SELECT chunk_id, chunk_text, chunk_index
+                            SELECT chunk_id, chunk_text, chunk_index, chunk_tokens
                             FROM {fq_table("chunks")}
                             WHERE chunk_id = ANY($1::text[])
                             """,
@@ -2413,7 +2811,7 @@ class MemoryEngine(MemoryEngineInterface):
 
                     # Apply token limit and build chunks_dict in the order of chunk_ids_ordered
                     chunks_dict = {}
-                    encoding = _get_tiktoken_encoding()
+                    encoding = get_tiktoken_encoding()
 
                     for chunk_id in chunk_ids_ordered:
                         if chunk_id not in chunks_lookup:
@@ -2421,7 +2819,10 @@ class MemoryEngine(MemoryEngineInterface):
 
                         row = chunks_lookup[chunk_id]
                         chunk_text = row["chunk_text"]
-                        chunk_tokens = len(encoding.encode(chunk_text))
+                        chunk_tokens = row["chunk_tokens"]
+                        if chunk_tokens is None:
+                            # Chunk stored before token counts were persisted
+                            chunk_tokens = count_tokens([chunk_text])[0]
 
                         # Check if adding this chunk would exceed the limit
                         if total_chunk_tokens + chunk_tokens > max_chunk_tokens:
@@ -2429,7 +2830,8 @@ class MemoryEngine(MemoryEngineInterface):
                             remaining_tokens = max_chunk_tokens - total_chunk_tokens
                             if remaining_tokens > 0:
                                 # Truncate to remaining tokens
-                                truncated_text = encoding.decode(encoding.encode(chunk_text)[:remaining_tokens])
+                                truncated_tokens = encoding.encode_ordinary(chunk_text)[:remaining_tokens]
+                                truncated_text = encoding.decode(truncated_tokens)
                                 chunks_dict[chunk_id] = ChunkInfo(
                                     chunk_text=truncated_text, chunk_index=row["chunk_index"], truncated=True
                                 )
@@ -2471,30 +2873,31 @@ class MemoryEngine(MemoryEngineInterface):
             logger.error("\n" + "\n".join(log_buffer))
             raise Exception(f"Failed to search memories: {str(e)}")
 
-    def _filter_by_token_budget(
-        self, results: list[dict[str, Any]], max_tokens: int
-    ) -> tuple[list[dict[str, Any]], int]:
+    def _filter_by_token_budget(self, results: list[ScoredResult], max_tokens: int) -> tuple[list[ScoredResult], int]:
         """
         Filter results to fit within token budget.
 
-        Counts tokens only for the 'text' field using tiktoken (cl100k_base encoding).
+        Uses the token count of each fact's text stored at retain time (tiktoken cl100k_base),
+        counting only facts that predate the stored counts.
         Stops before including a fact that would exceed the budget.
 
         Args:
-            results: List of search results
+            results: Scored results in rank order
             max_tokens: Maximum tokens allowed
 
         Returns:
             Tuple of (filtered_results, total_tokens_used)
         """
-        encoding = _get_tiktoken_encoding()
+        missing = [sr.retrieval.text for sr in results if sr.retrieval.text_tokens is None]
+        counted = iter(count_tokens(missing))
 
         filtered_results = []
         total_tokens = 0
 
         for result in results:
-            text = result.get("text", "")
-            text_tokens = len(encoding.encode(text))
+            text_tokens = result.retrieval.text_tokens
+            if text_tokens is None:
+                text_tokens = next(counted)
 
             # Check if adding this result would exceed budget
             if total_tokens + text_tokens <= max_tokens:
@@ -2593,6 +2996,7 @@ class MemoryEngine(MemoryEngineInterface):
                 # Invalidate deleted fact IDs from mental models
                 if deleted and unit_ids:
                     await self._invalidate_facts_from_mental_models(conn, bank_id, unit_ids)
+                    await notify_links_changed(conn, get_current_schema(), bank_id)
 
                 return {"document_deleted": 1 if deleted else 0, "memory_units_deleted": units_count if deleted else 0}
 
@@ -2632,6 +3036,7 @@ class MemoryEngine(MemoryEngineInterface):
                 # Invalidate deleted fact ID from mental models
                 if deleted and bank_id:
                     await self._invalidate_facts_from_mental_models(conn, bank_id, [str(deleted)])
+                    await notify_links_changed(conn, get_current_schema(), bank_id)
 
                 return {
                     "success": deleted is not None,
@@ -2686,6 +3091,7 @@ class MemoryEngine(MemoryEngineInterface):
                             bank_id,
                             fact_type,
                         )
+                        await notify_links_changed(conn, get_current_schema(), bank_id)
 
                         # Note: We don't delete entities when fact_type is specified,
                         # as they may be referenced by other memory units
@@ -2714,6 +3120,11 @@ class MemoryEngine(MemoryEngineInterface):
                         # Delete the bank profile itself
                         await conn.execute(f"DELETE FROM {fq_table('banks')} WHERE bank_id = $1", bank_id)
 
+                        # Drop the bank from every process's entity and edge caches once this commits
+                        await notify_entities_changed(conn, get_current_schema(), bank_id)
+                        await notify_links_changed(conn, get_current_schema(), bank_id)
+                        self._entity_cache.invalidate(bank_id)
+
                         return {
                             "memory_units_deleted": units_count,
                             "entities_deleted": entities_count,
@@ -5360,6 +5771,7 @@ class MemoryEngine(MemoryEngineInterface):
         *,
         request_context: "RequestContext",
         document_tags: list[str] | None = None,
+        update_mode: str = "replace",
     ) -> dict[str, Any]:
         """Submit a batch retain operation to run asynchronously."""
         await self._authenticate_tenant(request_context)
@@ -5391,6 +5803,8 @@ class MemoryEngine(MemoryEngineInterface):
         }
         if document_tags:
             task_payload["document_tags"] = document_tags
+        if update_mode != "replace":
+            task_payload["update_mode"] = update_mode
 
         await self._task_backend.submit_task(task_payload)
 
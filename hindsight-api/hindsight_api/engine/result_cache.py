@@ -0,0 +1,150 @@
+"""
+Two-tier cache for model results (query embeddings, reranker scores).
+
+Values are kept in a bounded in-process LRU with a TTL. An optional Redis backend lets
+several API replicas reuse each other's results; it is consulted only on local misses.
+After a Redis error the shared tier is bypassed for SHARED_CACHE_BACKOFF_SECONDS, so an
+outage doesn't add a socket timeout to every miss.
+
+Shared-tier calls block on the network: async callers run them in a worker thread.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Seconds the shared cache is bypassed after a Redis error
+SHARED_CACHE_BACKOFF_SECONDS = 30.0
+
+V = TypeVar("V")
+
+
+class ResultCache(Generic[V]):
+    """In-process LRU with a TTL, backed by an optional Redis cache shared across processes."""
+
+    def __init__(
+        self,
+        name: str,
+        serialize: Callable[[V], bytes | str],
+        deserialize: Callable[[bytes], V],
+        max_entries: int,
+        ttl_seconds: int = 3600,
+        shared_url: str | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            name: Cache name, used for metrics (record_cache_access) and logs
+            serialize: Converts a value to what is stored in Redis
+            deserialize: Converts a value read from Redis back
+            max_entries: Maximum number of values kept in process
+            ttl_seconds: Seconds before a cached value expires (0 = never)
+            shared_url: Optional Redis URL for a cache shared across processes
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.shared_url = shared_url
+        self._serialize = serialize
+        self._deserialize = deserialize
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        # Callers run in executor and worker threads, so guard the LRU
+        self._lock = threading.Lock()
+        self._shared = None
+        self._shared_failed = False
+        # Monotonic time until which the shared cache is bypassed after an error
+        self._shared_disabled_until = 0.0
+
+    def get(self, key: str) -> V | None:
+        """Return the in-process cached value for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return value
+
+    def get_many(self, keys: list[str]) -> dict[str, V]:
+        """Return the in-process cached values of the keys that have one."""
+        found = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def _put_local(self, key: str, value: V) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _get_shared(self):
+        """Lazily connect to the shared cache. Failures disable it instead of failing the caller."""
+        if not self.shared_url or self._shared_failed or time.monotonic() < self._shared_disabled_until:
+            return None
+        if self._shared is None:
+            try:
+                import redis
+            except ImportError:
+                logger.warning(f"redis is required for a shared {self.name} cache. Install it with: pip install redis")
+                self._shared_failed = True
+                return None
+            self._shared = redis.Redis.from_url(self.shared_url, socket_timeout=0.5)
+        return self._shared
+
+    def _shared_error(self, action: str, error: Exception) -> None:
+        self._shared_disabled_until = time.monotonic() + SHARED_CACHE_BACKOFF_SECONDS
+        logger.warning(
+            f"Shared {self.name} cache {action} failed, bypassing it for {SHARED_CACHE_BACKOFF_SECONDS:.0f}s: {error}"
+        )
+
+    def get_shared_many(self, keys: list[str]) -> dict[str, V]:
+        """Look keys up in the shared cache (blocking); hits are also cached in process."""
+        client = self._get_shared()
+        if client is None or not keys:
+            return {}
+        try:
+            raw_values = client.mget(keys)
+        except Exception as e:
+            self._shared_error("lookup", e)
+            return {}
+        found = {}
+        for key, raw in zip(keys, raw_values):
+            if raw is not None:
+                found[key] = self._deserialize(raw)
+                self._put_local(key, found[key])
+        return found
+
+    def put_many(self, items: dict[str, V]) -> None:
+        """Cache values in process and in the shared cache (blocking when one is configured)."""
+        for key, value in items.items():
+            self._put_local(key, value)
+        client = self._get_shared()
+        if client is None or not items:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, self._serialize(value), ex=self.ttl_seconds or None)
+            pipe.execute()
+        except Exception as e:
+            self._shared_error("write", e)
+
+    def record(self, hits: int = 0, misses: int = 0) -> None:
+        """Record cache hits and misses (hindsight.cache.requests.total)."""
+        from ..metrics import get_metrics_collector
+
+        get_metrics_collector().record_cache_access(self.name, hits=hits, misses=misses)
@@ -7,12 +7,16 @@ Handles storage of document chunks in the database.
 import logging
 
 from ..memory_engine import fq_table
+from ..tokens import count_tokens
+from .incremental import content_hash
 from .types import ChunkMetadata
 
 logger = logging.getLogger(__name__)
 
 
-async def store_chunks_batch(conn, bank_id: str, document_id: str, chunks: list[ChunkMetadata]) -> dict[int, str]:
+async def store_chunks_batch(
+    conn, bank_id: str, document_id: str, chunks: list[ChunkMetadata], kept_chunk_ids: dict[int, str] | None = None
+) -> dict[int, str]:
     """
     Store document chunks in the database.
 
@@ -21,6 +25,8 @@ async def store_chunks_batch(conn, bank_id: str, document_id: str, chunks: list[
         bank_id: Bank identifier
         document_id: Document identifier
         chunks: List of ChunkMetadata objects
+        kept_chunk_ids: Chunk index -> ID of an already stored chunk with the same content
+            (incremental retain). Those chunks are moved to their new index instead of inserted.
 
     Returns:
         Dictionary mapping global chunk index to chunk_id
@@ -28,30 +34,70 @@ async def store_chunks_batch(conn, bank_id: str, document_id: str, chunks: list[
     if not chunks:
         return {}
 
+    kept_chunk_ids = kept_chunk_ids or {}
+    taken_ids = {kept_chunk_ids[chunk.chunk_index] for chunk in chunks if chunk.chunk_index in kept_chunk_ids}
+
     # Prepare chunk data for batch insert
     chunk_ids = []
     chunk_texts = []
     chunk_indices = []
     chunk_id_map = {}
+    moved_ids = []
+    moved_indices = []
 
     for chunk in chunks:
+        kept_id = kept_chunk_ids.get(chunk.chunk_index)
+        if kept_id is not None:
+            moved_ids.append(kept_id)
+            moved_indices.append(chunk.chunk_index)
+            chunk_id_map[chunk.chunk_index] = kept_id
+            continue
         chunk_id = f"{bank_id}_{document_id}_{chunk.chunk_index}"
+        # A kept chunk may still carry the ID it got at an earlier position
+        suffix = 0
+        while chunk_id in taken_ids:
+            suffix += 1
+            chunk_id = f"{bank_id}_{document_id}_{chunk.chunk_index}_{suffix}"
+        taken_ids.add(chunk_id)
         chunk_ids.append(chunk_id)
         chunk_texts.append(chunk.chunk_text)
         chunk_indices.append(chunk.chunk_index)
         chunk_id_map[chunk.chunk_index] = chunk_id
 
-    # Batch insert all chunks
+    if moved_ids:
+        moved = await conn.fetchval(
+            f"""
+            WITH moved AS (
+                UPDATE {fq_table("chunks")} AS c
+                SET chunk_index = m.chunk_index
+                FROM unnest($1::text[], $2::integer[]) AS m(chunk_id, chunk_index)
+                WHERE c.chunk_id = m.chunk_id
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM moved
+            """,
+            moved_ids,
+            moved_indices,
+        )
+        if moved != len(moved_ids):
+            raise RuntimeError(f"Document {document_id} changed during incremental retain, retry the request")
+
+    if not chunk_ids:
+        return chunk_id_map
+
+    # Batch insert all chunks, with token counts so recall never has to re-encode them
     await conn.execute(
         f"""
-        INSERT INTO {fq_table("chunks")} (chunk_id, document_id, bank_id, chunk_text, chunk_index)
-        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::integer[])
+        INSERT INTO {fq_table("chunks")} (chunk_id, document_id, bank_id, chunk_text, chunk_index, chunk_tokens, content_hash)
+        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::integer[], $6::integer[], $7::text[])
         """,
         chunk_ids,
         [document_id] * len(chunk_texts),
         [bank_id] * len(chunk_texts),
         chunk_texts,
         chunk_indices,
+        count_tokens(chunk_texts),
+        [content_hash(text) for text in chunk_texts],
     )
 
     return chunk_id_map
@@ -4,6 +4,9 @@ Embedding generation utilities for memory units.
 
 import asyncio
 import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +33,8 @@ async def generate_embeddings_batch(embeddings_backend, texts: list[str]) -> lis
     """
     Generate embeddings for multiple texts using the provided embeddings backend.
 
-    Runs the embedding generation in a thread pool to avoid blocking the event loop
-    for CPU-bound operations.
+    Texts go through the backend's EmbeddingScheduler, which batches them with the texts
+    of concurrent retains and runs encode() off the event loop.
 
     Args:
         embeddings_backend: Embeddings instance to use for encoding
@@ -41,13 +44,242 @@ async def generate_embeddings_batch(embeddings_backend, texts: list[str]) -> lis
         List of embeddings in same order as input texts
     """
     try:
-        # Run embeddings in thread pool to avoid blocking event loop
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None,  # Use default thread pool
-            embeddings_backend.encode,
-            texts,
-        )
-        return embeddings
+        return await get_embedding_scheduler(embeddings_backend).embed_many(texts, backend=embeddings_backend)
     except Exception as e:
         raise Exception(f"Failed to generate batch embeddings: {str(e)}")
+
+
+@dataclass
+class _EmbeddingRequest:
+    """One caller's texts, completed once every text has its vector."""
+
+    future: asyncio.Future
+    vectors: list
+    remaining: int
+
+
+# Pending text: (text, backend whose encode() embeds it, request, index in the request)
+_PendingText = tuple[str, object, _EmbeddingRequest, int]
+
+# Retain batches are picked by length among this many batches' worth of the oldest texts
+_BUCKET_WINDOW = 8
+
+
+class EmbeddingScheduler:
+    """
+    Process-wide scheduler for encode() calls against one embedding model.
+
+    Concurrent callers (recall queries, retain batches) enqueue texts and await a future.
+    A batch is dispatched as soon as it is full, or once its first text has waited
+    window_ms. Batches run on a dedicated executor, and at most max_workers of them are in
+    flight. Texts beyond that wait in the scheduler rather than in the executor, so query
+    texts queued behind a large retain are still dispatched first.
+
+    Retain batches are cut from texts of similar length (see _take_batch), so a model
+    that pads each batch to its longest text wastes less work on padding.
+    """
+
+    def __init__(
+        self,
+        embeddings_backend,
+        window_ms: int = 2,
+        max_batch_size: int = 32,
+        bulk_batch_size: int = 64,
+        max_workers: int = 1,
+    ):
+        self._backend = embeddings_backend
+        self._window = max(window_ms, 0) / 1000.0
+        self._max_batch_size = max(max_batch_size, 1)
+        self._bulk_batch_size = max(bulk_batch_size, 1)
+        self._max_workers = max(max_workers, 1)
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="embed")
+        self._queries: list[_PendingText] = []
+        self._bulk: list[_PendingText] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Strong references to in-flight batch tasks (the loop only keeps weak ones)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def embed(self, text: str, backend=None) -> list[float]:
+        """Embed a single query, sharing the encode() call with concurrent callers."""
+        return (await self.embed_many([text], backend=backend, interactive=True))[0]
+
+    async def embed_many(self, texts: list[str], backend=None, interactive: bool = False) -> list[list[float]]:
+        """
+        Embed texts, batched with the texts of concurrent callers.
+
+        Args:
+            texts: Texts to embed
+            backend: Embeddings instance whose encode() is used (defaults to the scheduler's).
+                Texts are only batched with texts for the same backend.
+            interactive: Dispatch ahead of non-interactive texts (recall queries)
+
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures are bound to their loop; start fresh if we moved to a new one
+            self._loop = loop
+            self._queries = []
+            self._bulk = []
+            self._flush_handle = None
+            self._tasks = set()
+
+        request = _EmbeddingRequest(future=loop.create_future(), vectors=[None] * len(texts), remaining=len(texts))
+        queue = self._queries if interactive else self._bulk
+        backend = backend if backend is not None else self._backend
+        queue.extend((text, backend, request, i) for i, text in enumerate(texts))
+
+        if len(self._queries) >= self._max_batch_size or len(self._bulk) >= self._bulk_batch_size:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._dispatch)
+
+        return await request.future
+
+    def _dispatch(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while len(self._tasks) < self._max_workers:
+            batch = self._take_batch()
+            if not batch:
+                return
+            task = asyncio.ensure_future(self._encode_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # Whatever queued up meanwhile has already waited for a whole encode() call
+        if self._queries or self._bulk:
+            self._dispatch()
+
+    def _take_batch(self) -> list[_PendingText]:
+        """Remove and return the next batch: queries first, then retain texts bucketed by length."""
+        lanes = ((self._queries, self._max_batch_size, False), (self._bulk, self._bulk_batch_size, True))
+        for queue, size, bucket in lanes:
+            # Drop texts whose caller is gone (cancelled, or failed in an earlier batch)
+            queue[:] = [item for item in queue if not item[2].future.done()]
+            if not queue:
+                continue
+            backend = queue[0][1]
+            window = size * _BUCKET_WINDOW if bucket else size
+            candidates = [i for i, item in enumerate(queue[:window]) if item[1] is backend]
+            if bucket and len(candidates) > size:
+                # Batch the texts closest in length to the oldest one, which is always included
+                lengths = {i: len(queue[i][0]) for i in candidates}
+                by_length = sorted(candidates, key=lengths.__getitem__)
+                oldest = by_length.index(0)
+                starts = range(max(oldest - size + 1, 0), min(oldest, len(by_length) - size) + 1)
+                start = min(starts, key=lambda k: lengths[by_length[k + size - 1]] - lengths[by_length[k]])
+                candidates = by_length[start : start + size]
+            else:
+                candidates = candidates[:size]
+            chosen = set(candidates)
+            batch = [queue[i] for i in candidates]
+            queue[:] = [item for i, item in enumerate(queue) if i not in chosen]
+            return batch
+        return []
+
+    async def _encode_batch(self, batch: list[_PendingText]) -> None:
+        texts = [text for text, _, _, _ in batch]
+        backend = batch[0][1]
+        try:
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(self._executor, backend.encode, texts)
+        except Exception as e:
+            for _, _, request, _ in batch:
+                if not request.future.done():
+                    request.future.set_exception(Exception(f"Failed to generate embedding: {str(e)}"))
+            return
+
+        requests = {id(request) for _, _, request, _ in batch}
+        if len(requests) > 1:
+            logger.debug(f"Batched {len(texts)} embeddings from {len(requests)} callers into one encode() call")
+        for (_, _, request, index), vector in zip(batch, vectors):
+            request.vectors[index] = vector
+            request.remaining -= 1
+            if request.remaining == 0 and not request.future.done():
+                request.future.set_result(request.vectors)
+
+
+# One scheduler per embedding model
+_schedulers: "weakref.WeakKeyDictionary[object, EmbeddingScheduler]" = weakref.WeakKeyDictionary()
+
+
+def get_embedding_scheduler(embeddings_backend) -> EmbeddingScheduler:
+    """
+    Get (or create) the embedding scheduler for an embeddings backend.
+
+    Wrappers such as the query embedding cache share the scheduler of the model they wrap,
+    so recall and retain compete for the same executor instead of separate ones.
+    """
+    from ..embeddings import CachedEmbeddings
+
+    model = embeddings_backend
+    while isinstance(model, CachedEmbeddings):
+        model = model.inner
+
+    scheduler = _schedulers.get(model)
+    if scheduler is None:
+        from ...config import get_config
+
+        config = get_config()
+        scheduler = EmbeddingScheduler(
+            model,
+            window_ms=config.embeddings_query_batch_window_ms,
+            max_batch_size=config.embeddings_query_batch_size,
+            bulk_batch_size=config.embeddings_batch_size,
+            max_workers=config.embeddings_workers,
+        )
+        _schedulers[model] = scheduler
+    return scheduler
+
+
+async def generate_query_embedding(embeddings_backend, text: str) -> list[float]:
+    """
+    Generate embedding for a single query without blocking the event loop.
+
+    Concurrent calls against the same backend are micro-batched into one encode() call
+    (see EmbeddingScheduler).
+
+    Args:
+        embeddings_backend: Embeddings instance to use for encoding
+        text: Query text to embed
+
+    Returns:
+        Embedding vector (dimension depends on embeddings backend)
+    """
+    # Cache hits are served without an executor hop (see CachedEmbeddings)
+    get_cached = getattr(embeddings_backend, "get_cached", None)
+    if get_cached is not None:
+        cached = get_cached(text)
+        if cached is not None:
+            return cached
+    return await get_embedding_scheduler(embeddings_backend).embed(text, backend=embeddings_backend)
+
+
+async def generate_query_embeddings(embeddings_backend, texts: list[str]) -> list[list[float]]:
+    """
+    Generate embeddings for several queries.
+
+    The queries are dispatched together through the backend's EmbeddingScheduler, ahead of
+    retain texts, rather than competing with other callers for the model.
+
+    Args:
+        embeddings_backend: Embeddings instance to use for encoding
+        texts: Query texts to embed
+
+    Returns:
+        Embedding vectors in the same order as texts
+    """
+    try:
+        return await get_embedding_scheduler(embeddings_backend).embed_many(
+            texts, backend=embeddings_backend, interactive=True
+        )
+    except Exception as e:
+        raise Exception(f"Failed to generate query embeddings: {str(e)}")
@@ -57,27 +57,7 @@ async def process_entities_batch(
     fact_dates = [fact.occurred_start if fact.occurred_start is not None else fact.mentioned_at for fact in facts]
 
     # Convert EntityRef objects to dict format and merge with user-provided entities
-    entities_per_fact = []
-    for fact in facts:
-        # Start with LLM-extracted entities
-        llm_entities = [{"text": entity.name, "type": "CONCEPT"} for entity in (fact.entities or [])]
-
-        # Get user entities for this content (use content_index from fact)
-        user_entities = user_entities_per_content.get(fact.content_index, [])
-
-        # Merge with case-insensitive deduplication
-        seen_texts = {e["text"].lower() for e in llm_entities}
-        for user_entity in user_entities:
-            if user_entity["text"].lower() not in seen_texts:
-                llm_entities.append(
-                    {
-                        "text": user_entity["text"],
-                        "type": user_entity.get("type", "CONCEPT"),
-                    }
-                )
-                seen_texts.add(user_entity["text"].lower())
-
-        entities_per_fact.append(llm_entities)
+    entities_per_fact = [merge_entities(fact, user_entities_per_content) for fact in facts]
 
     # Use existing link_utils function for entity processing
     entity_links = await link_utils.extract_entities_batch_optimized(
@@ -95,6 +75,30 @@ async def process_entities_batch(
     return entity_links
 
 
+def merge_entities(fact: ProcessedFact, user_entities_per_content: dict[int, list[dict]]) -> list[dict]:
+    """
+    Merge a fact's LLM-extracted entities with the user-provided entities of its content.
+
+    Args:
+        fact: ProcessedFact whose content_index selects the user entities
+        user_entities_per_content: Dict mapping content_index to list of user-provided entities
+
+    Returns:
+        List of {"text", "type"} dicts, deduplicated case-insensitively
+    """
+    # Start with LLM-extracted entities
+    entities = [{"text": entity.name, "type": "CONCEPT"} for entity in (fact.entities or [])]
+
+    # Merge with case-insensitive deduplication
+    seen_texts = {e["text"].lower() for e in entities}
+    for user_entity in user_entities_per_content.get(fact.content_index, []):
+        if user_entity["text"].lower() not in seen_texts:
+            entities.append({"text": user_entity["text"], "type": user_entity.get("type", "CONCEPT")})
+            seen_texts.add(user_entity["text"].lower())
+
+    return entities
+
+
 async def insert_entity_links_batch(conn, entity_links: list[EntityLink]) -> None:
     """
     Insert entity links in batch.
@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Literal
 
@@ -1095,6 +1096,8 @@ async def extract_facts_from_text(
     agent_name: str,
     context: str = "",
     extract_opinions: bool = False,
+    chunks: list[str] | None = None,
+    skip_chunks: set[int] | None = None,
 ) -> tuple[list[Fact], list[tuple[str, int]], TokenUsage]:
     """
     Extract semantic facts from conversational or narrative text using LLM.
@@ -1112,6 +1115,8 @@ async def extract_facts_from_text(
         llm_config: LLM configuration to use
         agent_name: Agent name (memory owner)
         extract_opinions: If True, extract ONLY opinions. If False, extract world and bank facts (no opinions)
+        chunks: Pre-computed chunking of text (defaults to chunk_text)
+        skip_chunks: Indices of chunks whose facts are already stored; they are reported with 0 facts
 
     Returns:
         Tuple of (facts, chunks, usage) where:
@@ -1120,7 +1125,9 @@ async def extract_facts_from_text(
         - usage: Aggregated token usage across all LLM calls
     """
     config = get_config()
-    chunks = chunk_text(text, max_chars=config.retain_chunk_size)
+    if chunks is None:
+        chunks = chunk_text(text, max_chars=config.retain_chunk_size)
+    skip_chunks = skip_chunks or set()
 
     # Log chunk count before starting LLM requests
     total_chars = sum(len(c) for c in chunks)
@@ -1142,8 +1149,10 @@ async def extract_facts_from_text(
             extract_opinions=extract_opinions,
         )
         for i, chunk in enumerate(chunks)
+        if i not in skip_chunks
     ]
-    chunk_results = await asyncio.gather(*tasks)
+    extracted = iter(await asyncio.gather(*tasks))
+    chunk_results = [([], TokenUsage()) if i in skip_chunks else next(extracted) for i in range(len(chunks))]
     all_facts = []
     chunk_metadata = []  # [(chunk_text, fact_count), ...]
     total_usage = TokenUsage()
@@ -1171,7 +1180,12 @@ SECONDS_PER_FACT = 10
 
 
 async def extract_facts_from_contents(
-    contents: list[RetainContent], llm_config, agent_name: str, extract_opinions: bool = False
+    contents: list[RetainContent],
+    llm_config,
+    agent_name: str,
+    extract_opinions: bool = False,
+    content_chunks: list[list[str]] | None = None,
+    reused_chunks: set[int] | None = None,
 ) -> tuple[list[ExtractedFactType], list[ChunkMetadata], TokenUsage]:
     """
     Extract facts from multiple content items in parallel.
@@ -1187,6 +1201,8 @@ async def extract_facts_from_contents(
         llm_config: LLM configuration for fact extraction
         agent_name: Name of the agent (for agent-related fact detection)
         extract_opinions: If True, extract only opinions; otherwise world/bank facts
+        content_chunks: Pre-computed chunking of each content (incremental retain)
+        reused_chunks: Global chunk indices whose facts are already stored and are not re-extracted
 
     Returns:
         Tuple of (extracted_facts, chunks_metadata, usage)
@@ -1196,7 +1212,14 @@ async def extract_facts_from_contents(
 
     # Step 1: Create parallel fact extraction tasks
     fact_extraction_tasks = []
-    for item in contents:
+    chunk_offset = 0
+    for content_index, item in enumerate(contents):
+        chunks = content_chunks[content_index] if content_chunks is not None else None
+        skip_chunks = None
+        if chunks is not None:
+            if reused_chunks:
+                skip_chunks = {i for i in range(len(chunks)) if chunk_offset + i in reused_chunks}
+            chunk_offset += len(chunks)
         # Call extract_facts_from_text directly (defined earlier in this file)
         # to avoid circular import with utils.extract_facts
         task = extract_facts_from_text(
@@ -1206,6 +1229,8 @@ async def extract_facts_from_contents(
             llm_config=llm_config,
             agent_name=agent_name,
             extract_opinions=extract_opinions,
+            chunks=chunks,
+            skip_chunks=skip_chunks,
         )
         fact_extraction_tasks.append(task)
 
@@ -1245,32 +1270,9 @@ async def extract_facts_from_contents(
             for _ in range(chunk_fact_count):
                 if fact_idx_in_content < len(facts_from_llm):
                     fact_from_llm = facts_from_llm[fact_idx_in_content]
-
-                    # Convert Fact model from LLM to ExtractedFactType dataclass
-                    # mentioned_at is always the event_date (when the conversation/document occurred)
-                    extracted_fact = ExtractedFactType(
-                        fact_text=fact_from_llm.fact,
-                        fact_type=fact_from_llm.fact_type,
-                        entities=[e.text for e in (fact_from_llm.entities or [])],
-                        # occurred_start/end: from LLM only, leave None if not provided
-                        occurred_start=_parse_datetime(fact_from_llm.occurred_start)
-                        if fact_from_llm.occurred_start
-                        else None,
-                        occurred_end=_parse_datetime(fact_from_llm.occurred_end)
-                        if fact_from_llm.occurred_end
-                        else None,
-                        causal_relations=_convert_causal_relations(
-                            fact_from_llm.causal_relations or [], global_fact_idx
-                        ),
-                        content_index=content_index,
-                        chunk_index=chunk_global_idx,
-                        context=content.context,
-                        # mentioned_at: always the event_date (when the conversation/document occurred)
-                        mentioned_at=content.event_date,
-                        metadata=content.metadata,
-                        tags=content.tags,
+                    extracted_fact = _to_extracted_fact(
+                        fact_from_llm, content, content_index, chunk_global_idx, global_fact_idx
                     )
-
                     extracted_facts.append(extracted_fact)
                     global_fact_idx += 1
                     fact_idx_in_content += 1
@@ -1281,6 +1283,113 @@ async def extract_facts_from_contents(
     return extracted_facts, chunks_metadata, total_usage
 
 
+async def stream_facts_from_contents(
+    contents: list[RetainContent],
+    llm_config,
+    agent_name: str,
+    extract_opinions: bool = False,
+    content_chunks: list[list[str]] | None = None,
+    reused_chunks: set[int] | None = None,
+) -> AsyncIterator[tuple[ChunkMetadata, list[ExtractedFactType], TokenUsage]]:
+    """
+    Extract facts from multiple content items, yielding each chunk's facts once they are ready.
+
+    All chunks are extracted in parallel as in extract_facts_from_contents, but results are
+    yielded chunk by chunk instead of after the last LLM call. Chunks are yielded in order,
+    so fact indices, causal relation targets and temporal offsets are the same as
+    extract_facts_from_contents produces. Reused chunks are yielded with no facts.
+
+    Args:
+        contents: List of RetainContent objects to process
+        llm_config: LLM configuration for fact extraction
+        agent_name: Name of the agent (for agent-related fact detection)
+        extract_opinions: If True, extract only opinions; otherwise world/bank facts
+        content_chunks: Pre-computed chunking of each content (defaults to chunk_text)
+        reused_chunks: Global chunk indices whose facts are already stored and are not re-extracted
+
+    Yields:
+        Tuples of (chunk, facts extracted from it, token usage of its LLM calls)
+    """
+    config = get_config()
+    reused_chunks = reused_chunks or set()
+
+    chunks: list[ChunkMetadata] = []
+    tasks: list[asyncio.Task | None] = []
+    for content_index, item in enumerate(contents):
+        texts = (
+            content_chunks[content_index]
+            if content_chunks is not None
+            else chunk_text(item.content, max_chars=config.retain_chunk_size)
+        )
+        for i, text in enumerate(texts):
+            global_chunk_idx = len(chunks)
+            chunks.append(ChunkMetadata(text, 0, content_index, global_chunk_idx))
+            if global_chunk_idx in reused_chunks:
+                tasks.append(None)
+                continue
+            tasks.append(
+                asyncio.create_task(
+                    _extract_facts_with_auto_split(
+                        chunk=text,
+                        chunk_index=i,
+                        total_chunks=len(texts),
+                        event_date=item.event_date,
+                        context=item.context,
+                        llm_config=llm_config,
+                        agent_name=agent_name,
+                        extract_opinions=extract_opinions,
+                    )
+                )
+            )
+
+    try:
+        global_fact_idx = 0
+        facts_per_content: dict[int, int] = {}
+        for chunk, task in zip(chunks, tasks):
+            facts_from_llm, usage = await task if task is not None else ([], TokenUsage())
+            content = contents[chunk.content_index]
+            position = facts_per_content.get(chunk.content_index, 0)
+            extracted_facts = []
+            for fact_from_llm in facts_from_llm:
+                extracted_fact = _to_extracted_fact(
+                    fact_from_llm, content, chunk.content_index, chunk.chunk_index, global_fact_idx
+                )
+                _offset_fact_times(extracted_fact, position)
+                extracted_facts.append(extracted_fact)
+                global_fact_idx += 1
+                position += 1
+            facts_per_content[chunk.content_index] = position
+            chunk.fact_count = len(extracted_facts)
+            yield chunk, extracted_facts, usage
+    finally:
+        # The consumer stopped early (error or cancellation): don't leave LLM calls running
+        for task in tasks:
+            if task is not None and not task.done():
+                task.cancel()
+
+
+def _to_extracted_fact(
+    fact_from_llm: Fact, content: RetainContent, content_index: int, chunk_index: int, global_fact_idx: int
+) -> ExtractedFactType:
+    """Convert a Fact model from the LLM to the ExtractedFact dataclass used by the pipeline."""
+    return ExtractedFactType(
+        fact_text=fact_from_llm.fact,
+        fact_type=fact_from_llm.fact_type,
+        entities=[e.text for e in (fact_from_llm.entities or [])],
+        # occurred_start/end: from LLM only, leave None if not provided
+        occurred_start=_parse_datetime(fact_from_llm.occurred_start) if fact_from_llm.occurred_start else None,
+        occurred_end=_parse_datetime(fact_from_llm.occurred_end) if fact_from_llm.occurred_end else None,
+        causal_relations=_convert_causal_relations(fact_from_llm.causal_relations or [], global_fact_idx),
+        content_index=content_index,
+        chunk_index=chunk_index,
+        context=content.context,
+        # mentioned_at: always the event_date (when the conversation/document occurred)
+        mentioned_at=content.event_date,
+        metadata=content.metadata,
+        tags=content.tags,
+    )
+
+
 def _parse_datetime(date_str: str):
     """Parse ISO datetime string."""
     from dateutil import parser as date_parser
@@ -1328,13 +1437,17 @@ def _add_temporal_offsets(facts: list[ExtractedFactType], contents: list[RetainC
             content_fact_start = i
 
         # Calculate position within this content
-        fact_position = i - content_fact_start
-        offset = timedelta(seconds=fact_position * SECONDS_PER_FACT)
-
-        # Apply offset to all temporal fields
-        if fact.occurred_start:
-            fact.occurred_start = fact.occurred_start + offset
-        if fact.occurred_end:
-            fact.occurred_end = fact.occurred_end + offset
-        if fact.mentioned_at:
-            fact.mentioned_at = fact.mentioned_at + offset
+        _offset_fact_times(fact, i - content_fact_start)
+
+
+def _offset_fact_times(fact: ExtractedFactType, fact_position: int) -> None:
+    """Shift a fact's temporal fields by its position within its content."""
+    offset = timedelta(seconds=fact_position * SECONDS_PER_FACT)
+
+    # Apply offset to all temporal fields
+    if fact.occurred_start:
+        fact.occurred_start = fact.occurred_start + offset
+    if fact.occurred_end:
+        fact.occurred_end = fact.occurred_end + offset
+    if fact.mentioned_at:
+        fact.mentioned_at = fact.mentioned_at + offset
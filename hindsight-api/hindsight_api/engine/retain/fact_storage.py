@@ -8,25 +8,35 @@ import json
 import logging
 
 from ..memory_engine import fq_table
+from ..tokens import count_tokens
 from .types import ProcessedFact
 
 logger = logging.getLogger(__name__)
 
 
 async def insert_facts_batch(
-    conn, bank_id: str, facts: list[ProcessedFact], document_id: str | None = None
+    conn,
+    bank_id: str,
+    facts: list[ProcessedFact],
+    document_id: str | None = None,
+    enrichment_states: list[dict] | None = None,
 ) -> list[str]:
     """
-    Insert facts into the database in batch.
+        Insert facts into the database in batch.
 
-    Args:
-        conn: Database connection
-        bank_id: Bank identifier
-        facts: List of ProcessedFact objects to insert
-        document_id: Optional document ID to associate with facts
+        Units are inserted with enrichment_pending set; the retain orchestrator clears it with
+        mark_units_enriched() once their entities and links are stored. enrichment_state keeps
+    what is needed to finish an interrupted enrichment (see orchestrator.resume_pending_enrichment).
+
+        Args:
+            conn: Database connection
+            bank_id: Bank identifier
+            facts: List of ProcessedFact objects to insert
+            document_id: Optional document ID to associate with facts
+            enrichment_states: Optional enrichment_state per fact (same length as facts)
 
-    Returns:
-        List of unit IDs (UUIDs as strings) for the inserted facts
+        Returns:
+            List of unit IDs (UUIDs as strings) for the inserted facts
     """
     if not facts:
         return []
@@ -74,20 +84,24 @@ async def insert_facts_batch(
         WITH input_data AS (
             SELECT * FROM unnest(
                 $2::text[], $3::vector[], $4::timestamptz[], $5::timestamptz[], $6::timestamptz[], $7::timestamptz[],
-                $8::text[], $9::text[], $10::float[], $11::jsonb[], $12::text[], $13::text[], $14::jsonb[]
+                $8::text[], $9::text[], $10::float[], $11::jsonb[], $12::text[], $13::text[], $14::jsonb[],
+                $15::integer[], $16::jsonb[]
             ) AS t(text, embedding, event_date, occurred_start, occurred_end, mentioned_at,
-                   context, fact_type, confidence_score, metadata, chunk_id, document_id, tags_json)
+                   context, fact_type, confidence_score, metadata, chunk_id, document_id, tags_json, text_tokens,
+                   enrichment_state)
         )
         INSERT INTO {fq_table("memory_units")} (bank_id, text, embedding, event_date, occurred_start, occurred_end, mentioned_at,
-                                 context, fact_type, confidence_score, metadata, chunk_id, document_id, tags)
+                                 context, fact_type, confidence_score, metadata, chunk_id, document_id, text_tokens, tags,
+                                 enrichment_pending, enrichment_state)
         SELECT
             $1,
             text, embedding, event_date, occurred_start, occurred_end, mentioned_at,
-            context, fact_type, confidence_score, metadata, chunk_id, document_id,
+            context, fact_type, confidence_score, metadata, chunk_id, document_id, text_tokens,
             COALESCE(
                 (SELECT array_agg(elem) FROM jsonb_array_elements_text(tags_json) AS elem),
                 '{{}}'::varchar[]
-            )
+            ),
+            TRUE, enrichment_state
         FROM input_data
         RETURNING id
         """,
@@ -105,12 +119,64 @@ async def insert_facts_batch(
         chunk_ids,
         document_ids,
         tags_list,
+        count_tokens(fact_texts),  # counted once here so recall packs token budgets without re-encoding
+        [json.dumps(state) for state in enrichment_states] if enrichment_states else [None] * len(facts),
     )
 
     unit_ids = [str(row["id"]) for row in results]
     return unit_ids
 
 
+async def mark_units_enriched(conn, unit_ids: list[str]) -> None:
+    """
+    Clear enrichment_pending and enrichment_state once a unit's entities and links are stored.
+
+    Args:
+        conn: Database connection
+        unit_ids: Unit IDs returned by insert_facts_batch
+    """
+    if not unit_ids:
+        return
+    await conn.execute(
+        f"UPDATE {fq_table('memory_units')} SET enrichment_pending = FALSE, enrichment_state = NULL "
+        "WHERE id = ANY($1::uuid[])",
+        unit_ids,
+    )
+
+
+async def discard_units(conn, bank_id: str, unit_ids: list[str], chunk_ids: list[str], document_ids: list[str]) -> None:
+    """
+    Undo a retain whose enrichment failed after its facts were committed.
+
+    Deletes the units (cascading to whatever links and entity associations were already
+    stored) and the chunks created for them, and clears the content hash of the touched
+    documents so that retaining the same content again is not treated as unchanged.
+
+    Args:
+        conn: Database connection
+        bank_id: Bank identifier
+        unit_ids: Unit IDs returned by insert_facts_batch
+        chunk_ids: Chunk IDs created by this retain (chunks kept by an incremental update excluded)
+        document_ids: Documents written by this retain
+    """
+    await conn.execute(
+        f"DELETE FROM {fq_table('memory_units')} WHERE id = ANY($1::uuid[])",
+        unit_ids,
+    )
+    if chunk_ids:
+        await conn.execute(
+            f"DELETE FROM {fq_table('chunks')} WHERE bank_id = $1 AND chunk_id = ANY($2::text[])",
+            bank_id,
+            chunk_ids,
+        )
+    if document_ids:
+        await conn.execute(
+            f"UPDATE {fq_table('documents')} SET content_hash = NULL WHERE bank_id = $1 AND id = ANY($2::text[])",
+            bank_id,
+            document_ids,
+        )
+
+
 async def ensure_bank_exists(conn, bank_id: str) -> None:
     """
     Ensure bank exists in the database.
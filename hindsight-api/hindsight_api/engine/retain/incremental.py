@@ -0,0 +1,195 @@
+"""
+Incremental document re-ingestion for the retain pipeline.
+
+By default, re-retaining a document deletes it and runs the whole pipeline again. In
+incremental mode the new content is compared with what is stored instead:
+
+- documents whose content hash is unchanged are skipped entirely
+- within a changed document, only chunks whose content hash is new go through fact
+  extraction, embedding, entity resolution and linking
+- chunks that no longer appear are deleted together with their memory units, and the
+  remaining chunks keep their facts, entities and links
+
+Units still marked enrichment_pending (a retain that died between committing its facts and
+finishing entity and link enrichment) are never reused: their document is treated as
+changed and their chunks are extracted again.
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from ..memory_engine import fq_table
+from . import fact_extraction
+from .types import RetainContentDict
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest used for document and chunk hashes."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+@dataclass
+class IncrementalPlan:
+    """What an incremental retain has to process, after comparing with stored documents."""
+
+    # Indices into the original contents that still need processing
+    content_indices: list[int] = field(default_factory=list)
+    # Chunk texts of each remaining content, in order (fact extraction reuses this chunking)
+    content_chunks: list[list[str]] = field(default_factory=list)
+    # Global chunk index (across remaining contents) -> stored chunk_id whose facts are kept
+    kept_chunk_ids: dict[int, str] = field(default_factory=dict)
+    # Stored documents being updated in place (their chunks that were not kept get deleted)
+    updated_documents: list[str] = field(default_factory=list)
+    # Stored documents whose content is unchanged
+    skipped_documents: list[str] = field(default_factory=list)
+
+    @property
+    def reused_chunks(self) -> set[int]:
+        return set(self.kept_chunk_ids)
+
+    def expand_results(self, results: list[list[str]], total_contents: int) -> list[list[str]]:
+        """Map per-content results of the remaining contents back onto all original contents."""
+        expanded: list[list[str]] = [[] for _ in range(total_contents)]
+        for index, unit_ids in zip(self.content_indices, results):
+            expanded[index] = unit_ids
+        return expanded
+
+
+async def plan_incremental_update(
+    conn,
+    bank_id: str,
+    contents_dicts: list[RetainContentDict],
+    document_id: str | None,
+    chunk_size: int,
+) -> IncrementalPlan:
+    """
+    Compare contents with the stored documents they belong to.
+
+    Contents without a document ID are always processed.
+
+    Args:
+        conn: Database connection
+        bank_id: Bank identifier
+        contents_dicts: Contents to retain
+        document_id: Batch-level document ID applied to contents without their own
+        chunk_size: Maximum characters per chunk (retain_chunk_size)
+
+    Returns:
+        IncrementalPlan describing the remaining work
+    """
+    contents_by_doc: dict[str, list[int]] = defaultdict(list)
+    for idx, item in enumerate(contents_dicts):
+        doc_id = item.get("document_id") or document_id
+        if doc_id:
+            contents_by_doc[doc_id].append(idx)
+
+    stored_hashes: dict[str, str | None] = {}
+    pending_documents: set[str] = set()
+    stored_chunks: dict[str, dict[str, list[str]]] = defaultdict(lambda: defaultdict(list))
+    if contents_by_doc:
+        doc_ids = list(contents_by_doc)
+        rows = await conn.fetch(
+            f"SELECT id, content_hash FROM {fq_table('documents')} WHERE bank_id = $1 AND id = ANY($2::text[])",
+            bank_id,
+            doc_ids,
+        )
+        stored_hashes = {row["id"]: row["content_hash"] for row in rows}
+        rows = await conn.fetch(
+            f"""
+            SELECT DISTINCT document_id
+            FROM {fq_table("memory_units")}
+            WHERE bank_id = $1 AND document_id = ANY($2::text[]) AND enrichment_pending
+            """,
+            bank_id,
+            doc_ids,
+        )
+        pending_documents = {row["document_id"] for row in rows}
+        rows = await conn.fetch(
+            f"""
+            SELECT c.chunk_id, c.document_id, c.content_hash
+            FROM {fq_table("chunks")} c
+            WHERE c.bank_id = $1 AND c.document_id = ANY($2::text[]) AND c.content_hash IS NOT NULL
+              AND NOT EXISTS (
+                  SELECT 1 FROM {fq_table("memory_units")} mu
+                  WHERE mu.chunk_id = c.chunk_id AND mu.enrichment_pending
+              )
+            ORDER BY c.chunk_index
+            """,
+            bank_id,
+            doc_ids,
+        )
+        for row in rows:
+            stored_chunks[row["document_id"]][row["content_hash"]].append(row["chunk_id"])
+
+    plan = IncrementalPlan()
+    skipped: set[int] = set()
+    for doc_id, indices in contents_by_doc.items():
+        if doc_id not in stored_hashes:
+            continue
+        # Same combination handle_document_tracking hashes into documents.content_hash
+        combined_content = "\n".join(contents_dicts[i].get("content", "") for i in indices)
+        if doc_id not in pending_documents and stored_hashes[doc_id] == content_hash(combined_content):
+            plan.skipped_documents.append(doc_id)
+            skipped.update(indices)
+        else:
+            plan.updated_documents.append(doc_id)
+
+    global_chunk_idx = 0
+    for idx, item in enumerate(contents_dicts):
+        if idx in skipped:
+            continue
+        chunks = fact_extraction.chunk_text(item["content"], max_chars=chunk_size)
+        plan.content_indices.append(idx)
+        plan.content_chunks.append(chunks)
+
+        doc_id = item.get("document_id") or document_id
+        available = stored_chunks.get(doc_id) if doc_id in plan.updated_documents else None
+        for chunk in chunks:
+            if available:
+                matches = available.get(content_hash(chunk))
+                if matches:
+                    plan.kept_chunk_ids[global_chunk_idx] = matches.pop(0)
+            global_chunk_idx += 1
+
+    return plan
+
+
+async def delete_stale_chunks(conn, bank_id: str, plan: IncrementalPlan) -> int:
+    """
+    Delete the chunks of updated documents that were not kept, and their memory units.
+
+    Units without a chunk in an updated document can't be matched to the new content and
+    are deleted as well. Deleting units cascades to their links and entity associations.
+
+    Returns:
+        Number of memory units deleted
+    """
+    if not plan.updated_documents:
+        return 0
+
+    kept = list(plan.kept_chunk_ids.values())
+    deleted_units = await conn.fetch(
+        f"""
+        DELETE FROM {fq_table("memory_units")}
+        WHERE bank_id = $1 AND document_id = ANY($2::text[])
+          AND (chunk_id IS NULL OR chunk_id <> ALL($3::text[]))
+        RETURNING id
+        """,
+        bank_id,
+        plan.updated_documents,
+        kept,
+    )
+    await conn.execute(
+        f"""
+        DELETE FROM {fq_table("chunks")}
+        WHERE bank_id = $1 AND document_id = ANY($2::text[]) AND chunk_id <> ALL($3::text[])
+        """,
+        bank_id,
+        plan.updated_documents,
+        kept,
+    )
+    return len(deleted_units)
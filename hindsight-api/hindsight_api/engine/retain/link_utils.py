@@ -7,6 +7,7 @@ import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from ..db_utils import supports_hnsw_iterative_scan
 from ..memory_engine import fq_table
 from .types import EntityLink
 
@@ -254,7 +255,7 @@ async def extract_entities_batch_optimized(
                 unit_entity_pairs.append((unit_id, entity_id))
 
             # Batch insert all unit-entity links (MUCH faster!)
-            await entity_resolver.link_units_to_entities_batch(unit_entity_pairs, conn=conn)
+            await entity_resolver.link_units_to_entities_batch(unit_entity_pairs, conn=conn, bank_id=bank_id)
             _log(
                 log_buffer,
                 f"    [6.2.3] Create unit-entity links (batched): {len(unit_entity_pairs)} links in {time.time() - substep_6_2_3_start:.3f}s",
@@ -515,7 +516,8 @@ async def create_semantic_links_batch(
     """
     Create semantic links for multiple units efficiently.
 
-    For each unit, finds similar units and creates links.
+    For each unit, finds its nearest existing units via the HNSW index (one LATERAL
+    probe per unit) plus its nearest neighbours within the batch, and creates links.
 
     Args:
         conn: Database connection
@@ -537,108 +539,68 @@ async def create_semantic_links_batch(
 
         import numpy as np
 
-        # Fetch ALL existing units with embeddings in ONE query
+        # Nearest existing neighbours for every new unit in ONE query.
+        # Each LATERAL probe is an index-ordered `ORDER BY embedding <=> q LIMIT k`, so the
+        # cost depends on the batch size rather than on the number of units in the bank.
         fetch_start = time_mod.time()
-        all_existing = await conn.fetch(
+        if await supports_hnsw_iterative_scan(conn):
+            # Keep walking the index until top_k neighbours in this bank are found
+            await conn.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+        neighbour_rows = await conn.fetch(
             f"""
-            SELECT id, embedding
-            FROM {fq_table("memory_units")}
-            WHERE bank_id = $1
-              AND embedding IS NOT NULL
-              AND id::text != ALL($2)
+            SELECT q.unit_id, n.id AS neighbour_id, 1 - n.distance AS similarity
+            FROM unnest($1::uuid[], $2::text[]) AS q(unit_id, embedding)
+            CROSS JOIN LATERAL (
+                SELECT mu.id, mu.embedding <=> q.embedding::vector AS distance
+                FROM {fq_table("memory_units")} mu
+                WHERE mu.bank_id = $3
+                  AND mu.embedding IS NOT NULL
+                  AND mu.id <> ALL($1::uuid[])
+                ORDER BY mu.embedding <=> q.embedding::vector
+                LIMIT $4
+            ) n
+            WHERE 1 - n.distance >= $5
             """,
-            bank_id,
             unit_ids,
+            [str(e) for e in embeddings],
+            bank_id,
+            top_k,
+            threshold,
         )
         _log(
             log_buffer,
-            f"      [8.1] Fetch {len(all_existing)} existing embeddings (1 query): {time_mod.time() - fetch_start:.3f}s",
+            f"      [8.1] Find nearest existing neighbours for {len(unit_ids)} units (1 query): {time_mod.time() - fetch_start:.3f}s",
         )
 
-        # Convert to numpy for vectorized similarity computation
         compute_start = time_mod.time()
         all_links = []
-
-        if all_existing:
-            # Convert existing embeddings to numpy array
-            existing_ids = [str(row["id"]) for row in all_existing]
-            # Stack embeddings as 2D array: (num_embeddings, embedding_dim)
-            embedding_arrays = []
-            for row in all_existing:
-                raw_emb = row["embedding"]
-                # Handle different pgvector formats
-                if isinstance(raw_emb, str):
-                    # Parse string format: "[1.0, 2.0, ...]"
-                    import json
-
-                    emb = np.array(json.loads(raw_emb), dtype=np.float32)
-                elif isinstance(raw_emb, (list, tuple)):
-                    emb = np.array(raw_emb, dtype=np.float32)
-                else:
-                    # Try direct conversion (works for numpy arrays, pgvector objects, etc.)
-                    emb = np.array(raw_emb, dtype=np.float32)
-
-                # Ensure it's 1D
-                if emb.ndim != 1:
-                    raise ValueError(f"Expected 1D embedding, got shape {emb.shape}")
-                embedding_arrays.append(emb)
-
-            if not embedding_arrays:
-                existing_embeddings = np.array([])
-            elif len(embedding_arrays) == 1:
-                # Single embedding: reshape to (1, dim)
-                existing_embeddings = embedding_arrays[0].reshape(1, -1)
-            else:
-                # Multiple embeddings: vstack
-                existing_embeddings = np.vstack(embedding_arrays)
-
-            # For each new unit, compute similarities with ALL existing units
-            for unit_id, new_embedding in zip(unit_ids, embeddings):
-                new_emb_array = np.array(new_embedding)
-
-                # Compute cosine similarities (dot product for normalized vectors)
-                similarities = np.dot(existing_embeddings, new_emb_array)
-
-                # Find top-k above threshold
-                # Get indices of similarities above threshold
-                above_threshold = np.where(similarities >= threshold)[0]
-
-                if len(above_threshold) > 0:
-                    # Sort by similarity (descending) and take top-k
-                    sorted_indices = above_threshold[np.argsort(-similarities[above_threshold])][:top_k]
-
-                    for idx in sorted_indices:
-                        similar_id = existing_ids[idx]
-                        # Clamp to [0, 1] to handle floating point precision issues
-                        similarity = float(min(1.0, max(0.0, similarities[idx])))
-                        all_links.append((unit_id, similar_id, "semantic", similarity, None))
+        for row in neighbour_rows:
+            # Clamp to [0, 1] to handle floating point precision issues
+            similarity = float(min(1.0, max(0.0, row["similarity"])))
+            all_links.append((str(row["unit_id"]), str(row["neighbour_id"]), "semantic", similarity, None))
 
         # Also compute similarities WITHIN the new batch (new units to each other)
         # Apply the same top_k limit per unit as we do for existing units
         if len(unit_ids) > 1:
-            new_embeddings_matrix = np.array(embeddings)
+            new_embeddings_matrix = np.array(embeddings, dtype=np.float32)
+            # One matrix product for all pairs (cosine == dot product for normalized vectors)
+            batch_similarities = new_embeddings_matrix @ new_embeddings_matrix.T
+            np.fill_diagonal(batch_similarities, -np.inf)
 
             for i, unit_id in enumerate(unit_ids):
-                # Compute similarities with all OTHER new units
-                other_indices = [j for j in range(len(unit_ids)) if j != i]
-                if not other_indices:
-                    continue
-
-                other_embeddings = new_embeddings_matrix[other_indices]
-                similarities = np.dot(other_embeddings, new_embeddings_matrix[i])
+                similarities = batch_similarities[i]
 
                 # Find top-k above threshold (same logic as existing units)
                 above_threshold = np.where(similarities >= threshold)[0]
 
                 if len(above_threshold) > 0:
                     # Sort by similarity (descending) and take top-k
-                    sorted_local_indices = above_threshold[np.argsort(-similarities[above_threshold])][:top_k]
+                    sorted_indices = above_threshold[np.argsort(-similarities[above_threshold])][:top_k]
 
-                    for local_idx in sorted_local_indices:
-                        other_idx = other_indices[local_idx]
+                    for other_idx in sorted_indices:
                         other_id = unit_ids[other_idx]
                         # Clamp to [0, 1] to handle floating point precision issues
-                        similarity = float(min(1.0, max(0.0, similarities[local_idx])))
+                        similarity = float(min(1.0, max(0.0, similarities[other_idx])))
                         all_links.append((unit_id, other_id, "semantic", similarity, None))
 
         _log(
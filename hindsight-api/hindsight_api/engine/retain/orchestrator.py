@@ -4,12 +4,18 @@ Main orchestrator for the retain pipeline.
 Coordinates all retain pipeline modules to store memories efficiently.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import time
 import uuid
+from collections import defaultdict
 from datetime import UTC, datetime
 
+from ...config import get_config
 from ..db_utils import acquire_with_retry
+from ..memory_engine import fq_table, get_current_schema
 from . import bank_utils
 
 
@@ -26,12 +32,22 @@ from . import (
     entity_processing,
     fact_extraction,
     fact_storage,
+    incremental,
     link_creation,
 )
-from .types import EntityLink, ExtractedFact, ProcessedFact, RetainContent, RetainContentDict
+from .types import ChunkMetadata, EntityLink, ExtractedFact, ProcessedFact, RetainContent, RetainContentDict
 
 logger = logging.getLogger(__name__)
 
+# Pending units older than this whose enrichment_state is missing are resumed by the recovery sweep
+PENDING_ENRICHMENT_GRACE = "1 hour"
+
+# Pending units read per batch by the recovery sweep
+RESUME_ENRICHMENT_BATCH_SIZE = 1_000
+
+# Seconds between recovery sweeps (one runs at startup)
+ENRICHMENT_SWEEP_INTERVAL_SECONDS = 600.0
+
 
 async def retain_batch(
     pool,
@@ -47,6 +63,7 @@ async def retain_batch(
     fact_type_override: str | None = None,
     confidence_score: float | None = None,
     document_tags: list[str] | None = None,
+    update_mode: str = "replace",
 ) -> tuple[list[list[str]], TokenUsage]:
     """
     Process a batch of content through the retain pipeline.
@@ -65,9 +82,12 @@ async def retain_batch(
         fact_type_override: Override fact type for all facts
         confidence_score: Confidence score for opinions
         document_tags: Tags applied to all items in this batch
+        update_mode: How existing documents are updated: "replace" deletes and re-processes them,
+            "incremental" skips unchanged documents and re-processes only added or changed chunks
 
     Returns:
-        Tuple of (unit ID lists, token usage for fact extraction)
+        Tuple of (unit ID lists, token usage for fact extraction). Incremental retains only
+        report units created by this call.
     """
     start_time = time.time()
     total_chars = sum(len(item.get("content", "")) for item in contents_dicts)
@@ -83,6 +103,30 @@ async def retain_batch(
     profile = await bank_utils.get_bank_profile(pool, bank_id)
     agent_name = profile["name"]
 
+    # Incremental update: compare with stored documents and keep only the work that changed
+    plan = None
+    total_contents = len(contents_dicts)
+    if update_mode == "incremental":
+        step_start = time.time()
+        async with acquire_with_retry(pool) as conn:
+            plan = await incremental.plan_incremental_update(
+                conn, bank_id, contents_dicts, document_id, get_config().retain_chunk_size
+            )
+        contents_dicts = [contents_dicts[i] for i in plan.content_indices]
+        log_buffer.append(
+            f"[0] Incremental plan: {len(plan.skipped_documents)} unchanged documents skipped, "
+            f"{len(plan.kept_chunk_ids)}/{sum(len(c) for c in plan.content_chunks)} chunks kept "
+            f"in {time.time() - step_start:.3f}s"
+        )
+        if not contents_dicts:
+            logger.info("\n" + "\n".join(log_buffer) + "\n")
+            return [[] for _ in range(total_contents)], TokenUsage()
+    # Existing documents are deleted and rebuilt only in replace mode
+    replace_documents = is_first_batch and plan is None
+    replaces_memories = await _replaces_memories(pool, bank_id, contents_dicts, document_id, replace_documents, plan)
+    # Identifies this retain's pending units; see _lock_retain()
+    retain_token = uuid.uuid4().hex
+
     # Convert dicts to RetainContent objects
     contents = []
     for item in contents_dicts:
@@ -99,12 +143,44 @@ async def retain_batch(
         )
         contents.append(content)
 
+    extract_opinions = fact_type_override == "opinion"
+    # The pipeline commits each batch of facts on its own, so it can't keep replaced memories until
+    # their replacements are enriched; updates of stored documents take the single-transaction path
+    if get_config().retain_pipeline and not replaces_memories:
+        async with acquire_with_retry(pool) as lock_conn:
+            await _lock_retain(lock_conn, retain_token)
+            return await _retain_batch_pipelined(
+                pool,
+                embeddings_model,
+                llm_config,
+                entity_resolver,
+                format_date_fn,
+                duplicate_checker_fn,
+                bank_id,
+                agent_name,
+                contents,
+                contents_dicts,
+                document_id,
+                replace_documents,
+                fact_type_override,
+                document_tags,
+                plan,
+                total_contents,
+                log_buffer,
+                start_time,
+                retain_token,
+            )
+
     # Step 1: Extract facts from all contents
     step_start = time.time()
-    extract_opinions = fact_type_override == "opinion"
 
     extracted_facts, chunks, usage = await fact_extraction.extract_facts_from_contents(
-        contents, llm_config, agent_name, extract_opinions
+        contents,
+        llm_config,
+        agent_name,
+        extract_opinions,
+        content_chunks=plan.content_chunks if plan else None,
+        reused_chunks=plan.reused_chunks if plan else None,
     )
     log_buffer.append(
         f"[1] Extract facts: {len(extracted_facts)} facts, {len(chunks)} chunks from {len(contents)} contents in {time.time() - step_start:.3f}s"
@@ -133,7 +209,7 @@ async def retain_batch(
                         if first_item.get("metadata"):
                             retain_params["metadata"] = first_item["metadata"]
                     await fact_storage.handle_document_tracking(
-                        conn, bank_id, document_id, combined_content, is_first_batch, retain_params, document_tags
+                        conn, bank_id, document_id, combined_content, replace_documents, retain_params, document_tags
                     )
                 else:
                     # Check for per-item document_ids
@@ -161,14 +237,28 @@ async def retain_batch(
                             if first_item.get("metadata"):
                                 retain_params["metadata"] = first_item["metadata"]
                         await fact_storage.handle_document_tracking(
-                            conn, bank_id, doc_id, combined_content, is_first_batch, retain_params, document_tags
+                            conn, bank_id, doc_id, combined_content, replace_documents, retain_params, document_tags
                         )
 
+                if plan is not None:
+                    # Drop what the new content no longer contains and record its new chunks, so they
+                    # are not extracted again on the next incremental retain
+                    deleted_units = await incremental.delete_stale_chunks(conn, bank_id, plan)
+                    chunks_by_doc = defaultdict(list)
+                    for chunk in chunks:
+                        doc_id = contents_dicts[chunk.content_index].get("document_id") or document_id
+                        if doc_id:
+                            chunks_by_doc[doc_id].append(chunk)
+                    for doc_id, doc_chunks in chunks_by_doc.items():
+                        await chunk_storage.store_chunks_batch(conn, bank_id, doc_id, doc_chunks, plan.kept_chunk_ids)
+                    if deleted_units:
+                        await _notify_links_changed(conn, bank_id)
+
         total_time = time.time() - start_time
         logger.info(
             f"RETAIN_BATCH COMPLETE: 0 facts extracted from {len(contents)} contents in {total_time:.3f}s (document tracked, no facts)"
         )
-        return [[] for _ in contents], usage
+        return _expand_results(plan, [[] for _ in contents], total_contents), usage
 
     # Apply fact_type_override if provided
     if fact_type_override:
@@ -187,159 +277,45 @@ async def retain_batch(
         for extracted_fact, embedding in zip(extracted_facts, embeddings)
     ]
 
-    # Track document IDs for logging
-    document_ids_added = []
-
-    # Group contents by document_id for document tracking and chunk storage
-    from collections import defaultdict
-
-    contents_by_doc = defaultdict(list)
-    for idx, content_dict in enumerate(contents_dicts):
-        doc_id = content_dict.get("document_id")
-        contents_by_doc[doc_id].append((idx, content_dict))
-
     # Step 4: Database transaction
+    user_entities_per_content = {idx: content.entities for idx, content in enumerate(contents) if content.entities}
     async with acquire_with_retry(pool) as conn:
+        await _lock_retain(conn, retain_token)
         async with conn.transaction():
             # Ensure bank exists
             await fact_storage.ensure_bank_exists(conn, bank_id)
 
             # Handle document tracking for all documents
             step_start = time.time()
-            # Map None document_id to generated UUIDs
-            doc_id_mapping = {}  # Maps original doc_id (including None) to actual doc_id used
-
-            if document_id:
-                # Legacy: single document_id parameter
-                combined_content = "\n".join([c.get("content", "") for c in contents_dicts])
-                retain_params = {}
-                if contents_dicts:
-                    first_item = contents_dicts[0]
-                    if first_item.get("context"):
-                        retain_params["context"] = first_item["context"]
-                    if first_item.get("event_date"):
-                        retain_params["event_date"] = (
-                            first_item["event_date"].isoformat()
-                            if hasattr(first_item["event_date"], "isoformat")
-                            else str(first_item["event_date"])
-                        )
-                    if first_item.get("metadata"):
-                        retain_params["metadata"] = first_item["metadata"]
-
-                await fact_storage.handle_document_tracking(
-                    conn, bank_id, document_id, combined_content, is_first_batch, retain_params, document_tags
-                )
-                document_ids_added.append(document_id)
-                doc_id_mapping[None] = document_id  # For backwards compatibility
-            else:
-                # Handle per-item document_ids (create documents if any item has document_id or if chunks exist)
-                has_any_doc_ids = any(item.get("document_id") for item in contents_dicts)
-
-                if has_any_doc_ids or chunks:
-                    for original_doc_id, doc_contents in contents_by_doc.items():
-                        actual_doc_id = original_doc_id
-
-                        # Only create document record if:
-                        # 1. Item has explicit document_id, OR
-                        # 2. There are chunks (need document for chunk storage)
-                        should_create_doc = (original_doc_id is not None) or chunks
-
-                        if should_create_doc:
-                            if actual_doc_id is None:
-                                # No document_id but have chunks - generate one
-                                actual_doc_id = str(uuid.uuid4())
-
-                            # Store mapping for later use
-                            doc_id_mapping[original_doc_id] = actual_doc_id
-
-                            # Combine content for this document
-                            combined_content = "\n".join([c.get("content", "") for _, c in doc_contents])
-
-                            # Extract retain params from first content item
-                            retain_params = {}
-                            if doc_contents:
-                                first_item = doc_contents[0][1]
-                                if first_item.get("context"):
-                                    retain_params["context"] = first_item["context"]
-                                if first_item.get("event_date"):
-                                    retain_params["event_date"] = (
-                                        first_item["event_date"].isoformat()
-                                        if hasattr(first_item["event_date"], "isoformat")
-                                        else str(first_item["event_date"])
-                                    )
-                                if first_item.get("metadata"):
-                                    retain_params["metadata"] = first_item["metadata"]
-
-                            await fact_storage.handle_document_tracking(
-                                conn,
-                                bank_id,
-                                actual_doc_id,
-                                combined_content,
-                                is_first_batch,
-                                retain_params,
-                                document_tags,
-                            )
-                            document_ids_added.append(actual_doc_id)
+            doc_id_mapping, document_ids_added = await _track_documents(
+                conn, bank_id, contents_dicts, document_id, replace_documents, document_tags, bool(chunks)
+            )
 
             if document_ids_added:
                 log_buffer.append(
                     f"[2.5] Document tracking: {len(document_ids_added)} documents in {time.time() - step_start:.3f}s"
                 )
 
+            if plan is not None:
+                step_start = time.time()
+                deleted_units = await incremental.delete_stale_chunks(conn, bank_id, plan)
+                log_buffer.append(
+                    f"[2.6] Stale chunks: {deleted_units} units of removed chunks deleted in {time.time() - step_start:.3f}s"
+                )
+
             # Store chunks and map to facts for all documents
             step_start = time.time()
-            chunk_id_map_by_doc = {}  # Maps (doc_id, chunk_index) -> chunk_id
-
+            chunk_id_map_by_doc = await _store_chunks(
+                conn, bank_id, chunks, contents_dicts, doc_id_mapping, document_id, plan
+            )
             if chunks:
-                # Group chunks by their source document
-                chunks_by_doc = defaultdict(list)
-                for chunk in chunks:
-                    # chunk.content_index tells us which content this chunk came from
-                    original_doc_id = contents_dicts[chunk.content_index].get("document_id")
-                    # Map to actual document_id (handles None -> generated UUID mapping)
-                    actual_doc_id = doc_id_mapping.get(original_doc_id, original_doc_id)
-                    if actual_doc_id is None and document_id:
-                        actual_doc_id = document_id
-                    chunks_by_doc[actual_doc_id].append(chunk)
-
-                # Store chunks for each document
-                for doc_id, doc_chunks in chunks_by_doc.items():
-                    chunk_id_map = await chunk_storage.store_chunks_batch(conn, bank_id, doc_id, doc_chunks)
-                    # Store mapping with document context
-                    for chunk_idx, chunk_id in chunk_id_map.items():
-                        chunk_id_map_by_doc[(doc_id, chunk_idx)] = chunk_id
-
+                stored_docs = {doc_id for doc_id, _ in chunk_id_map_by_doc}
                 log_buffer.append(
-                    f"[3] Store chunks: {len(chunks)} chunks for {len(chunks_by_doc)} documents in {time.time() - step_start:.3f}s"
+                    f"[3] Store chunks: {len(chunks)} chunks for {len(stored_docs)} documents in {time.time() - step_start:.3f}s"
                 )
-
-                # Map chunk_ids and document_ids to facts
-                for fact, processed_fact in zip(extracted_facts, processed_facts):
-                    # Get the original document_id for this fact's source content
-                    original_doc_id = contents_dicts[fact.content_index].get("document_id")
-                    # Map to actual document_id (handles None -> generated UUID mapping)
-                    actual_doc_id = doc_id_mapping.get(original_doc_id, original_doc_id)
-                    if actual_doc_id is None and document_id:
-                        actual_doc_id = document_id
-
-                    # Set document_id on the fact
-                    processed_fact.document_id = actual_doc_id
-
-                    # Map chunk_id if this fact came from a chunk
-                    if fact.chunk_index is not None:
-                        # Look up chunk_id using (doc_id, chunk_index)
-                        chunk_id = chunk_id_map_by_doc.get((actual_doc_id, fact.chunk_index))
-                        if chunk_id:
-                            processed_fact.chunk_id = chunk_id
-            else:
-                # No chunks - still need to set document_id on facts
-                for fact, processed_fact in zip(extracted_facts, processed_facts):
-                    original_doc_id = contents_dicts[fact.content_index].get("document_id")
-                    # Map to actual document_id (handles None -> generated UUID mapping)
-                    actual_doc_id = doc_id_mapping.get(original_doc_id, original_doc_id)
-                    if actual_doc_id is None and document_id:
-                        actual_doc_id = document_id
-                    processed_fact.document_id = actual_doc_id
+            _assign_documents(
+                extracted_facts, processed_facts, contents_dicts, doc_id_mapping, document_id, chunk_id_map_by_doc
+            )
 
             # Deduplication
             step_start = time.time()
@@ -354,59 +330,49 @@ async def retain_batch(
             non_duplicate_facts = deduplication.filter_duplicates(processed_facts, is_duplicate_flags)
 
             if not non_duplicate_facts:
-                return [[] for _ in contents], usage
+                # Replaced documents and removed chunks may still have taken links with them
+                await _notify_links_changed(conn, bank_id)
+                return _expand_results(plan, [[] for _ in contents], total_contents), usage
 
             # Insert facts (document_id is now stored per-fact)
             step_start = time.time()
-            unit_ids = await fact_storage.insert_facts_batch(conn, bank_id, non_duplicate_facts)
-            log_buffer.append(f"[5] Insert facts: {len(unit_ids)} units in {time.time() - step_start:.3f}s")
-
-            # Process entities
-            step_start = time.time()
-            # Build map of content_index -> user entities for merging
-            user_entities_per_content = {
-                idx: content.entities for idx, content in enumerate(contents) if content.entities
-            }
-            entity_links = await entity_processing.process_entities_batch(
-                entity_resolver,
+            unit_ids = await fact_storage.insert_facts_batch(
                 conn,
                 bank_id,
-                unit_ids,
                 non_duplicate_facts,
-                log_buffer,
-                user_entities_per_content=user_entities_per_content,
-            )
-            log_buffer.append(f"[6] Process entities: {len(entity_links)} links in {time.time() - step_start:.3f}s")
-
-            # Create temporal links
-            step_start = time.time()
-            temporal_link_count = await link_creation.create_temporal_links_batch(conn, bank_id, unit_ids)
-            log_buffer.append(f"[7] Temporal links: {temporal_link_count} links in {time.time() - step_start:.3f}s")
-
-            # Create semantic links
-            step_start = time.time()
-            embeddings_for_links = [fact.embedding for fact in non_duplicate_facts]
-            semantic_link_count = await link_creation.create_semantic_links_batch(
-                conn, bank_id, unit_ids, embeddings_for_links
-            )
-            log_buffer.append(f"[8] Semantic links: {semantic_link_count} links in {time.time() - step_start:.3f}s")
-
-            # Insert entity links
-            step_start = time.time()
-            if entity_links:
-                await entity_processing.insert_entity_links_batch(conn, entity_links)
-            log_buffer.append(
-                f"[9] Entity links: {len(entity_links) if entity_links else 0} links in {time.time() - step_start:.3f}s"
+                enrichment_states=_enrichment_states(non_duplicate_facts, user_entities_per_content, retain_token),
             )
-
-            # Create causal links
-            step_start = time.time()
-            causal_link_count = await link_creation.create_causal_links_batch(conn, unit_ids, non_duplicate_facts)
-            log_buffer.append(f"[10] Causal links: {causal_link_count} links in {time.time() - step_start:.3f}s")
+            log_buffer.append(f"[5] Insert facts: {len(unit_ids)} units in {time.time() - step_start:.3f}s")
 
             # Map results back to original content items
             result_unit_ids = _map_results_to_contents(contents, extracted_facts, is_duplicate_flags, unit_ids)
 
+            if replaces_memories:
+                # The memories being replaced were deleted in this transaction, so their replacements
+                # are enriched in it too (each stage becomes a savepoint): if enrichment fails, the
+                # document keeps its old memories instead of being left with none.
+                await _enrich_units(
+                    conn, entity_resolver, bank_id, unit_ids, non_duplicate_facts, user_entities_per_content, log_buffer
+                )
+
+        if not replaces_memories:
+            # Facts and chunks are committed and visible to recall. Entities and links are added in
+            # short transactions of their own, so concurrent retains into the bank don't wait on
+            # each other's entity and link locks for the whole batch.
+            try:
+                await _enrich_units(
+                    conn, entity_resolver, bank_id, unit_ids, non_duplicate_facts, user_entities_per_content, log_buffer
+                )
+            except Exception:
+                # Undo the staged facts so a retry of this retain starts from a clean state
+                kept_chunk_ids = set(plan.kept_chunk_ids.values()) if plan else set()
+                new_chunk_ids = [cid for cid in chunk_id_map_by_doc.values() if cid not in kept_chunk_ids]
+                async with conn.transaction():
+                    await fact_storage.discard_units(conn, bank_id, unit_ids, new_chunk_ids, document_ids_added)
+                    await _notify_links_changed(conn, bank_id)
+                logger.error("\n" + "\n".join(log_buffer) + "\n")
+                raise
+
         # Log final summary
         total_time = time.time() - start_time
         log_buffer.append(f"{'=' * 60}")
@@ -417,7 +383,660 @@ async def retain_batch(
 
         logger.info("\n" + "\n".join(log_buffer) + "\n")
 
-        return result_unit_ids, usage
+        return _expand_results(plan, result_unit_ids, total_contents), usage
+
+
+async def _retain_batch_pipelined(
+    pool,
+    embeddings_model,
+    llm_config,
+    entity_resolver,
+    format_date_fn,
+    duplicate_checker_fn,
+    bank_id: str,
+    agent_name: str,
+    contents: list[RetainContent],
+    contents_dicts: list[RetainContentDict],
+    document_id: str | None,
+    replace_documents: bool,
+    fact_type_override: str | None,
+    document_tags: list[str] | None,
+    plan: incremental.IncrementalPlan | None,
+    total_contents: int,
+    log_buffer: list[str],
+    start_time: float,
+    retain_token: str,
+) -> tuple[list[list[str]], TokenUsage]:
+    """
+    Run retain as a pipeline of extraction, embedding and storage stages (retain_pipeline).
+
+    Documents and chunks are stored first. Each chunk's facts are then embedded and stored
+    as soon as its LLM call finishes, while later chunks are still being extracted. The
+    stages are connected by bounded queues, and the embedding and storage stages take
+    everything queued at once, so they batch naturally when they fall behind.
+
+    Facts are the same as in the non-pipelined path. Each stored batch commits on its own,
+    so memories become visible to recall while the rest of the batch is processed.
+    Causal links are created once all facts are stored, because causal relations can point
+    at facts of any chunk. If any stage fails, everything stored by this call is discarded.
+    The caller holds the retain lock of `retain_token` until this returns.
+    """
+    config = get_config()
+    queue_size = max(1, config.retain_pipeline_queue_size)
+    content_chunks = (
+        plan.content_chunks
+        if plan
+        else [fact_extraction.chunk_text(content.content, max_chars=config.retain_chunk_size) for content in contents]
+    )
+    chunks: list[ChunkMetadata] = []
+    for content_index, texts in enumerate(content_chunks):
+        for text in texts:
+            chunks.append(
+                ChunkMetadata(chunk_text=text, fact_count=0, content_index=content_index, chunk_index=len(chunks))
+            )
+
+    # Step 1: Documents and chunks, committed before extraction starts
+    step_start = time.time()
+    async with acquire_with_retry(pool) as conn:
+        async with conn.transaction():
+            await fact_storage.ensure_bank_exists(conn, bank_id)
+            doc_id_mapping, document_ids_added = await _track_documents(
+                conn, bank_id, contents_dicts, document_id, replace_documents, document_tags, bool(chunks)
+            )
+            deleted_units = await incremental.delete_stale_chunks(conn, bank_id, plan) if plan is not None else 0
+            chunk_id_map_by_doc = await _store_chunks(
+                conn, bank_id, chunks, contents_dicts, doc_id_mapping, document_id, plan
+            )
+            if deleted_units:
+                await _notify_links_changed(conn, bank_id)
+    log_buffer.append(
+        f"[1] Documents and chunks: {len(document_ids_added)} documents, {len(chunks)} chunks "
+        f"in {time.time() - step_start:.3f}s"
+    )
+
+    usage = TokenUsage()
+    user_entities_per_content = {idx: content.entities for idx, content in enumerate(contents) if content.entities}
+    extracted_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    embedded_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    result_unit_ids: list[list[str]] = [[] for _ in contents]
+    unit_ids: list[str] = []
+    stored_facts: list[ProcessedFact] = []
+    counts = {"facts": 0, "duplicates": 0, "batches": 0}
+    stage_times = {"extract": 0.0, "embed": 0.0, "store": 0.0}
+
+    async def extract_stage() -> None:
+        nonlocal usage
+        stage_start = time.time()
+        async for _, chunk_facts, chunk_usage in fact_extraction.stream_facts_from_contents(
+            contents,
+            llm_config,
+            agent_name,
+            fact_type_override == "opinion",
+            content_chunks=content_chunks,
+            reused_chunks=plan.reused_chunks if plan else None,
+        ):
+            usage = usage + chunk_usage
+            if not chunk_facts:
+                continue
+            if fact_type_override:
+                for fact in chunk_facts:
+                    fact.fact_type = fact_type_override
+            counts["facts"] += len(chunk_facts)
+            await extracted_queue.put(chunk_facts)
+        await extracted_queue.put(None)
+        stage_times["extract"] = time.time() - stage_start
+
+    async def embed_stage() -> None:
+        done = False
+        while not done:
+            batches, done = await _next_batches(extracted_queue)
+            if not batches:
+                continue
+            stage_start = time.time()
+            extracted_facts = [fact for batch in batches for fact in batch]
+            augmented_texts = embedding_processing.augment_texts_with_dates(extracted_facts, format_date_fn)
+            embeddings = await embedding_processing.generate_embeddings_batch(embeddings_model, augmented_texts)
+            processed_facts = [
+                ProcessedFact.from_extracted_fact(extracted_fact, embedding)
+                for extracted_fact, embedding in zip(extracted_facts, embeddings)
+            ]
+            stage_times["embed"] += time.time() - stage_start
+            await embedded_queue.put((extracted_facts, processed_facts))
+        await embedded_queue.put(None)
+
+    async def store_stage() -> None:
+        done = False
+        while not done:
+            batches, done = await _next_batches(embedded_queue)
+            if not batches:
+                continue
+            stage_start = time.time()
+            extracted_facts = [fact for batch, _ in batches for fact in batch]
+            processed_facts = [fact for _, batch in batches for fact in batch]
+            _assign_documents(
+                extracted_facts, processed_facts, contents_dicts, doc_id_mapping, document_id, chunk_id_map_by_doc
+            )
+            async with acquire_with_retry(pool) as conn:
+                async with conn.transaction():
+                    is_duplicate_flags = await deduplication.check_duplicates_batch(
+                        conn, bank_id, processed_facts, duplicate_checker_fn
+                    )
+                    new_facts = deduplication.filter_duplicates(processed_facts, is_duplicate_flags)
+                    new_unit_ids = await fact_storage.insert_facts_batch(
+                        conn,
+                        bank_id,
+                        new_facts,
+                        enrichment_states=_enrichment_states(new_facts, user_entities_per_content, retain_token),
+                    )
+                unit_ids.extend(new_unit_ids)
+                stored_facts.extend(new_facts)
+                if new_facts:
+                    # Per-batch stage timings would flood the summary, so they are only logged at debug level
+                    batch_log: list[str] = []
+                    await _link_units(
+                        conn, entity_resolver, bank_id, new_unit_ids, new_facts, user_entities_per_content, batch_log
+                    )
+                    logger.debug("\n".join(batch_log))
+            new_ids = iter(new_unit_ids)
+            for fact, is_duplicate in zip(extracted_facts, is_duplicate_flags):
+                if not is_duplicate:
+                    result_unit_ids[fact.content_index].append(next(new_ids))
+            counts["duplicates"] += sum(is_duplicate_flags)
+            counts["batches"] += 1
+            stage_times["store"] += time.time() - stage_start
+
+    try:
+        await _run_stages(extract_stage(), embed_stage(), store_stage())
+        async with acquire_with_retry(pool) as conn:
+            if unit_ids:
+                await _finish_enrichment(conn, bank_id, unit_ids, stored_facts, log_buffer)
+    except Exception:
+        # Undo everything this call stored so a retry starts from a clean state
+        kept_chunk_ids = set(plan.kept_chunk_ids.values()) if plan else set()
+        new_chunk_ids = [cid for cid in chunk_id_map_by_doc.values() if cid not in kept_chunk_ids]
+        async with acquire_with_retry(pool) as conn:
+            async with conn.transaction():
+                await fact_storage.discard_units(conn, bank_id, unit_ids, new_chunk_ids, document_ids_added)
+                await _notify_links_changed(conn, bank_id)
+        logger.error("\n" + "\n".join(log_buffer) + "\n")
+        raise
+
+    total_time = time.time() - start_time
+    log_buffer.append(
+        f"[2] Pipeline: {counts['facts']} facts, {counts['duplicates']} duplicates, {len(unit_ids)} units "
+        f"in {counts['batches']} stored batches (extract {stage_times['extract']:.3f}s, "
+        f"embed {stage_times['embed']:.3f}s, store {stage_times['store']:.3f}s)"
+    )
+    log_buffer.append(f"{'=' * 60}")
+    log_buffer.append(f"RETAIN_BATCH COMPLETE: {len(unit_ids)} units in {total_time:.3f}s")
+    if document_ids_added:
+        log_buffer.append(f"Documents: {', '.join(document_ids_added)}")
+    log_buffer.append(f"{'=' * 60}")
+
+    logger.info("\n" + "\n".join(log_buffer) + "\n")
+
+    return _expand_results(plan, result_unit_ids, total_contents), usage
+
+
+async def _next_batches(queue: asyncio.Queue) -> tuple[list, bool]:
+    """
+    Wait for the next item of a pipeline queue, then take everything else already queued.
+
+    The producer ends the queue with None. Returns the items and whether the end was reached.
+    """
+    items = [await queue.get()]
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    done = items[-1] is None
+    return [item for item in items if item is not None], done
+
+
+async def _run_stages(*stages) -> None:
+    """Run pipeline stages concurrently; the first failure cancels the others and is raised."""
+    tasks = [asyncio.create_task(stage) for stage in stages]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+
+async def _replaces_memories(
+    pool,
+    bank_id: str,
+    contents_dicts: list[RetainContentDict],
+    document_id: str | None,
+    replace_documents: bool,
+    plan: incremental.IncrementalPlan | None,
+) -> bool:
+    """Whether this retain deletes stored memories of the documents it updates."""
+    if plan is not None:
+        return bool(plan.updated_documents)
+    if not replace_documents:
+        return False
+    document_ids = (
+        [document_id] if document_id else sorted({c["document_id"] for c in contents_dicts if c.get("document_id")})
+    )
+    if not document_ids:
+        return False
+    async with acquire_with_retry(pool) as conn:
+        return await conn.fetchval(
+            f"SELECT EXISTS(SELECT 1 FROM {fq_table('documents')} WHERE bank_id = $1 AND id = ANY($2::text[]))",
+            bank_id,
+            document_ids,
+        )
+
+
+def _retain_lock_id(retain_token: str) -> int:
+    """Advisory lock ID of a retain token (signed bigint)."""
+    return int.from_bytes(hashlib.sha256(f"retain:{retain_token}".encode()).digest()[:8], "big", signed=True)
+
+
+async def _lock_retain(conn, retain_token: str) -> None:
+    """
+    Take the session advisory lock of a running retain.
+
+    The lock is held until the connection goes back to the pool (asyncpg's reset releases it),
+    and is taken before any of the retain's units are committed, so resume_pending_enrichment()
+    never touches the pending units of a retain that is still running.
+    """
+    await conn.execute("SELECT pg_advisory_lock($1)", _retain_lock_id(retain_token))
+
+
+def _enrichment_states(
+    facts: list[ProcessedFact], user_entities_per_content: dict[int, list[dict]], retain_token: str
+) -> list[dict]:
+    """enrichment_state of each fact: its retain token and the entity mentions to resolve."""
+    return [
+        {"retain": retain_token, "entities": entity_processing.merge_entities(fact, user_entities_per_content)}
+        for fact in facts
+    ]
+
+
+async def _track_documents(
+    conn,
+    bank_id: str,
+    contents_dicts: list[RetainContentDict],
+    document_id: str | None,
+    replace_documents: bool,
+    document_tags: list[str] | None,
+    has_chunks: bool,
+) -> tuple[dict[str | None, str], list[str]]:
+    """
+    Create or update the document records for a batch.
+
+    Contents without a document ID get a generated one when the batch has chunks to store.
+
+    Returns:
+        Tuple of (original document ID -> document ID used, document IDs written)
+    """
+    document_ids_added = []
+
+    # Group contents by document_id for document tracking and chunk storage
+    contents_by_doc = defaultdict(list)
+    for idx, content_dict in enumerate(contents_dicts):
+        doc_id = content_dict.get("document_id")
+        contents_by_doc[doc_id].append((idx, content_dict))
+
+    # Map None document_id to generated UUIDs
+    doc_id_mapping = {}  # Maps original doc_id (including None) to actual doc_id used
+
+    if document_id:
+        # Legacy: single document_id parameter
+        combined_content = "\n".join([c.get("content", "") for c in contents_dicts])
+        retain_params = {}
+        if contents_dicts:
+            first_item = contents_dicts[0]
+            if first_item.get("context"):
+                retain_params["context"] = first_item["context"]
+            if first_item.get("event_date"):
+                retain_params["event_date"] = (
+                    first_item["event_date"].isoformat()
+                    if hasattr(first_item["event_date"], "isoformat")
+                    else str(first_item["event_date"])
+                )
+            if first_item.get("metadata"):
+                retain_params["metadata"] = first_item["metadata"]
+
+        await fact_storage.handle_document_tracking(
+            conn, bank_id, document_id, combined_content, replace_documents, retain_params, document_tags
+        )
+        document_ids_added.append(document_id)
+        doc_id_mapping[None] = document_id  # For backwards compatibility
+    else:
+        # Handle per-item document_ids (create documents if any item has document_id or if chunks exist)
+        has_any_doc_ids = any(item.get("document_id") for item in contents_dicts)
+
+        if has_any_doc_ids or has_chunks:
+            for original_doc_id, doc_contents in contents_by_doc.items():
+                actual_doc_id = original_doc_id
+
+                # Only create document record if:
+                # 1. Item has explicit document_id, OR
+                # 2. There are chunks (need document for chunk storage)
+                should_create_doc = (original_doc_id is not None) or has_chunks
+
+                if should_create_doc:
+                    if actual_doc_id is None:
+                        # No document_id but have chunks - generate one
+                        actual_doc_id = str(uuid.uuid4())
+
+                    # Store mapping for later use
+                    doc_id_mapping[original_doc_id] = actual_doc_id
+
+                    # Combine content for this document
+                    combined_content = "\n".join([c.get("content", "") for _, c in doc_contents])
+
+                    # Extract retain params from first content item
+                    retain_params = {}
+                    if doc_contents:
+                        first_item = doc_contents[0][1]
+                        if first_item.get("context"):
+                            retain_params["context"] = first_item["context"]
+                        if first_item.get("event_date"):
+                            retain_params["event_date"] = (
+                                first_item["event_date"].isoformat()
+                                if hasattr(first_item["event_date"], "isoformat")
+                                else str(first_item["event_date"])
+                            )
+                        if first_item.get("metadata"):
+                            retain_params["metadata"] = first_item["metadata"]
+
+                    await fact_storage.handle_document_tracking(
+                        conn,
+                        bank_id,
+                        actual_doc_id,
+                        combined_content,
+                        replace_documents,
+                        retain_params,
+                        document_tags,
+                    )
+                    document_ids_added.append(actual_doc_id)
+
+    return doc_id_mapping, document_ids_added
+
+
+async def _store_chunks(
+    conn,
+    bank_id: str,
+    chunks: list[ChunkMetadata],
+    contents_dicts: list[RetainContentDict],
+    doc_id_mapping: dict[str | None, str],
+    document_id: str | None,
+    plan: incremental.IncrementalPlan | None,
+) -> dict[tuple[str, int], str]:
+    """
+    Store chunks under the documents their contents belong to.
+
+    Returns:
+        Mapping of (document ID, global chunk index) -> chunk ID
+    """
+    chunk_id_map_by_doc = {}  # Maps (doc_id, chunk_index) -> chunk_id
+    if not chunks:
+        return chunk_id_map_by_doc
+
+    # Group chunks by their source document
+    chunks_by_doc = defaultdict(list)
+    for chunk in chunks:
+        # chunk.content_index tells us which content this chunk came from
+        actual_doc_id = _document_id_for(contents_dicts[chunk.content_index], doc_id_mapping, document_id)
+        chunks_by_doc[actual_doc_id].append(chunk)
+
+    # Store chunks for each document
+    for doc_id, doc_chunks in chunks_by_doc.items():
+        chunk_id_map = await chunk_storage.store_chunks_batch(
+            conn, bank_id, doc_id, doc_chunks, plan.kept_chunk_ids if plan else None
+        )
+        # Store mapping with document context
+        for chunk_idx, chunk_id in chunk_id_map.items():
+            chunk_id_map_by_doc[(doc_id, chunk_idx)] = chunk_id
+
+    return chunk_id_map_by_doc
+
+
+def _assign_documents(
+    extracted_facts: list[ExtractedFact],
+    processed_facts: list[ProcessedFact],
+    contents_dicts: list[RetainContentDict],
+    doc_id_mapping: dict[str | None, str],
+    document_id: str | None,
+    chunk_id_map_by_doc: dict[tuple[str, int], str],
+) -> None:
+    """Set the document ID and chunk ID of each processed fact from its source content and chunk."""
+    for fact, processed_fact in zip(extracted_facts, processed_facts):
+        actual_doc_id = _document_id_for(contents_dicts[fact.content_index], doc_id_mapping, document_id)
+
+        # Set document_id on the fact
+        processed_fact.document_id = actual_doc_id
+
+        # Map chunk_id if this fact came from a chunk
+        if fact.chunk_index is not None:
+            # Look up chunk_id using (doc_id, chunk_index)
+            chunk_id = chunk_id_map_by_doc.get((actual_doc_id, fact.chunk_index))
+            if chunk_id:
+                processed_fact.chunk_id = chunk_id
+
+
+def _document_id_for(
+    content_dict: RetainContentDict, doc_id_mapping: dict[str | None, str], document_id: str | None
+) -> str | None:
+    """Document ID used for a content, after mapping None to a generated document ID."""
+    original_doc_id = content_dict.get("document_id")
+    # Map to actual document_id (handles None -> generated UUID mapping)
+    actual_doc_id = doc_id_mapping.get(original_doc_id, original_doc_id)
+    if actual_doc_id is None and document_id:
+        actual_doc_id = document_id
+    return actual_doc_id
+
+
+async def _enrich_units(
+    conn,
+    entity_resolver,
+    bank_id: str,
+    unit_ids: list[str],
+    facts: list[ProcessedFact],
+    user_entities_per_content: dict[int, list[dict]],
+    log_buffer: list[str],
+) -> None:
+    """
+    Resolve entities and create links for committed units, one short transaction per stage.
+
+    Every stage inserts with ON CONFLICT DO NOTHING, and the units stay enrichment_pending
+    until the last stage commits.
+    """
+    await _link_units(conn, entity_resolver, bank_id, unit_ids, facts, user_entities_per_content, log_buffer)
+    await _finish_enrichment(conn, bank_id, unit_ids, facts, log_buffer)
+
+
+async def _link_units(
+    conn,
+    entity_resolver,
+    bank_id: str,
+    unit_ids: list[str],
+    facts: list[ProcessedFact],
+    user_entities_per_content: dict[int, list[dict]],
+    log_buffer: list[str],
+) -> None:
+    """Store entities, entity links, temporal links and semantic links of committed units."""
+    # Process entities and insert entity links
+    step_start = time.time()
+    async with conn.transaction():
+        entity_links = await entity_processing.process_entities_batch(
+            entity_resolver,
+            conn,
+            bank_id,
+            unit_ids,
+            facts,
+            log_buffer,
+            user_entities_per_content=user_entities_per_content,
+        )
+        if entity_links:
+            await entity_processing.insert_entity_links_batch(conn, entity_links)
+            await _notify_links_changed(conn, bank_id)
+    log_buffer.append(f"[6] Entities: {len(entity_links)} entity links in {time.time() - step_start:.3f}s")
+
+    # Create temporal links
+    step_start = time.time()
+    async with conn.transaction():
+        temporal_link_count = await link_creation.create_temporal_links_batch(conn, bank_id, unit_ids)
+        await _notify_links_changed(conn, bank_id)
+    log_buffer.append(f"[7] Temporal links: {temporal_link_count} links in {time.time() - step_start:.3f}s")
+
+    # Create semantic links
+    step_start = time.time()
+    async with conn.transaction():
+        embeddings_for_links = [fact.embedding for fact in facts]
+        semantic_link_count = await link_creation.create_semantic_links_batch(
+            conn, bank_id, unit_ids, embeddings_for_links
+        )
+        await _notify_links_changed(conn, bank_id)
+    log_buffer.append(f"[8] Semantic links: {semantic_link_count} links in {time.time() - step_start:.3f}s")
+
+
+async def _finish_enrichment(
+    conn, bank_id: str, unit_ids: list[str], facts: list[ProcessedFact], log_buffer: list[str]
+) -> None:
+    """
+    Create causal links and mark the units enriched.
+
+    Causal relations index into all facts of the retain, so this runs once over all of them.
+    """
+    step_start = time.time()
+    async with conn.transaction():
+        causal_link_count = await link_creation.create_causal_links_batch(conn, unit_ids, facts)
+        await fact_storage.mark_units_enriched(conn, unit_ids)
+        await _notify_links_changed(conn, bank_id)
+    log_buffer.append(f"[9] Causal links: {causal_link_count} links in {time.time() - step_start:.3f}s")
+
+
+async def list_memory_schemas(conn) -> list[str]:
+    """Return every schema with a memory_units table (the default schema and each tenant's)."""
+    rows = await conn.fetch(
+        "SELECT table_schema FROM information_schema.tables WHERE table_name = 'memory_units' ORDER BY table_schema"
+    )
+    return [row["table_schema"] for row in rows]
+
+
+async def resume_pending_enrichment(pool, entity_resolver, batch_size: int = RESUME_ENRICHMENT_BATCH_SIZE) -> int:
+    """
+    Enrich units of the current schema left enrichment_pending by a retain that died before finishing.
+
+    A retain holds the advisory lock of its token until its enrichment is done (see
+    _lock_retain), so the units of a token whose lock can be taken belong to a retain that
+    is no longer running. Their entities are resolved from enrichment_state, and their
+    temporal and semantic links are created. Causal links are not recovered: they index
+    into the full extraction batch of the retain, which is gone. Units without an
+    enrichment_state (inserted before it existed) are resumed once PENDING_ENRICHMENT_GRACE old,
+    under a per-bank lock so concurrent sweeps don't enrich them twice.
+
+    Pending units are read in batches of `batch_size`, in (created_at, id) order, until
+    none are left; units of retains that are still running are skipped.
+
+    Args:
+        pool: Database connection pool
+        entity_resolver: Entity resolver for entity processing
+        batch_size: Number of pending units read per batch
+
+    Returns:
+        Number of units enriched
+    """
+    schema = get_current_schema()
+    enriched = 0
+    after = (datetime.min.replace(tzinfo=UTC), uuid.UUID(int=0))
+    async with acquire_with_retry(pool) as conn:
+        while True:
+            rows = await conn.fetch(
+                f"""
+                SELECT id, bank_id, text, embedding::text AS embedding, occurred_start, occurred_end, mentioned_at,
+                       context, fact_type, enrichment_state, created_at
+                FROM {fq_table("memory_units")}
+                WHERE enrichment_pending
+                  AND (enrichment_state IS NOT NULL OR created_at < NOW() - INTERVAL '{PENDING_ENRICHMENT_GRACE}')
+                  AND (created_at, id) > ($2, $3)
+                ORDER BY created_at, id
+                LIMIT $1
+                """,
+                batch_size,
+                *after,
+            )
+            if not rows:
+                break
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+            enriched += await _resume_units(conn, entity_resolver, schema, rows)
+            if len(rows) < batch_size:
+                break
+    return enriched
+
+
+async def _resume_units(conn, entity_resolver, schema: str, rows: list) -> int:
+    """Enrich one batch of pending units, grouped by the retain that inserted them."""
+    units_by_retain = defaultdict(list)
+    for row in rows:
+        state = json.loads(row["enrichment_state"]) if row["enrichment_state"] else {}
+        units_by_retain[(row["bank_id"], state.get("retain"))].append((row, state))
+
+    enriched = 0
+    for (bank_id, retain_token), units in units_by_retain.items():
+        lock_id = _retain_lock_id(retain_token or f"pending:{schema}:{bank_id}")
+        if not await conn.fetchval("SELECT pg_try_advisory_lock($1)", lock_id):
+            # The retain is still running and enriches these units itself (or another sweep has them)
+            continue
+        try:
+            # Another process may have resumed them since they were read
+            still_pending = {
+                str(r["id"])
+                for r in await conn.fetch(
+                    f"SELECT id FROM {fq_table('memory_units')} WHERE id = ANY($1::uuid[]) AND enrichment_pending",
+                    [row["id"] for row, _ in units],
+                )
+            }
+            units = [(row, state) for row, state in units if str(row["id"]) in still_pending]
+            if not units:
+                continue
+            unit_ids = [str(row["id"]) for row, _ in units]
+            facts = [
+                ProcessedFact(
+                    fact_text=row["text"],
+                    fact_type=row["fact_type"],
+                    embedding=json.loads(row["embedding"]),
+                    occurred_start=row["occurred_start"],
+                    occurred_end=row["occurred_end"],
+                    mentioned_at=row["mentioned_at"],
+                    context=row["context"] or "",
+                    metadata={},
+                    content_index=i,
+                )
+                for i, (row, _) in enumerate(units)
+            ]
+            stored_entities = {i: state.get("entities", []) for i, (_, state) in enumerate(units)}
+            log_buffer: list[str] = []
+            await _link_units(conn, entity_resolver, bank_id, unit_ids, facts, stored_entities, log_buffer)
+            await _finish_enrichment(conn, bank_id, unit_ids, facts, log_buffer)
+            enriched += len(unit_ids)
+            logger.debug("\n".join(log_buffer))
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", lock_id)
+
+    return enriched
+
+
+async def _notify_links_changed(conn, bank_id: str) -> None:
+    """Drop this bank's cached graph edges in every process once the transaction commits."""
+    from ..memory_engine import get_current_schema
+    from ..search.edge_cache import notify_links_changed
+
+    await notify_links_changed(conn, get_current_schema(), bank_id)
+
+
+def _expand_results(
+    plan: incremental.IncrementalPlan | None, results: list[list[str]], total_contents: int
+) -> list[list[str]]:
+    """Map results back onto all contents when an incremental retain skipped some of them."""
+    return plan.expand_results(results, total_contents) if plan is not None else results
 
 
 def _map_results_to_contents(
@@ -0,0 +1,225 @@
+"""
+Process-wide cache of MPFP adjacency lists.
+
+MPFP loads the top-k edges per link type for every frontier node it reaches. Recalls against
+a hot bank reach the same entry and hub nodes over and over, so SharedEdgeCache keeps those
+adjacency lists across recalls, bounded by the total number of cached edges (LRU by node).
+
+A bank's adjacency only changes when retain adds links or memories are deleted. Writers call
+notify_links_changed inside the writing transaction; Postgres delivers the notification on
+commit and every process drops that bank's cached adjacency. The cache is bypassed while its
+LISTEN connection is down.
+"""
+
+import itertools
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import asyncpg
+
+from ..memory_engine import get_current_schema
+
+if TYPE_CHECKING:
+    from .mpfp_retrieval import EdgeTarget
+
+logger = logging.getLogger(__name__)
+
+LINK_CHANGES_CHANNEL = "hindsight_link_changes"
+
+# Seconds between attempts to re-establish a lost LISTEN connection
+_LISTENER_RETRY_SECONDS = 30.0
+
+# (schema, bank_id, node_id)
+NodeKey = tuple[str, str, str]
+# edge_type -> neighbours, best first
+Adjacency = dict[str, list["EdgeTarget"]]
+
+
+async def notify_links_changed(conn, schema: str, bank_id: str | None = None) -> None:
+    """
+    Tell every process to drop its cached graph edges for a bank (or a whole schema).
+
+    Call inside the transaction that inserts or deletes links; the notification is
+    delivered when it commits.
+    """
+    await conn.execute(
+        "SELECT pg_notify($1, $2)", LINK_CHANGES_CHANNEL, json.dumps({"schema": schema, "bank_id": bank_id})
+    )
+
+
+class SharedEdgeCache:
+    """
+    Edge-count-bounded LRU of per-node adjacency lists, kept current through LISTEN/NOTIFY.
+
+    Each entry holds the top-k edges per link type of one node, as loaded by
+    load_all_edges_for_frontier, and serves any later request for up to that many edges.
+    """
+
+    def __init__(self, max_edges: int):
+        self.max_edges = max_edges
+        self._nodes: OrderedDict[NodeKey, tuple[int, Adjacency, int]] = OrderedDict()  # -> (top_k, edges, size)
+        self._bank_nodes: dict[tuple[str, str], set[str]] = {}
+        self._size = 0
+        # Bumped on invalidation, so loads that raced with a change are not stored
+        self._epoch = 0
+        self._generations: dict[tuple[str, str | None], int] = {}
+        self._counter = itertools.count(1)
+        self._db_url: str | None = None
+        self._listener: asyncpg.Connection | None = None
+        self._last_connect_attempt: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_edges > 0 and self._listener is not None
+
+    async def start(self, db_url: str) -> None:
+        """Open the LISTEN connection. The cache stays bypassed if it cannot connect."""
+        if self.max_edges <= 0:
+            return
+        self._db_url = db_url
+        await self._ensure_listener()
+
+    async def stop(self) -> None:
+        self._db_url = None
+        listener, self._listener = self._listener, None
+        self.clear()
+        if listener is not None and not listener.is_closed():
+            listener.remove_termination_listener(self._on_listener_terminated)
+            await listener.close()
+
+    def clear(self) -> None:
+        self._nodes.clear()
+        self._bank_nodes.clear()
+        self._size = 0
+        self._epoch += 1
+
+    async def _ensure_listener(self) -> bool:
+        if self._listener is not None:
+            return True
+        if self._db_url is None:
+            return False
+        if (
+            self._last_connect_attempt is not None
+            and time.monotonic() - self._last_connect_attempt < _LISTENER_RETRY_SECONDS
+        ):
+            return False
+        self._last_connect_attempt = time.monotonic()
+        try:
+            listener = await asyncpg.connect(self._db_url)
+            await listener.add_listener(LINK_CHANGES_CHANNEL, self._on_notification)
+            listener.add_termination_listener(self._on_listener_terminated)
+        except Exception as e:
+            logger.warning(f"MPFP edge cache disabled: could not LISTEN on {LINK_CHANGES_CHANNEL}: {e}")
+            return False
+        self._listener = listener
+        return True
+
+    def _on_listener_terminated(self, connection) -> None:
+        # Notifications may have been missed; nothing cached can be trusted any more
+        logger.warning("MPFP edge cache LISTEN connection lost, clearing cache")
+        self._listener = None
+        self.clear()
+
+    def _token(self, schema: str, bank_id: str) -> tuple[int, int, int]:
+        return self._epoch, self._generations.get((schema, None), 0), self._generations.get((schema, bank_id), 0)
+
+    async def lookup(
+        self, bank_id: str, node_ids: list[str], top_k: int
+    ) -> tuple[dict[str, dict[str, list["EdgeTarget"]]], list[str], tuple[int, int, int]] | None:
+        """
+        Look up the adjacency of nodes in a bank.
+
+        Returns None when the cache is disabled. Otherwise returns the cached edges grouped
+        as edge_type -> node_id -> neighbours, the node IDs that were found, and a token to
+        pass to store() for the nodes that were not.
+        """
+        if self.max_edges <= 0 or not await self._ensure_listener():
+            return None
+
+        from ...metrics import get_metrics_collector
+
+        schema = get_current_schema()
+        edges_by_type: dict[str, dict[str, list[EdgeTarget]]] = {}
+        hits = []
+        for node_id in node_ids:
+            key = (schema, bank_id, node_id)
+            entry = self._nodes.get(key)
+            if entry is None or entry[0] < top_k:
+                continue
+            self._nodes.move_to_end(key)
+            hits.append(node_id)
+            for edge_type, neighbors in entry[1].items():
+                edges_by_type.setdefault(edge_type, {})[node_id] = neighbors
+        get_metrics_collector().record_cache_access("mpfp_edge", hits=len(hits), misses=len(node_ids) - len(hits))
+        return edges_by_type, hits, self._token(schema, bank_id)
+
+    def store(
+        self,
+        bank_id: str,
+        edges_by_type: dict[str, dict[str, list["EdgeTarget"]]],
+        node_ids: list[str],
+        top_k: int,
+        token: tuple[int, int, int],
+    ) -> None:
+        """Cache freshly loaded adjacency for node_ids, unless the bank changed since lookup()."""
+        schema = get_current_schema()
+        if not self.enabled or self._token(schema, bank_id) != token:
+            return
+        bank_nodes = self._bank_nodes.setdefault((schema, bank_id), set())
+        for node_id in node_ids:
+            adjacency = {edge_type: edges[node_id] for edge_type, edges in edges_by_type.items() if node_id in edges}
+            # Nodes without edges still take a slot, so the bound also limits entry count
+            size = max(1, sum(len(neighbors) for neighbors in adjacency.values()))
+            key = (schema, bank_id, node_id)
+            previous = self._nodes.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._nodes[key] = (top_k, adjacency, size)
+            self._size += size
+            bank_nodes.add(node_id)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._size > self.max_edges and self._nodes:
+            (schema, bank_id, node_id), (_, _, size) = self._nodes.popitem(last=False)
+            self._size -= size
+            bank_nodes = self._bank_nodes.get((schema, bank_id))
+            if bank_nodes is not None:
+                bank_nodes.discard(node_id)
+                if not bank_nodes:
+                    del self._bank_nodes[(schema, bank_id)]
+
+    def invalidate(self, bank_id: str | None = None, schema: str | None = None) -> None:
+        """Drop a bank's (or every bank of a schema's) edges from this process's cache."""
+        schema = schema or get_current_schema()
+        self._generations[(schema, bank_id)] = next(self._counter)
+        banks = [key for key in self._bank_nodes if key[0] == schema and (bank_id is None or key[1] == bank_id)]
+        for key in banks:
+            for node_id in self._bank_nodes.pop(key):
+                entry = self._nodes.pop((schema, key[1], node_id), None)
+                if entry is not None:
+                    self._size -= entry[2]
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self.invalidate(message.get("bank_id"), message["schema"])
+        except Exception as e:
+            logger.warning(f"MPFP edge cache: bad notification {payload!r} ({e}), clearing cache")
+            self.clear()
+
+
+_shared_edge_cache: SharedEdgeCache | None = None
+
+
+def get_shared_edge_cache() -> SharedEdgeCache:
+    """Get (or create) the process-wide MPFP edge cache."""
+    global _shared_edge_cache
+    if _shared_edge_cache is None:
+        from ...config import get_config
+
+        _shared_edge_cache = SharedEdgeCache(get_config().mpfp_edge_cache_max_edges)
+    return _shared_edge_cache
@@ -17,11 +17,13 @@ Key properties:
 
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 
 from ..db_utils import acquire_with_retry
 from ..memory_engine import fq_table
+from .edge_cache import SharedEdgeCache, get_shared_edge_cache
 from .graph_retrieval import GraphRetriever
 from .tags import TagsMatch
 from .types import MPFPTimings, RetrievalResult
@@ -51,6 +53,8 @@ class EdgeCache:
     Shared across patterns to avoid redundant loads.
     Loads ALL edge types at once to minimize DB queries.
     Thread-safe via asyncio lock to prevent redundant concurrent loads.
+    When given a SharedEdgeCache and bank, nodes cached by earlier recalls are served
+    from it and only cold nodes are queried.
     """
 
     # edge_type -> from_node_id -> list of EdgeTarget
@@ -64,6 +68,11 @@ class EdgeCache:
     hop_details: list[dict] = field(default_factory=list)
     # Lock to prevent redundant concurrent loads
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Process-wide adjacency cache backing this one (optional)
+    shared: SharedEdgeCache | None = None
+    bank_id: str | None = None
+    # Nodes served from the shared cache instead of the DB
+    shared_hits: int = 0
 
     def get_neighbors(self, edge_type: str, node_id: str) -> list[EdgeTarget]:
         """Get neighbors for a node via a specific edge type."""
@@ -106,6 +115,37 @@ class EdgeCache:
         # Mark all queried nodes as fully loaded (even if they have no edges)
         self._fully_loaded.update(all_queried)
 
+    async def load(self, pool, node_ids: list[str], top_k_per_type: int) -> int:
+        """
+        Make sure all edges of node_ids are cached, querying only nodes nobody has loaded yet.
+
+        Returns:
+            Number of edges loaded from the DB
+        """
+        uncached = self.get_uncached(node_ids)
+        if not uncached:
+            return 0
+
+        token = None
+        if self.shared is not None and self.bank_id is not None:
+            found = await self.shared.lookup(self.bank_id, uncached, top_k_per_type)
+            if found is not None:
+                edges_by_type, hits, token = found
+                self.add_all_edges(edges_by_type, hits)
+                self.shared_hits += len(hits)
+                uncached = self.get_uncached(uncached)
+                if not uncached:
+                    return 0
+
+        load_start = time.time()
+        edges_by_type = await load_all_edges_for_frontier(pool, uncached, top_k_per_type)
+        self.edge_load_time += time.time() - load_start
+        self.db_queries += 1
+        self.add_all_edges(edges_by_type, uncached)
+        if token is not None:
+            self.shared.store(self.bank_id, edges_by_type, uncached, top_k_per_type, token)
+        return sum(len(neighbors) for edges in edges_by_type.values() for neighbors in edges.values())
+
 
 @dataclass
 class PatternResult:
@@ -325,8 +365,6 @@ async def mpfp_traverse_hop_synchronized(
     Returns:
         List of PatternResult for each pattern
     """
-    import time
-
     # Initialize all pattern states
     states = [_init_pattern_state(seeds, pattern) for seeds, pattern in pattern_jobs]
 
@@ -358,14 +396,8 @@ async def mpfp_traverse_hop_synchronized(
             hop_timing["uncached_after_filter"] = len(uncached_list)
             if uncached_list:
                 load_start = time.time()
-                edges_by_type = await load_all_edges_for_frontier(pool, uncached_list, config.top_k_neighbors)
+                hop_timing["edges_loaded"] = await cache.load(pool, uncached_list, config.top_k_neighbors)
                 hop_timing["load_time"] = time.time() - load_start
-                cache.edge_load_time += hop_timing["load_time"]
-                cache.db_queries += 1
-                cache.add_all_edges(edges_by_type, uncached_list)
-                hop_timing["edges_loaded"] = sum(
-                    len(neighbors) for edges in edges_by_type.values() for neighbors in edges.values()
-                )
 
         hop_timing["total_time"] = time.time() - hop_start
         hop_times.append(hop_timing)
@@ -449,7 +481,7 @@ async def fetch_memory_units_by_ids(
         rows = await conn.fetch(
             f"""
             SELECT id, text, context, event_date, occurred_start, occurred_end,
-                   mentioned_at, embedding, fact_type, document_id, chunk_id, tags
+                   mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens
             FROM {fq_table("memory_units")}
             WHERE id = ANY($1::uuid[])
               AND fact_type = $2
@@ -503,7 +535,7 @@ class MPFPGraphRetriever(GraphRetriever):
         query_text: str | None = None,
         semantic_seeds: list[RetrievalResult] | None = None,
         temporal_seeds: list[RetrievalResult] | None = None,
-        adjacency=None,  # Ignored - kept for interface compatibility
+        adjacency=None,  # Optional EdgeCache shared with other retrievals on the same bank
         tags: list[str] | None = None,
         tags_match: TagsMatch = "any",
     ) -> tuple[list[RetrievalResult], MPFPTimings | None]:
@@ -519,14 +551,13 @@ class MPFPGraphRetriever(GraphRetriever):
             query_text: Original query text (optional)
             semantic_seeds: Pre-computed semantic entry points
             temporal_seeds: Pre-computed temporal entry points
-            adjacency: Ignored (kept for interface compatibility)
+            adjacency: Optional EdgeCache to reuse edges already loaded by other retrievals
+                on the same bank (e.g. the other queries of a batch recall)
             tags: Optional list of tags for visibility filtering (OR matching)
 
         Returns:
             Tuple of (List of RetrievalResult with activation scores, MPFPTimings)
         """
-        import time
-
         timings = MPFPTimings(fact_type=fact_type)
 
         # Convert seeds to SeedNode format
@@ -565,20 +596,17 @@ class MPFPGraphRetriever(GraphRetriever):
 
         timings.pattern_count = len(pattern_jobs)
 
-        # Shared edge cache across all patterns
-        cache = EdgeCache()
+        # Shared edge cache across all patterns (and across retrievals when one is passed in),
+        # backed by the process-wide adjacency cache for this bank
+        cache = adjacency if isinstance(adjacency, EdgeCache) else EdgeCache()
+        if cache.shared is None:
+            cache.shared = get_shared_edge_cache()
+            cache.bank_id = bank_id
 
         # Pre-warm cache with ALL seed node edges BEFORE running patterns
         # This prevents redundant DB queries at hop 1
         all_seed_ids = list({s.node_id for seeds, _ in pattern_jobs for s in seeds})
-        if all_seed_ids:
-            import time as time_module
-
-            prewarm_start = time_module.time()
-            edges_by_type = await load_all_edges_for_frontier(pool, all_seed_ids, self.config.top_k_neighbors)
-            cache.edge_load_time += time_module.time() - prewarm_start
-            cache.db_queries += 1
-            cache.add_all_edges(edges_by_type, all_seed_ids)
+        await cache.load(pool, all_seed_ids, self.config.top_k_neighbors)
 
         # Run all patterns with HOP-SYNCHRONIZED edge loading
         # This batches hop-2 edge loads across ALL patterns into ONE query
@@ -590,6 +618,7 @@ class MPFPGraphRetriever(GraphRetriever):
         # Record edge loading stats from cache
         timings.edge_count = sum(len(neighbors) for g in cache.graphs.values() for neighbors in g.values())
         timings.db_queries = cache.db_queries
+        timings.cache_hits = cache.shared_hits
         timings.edge_load_time = cache.edge_load_time
         timings.hop_details = cache.hop_details
 
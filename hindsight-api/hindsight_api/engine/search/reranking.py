@@ -2,6 +2,8 @@
 Cross-encoder neural reranking for search results.
 """
 
+import asyncio
+
 from .types import MergedCandidate, ScoredResult
 
 
@@ -55,36 +57,25 @@ class CrossEncoderReranker:
         Returns:
             List of ScoredResult objects sorted by cross-encoder score
         """
-        if not candidates:
-            return []
-
-        # Prepare query-document pairs with date information
-        pairs = []
-        for candidate in candidates:
-            retrieval = candidate.retrieval
-
-            # Use text + context for better ranking
-            doc_text = retrieval.text
-            if retrieval.context:
-                doc_text = f"{retrieval.context}: {doc_text}"
-
-            # Add formatted date information for temporal awareness
-            if retrieval.occurred_start:
-                occurred_start = retrieval.occurred_start
+        return (await self.rerank_batch([(query, candidates)]))[0]
 
-                # Format in two styles for better model understanding
-                # 1. ISO format: YYYY-MM-DD
-                date_iso = occurred_start.strftime("%Y-%m-%d")
-
-                # 2. Human-readable: "June 5, 2022"
-                date_readable = occurred_start.strftime("%B %d, %Y")
+    async def rerank_batch(self, requests: list[tuple[str, list[MergedCandidate]]]) -> list[list[ScoredResult]]:
+        """
+        Rerank the candidates of several queries with one cross-encoder call.
 
-                # Prepend date to document text
-                doc_text = f"[Date: {date_readable} ({date_iso})] {doc_text}"
+        Args:
+            requests: (query, candidates) per query
 
-            pairs.append([query, doc_text])
+        Returns:
+            Per request, ScoredResult objects sorted by cross-encoder score
+        """
+        pairs = []
+        for query, candidates in requests:
+            pairs.extend([query, _document_text(candidate)] for candidate in candidates)
+        if not pairs:
+            return [[] for _ in requests]
 
-        # Get cross-encoder scores
+        # Get cross-encoder scores for every (query, candidate) pair at once
         scores = await self.cross_encoder.predict(pairs)
 
         # Normalize scores using sigmoid to [0, 1] range
@@ -94,20 +85,127 @@ class CrossEncoderReranker:
         def sigmoid(x):
             return 1 / (1 + np.exp(-x))
 
-        normalized_scores = [sigmoid(score) for score in scores]
+        results = []
+        offset = 0
+        for _, candidates in requests:
+            request_scores = scores[offset : offset + len(candidates)]
+            offset += len(candidates)
+
+            # Create ScoredResult objects with cross-encoder scores
+            scored_results = []
+            for candidate, raw_score in zip(candidates, request_scores):
+                norm_score = sigmoid(raw_score)
+                scored_result = ScoredResult(
+                    candidate=candidate,
+                    cross_encoder_score=float(raw_score),
+                    cross_encoder_score_normalized=float(norm_score),
+                    weight=float(norm_score),  # Initial weight is just cross-encoder score
+                )
+                scored_results.append(scored_result)
+
+            # Sort by cross-encoder score
+            scored_results.sort(key=lambda x: x.weight, reverse=True)
+            results.append(scored_results)
+
+        return results
+
+
+def _document_text(candidate: MergedCandidate) -> str:
+    """Document side of a cross-encoder pair: text with context and date information."""
+    retrieval = candidate.retrieval
+
+    # Use text + context for better ranking
+    doc_text = retrieval.text
+    if retrieval.context:
+        doc_text = f"{retrieval.context}: {doc_text}"
+
+    # Add formatted date information for temporal awareness
+    if retrieval.occurred_start:
+        occurred_start = retrieval.occurred_start
+
+        # Format in two styles for better model understanding
+        # 1. ISO format: YYYY-MM-DD
+        date_iso = occurred_start.strftime("%Y-%m-%d")
+
+        # 2. Human-readable: "June 5, 2022"
+        date_readable = occurred_start.strftime("%B %d, %Y")
 
-        # Create ScoredResult objects with cross-encoder scores
-        scored_results = []
-        for candidate, raw_score, norm_score in zip(candidates, scores, normalized_scores):
-            scored_result = ScoredResult(
-                candidate=candidate,
-                cross_encoder_score=float(raw_score),
-                cross_encoder_score_normalized=float(norm_score),
-                weight=float(norm_score),  # Initial weight is just cross-encoder score
-            )
-            scored_results.append(scored_result)
+        # Prepend date to document text
+        doc_text = f"[Date: {date_readable} ({date_iso})] {doc_text}"
 
-        # Sort by cross-encoder score
-        scored_results.sort(key=lambda x: x.weight, reverse=True)
+    return doc_text
 
-        return scored_results
+
+class RerankBatch:
+    """
+    Gathers the rerank calls of a fixed set of concurrent recalls into one cross-encoder call.
+
+    Every participant either calls rerank() once or leaves without reranking (e.g. it failed
+    earlier); the batch is scored as soon as every remaining participant has submitted.
+    """
+
+    def __init__(self, reranker: CrossEncoderReranker, participants: int):
+        self._reranker = reranker
+        self._remaining = participants
+        self._pending: list[tuple[str, list[MergedCandidate], asyncio.Future]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def participant(self) -> "_RerankParticipant":
+        return _RerankParticipant(self)
+
+    async def _submit(self, query: str, candidates: list[MergedCandidate]) -> list[ScoredResult]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, candidates, future))
+        self._maybe_flush()
+        return await future
+
+    def _leave(self) -> None:
+        self._remaining -= 1
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if not self._pending or len(self._pending) < self._remaining:
+            return
+        batch, self._pending = self._pending, []
+        self._remaining -= len(batch)
+        task = asyncio.ensure_future(self._score(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _score(self, batch: list[tuple[str, list[MergedCandidate], asyncio.Future]]) -> None:
+        try:
+            results = await self._reranker.rerank_batch([(query, candidates) for query, candidates, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), scored in zip(batch, results):
+            if not future.done():
+                future.set_result(scored)
+
+
+class _RerankParticipant:
+    """One recall's view of a RerankBatch (use as an async context manager)."""
+
+    def __init__(self, batch: RerankBatch):
+        self._batch = batch
+        self._submitted = False
+
+    async def __aenter__(self) -> "_RerankParticipant":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if not self._submitted:
+            self._submitted = True
+            self._batch._leave()
+
+    async def ensure_initialized(self) -> None:
+        await self._batch._reranker.ensure_initialized()
+
+    async def rerank(self, query: str, candidates: list[MergedCandidate]) -> list[ScoredResult]:
+        if self._submitted:
+            # Already scored with the batch (e.g. a retried search); score on its own
+            return await self._batch._reranker.rerank(query, candidates)
+        self._submitted = True
+        return await self._batch._submit(query, candidates)
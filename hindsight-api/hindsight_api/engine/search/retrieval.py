@@ -10,13 +10,17 @@ Implements:
 
 import asyncio
 import logging
-from dataclasses import dataclass, field
+import math
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from typing import Optional
 
 from ...config import get_config
-from ..db_utils import acquire_with_retry
-from ..memory_engine import fq_table
+from ..db_utils import acquire_with_retry, supports_hnsw_iterative_scan
+from ..memory_engine import fq_table, get_current_schema
+from .fusion import reciprocal_rank_fusion
 from .graph_retrieval import BFSGraphRetriever, GraphRetriever
 from .link_expansion_retrieval import LinkExpansionRetriever
 from .mpfp_retrieval import MPFPGraphRetriever
@@ -40,6 +44,28 @@ class ParallelRetrievalResult:
     max_conn_wait: float = 0.0  # Maximum connection acquisition wait time across all methods
 
 
+@dataclass
+class AdaptiveDecision:
+    """How adaptive recall sized graph and temporal retrieval after semantic + BM25."""
+
+    # Results expected to fit in max_tokens
+    target_results: int
+    # Graph budget per fact type (0 = graph retrieval skipped)
+    graph_budget: int
+    # Temporal budget (only used when the query has a temporal constraint)
+    temporal_budget: int
+    # Fraction of the semantic top-k also in the BM25 top-k
+    overlap: float
+    # Lowest similarity inside the fused top-k minus the highest outside it (None if undefined)
+    score_gap: float | None
+    # Whether the fused top-k was considered stable (graph skipped)
+    stable: bool
+    reason: str
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
 @dataclass
 class MultiFactTypeRetrievalResult:
     """Result from retrieval across all fact types."""
@@ -50,6 +76,89 @@ class MultiFactTypeRetrievalResult:
     timings: dict[str, float] = field(default_factory=dict)
     # Max connection wait across all operations
     max_conn_wait: float = 0.0
+    # Adaptive recall decision (None when adaptive recall is off)
+    adaptive: AdaptiveDecision | None = None
+
+
+# Adaptive recall: graph/temporal budget per result that fits in max_tokens, and its floor
+_ADAPTIVE_BUDGET_PER_RESULT = 4
+_ADAPTIVE_MIN_BUDGET = 20
+# Assumed tokens per fact when none of the first-stage results has a stored count
+_ADAPTIVE_DEFAULT_FACT_TOKENS = 40
+
+
+def plan_adaptive_retrieval(
+    semantic_bm25_results: dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]],
+    thinking_budget: int,
+    max_tokens: int,
+    min_overlap: float,
+    min_score_gap: float,
+) -> AdaptiveDecision:
+    """
+    Decide how much graph and temporal retrieval a recall still needs after semantic + BM25.
+
+    The budget is scaled to the number of results that fit in max_tokens: exploring
+    thinking_budget graph nodes is wasted when the token filter keeps a handful of facts.
+    Graph retrieval is skipped entirely when the semantic + BM25 top-k is already stable,
+    meaning either:
+
+    - overlap: at least min_overlap of the semantic top-k is also in the BM25 top-k, so two
+      independent signals agree on what the answer is
+    - score gap: the semantic hits in the fused top-k are at least min_score_gap more similar
+      than every semantic hit outside it
+
+    Temporal retrieval is never skipped (it is the only method honoring the query's date
+    range), only shrunk to the scaled budget.
+
+    Args:
+        semantic_bm25_results: Semantic and BM25 results per fact type
+        thinking_budget: Budget the recall was requested with
+        max_tokens: Token budget of the recall response
+        min_overlap: Overlap at or above which the top-k is stable
+        min_score_gap: Score gap at or above which the top-k is stable
+
+    Returns:
+        AdaptiveDecision with the budgets to use
+    """
+    semantic = sorted(
+        (r for sem, _ in semantic_bm25_results.values() for r in sem), key=lambda r: r.similarity or 0.0, reverse=True
+    )
+    bm25 = sorted(
+        (r for _, bm in semantic_bm25_results.values() for r in bm), key=lambda r: r.bm25_score or 0.0, reverse=True
+    )
+
+    sample = semantic[:20] + bm25[:20]
+    if sample:
+        counts = [r.text_tokens if r.text_tokens is not None else len(r.text) // 4 + 1 for r in sample]
+        tokens_per_result = max(sum(counts) / len(counts), 1.0)
+    else:
+        tokens_per_result = _ADAPTIVE_DEFAULT_FACT_TOKENS
+    target = max(1, min(thinking_budget, math.ceil(max_tokens / tokens_per_result)))
+    scaled_budget = min(thinking_budget, max(target * _ADAPTIVE_BUDGET_PER_RESULT, _ADAPTIVE_MIN_BUDGET))
+
+    if not semantic:
+        return AdaptiveDecision(target, scaled_budget, scaled_budget, 0.0, None, False, "no semantic results")
+
+    semantic_top = {r.id for r in semantic[:target]}
+    bm25_top = {r.id for r in bm25[:target]}
+    overlap = len(semantic_top & bm25_top) / min(target, len(semantic)) if bm25 else 0.0
+
+    fused_top = {c.id for c in reciprocal_rank_fusion([semantic, bm25])[:target]}
+    inside = [r.similarity or 0.0 for r in semantic if r.id in fused_top]
+    outside = [r.similarity or 0.0 for r in semantic if r.id not in fused_top]
+    score_gap = min(inside) - max(outside) if inside and outside else None
+
+    if overlap >= min_overlap:
+        return AdaptiveDecision(
+            target, 0, scaled_budget, overlap, score_gap, True, f"semantic/bm25 overlap {overlap:.2f}"
+        )
+    if score_gap is not None and score_gap >= min_score_gap:
+        return AdaptiveDecision(
+            target, 0, scaled_budget, overlap, score_gap, True, f"semantic score gap {score_gap:.3f}"
+        )
+    return AdaptiveDecision(
+        target, scaled_budget, scaled_budget, overlap, score_gap, False, "top-k not stable, graph budget scaled"
+    )
 
 
 # Default graph retriever instance (can be overridden)
@@ -116,7 +225,7 @@ async def retrieve_semantic(
 
     results = await conn.fetch(
         f"""
-        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
+        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
                1 - (embedding <=> $1::vector) AS similarity
         FROM {fq_table("memory_units")}
         WHERE bank_id = $2
@@ -180,7 +289,7 @@ async def retrieve_bm25(
 
     results = await conn.fetch(
         f"""
-        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
+        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
                ts_rank_cd(search_vector, to_tsquery('english', $1)) AS bm25_score
         FROM {fq_table("memory_units")}
         WHERE bank_id = $2
@@ -195,6 +304,210 @@ async def retrieve_bm25(
     return [RetrievalResult.from_db_row(dict(r)) for r in results]
 
 
+# Fact types with a partial HNSW index (see migration m8h9i0j1k2l3). ANN probes inline
+# the fact type as a literal so the planner can match the partial index predicate.
+ANN_INDEXED_FACT_TYPES = frozenset(["world", "experience", "observation"])
+
+# Minimum similarity for semantic candidates (applied after the index-ordered scan in ANN mode)
+SEMANTIC_SIMILARITY_THRESHOLD = 0.3
+
+# pgvector caps hnsw.ef_search at 1000
+_ANN_EF_SEARCH_MIN = 40
+_ANN_EF_SEARCH_MAX = 1000
+
+# Seconds a "too small for ANN" decision is reused before the bank size is checked again.
+# "Large enough" decisions are kept: banks rarely shrink, and ANN stays exact on a small bank.
+ANN_DECISION_TTL_SECONDS = 300.0
+_ANN_DECISION_CACHE_MAX = 10_000
+
+# (schema, bank_id, fact_types, min bank size) -> (monotonic expiry, 0 = never; use_ann)
+_ann_decisions: OrderedDict[tuple[str, str, tuple[str, ...], int], tuple[float, bool]] = OrderedDict()
+
+
+def compute_ann_ef_search(limit: int) -> int:
+    """
+    Size the HNSW candidate list for a probe returning `limit` rows.
+
+    The candidate list must be at least as large as the requested limit, and is doubled
+    to leave headroom for rows dropped by the bank/tags post-filter.
+    """
+    return max(_ANN_EF_SEARCH_MIN, min(_ANN_EF_SEARCH_MAX, limit * 2))
+
+
+async def should_use_ann(conn, bank_id: str, fact_types: list[str]) -> bool:
+    """
+    Decide whether semantic retrieval should use the HNSW index-ordered path.
+
+    Small banks are served by the exact path: a sequential scan over a few thousand rows
+    is cheap and gives perfect recall. So is every bank when pgvector has no iterative
+    scans (< 0.8): the index would then post-filter one ef_search candidate list shared
+    by all banks, and a bank could get far fewer than `limit` results.
+
+    The bank size check is bounded by the threshold, and its outcome is cached per bank
+    (see ANN_DECISION_TTL_SECONDS), so recalls don't pay an extra query each.
+    """
+    config = get_config()
+    if not config.recall_ann_enabled:
+        return False
+    if not fact_types or any(ft not in ANN_INDEXED_FACT_TYPES for ft in fact_types):
+        return False
+    if not await supports_hnsw_iterative_scan(conn):
+        return False
+
+    min_size = config.recall_ann_min_bank_size
+    if min_size <= 0:
+        return True
+
+    key = (get_current_schema(), bank_id, tuple(sorted(fact_types)), min_size)
+    now = time.monotonic()
+    cached = _ann_decisions.get(key)
+    if cached is not None and (not cached[0] or cached[0] > now):
+        _ann_decisions.move_to_end(key)
+        return cached[1]
+
+    bounded_count = await conn.fetchval(
+        f"""
+        SELECT COUNT(*) FROM (
+            SELECT 1 FROM {fq_table("memory_units")}
+            WHERE bank_id = $1 AND fact_type = ANY($2)
+            LIMIT $3
+        ) s
+        """,
+        bank_id,
+        fact_types,
+        min_size,
+    )
+    use_ann = bounded_count >= min_size
+    _ann_decisions[key] = (0.0 if use_ann else now + ANN_DECISION_TTL_SECONDS, use_ann)
+    _ann_decisions.move_to_end(key)
+    while len(_ann_decisions) > _ANN_DECISION_CACHE_MAX:
+        _ann_decisions.popitem(last=False)
+    return use_ann
+
+
+async def _configure_ann_scan(conn, limit: int) -> None:
+    """Apply per-transaction HNSW settings for an ANN probe. Must run inside a transaction."""
+    await conn.execute(f"SET LOCAL hnsw.ef_search = {compute_ann_ef_search(limit)}")
+    if await supports_hnsw_iterative_scan(conn):
+        # Keep scanning the graph until LIMIT rows survive the bank/tags filters
+        await conn.execute("SET LOCAL hnsw.iterative_scan = strict_order")
+
+
+def _build_semantic_ann_sql(fact_types: list[str], tags_clause: str, emb: str = "$1") -> str:
+    """
+    Build one index-ordered probe per fact type, combined with UNION ALL.
+
+    Each branch is a plain `ORDER BY embedding <=> $1 LIMIT $4` over a single fact type,
+    which pgvector can serve from the partial HNSW index. Bank and tags are filtered
+    during the scan; the similarity threshold is applied by the caller on the output.
+    Parameters: $1 = query embedding (or the `emb` expression), $2 = bank_id, $3 = fact_types, $4 = limit.
+    """
+    branches = []
+    for ft in fact_types:
+        # Fact types are validated against ANN_INDEXED_FACT_TYPES before reaching here
+        branches.append(
+            f"""(
+                SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                       1 - (embedding <=> {emb}::vector) AS similarity,
+                       NULL::float AS bm25_score,
+                       'semantic' AS source
+                FROM {fq_table("memory_units")}
+                WHERE fact_type = '{ft}'
+                  AND fact_type = ANY($3)
+                  AND bank_id = $2
+                  AND embedding IS NOT NULL
+                  {tags_clause}
+                ORDER BY embedding <=> {emb}::vector
+                LIMIT $4
+            )"""
+        )
+    return "\n            UNION ALL\n            ".join(branches)
+
+
+def _build_semantic_sql(fact_types: list[str], tags_clause: str, use_ann: bool, emb: str = "$1") -> str:
+    """Top-$4 semantic matches per fact type above the similarity threshold."""
+    if use_ann:
+        return f"""
+            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                   similarity, bm25_score, source
+            FROM (
+            {_build_semantic_ann_sql(fact_types, tags_clause, emb)}
+            ) ann
+            WHERE similarity >= {SEMANTIC_SIMILARITY_THRESHOLD}
+        """
+    return f"""
+            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                   similarity, bm25_score, source
+            FROM (
+                SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                       1 - (embedding <=> {emb}::vector) AS similarity,
+                       NULL::float AS bm25_score,
+                       'semantic' AS source,
+                       ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY embedding <=> {emb}::vector) AS rn
+                FROM {fq_table("memory_units")}
+                WHERE bank_id = $2
+                  AND embedding IS NOT NULL
+                  AND fact_type = ANY($3)
+                  AND (1 - (embedding <=> {emb}::vector)) >= {SEMANTIC_SIMILARITY_THRESHOLD}
+                  {tags_clause}
+            ) semantic_ranked
+            WHERE rn <= $4
+        """
+
+
+def _build_bm25_sql(tags_clause: str, tsquery: str = "$5") -> str:
+    """Top-$4 BM25 matches per fact type for a tsquery string (param $5 or the `tsquery` expression)."""
+    return f"""
+            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                   similarity, bm25_score, source
+            FROM (
+                SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
+                       NULL::float AS similarity,
+                       ts_rank_cd(search_vector, to_tsquery('english', {tsquery})) AS bm25_score,
+                       'bm25' AS source,
+                       ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY ts_rank_cd(search_vector, to_tsquery('english', {tsquery})) DESC) AS rn
+                FROM {fq_table("memory_units")}
+                WHERE bank_id = $2
+                  AND fact_type = ANY($3)
+                  AND search_vector @@ to_tsquery('english', {tsquery})
+                  {tags_clause}
+            ) bm25_ranked
+            WHERE rn <= $4
+        """
+
+
+def _bm25_tsquery(query_text: str) -> str:
+    """OR-tsquery over the query's word tokens ("" when it has none)."""
+    import re
+
+    # Sanitize query text for BM25 (same as retrieve_bm25)
+    sanitized_text = re.sub(r"[^\w\s]", " ", query_text.lower())
+    return " | ".join(token for token in sanitized_text.split() if token)
+
+
+def _group_semantic_bm25_rows(
+    rows, fact_types: list[str]
+) -> dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]]:
+    """Group combined semantic/BM25 rows into fact_type -> (semantic_results, bm25_results)."""
+    result_dict: dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]] = {ft: ([], []) for ft in fact_types}
+    for r in rows:
+        row = dict(r)
+        row.pop("query_index", None)
+        source = row.pop("source", None)
+        ft = row.get("fact_type")
+        if ft in result_dict:
+            if source == "semantic":
+                result_dict[ft][0].append(RetrievalResult.from_db_row(row))
+            else:
+                result_dict[ft][1].append(RetrievalResult.from_db_row(row))
+
+    # UNION ALL gives no ordering guarantee; keep semantic lists best-first for RRF
+    for semantic_results, _ in result_dict.values():
+        semantic_results.sort(key=lambda r: r.similarity or 0.0, reverse=True)
+
+    return result_dict
+
+
 async def retrieve_semantic_bm25_combined(
     conn,
     query_emb_str: str,
@@ -204,6 +517,7 @@ async def retrieve_semantic_bm25_combined(
     limit: int,
     tags: list[str] | None = None,
     tags_match: TagsMatch = "any",
+    use_ann: bool = False,
 ) -> dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]]:
     """
     Combined semantic + BM25 retrieval for multiple fact types in a single query.
@@ -211,6 +525,9 @@ async def retrieve_semantic_bm25_combined(
     Uses CTEs with window functions to get top-N results per fact type per method,
     all in one database round-trip.
 
+    With use_ann=True the semantic side is served by one HNSW index-ordered probe per
+    fact type instead of a window function over the whole bank (see should_use_ann).
+
     Args:
         conn: Database connection
         query_emb_str: Query embedding as string
@@ -218,123 +535,113 @@ async def retrieve_semantic_bm25_combined(
         bank_id: Bank ID
         fact_types: List of fact types to retrieve
         limit: Maximum results per method per fact type
+        use_ann: Use approximate (HNSW) semantic search
 
     Returns:
         Dict mapping fact_type -> (semantic_results, bm25_results)
     """
-    import re
+    query_tsquery = _bm25_tsquery(query_text)
 
-    # Sanitize query text for BM25 (same as retrieve_bm25)
-    sanitized_text = re.sub(r"[^\w\s]", " ", query_text.lower())
-    tokens = [token for token in sanitized_text.split() if token]
+    # Tags clause - param 5 for semantic-only, param 6 when BM25 tsquery takes $5
+    tags_param_idx = 6 if query_tsquery else 5
+    tags_clause = build_tags_where_clause_simple(tags, tags_param_idx, match=tags_match)
+    semantic_sql = _build_semantic_sql(fact_types, tags_clause, use_ann)
 
     # If no valid tokens for BM25, just run semantic
-    if not tokens:
-        tags_clause = build_tags_where_clause_simple(tags, 5, match=tags_match)
+    if not query_tsquery:
         params = [query_emb_str, bank_id, fact_types, limit]
         if tags:
             params.append(tags)
-        results = await conn.fetch(
-            f"""
-            WITH semantic_ranked AS (
-                SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                       1 - (embedding <=> $1::vector) AS similarity,
-                       NULL::float AS bm25_score,
-                       'semantic' AS source,
-                       ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY embedding <=> $1::vector) AS rn
-                FROM {fq_table("memory_units")}
-                WHERE bank_id = $2
-                  AND embedding IS NOT NULL
-                  AND fact_type = ANY($3)
-                  AND (1 - (embedding <=> $1::vector)) >= 0.3
-                  {tags_clause}
-            )
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                   similarity, bm25_score, source
-            FROM semantic_ranked
-            WHERE rn <= $4
-            """,
-            *params,
-        )
-        # Group by fact_type
-        result_dict: dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]] = {
-            ft: ([], []) for ft in fact_types
-        }
-        for r in results:
-            row = dict(r)
-            ft = row.get("fact_type")
-            row.pop("source", None)
-            if ft in result_dict:
-                result_dict[ft][0].append(RetrievalResult.from_db_row(row))
-        return result_dict
+        query = f"WITH semantic AS ({semantic_sql}) SELECT * FROM semantic"
+    else:
+        params = [query_emb_str, bank_id, fact_types, limit, query_tsquery]
+        if tags:
+            params.append(tags)
 
-    query_tsquery = " | ".join(tokens)
+        # Combined CTE query for both semantic and BM25 across all fact types
+        # Uses window functions to limit per fact_type per method
+        query = f"""
+        WITH semantic AS ({semantic_sql}),
+        bm25 AS ({_build_bm25_sql(tags_clause)})
+        SELECT * FROM semantic
+        UNION ALL
+        SELECT * FROM bm25
+        """
+
+    if use_ann:
+        # SET LOCAL only lives for the transaction, so the settings never leak back into the pool
+        async with conn.transaction():
+            await _configure_ann_scan(conn, limit)
+            results = await conn.fetch(query, *params)
+    else:
+        results = await conn.fetch(query, *params)
+
+    return _group_semantic_bm25_rows(results, fact_types)
+
+
+async def retrieve_semantic_bm25_batch(
+    conn,
+    query_emb_strs: list[str],
+    query_texts: list[str],
+    bank_id: str,
+    fact_types: list[str],
+    limit: int,
+    tags: list[str] | None = None,
+    tags_match: TagsMatch = "any",
+    use_ann: bool = False,
+) -> list[dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]]]:
+    """
+    Semantic + BM25 retrieval for several queries against one bank in a single round-trip.
+
+    Runs the same per-fact-type top-N probes as retrieve_semantic_bm25_combined, once per
+    query via LATERAL joins over the unnested query embeddings and tsqueries.
+
+    Args:
+        conn: Database connection
+        query_emb_strs: Query embeddings as strings
+        query_texts: Query texts for BM25 (same order as query_emb_strs)
+        bank_id: Bank ID
+        fact_types: List of fact types to retrieve
+        limit: Maximum results per method per fact type per query
+        use_ann: Use approximate (HNSW) semantic search
+
+    Returns:
+        One dict per query (input order) mapping fact_type -> (semantic_results, bm25_results)
+    """
+    if not query_emb_strs:
+        return []
 
-    # Build tags clause - param 6 if tags provided
+    tsqueries = [_bm25_tsquery(text) for text in query_texts]
     tags_clause = build_tags_where_clause_simple(tags, 6, match=tags_match)
-    params = [query_emb_str, bank_id, fact_types, limit, query_tsquery]
+    params = [query_emb_strs, bank_id, fact_types, limit, tsqueries]
     if tags:
         params.append(tags)
 
-    # Combined CTE query for both semantic and BM25 across all fact types
-    # Uses window functions to limit per fact_type per method
-    results = await conn.fetch(
-        f"""
-        WITH semantic_ranked AS (
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                   1 - (embedding <=> $1::vector) AS similarity,
-                   NULL::float AS bm25_score,
-                   'semantic' AS source,
-                   ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY embedding <=> $1::vector) AS rn
-            FROM {fq_table("memory_units")}
-            WHERE bank_id = $2
-              AND embedding IS NOT NULL
-              AND fact_type = ANY($3)
-              AND (1 - (embedding <=> $1::vector)) >= 0.3
-              {tags_clause}
-        ),
-        bm25_ranked AS (
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                   NULL::float AS similarity,
-                   ts_rank_cd(search_vector, to_tsquery('english', $5)) AS bm25_score,
-                   'bm25' AS source,
-                   ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY ts_rank_cd(search_vector, to_tsquery('english', $5)) DESC) AS rn
-            FROM {fq_table("memory_units")}
-            WHERE bank_id = $2
-              AND fact_type = ANY($3)
-              AND search_vector @@ to_tsquery('english', $5)
-              {tags_clause}
-        ),
-        semantic AS (
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                   similarity, bm25_score, source
-            FROM semantic_ranked WHERE rn <= $4
-        ),
-        bm25 AS (
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
-                   similarity, bm25_score, source
-            FROM bm25_ranked WHERE rn <= $4
-        )
-        SELECT * FROM semantic
-        UNION ALL
-        SELECT * FROM bm25
-        """,
-        *params,
+    query = f"""
+    WITH q AS (
+        SELECT emb, tsq, query_index
+        FROM unnest($1::text[], $5::text[]) WITH ORDINALITY AS q(emb, tsq, query_index)
     )
+    SELECT q.query_index, s.*
+    FROM q
+    CROSS JOIN LATERAL ({_build_semantic_sql(fact_types, tags_clause, use_ann, emb="q.emb")}) s
+    UNION ALL
+    SELECT q.query_index, b.*
+    FROM (SELECT * FROM q WHERE tsq <> '') q
+    CROSS JOIN LATERAL ({_build_bm25_sql(tags_clause, tsquery="q.tsq")}) b
+    """
 
-    # Group results by fact_type and source
-    result_dict: dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]] = {ft: ([], []) for ft in fact_types}
-    for r in results:
-        row = dict(r)
-        source = row.pop("source", None)
-        ft = row.get("fact_type")
-        if ft in result_dict:
-            if source == "semantic":
-                result_dict[ft][0].append(RetrievalResult.from_db_row(row))
-            else:
-                result_dict[ft][1].append(RetrievalResult.from_db_row(row))
+    if use_ann:
+        async with conn.transaction():
+            await _configure_ann_scan(conn, limit)
+            rows = await conn.fetch(query, *params)
+    else:
+        rows = await conn.fetch(query, *params)
 
-    return result_dict
+    rows_by_query: list[list] = [[] for _ in query_emb_strs]
+    for row in rows:
+        rows_by_query[row["query_index"] - 1].append(row)
+    return [_group_semantic_bm25_rows(query_rows, fact_types) for query_rows in rows_by_query]
 
 
 async def retrieve_temporal_combined(
@@ -386,7 +693,7 @@ async def retrieve_temporal_combined(
     entry_points = await conn.fetch(
         f"""
         WITH ranked_entries AS (
-            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
+            SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
                    1 - (embedding <=> $1::vector) AS similarity,
                    ROW_NUMBER() OVER (PARTITION BY fact_type ORDER BY COALESCE(occurred_start, mentioned_at, occurred_end) DESC, embedding <=> $1::vector) AS rn
             FROM {fq_table("memory_units")}
@@ -406,7 +713,7 @@ async def retrieve_temporal_combined(
               AND (1 - (embedding <=> $1::vector)) >= $6
               {tags_clause}
         )
-        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags, similarity
+        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens, similarity
         FROM ranked_entries
         WHERE rn <= 10
         """,
@@ -486,7 +793,7 @@ async def retrieve_temporal_combined(
 
             neighbors = await conn.fetch(
                 f"""
-                SELECT mu.id, mu.text, mu.context, mu.event_date, mu.occurred_start, mu.occurred_end, mu.mentioned_at, mu.embedding, mu.fact_type, mu.document_id, mu.chunk_id, mu.tags,
+                SELECT mu.id, mu.text, mu.context, mu.event_date, mu.occurred_start, mu.occurred_end, mu.mentioned_at, mu.fact_type, mu.document_id, mu.chunk_id, mu.tags, mu.text_tokens,
                        ml.weight, ml.link_type, ml.from_unit_id,
                        1 - (mu.embedding <=> $1::vector) AS similarity
                 FROM {fq_table("memory_links")} ml
@@ -610,7 +917,7 @@ async def retrieve_temporal(
 
     entry_points = await conn.fetch(
         f"""
-        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, embedding, fact_type, document_id, chunk_id, tags,
+        SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at, fact_type, document_id, chunk_id, tags, text_tokens,
                1 - (embedding <=> $1::vector) AS similarity
         FROM {fq_table("memory_units")}
         WHERE bank_id = $2
@@ -691,7 +998,7 @@ async def retrieve_temporal(
         # Batch fetch all neighbors for this batch of nodes
         neighbors = await conn.fetch(
             f"""
-            SELECT mu.id, mu.text, mu.context, mu.event_date, mu.occurred_start, mu.occurred_end, mu.mentioned_at, mu.embedding, mu.fact_type, mu.document_id, mu.chunk_id,
+            SELECT mu.id, mu.text, mu.context, mu.event_date, mu.occurred_start, mu.occurred_end, mu.mentioned_at, mu.fact_type, mu.document_id, mu.chunk_id, mu.text_tokens,
                    ml.weight, ml.link_type, ml.from_unit_id,
                    1 - (mu.embedding <=> $1::vector) AS similarity
             FROM {fq_table("memory_links")} ml
@@ -1023,7 +1330,7 @@ async def _get_temporal_entry_points(
     rows = await conn.fetch(
         f"""
         SELECT id, text, context, event_date, occurred_start, occurred_end, mentioned_at,
-               embedding, fact_type, document_id, chunk_id,
+               fact_type, document_id, chunk_id, text_tokens,
                1 - (embedding <=> $1::vector) AS similarity
         FROM {fq_table("memory_units")}
         WHERE bank_id = $2
@@ -1190,6 +1497,10 @@ async def retrieve_all_fact_types_parallel(
     graph_retriever: GraphRetriever | None = None,
     tags: list[str] | None = None,
     tags_match: TagsMatch = "any",
+    semantic_bm25_results: dict[str, tuple[list[RetrievalResult], list[RetrievalResult]]] | None = None,
+    edge_cache=None,
+    adaptive: bool = False,
+    max_tokens: int | None = None,
 ) -> MultiFactTypeRetrievalResult:
     """
     Optimized retrieval for multiple fact types using batched queries.
@@ -1209,6 +1520,11 @@ async def retrieve_all_fact_types_parallel(
         question_date: Optional date when question was asked (for temporal filtering)
         query_analyzer: Query analyzer to use (defaults to TransformerQueryAnalyzer)
         graph_retriever: Graph retrieval strategy (defaults to configured retriever)
+        semantic_bm25_results: Pre-computed semantic + BM25 results (batch recall); skips that query
+        edge_cache: Graph edge cache shared with other retrievals on the same bank (batch recall)
+        adaptive: Size graph and temporal retrieval from the semantic + BM25 results
+            (see plan_adaptive_retrieval); requires max_tokens
+        max_tokens: Token budget of the recall response (adaptive recall)
 
     Returns:
         MultiFactTypeRetrievalResult with results organized by fact type
@@ -1237,19 +1553,41 @@ async def retrieve_all_fact_types_parallel(
     async with acquire_with_retry(pool) as conn:
         conn_wait = time.time() - semantic_bm25_start
 
-        # Semantic + BM25 combined
-        semantic_bm25_results = await retrieve_semantic_bm25_combined(
-            conn,
-            query_embedding_str,
-            query_text,
-            bank_id,
-            fact_types,
-            thinking_budget,
-            tags=tags,
-            tags_match=tags_match,
-        )
+        # Semantic + BM25 combined (unless the caller already ran it for a batch of queries)
+        if semantic_bm25_results is None:
+            # Large banks use HNSW index-ordered probes; small banks stay on the exact path
+            use_ann = await should_use_ann(conn, bank_id, fact_types)
+            if use_ann:
+                logger.debug(f"[RECALL {bank_id[:8]}] Using ANN semantic retrieval")
+
+            semantic_bm25_results = await retrieve_semantic_bm25_combined(
+                conn,
+                query_embedding_str,
+                query_text,
+                bank_id,
+                fact_types,
+                thinking_budget,
+                tags=tags,
+                tags_match=tags_match,
+                use_ann=use_ann,
+            )
         semantic_bm25_time = time.time() - semantic_bm25_start
 
+        decision: AdaptiveDecision | None = None
+        graph_budget = thinking_budget
+        temporal_budget = thinking_budget
+        if adaptive and max_tokens is not None:
+            config = get_config()
+            decision = plan_adaptive_retrieval(
+                semantic_bm25_results,
+                thinking_budget,
+                max_tokens,
+                min_overlap=config.recall_adaptive_min_overlap,
+                min_score_gap=config.recall_adaptive_min_score_gap,
+            )
+            graph_budget = decision.graph_budget
+            temporal_budget = decision.temporal_budget
+
         # Temporal combined (if constraint detected) - same connection!
         if temporal_constraint:
             tc_start, tc_end = temporal_constraint
@@ -1261,7 +1599,7 @@ async def retrieve_all_fact_types_parallel(
                 fact_types,
                 tc_start,
                 tc_end,
-                budget=thinking_budget,
+                budget=temporal_budget,
                 semantic_threshold=0.1,
                 tags=tags,
                 tags_match=tags_match,
@@ -1279,17 +1617,18 @@ async def retrieve_all_fact_types_parallel(
             query_embedding_str=query_embedding_str,
             bank_id=bank_id,
             fact_type=ft,
-            budget=thinking_budget,
+            budget=graph_budget,
             query_text=query_text,
             semantic_seeds=None,
             temporal_seeds=None,
+            adjacency=edge_cache,
             tags=tags,
             tags_match=tags_match,
         )
         return ft, results, time.time() - graph_start, mpfp_timing
 
-    # Run graph for all fact types in parallel
-    graph_tasks = [run_graph_for_fact_type(ft) for ft in fact_types]
+    # Run graph for all fact types in parallel (unless adaptive recall found the top-k stable)
+    graph_tasks = [run_graph_for_fact_type(ft) for ft in fact_types] if graph_budget > 0 else []
     graph_results_list = await asyncio.gather(*graph_tasks)
 
     # Organize results by fact type
@@ -1343,4 +1682,5 @@ async def retrieve_all_fact_types_parallel(
         results_by_fact_type=results_by_fact_type,
         timings=timings,
         max_conn_wait=max_conn_wait,
+        adaptive=decision,
     )
@@ -284,6 +284,18 @@ class SearchTracer:
             )
         )
 
+    def record_adaptive_decision(self, decision: dict[str, Any]):
+        """
+        Record how adaptive recall sized graph and temporal retrieval.
+
+        Stored as the "adaptive_retrieval" phase so traces of adaptive and full recalls can be
+        compared for quality versus latency.
+
+        Args:
+            decision: AdaptiveDecision fields (budgets, overlap, score gap, reason)
+        """
+        self.add_phase_metric("adaptive_retrieval", 0.0, decision)
+
     def add_phase_metric(self, phase_name: str, duration_seconds: float, details: dict[str, Any] | None = None):
         """
         Record metrics for a search phase.
@@ -17,6 +17,7 @@ class MPFPTimings:
     fact_type: str
     edge_count: int = 0  # Total edges loaded
     db_queries: int = 0  # Number of DB queries for edge loading
+    cache_hits: int = 0  # Nodes whose edges came from the shared edge cache instead of the DB
     edge_load_time: float = 0.0  # Time spent loading edges from DB
     traverse: float = 0.0  # Total traversal time (includes edge loading)
     pattern_count: int = 0  # Number of patterns executed
@@ -46,8 +47,9 @@ class RetrievalResult:
     mentioned_at: datetime | None = None
     document_id: str | None = None
     chunk_id: str | None = None
-    embedding: list[float] | None = None
+    embedding: list[float] | None = None  # Not selected by recall queries
     tags: list[str] | None = None  # Visibility scope tags
+    text_tokens: int | None = None  # Token count of text, stored at retain time (NULL for rows not yet backfilled)
 
     # Retrieval-specific scores (only one will be set depending on retrieval method)
     similarity: float | None = None  # Semantic retrieval
@@ -72,6 +74,7 @@ class RetrievalResult:
             chunk_id=row.get("chunk_id"),
             embedding=row.get("embedding"),
             tags=row.get("tags"),
+            text_tokens=row.get("text_tokens"),
             similarity=row.get("similarity"),
             bm25_score=row.get("bm25_score"),
             activation=row.get("activation"),
@@ -156,6 +159,7 @@ class ScoredResult:
             "chunk_id": self.retrieval.chunk_id,
             "embedding": self.retrieval.embedding,
             "tags": self.retrieval.tags,
+            "text_tokens": self.retrieval.text_tokens,
             "semantic_similarity": self.retrieval.similarity,
             "bm25_score": self.retrieval.bm25_score,
         }
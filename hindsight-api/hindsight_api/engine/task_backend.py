@@ -4,10 +4,17 @@ Task backend for distributed task processing.
 This provides an abstraction for task storage and execution:
 - BrokerTaskBackend: Uses PostgreSQL as broker (production)
 - SyncTaskBackend: Executes tasks immediately (testing/embedded)
+
+BrokerTaskBackend keeps large task contents out of the queue row: they are written once
+to the async_operation_payloads table (optionally compressed) and the task payload
+carries a "contents_ref" instead, resolved by the handler when the task runs.
 """
 
+import asyncio
 import json
 import logging
+import uuid
+import zlib
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
@@ -17,6 +24,60 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Channel workers LISTEN on; BrokerTaskBackend notifies it (payload: task type) when a task is submitted
+TASK_NOTIFY_CHANNEL = "hindsight_tasks"
+
+# Task type of adjacent batch_retain tasks of one bank merged by WorkerPoller into a single execution.
+# Never stored: the payload holds the original task dicts (with their operation_id) under "tasks".
+COALESCED_RETAIN_TASK_TYPE = "coalesced_batch_retain"
+
+# Task payload store: large task contents, keyed by operation_id
+PAYLOAD_TABLE = "async_operation_payloads"
+
+
+def encode_task_contents(contents_json: bytes, compression: str) -> bytes:
+    """
+    Encode serialized task contents for the payload store.
+
+    Args:
+        contents_json: Task contents serialized as JSON (UTF-8)
+        compression: "none", "zlib" or "zstd" (requires the zstandard package)
+    """
+    if compression == "zlib":
+        return zlib.compress(contents_json, 1)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is required for zstd task payload compression. Install it with: pip install zstandard"
+            )
+        return zstandard.ZstdCompressor(level=3).compress(contents_json)
+    return contents_json
+
+
+def decode_task_contents(encoding: str, data: bytes) -> list[dict[str, Any]]:
+    """Deserialize task contents written by encode_task_contents()."""
+    if encoding == "zlib":
+        data = zlib.decompress(data)
+    elif encoding == "zstd":
+        import zstandard
+
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return json.loads(data)
+
+
+class CoalescedTaskError(Exception):
+    """Raised by a coalesced task when some of its merged operations failed; the others completed."""
+
+    def __init__(self, failures: dict[str, str]):
+        """
+        Args:
+            failures: Error message per failed operation_id
+        """
+        super().__init__(f"{len(failures)} coalesced operations failed")
+        self.failures = failures
+
 
 def fq_table(table: str, schema: str | None = None) -> str:
     """Get fully-qualified table name with optional schema prefix."""
@@ -133,8 +194,12 @@ class BrokerTaskBackend(TaskBackend):
     """
     Task backend using PostgreSQL as broker.
 
-    submit_task() stores task_payload in async_operations table.
-    Actual polling and execution is handled separately by WorkerPoller.
+    submit_task() stores task_payload in async_operations table and notifies
+    TASK_NOTIFY_CHANNEL, so listening workers claim it without waiting for their
+    next poll. Actual polling and execution is handled separately by WorkerPoller.
+
+    Contents larger than payload_inline_max_bytes are written to the payload store
+    and replaced by a "contents_ref" (the operation_id of the stored payload).
 
     This backend is used by the API to store tasks. Workers poll
     the database separately to claim and execute tasks.
@@ -144,6 +209,8 @@ class BrokerTaskBackend(TaskBackend):
         self,
         pool_getter: Callable[[], "asyncpg.Pool"],
         schema: str | None = None,
+        payload_inline_max_bytes: int | None = None,
+        payload_compression: str | None = None,
     ):
         """
         Initialize the broker task backend.
@@ -151,10 +218,22 @@ class BrokerTaskBackend(TaskBackend):
         Args:
             pool_getter: Callable that returns the asyncpg connection pool
             schema: Database schema for multi-tenant support (optional)
+            payload_inline_max_bytes: Larger contents go to the payload store (default from config)
+            payload_compression: Payload store compression, "none", "zlib" or "zstd" (default from config)
         """
         super().__init__()
         self._pool_getter = pool_getter
         self._schema = schema
+        if payload_inline_max_bytes is None or payload_compression is None:
+            from ..config import get_config
+
+            config = get_config()
+            if payload_inline_max_bytes is None:
+                payload_inline_max_bytes = config.task_payload_inline_max_bytes
+            if payload_compression is None:
+                payload_compression = config.task_payload_compression
+        self._payload_inline_max_bytes = payload_inline_max_bytes
+        self._payload_compression = payload_compression
 
     async def initialize(self):
         """Initialize the backend."""
@@ -163,11 +242,16 @@ class BrokerTaskBackend(TaskBackend):
 
     async def submit_task(self, task_dict: dict[str, Any]):
         """
-        Store task payload in async_operations table.
+        Store task payload in async_operations table and notify listening workers.
+
+        The notification is sent by the same statement, so it is delivered when the
+        write commits (never before the task is visible to claimers).
 
         The task_dict should contain an 'operation_id' if updating an existing
         operation record, otherwise a new operation will be created.
 
+        Large 'contents' are written to the payload store in the same transaction.
+
         Args:
             task_dict: Task dictionary to store (must be JSON serializable)
         """
@@ -178,37 +262,93 @@ class BrokerTaskBackend(TaskBackend):
         operation_id = task_dict.get("operation_id")
         task_type = task_dict.get("type", "unknown")
         bank_id = task_dict.get("bank_id")
-        payload_json = json.dumps(task_dict)
+        new_id = None if operation_id else uuid.uuid4()
 
         table = fq_table("async_operations", self._schema)
 
+        contents_json = None
+        if task_dict.get("contents") and not task_dict.get("contents_ref"):
+            contents_json = json.dumps(task_dict["contents"]).encode("utf-8")
+            if len(contents_json) <= self._payload_inline_max_bytes:
+                contents_json = None
+
+        if contents_json is None:
+            await self._write_task(pool, table, task_dict, json.dumps(task_dict), task_type, bank_id, new_id)
+            return
+
+        # Large contents: store them once in the payload store, keep a reference in the queue row
+        data = await asyncio.to_thread(encode_task_contents, contents_json, self._payload_compression)
+        contents_ref = operation_id or str(new_id)
+        task_dict = {key: value for key, value in task_dict.items() if key != "contents"}
+        task_dict["contents_ref"] = contents_ref
+
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await self._write_task(conn, table, task_dict, json.dumps(task_dict), task_type, bank_id, new_id)
+                await conn.execute(
+                    f"""
+                    INSERT INTO {fq_table(PAYLOAD_TABLE, self._schema)} (operation_id, encoding, data, raw_bytes)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (operation_id) DO UPDATE
+                    SET encoding = EXCLUDED.encoding, data = EXCLUDED.data, raw_bytes = EXCLUDED.raw_bytes
+                    """,
+                    uuid.UUID(contents_ref),
+                    self._payload_compression,
+                    data,
+                    len(contents_json),
+                )
+        logger.debug(
+            f"Stored {len(contents_json):,} bytes of task contents for operation {contents_ref} "
+            f"in the payload store ({len(data):,} bytes, {self._payload_compression})"
+        )
+
+    async def _write_task(
+        self,
+        conn: "asyncpg.Pool | asyncpg.Connection",
+        table: str,
+        task_dict: dict[str, Any],
+        payload_json: str,
+        task_type: str,
+        bank_id: str | None,
+        new_id: uuid.UUID | None,
+    ):
+        """Write the task payload to its operation row (new_id: insert a new row) and notify workers."""
+        operation_id = task_dict.get("operation_id")
         if operation_id:
             # Update existing operation with task payload
-            await pool.execute(
+            await conn.execute(
                 f"""
-                UPDATE {table}
-                SET task_payload = $1::jsonb, updated_at = now()
-                WHERE operation_id = $2
+                WITH updated AS (
+                    UPDATE {table}
+                    SET task_payload = $1::jsonb, updated_at = now()
+                    WHERE operation_id = $2
+                    RETURNING operation_id
+                )
+                SELECT pg_notify($3, $4) FROM updated
                 """,
                 payload_json,
                 operation_id,
+                TASK_NOTIFY_CHANNEL,
+                task_type,
             )
             logger.debug(f"Updated task payload for operation {operation_id}")
         else:
             # Insert new operation (for tasks without pre-created records)
             # e.g., access_count_update tasks
-            import uuid
-
-            new_id = uuid.uuid4()
-            await pool.execute(
+            await conn.execute(
                 f"""
-                INSERT INTO {table} (operation_id, bank_id, operation_type, status, task_payload)
-                VALUES ($1, $2, $3, 'pending', $4::jsonb)
+                WITH inserted AS (
+                    INSERT INTO {table} (operation_id, bank_id, operation_type, status, task_payload)
+                    VALUES ($1, $2, $3, 'pending', $4::jsonb)
+                    RETURNING operation_id
+                )
+                SELECT pg_notify($5, $3) FROM inserted
                 """,
                 new_id,
                 bank_id,
                 task_type,
                 payload_json,
+                TASK_NOTIFY_CHANNEL,
             )
             logger.debug(f"Created new operation {new_id} for task type {task_type}")
 
@@ -0,0 +1,31 @@
+"""
+Token counting for recall budgets.
+
+Facts and chunks are counted once when they are stored (memory_units.text_tokens,
+chunks.chunk_tokens), so recall can pack its token budgets with stored integers instead of
+re-encoding every candidate on every request.
+"""
+
+import tiktoken
+
+# Cache tiktoken encoding for token budget filtering (module-level singleton)
+_TIKTOKEN_ENCODING = None
+
+
+def get_tiktoken_encoding():
+    """Get cached tiktoken encoding (cl100k_base for GPT-4/3.5)."""
+    global _TIKTOKEN_ENCODING
+    if _TIKTOKEN_ENCODING is None:
+        _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+    return _TIKTOKEN_ENCODING
+
+
+def count_tokens(texts: list[str]) -> list[int]:
+    """
+    Count the cl100k_base tokens of each text.
+
+    Special-token markers in user content are counted as plain text rather than rejected.
+    """
+    if not texts:
+        return []
+    return [len(tokens) for tokens in get_tiktoken_encoding().encode_ordinary_batch(texts)]
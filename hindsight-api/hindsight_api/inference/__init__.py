@@ -0,0 +1,12 @@
+"""
+Local inference sidecar: one process per host serving the local embedding and reranker models.
+
+This package provides:
+- InferenceService: Hosts the models and batches requests from all client processes
+- create_inference_app: TEI-compatible HTTP app served over a Unix socket
+- main: CLI entry point for hindsight-inference
+"""
+
+from .server import InferenceService, create_inference_app
+
+__all__ = ["InferenceService", "create_inference_app"]
@@ -0,0 +1,139 @@
+"""
+Command-line interface for the Hindsight inference sidecar.
+
+Run one sidecar per host with:
+    hindsight-inference
+
+and set HINDSIGHT_API_EMBEDDINGS_PROVIDER=sidecar and HINDSIGHT_API_RERANKER_PROVIDER=sidecar
+for the API and worker processes on that host. The sidecar loads the models configured for
+the "local" providers (HINDSIGHT_API_EMBEDDINGS_LOCAL_*, HINDSIGHT_API_RERANKER_LOCAL_*).
+
+Stop with Ctrl+C (graceful shutdown).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import warnings
+
+from ..config import (
+    DEFAULT_INFERENCE_SOCKET,
+    DEFAULT_RERANKER_TEI_BATCH_SIZE,
+    ENV_INFERENCE_SOCKET,
+    get_config,
+)
+from ..engine.cross_encoder import create_local_cross_encoder_from_env
+from ..engine.embeddings import create_local_embeddings_from_env
+from .server import InferenceService, create_inference_app
+
+# Filter deprecation warnings from third-party libraries
+warnings.filterwarnings("ignore", message="websockets.legacy is deprecated")
+warnings.filterwarnings("ignore", message="websockets.server.WebSocketServerProtocol is deprecated")
+
+# Disable tokenizers parallelism to avoid warnings
+os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+
+def main():
+    """Main entry point for the hindsight-inference CLI."""
+    # Load configuration from environment
+    config = get_config()
+
+    parser = argparse.ArgumentParser(
+        prog="hindsight-inference",
+        description="Hindsight Inference - local embedding and reranker models shared by the processes of a host",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get(ENV_INFERENCE_SOCKET, DEFAULT_INFERENCE_SOCKET),
+        help=f"Unix socket to listen on (default: {DEFAULT_INFERENCE_SOCKET}, env: {ENV_INFERENCE_SOCKET})",
+    )
+    parser.add_argument(
+        "--no-embeddings",
+        action="store_true",
+        help="Do not load the embedding model (serve reranking only)",
+    )
+    parser.add_argument(
+        "--no-reranker",
+        action="store_true",
+        help="Do not load the cross-encoder (serve embeddings only)",
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=config.embeddings_batch_size,
+        help=f"Max texts per encode() call (default: {config.embeddings_batch_size}, env: HINDSIGHT_API_EMBEDDINGS_BATCH_SIZE)",
+    )
+    parser.add_argument(
+        "--rerank-batch-size",
+        type=int,
+        default=DEFAULT_RERANKER_TEI_BATCH_SIZE,
+        help=f"Max query-document pairs per cross-encoder call (default: {DEFAULT_RERANKER_TEI_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--batch-window-ms",
+        type=int,
+        default=config.embeddings_query_batch_window_ms,
+        help=f"Max time a request waits for others before a partial batch runs "
+        f"(default: {config.embeddings_query_batch_window_ms}, env: HINDSIGHT_API_EMBEDDINGS_QUERY_BATCH_WINDOW_MS)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default=config.log_level,
+        choices=["critical", "error", "warning", "info", "debug", "trace"],
+        help=f"Log level (default: {config.log_level}, env: HINDSIGHT_API_LOG_LEVEL)",
+    )
+
+    args = parser.parse_args()
+    if args.no_embeddings and args.no_reranker:
+        parser.error("--no-embeddings and --no-reranker leave nothing to serve")
+
+    # Configure logging
+    config.configure_logging()
+
+    service = InferenceService(
+        embeddings=None if args.no_embeddings else create_local_embeddings_from_env(),
+        cross_encoder=None if args.no_reranker else create_local_cross_encoder_from_env(),
+        window_ms=args.batch_window_ms,
+        embed_batch_size=args.embed_batch_size,
+        rerank_batch_size=args.rerank_batch_size,
+    )
+
+    print("Starting Hindsight Inference")
+    if service.embeddings is not None:
+        print(f"  Embeddings: {service.embeddings.model_name} ({service.embeddings.backend})")
+    if service.cross_encoder is not None:
+        print(f"  Reranker: {service.cross_encoder.model_name} ({service.cross_encoder.backend})")
+    print(f"  Socket: {args.socket}")
+    print()
+
+    async def run():
+        import uvicorn
+
+        await service.initialize()
+
+        # A socket file left behind by a previous run would make the bind fail
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+        uvicorn_config = uvicorn.Config(
+            create_inference_app(service),
+            uds=args.socket,
+            log_level=args.log_level if args.log_level != "trace" else "debug",
+            access_log=False,
+        )
+        server = uvicorn.Server(uvicorn_config)
+        print(f"Inference sidecar started. Listening on {args.socket}")
+        await server.serve()
+        print("Inference sidecar shutdown complete")
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nInference sidecar interrupted")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+HTTP app of the local inference sidecar.
+
+API workers and hindsight-worker processes configured with the "sidecar" provider send
+their embedding and rerank calls here instead of each loading their own copy of the
+models. The sidecar speaks the TEI API (POST /embed, POST /rerank, GET /info), so the
+existing TEI clients are used over the sidecar's Unix socket:
+
+- /embeddings/info, /embeddings/embed for the embedding model
+- /reranker/info, /reranker/rerank for the cross-encoder
+
+Texts and pairs from concurrent requests, across every client process, are batched
+together by one EmbeddingScheduler per model. Each model runs one batch at a time, so
+the host's cores are not oversubscribed by competing thread pools.
+"""
+
+import logging
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from ..engine.cross_encoder import LocalSTCrossEncoder
+from ..engine.embeddings import LocalSTEmbeddings
+from ..engine.retain.embedding_utils import EmbeddingScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class EmbedRequest(BaseModel):
+    """TEI /embed request."""
+
+    inputs: str | list[str]
+
+
+class RerankRequest(BaseModel):
+    """TEI /rerank request."""
+
+    query: str
+    texts: list[str]
+    return_text: bool = False
+
+
+class _PairScorer:
+    """Exposes a cross-encoder through the encode() interface EmbeddingScheduler batches."""
+
+    def __init__(self, cross_encoder: LocalSTCrossEncoder):
+        self.cross_encoder = cross_encoder
+
+    def encode(self, pairs: list[tuple[str, str]]) -> list[float]:
+        return self.cross_encoder.score(pairs)
+
+
+class InferenceService:
+    """Hosts the local models and batches requests from all client processes."""
+
+    def __init__(
+        self,
+        embeddings: LocalSTEmbeddings | None,
+        cross_encoder: LocalSTCrossEncoder | None,
+        window_ms: int = 2,
+        embed_batch_size: int = 64,
+        rerank_batch_size: int = 128,
+    ):
+        """
+        Initialize the inference service.
+
+        Args:
+            embeddings: Local embedding model to serve (None to serve reranking only)
+            cross_encoder: Local cross-encoder to serve (None to serve embeddings only)
+            window_ms: Max time a request waits for others before a partial batch runs
+            embed_batch_size: Max texts per encode() call
+            rerank_batch_size: Max pairs per cross-encoder call
+        """
+        self.embeddings = embeddings
+        self.cross_encoder = cross_encoder
+        self._embed_scheduler = (
+            EmbeddingScheduler(embeddings, window_ms=window_ms, bulk_batch_size=embed_batch_size)
+            if embeddings is not None
+            else None
+        )
+        # Pairs go through the scheduler's first-come lane: there is no text length to bucket by
+        self._rerank_scheduler = (
+            EmbeddingScheduler(_PairScorer(cross_encoder), window_ms=window_ms, max_batch_size=rerank_batch_size)
+            if cross_encoder is not None
+            else None
+        )
+
+    async def initialize(self) -> None:
+        """Load the models."""
+        if self.embeddings is not None:
+            await self.embeddings.initialize()
+        if self.cross_encoder is not None:
+            await self.cross_encoder.initialize()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, batched with the texts of concurrent requests."""
+        if self._embed_scheduler is None:
+            raise HTTPException(status_code=404, detail="This sidecar does not serve embeddings")
+        return await self._embed_scheduler.embed_many(texts)
+
+    async def rerank(self, query: str, texts: list[str]) -> list[float]:
+        """Score texts against a query (raw cross-encoder scores, like the local provider)."""
+        if self._rerank_scheduler is None:
+            raise HTTPException(status_code=404, detail="This sidecar does not serve reranking")
+        return await self._rerank_scheduler.embed_many([(query, text) for text in texts], interactive=True)
+
+
+def create_inference_app(service: InferenceService) -> FastAPI:
+    """Create the TEI-compatible app of the inference sidecar."""
+    app = FastAPI(
+        title="Hindsight Inference",
+        description="Local embedding and reranker models shared by the processes of a host",
+    )
+
+    @app.get("/health", summary="Health check endpoint", tags=["Monitoring"])
+    async def health_endpoint():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "embeddings": service.embeddings is not None,
+            "reranker": service.cross_encoder is not None,
+        }
+
+    @app.get("/embeddings/info", summary="Embedding model info", tags=["Embeddings"])
+    async def embeddings_info():
+        """Return the served embedding model (TEI /info)."""
+        if service.embeddings is None:
+            raise HTTPException(status_code=404, detail="This sidecar does not serve embeddings")
+        return {"model_id": service.embeddings.model_name, "dimension": service.embeddings.dimension}
+
+    @app.post("/embeddings/embed", summary="Embed texts", tags=["Embeddings"])
+    async def embed(request: EmbedRequest) -> list[list[float]]:
+        """Embed texts (TEI /embed)."""
+        texts = [request.inputs] if isinstance(request.inputs, str) else request.inputs
+        return await service.embed(texts)
+
+    @app.get("/reranker/info", summary="Reranker model info", tags=["Reranker"])
+    async def reranker_info():
+        """Return the served cross-encoder model (TEI /info)."""
+        if service.cross_encoder is None:
+            raise HTTPException(status_code=404, detail="This sidecar does not serve reranking")
+        return {"model_id": service.cross_encoder.model_name}
+
+    @app.post("/reranker/rerank", summary="Rerank texts", tags=["Reranker"])
+    async def rerank(request: RerankRequest) -> list[dict]:
+        """Score texts against a query (TEI /rerank: sorted by score, with original indices)."""
+        scores = await service.rerank(request.query, request.texts)
+        results = [{"index": i, "score": score} for i, score in enumerate(scores)]
+        if request.return_text:
+            for result in results:
+                result["text"] = request.texts[result["index"]]
+        return sorted(results, key=lambda result: result["score"], reverse=True)
+
+    return app
@@ -175,6 +175,10 @@ def main():
             llm_model=config.llm_model,
             llm_base_url=config.llm_base_url,
             llm_max_concurrent=config.llm_max_concurrent,
+            llm_tokens_per_minute=config.llm_tokens_per_minute,
+            llm_provider_limits=config.llm_provider_limits,
+            llm_queue_timeouts=config.llm_queue_timeouts,
+            llm_priority_aging_seconds=config.llm_priority_aging_seconds,
             llm_timeout=config.llm_timeout,
             retain_llm_provider=config.retain_llm_provider,
             retain_llm_api_key=config.retain_llm_api_key,
@@ -189,6 +193,13 @@ def main():
             embeddings_tei_url=config.embeddings_tei_url,
             embeddings_openai_base_url=config.embeddings_openai_base_url,
             embeddings_cohere_base_url=config.embeddings_cohere_base_url,
+            embeddings_query_batch_window_ms=config.embeddings_query_batch_window_ms,
+            embeddings_query_batch_size=config.embeddings_query_batch_size,
+            embeddings_batch_size=config.embeddings_batch_size,
+            embeddings_workers=config.embeddings_workers,
+            embeddings_query_cache_size=config.embeddings_query_cache_size,
+            embeddings_query_cache_ttl=config.embeddings_query_cache_ttl,
+            embeddings_query_cache_url=config.embeddings_query_cache_url,
             reranker_provider=config.reranker_provider,
             reranker_local_model=config.reranker_local_model,
             reranker_tei_url=config.reranker_tei_url,
@@ -196,6 +207,9 @@ def main():
             reranker_tei_max_concurrent=config.reranker_tei_max_concurrent,
             reranker_max_candidates=config.reranker_max_candidates,
             reranker_cohere_base_url=config.reranker_cohere_base_url,
+            reranker_cache_size=config.reranker_cache_size,
+            reranker_cache_ttl=config.reranker_cache_ttl,
+            reranker_cache_url=config.reranker_cache_url,
             host=args.host,
             port=args.port,
             log_level=args.log_level,
@@ -203,8 +217,14 @@ def main():
             mcp_enabled=config.mcp_enabled,
             graph_retriever=config.graph_retriever,
             mpfp_top_k_neighbors=config.mpfp_top_k_neighbors,
+            mpfp_edge_cache_max_edges=config.mpfp_edge_cache_max_edges,
             recall_max_concurrent=config.recall_max_concurrent,
             recall_connection_budget=config.recall_connection_budget,
+            recall_ann_enabled=config.recall_ann_enabled,
+            recall_ann_min_bank_size=config.recall_ann_min_bank_size,
+            recall_adaptive=config.recall_adaptive,
+            recall_adaptive_min_overlap=config.recall_adaptive_min_overlap,
+            recall_adaptive_min_score_gap=config.recall_adaptive_min_score_gap,
             observation_min_facts=config.observation_min_facts,
             observation_top_entities=config.observation_top_entities,
             retain_max_completion_tokens=config.retain_max_completion_tokens,
@@ -212,6 +232,10 @@ def main():
             retain_extract_causal_links=config.retain_extract_causal_links,
             retain_extraction_mode=config.retain_extraction_mode,
             retain_observations_async=config.retain_observations_async,
+            retain_dedup_mode=config.retain_dedup_mode,
+            retain_entity_cache_max_entries=config.retain_entity_cache_max_entries,
+            retain_pipeline=config.retain_pipeline,
+            retain_pipeline_queue_size=config.retain_pipeline_queue_size,
             skip_llm_verification=config.skip_llm_verification,
             lazy_reranker=config.lazy_reranker,
             run_migrations_on_startup=config.run_migrations_on_startup,
@@ -222,9 +246,16 @@ def main():
             worker_enabled=config.worker_enabled,
             worker_id=config.worker_id,
             worker_poll_interval_ms=config.worker_poll_interval_ms,
+            worker_notify_enabled=config.worker_notify_enabled,
+            worker_fallback_poll_interval_ms=config.worker_fallback_poll_interval_ms,
             worker_max_retries=config.worker_max_retries,
             worker_batch_size=config.worker_batch_size,
+            worker_task_slots=config.worker_task_slots,
+            worker_fair_scheduling=config.worker_fair_scheduling,
+            worker_retain_coalesce_chars=config.worker_retain_coalesce_chars,
             worker_http_port=config.worker_http_port,
+            task_payload_inline_max_bytes=config.task_payload_inline_max_bytes,
+            task_payload_compression=config.task_payload_compression,
             reflect_max_iterations=config.reflect_max_iterations,
             mental_model_refresh_concurrency=config.mental_model_refresh_concurrency,
         )
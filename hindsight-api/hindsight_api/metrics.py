@@ -28,6 +28,8 @@ from opentelemetry.sdk.resources import Resource
 if TYPE_CHECKING:
     import asyncpg
 
+    from .worker.poller import WorkerPoller
+
 
 def _get_tenant() -> str:
     """Get current tenant (schema) from context for metrics labeling."""
@@ -47,6 +49,12 @@ LLM_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 15.0, 30.0, 60
 # HTTP request duration buckets (millisecond-level for fast endpoints)
 HTTP_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
 
+# Worker queue age buckets (time a task waited in async_operations before being claimed)
+QUEUE_AGE_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+
+# LLM queue wait buckets (time a request waited for a slot of its provider's scheduler)
+LLM_QUEUE_WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
 
 def get_token_bucket(token_count: int) -> str:
     """
@@ -135,11 +143,23 @@ def initialize_metrics(service_name: str = "hindsight-api", service_version: str
         aggregation=ExplicitBucketHistogramAggregation(boundaries=HTTP_DURATION_BUCKETS),
     )
 
+    # Create view with custom bucket boundaries for worker queue age histogram
+    queue_age_view = View(
+        instrument_name="hindsight.worker.task.queue_age",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=QUEUE_AGE_BUCKETS),
+    )
+
+    # Create view with custom bucket boundaries for LLM queue wait histogram
+    llm_queue_wait_view = View(
+        instrument_name="hindsight.llm.queue_wait",
+        aggregation=ExplicitBucketHistogramAggregation(boundaries=LLM_QUEUE_WAIT_BUCKETS),
+    )
+
     # Create meter provider with Prometheus exporter and custom views
     provider = MeterProvider(
         resource=resource,
         metric_readers=[prometheus_reader],
-        views=[duration_view, llm_duration_view, http_duration_view],
+        views=[duration_view, llm_duration_view, http_duration_view, queue_age_view, llm_queue_wait_view],
     )
 
     # Set the global meter provider
@@ -202,10 +222,47 @@ class MetricsCollectorBase:
         """Context manager to record HTTP request metrics."""
         raise NotImplementedError
 
+    def record_cache_access(self, cache: str, hits: int = 0, misses: int = 0):
+        """
+        Record lookups against an in-process or shared cache.
+
+        Args:
+            cache: Cache identifier (e.g., "query_embedding")
+            hits: Number of keys served from the cache
+            misses: Number of keys that had to be computed
+        """
+        raise NotImplementedError
+
+    def record_task_claimed(self, task_type: str, queue_age: float):
+        """
+        Record a task claimed by a worker.
+
+        Args:
+            task_type: Task type (e.g., "batch_retain")
+            queue_age: Seconds the task waited in the queue before being claimed
+        """
+        raise NotImplementedError
+
+    def record_llm_queue_wait(self, provider: str, priority_class: str, wait: float, admitted: bool = True):
+        """
+        Record the time an LLM request waited for a slot.
+
+        Args:
+            provider: LLM provider (scheduler) name
+            priority_class: Priority class of the request (e.g., "interactive")
+            wait: Seconds waited
+            admitted: False if the request was rejected at its deadline
+        """
+        raise NotImplementedError
+
     def set_db_pool(self, pool: "asyncpg.Pool"):
         """Set the database pool for metrics collection."""
         pass
 
+    def set_worker_poller(self, poller: "WorkerPoller"):
+        """Set the worker poller for slot occupancy metrics."""
+        pass
+
 
 class NoOpMetricsCollector(MetricsCollectorBase):
     """No-op metrics collector that does nothing. Used when metrics are disabled."""
@@ -240,6 +297,18 @@ class NoOpMetricsCollector(MetricsCollectorBase):
         """No-op HTTP request recording."""
         yield
 
+    def record_cache_access(self, cache: str, hits: int = 0, misses: int = 0):
+        """No-op cache access recording."""
+        pass
+
+    def record_task_claimed(self, task_type: str, queue_age: float):
+        """No-op task claim recording."""
+        pass
+
+    def record_llm_queue_wait(self, provider: str, priority_class: str, wait: float, admitted: bool = True):
+        """No-op LLM queue wait recording."""
+        pass
+
 
 class MetricsCollector(MetricsCollectorBase):
     """
@@ -297,12 +366,34 @@ class MetricsCollector(MetricsCollectorBase):
             unit="requests",
         )
 
+        # Cache lookups (hit/miss) for embedding and scoring caches
+        self.cache_requests_total = self.meter.create_counter(
+            name="hindsight.cache.requests.total", description="Total number of cache lookups", unit="requests"
+        )
+
+        # Worker task claims: time each task waited in the queue
+        self.worker_queue_age = self.meter.create_histogram(
+            name="hindsight.worker.task.queue_age",
+            description="Time tasks waited in the queue before being claimed by a worker",
+            unit="s",
+        )
+
+        # LLM scheduler: time each request waited for a slot, per priority class
+        self.llm_queue_wait = self.meter.create_histogram(
+            name="hindsight.llm.queue_wait",
+            description="Time LLM requests waited for a slot of their provider's scheduler",
+            unit="s",
+        )
+
         # Process metrics (observable gauges - collected on scrape)
         self._setup_process_metrics()
 
         # DB pool metrics holder (set via set_db_pool)
         self._db_pool: "asyncpg.Pool | None" = None
 
+        # Worker poller holder (set via set_worker_poller)
+        self._worker_poller: "WorkerPoller | None" = None
+
     @contextmanager
     def record_operation(
         self,
@@ -453,6 +544,45 @@ class MetricsCollector(MetricsCollectorBase):
             # Decrement in-progress
             self.http_requests_in_progress.add(-1, base_attributes)
 
+    def record_cache_access(self, cache: str, hits: int = 0, misses: int = 0):
+        """
+        Record lookups against an in-process or shared cache.
+
+        Args:
+            cache: Cache identifier (e.g., "query_embedding")
+            hits: Number of keys served from the cache
+            misses: Number of keys that had to be computed
+        """
+        if hits > 0:
+            self.cache_requests_total.add(hits, {"cache": cache, "result": "hit"})
+        if misses > 0:
+            self.cache_requests_total.add(misses, {"cache": cache, "result": "miss"})
+
+    def record_task_claimed(self, task_type: str, queue_age: float):
+        """
+        Record a task claimed by a worker.
+
+        Args:
+            task_type: Task type (e.g., "batch_retain")
+            queue_age: Seconds the task waited in the queue before being claimed
+        """
+        self.worker_queue_age.record(max(queue_age, 0.0), {"task_type": task_type})
+
+    def record_llm_queue_wait(self, provider: str, priority_class: str, wait: float, admitted: bool = True):
+        """
+        Record the time an LLM request waited for a slot.
+
+        Args:
+            provider: LLM provider (scheduler) name
+            priority_class: Priority class of the request (e.g., "interactive")
+            wait: Seconds waited
+            admitted: False if the request was rejected at its deadline
+        """
+        self.llm_queue_wait.record(
+            wait,
+            {"provider": provider, "priority_class": priority_class, "outcome": "admitted" if admitted else "timeout"},
+        )
+
     def _setup_process_metrics(self):
         """Set up observable gauges for process metrics."""
 
@@ -601,6 +731,45 @@ class MetricsCollector(MetricsCollectorBase):
             unit="{connections}",
         )
 
+    def set_worker_poller(self, poller: "WorkerPoller"):
+        """
+        Set the worker poller for slot occupancy metrics.
+
+        Args:
+            poller: WorkerPoller instance
+        """
+        self._worker_poller = poller
+        self._setup_worker_metrics()
+
+    def _setup_worker_metrics(self):
+        """Set up observable gauges for worker slot pools."""
+
+        def get_slots_in_use(_options):
+            """Get number of busy slots per pool."""
+            if self._worker_poller is not None:
+                for pool in self._worker_poller.slot_pools:
+                    yield metrics.Observation(pool.in_use, {"pool": pool.name})
+
+        def get_slots_total(_options):
+            """Get number of slots per pool."""
+            if self._worker_poller is not None:
+                for pool in self._worker_poller.slot_pools:
+                    yield metrics.Observation(pool.size, {"pool": pool.name})
+
+        self.meter.create_observable_gauge(
+            name="hindsight.worker.slots.in_use",
+            callbacks=[get_slots_in_use],
+            description="Number of worker task slots running a task",
+            unit="{slots}",
+        )
+
+        self.meter.create_observable_gauge(
+            name="hindsight.worker.slots.total",
+            callbacks=[get_slots_total],
+            description="Number of worker task slots",
+            unit="{slots}",
+        )
+
 
 # Global metrics collector instance (defaults to no-op)
 _metrics_collector: MetricsCollectorBase = NoOpMetricsCollector()
@@ -366,6 +366,17 @@ def ensure_embedding_dimension(
                 WITH (m = 16, ef_construction = 64)
             """)
         )
+        # Recreate the per-fact-type partial HNSW indexes used by ANN recall
+        for fact_type in ("world", "experience", "observation"):
+            conn.execute(
+                text(f"""
+                    CREATE INDEX IF NOT EXISTS idx_memory_units_embedding_hnsw_{fact_type}
+                    ON {schema_name}.memory_units
+                    USING hnsw (embedding vector_cosine_ops)
+                    WITH (m = 16, ef_construction = 64)
+                    WHERE fact_type = '{fact_type}'
+                """)
+            )
         conn.commit()
 
         logger.info(f"Successfully changed embedding dimension to {required_dimension}")
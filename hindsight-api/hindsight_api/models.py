@@ -25,6 +25,7 @@ class RequestContext:
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    Boolean,
     CheckConstraint,
     Float,
     ForeignKey,
@@ -83,6 +84,7 @@ class MemoryUnit(Base):
     bank_id: Mapped[str] = mapped_column(Text, nullable=False)
     document_id: Mapped[str | None] = mapped_column(Text)
     text: Mapped[str] = mapped_column(Text, nullable=False)
+    text_tokens: Mapped[int | None] = mapped_column(Integer)  # tiktoken count of text, stored at retain time
     embedding = mapped_column(Vector(EMBEDDING_DIMENSION))  # pgvector type
     context: Mapped[str | None] = mapped_column(Text)
     event_date: Mapped[datetime] = mapped_column(
@@ -95,6 +97,12 @@ class MemoryUnit(Base):
     mentioned_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=True))  # When fact was mentioned
     fact_type: Mapped[str] = mapped_column(Text, nullable=False, server_default="world")
     confidence_score: Mapped[float | None] = mapped_column(Float)
+    enrichment_pending: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, server_default=sql_text("false")
+    )  # Set until retain has stored the unit's entities and links
+    enrichment_state: Mapped[dict | None] = mapped_column(
+        JSONB
+    )  # Retain token and entity mentions needed to resume a pending enrichment
     unit_metadata: Mapped[dict] = mapped_column(
         "metadata", JSONB, server_default=sql_text("'{}'::jsonb")
     )  # User-defined metadata (str->str)
@@ -160,6 +168,12 @@ class MemoryUnit(Base):
             postgresql_where=sql_text("fact_type = 'observation'"),
             postgresql_ops={"event_date": "DESC"},
         ),
+        Index(
+            "idx_memory_units_enrichment_pending",
+            "bank_id",
+            "document_id",
+            postgresql_where=sql_text("enrichment_pending"),
+        ),
         Index(
             "idx_memory_units_embedding",
             "embedding",
@@ -2,10 +2,11 @@
 Worker package for distributed task processing.
 
 This package provides:
-- WorkerPoller: Polls PostgreSQL for pending tasks and executes them
+- WorkerPoller: Polls PostgreSQL for pending tasks and executes them in slot pools
+- parse_task_slots: Parses dedicated slot pools ("task_type=slots,...")
 - main: CLI entry point for hindsight-worker
 """
 
-from .poller import WorkerPoller
+from .poller import WorkerPoller, parse_task_slots
 
-__all__ = ["WorkerPoller"]
+__all__ = ["WorkerPoller", "parse_task_slots"]
@@ -19,7 +19,7 @@ import warnings
 
 from ..config import get_config
 from ..engine.task_backend import SyncTaskBackend
-from .poller import WorkerPoller
+from .poller import WorkerPoller, parse_task_slots
 
 # Filter deprecation warnings from third-party libraries
 warnings.filterwarnings("ignore", message="websockets.legacy is deprecated")
@@ -59,6 +59,8 @@ def create_worker_app(poller: WorkerPoller, memory):
     if memory._pool is not None and hasattr(metrics_collector, "set_db_pool"):
         metrics_collector.set_db_pool(memory._pool)
         logger.info("DB pool metrics configured")
+    if hasattr(metrics_collector, "set_worker_poller"):
+        metrics_collector.set_worker_poller(poller)
 
     @app.get(
         "/health",
@@ -128,7 +130,12 @@ def main():
         "--batch-size",
         type=int,
         default=config.worker_batch_size,
-        help=f"Tasks to claim per poll (default: {config.worker_batch_size}, env: HINDSIGHT_API_WORKER_BATCH_SIZE)",
+        help=f"Tasks in flight in the shared slot pool (default: {config.worker_batch_size}, env: HINDSIGHT_API_WORKER_BATCH_SIZE)",
+    )
+    parser.add_argument(
+        "--task-slots",
+        default=config.worker_task_slots,
+        help=f"Dedicated slot pools as task_type=slots,... (default: {config.worker_task_slots!r}, env: HINDSIGHT_API_WORKER_TASK_SLOTS)",
     )
     parser.add_argument(
         "--max-retries",
@@ -159,6 +166,10 @@ def main():
     )
 
     args = parser.parse_args()
+    try:
+        task_slots = parse_task_slots(args.task_slots)
+    except ValueError as e:
+        parser.error(str(e))
 
     # Configure logging
     config.configure_logging()
@@ -167,8 +178,14 @@ def main():
     from .. import MemoryEngine
 
     print(f"Starting Hindsight Worker: {args.worker_id}")
+    if config.worker_notify_enabled:
+        print(f"  Wake-ups: LISTEN/NOTIFY (fallback poll: {config.worker_fallback_poll_interval_ms}ms)")
     print(f"  Poll interval: {args.poll_interval}ms")
     print(f"  Batch size: {args.batch_size}")
+    print(f"  Task slots: {task_slots or 'shared only'}")
+    print(f"  Fair scheduling: {config.worker_fair_scheduling}")
+    coalesce_chars = config.worker_retain_coalesce_chars
+    print(f"  Retain coalescing: {f'up to {coalesce_chars:,} chars' if coalesce_chars else 'off'}")
     print(f"  Max retries: {args.max_retries}")
     print(f"  HTTP server: {args.http_host}:{args.http_port}")
     print()
@@ -201,6 +218,11 @@ def main():
             poll_interval_ms=args.poll_interval,
             batch_size=args.batch_size,
             max_retries=args.max_retries,
+            task_slots=task_slots,
+            listen=config.worker_notify_enabled,
+            fallback_poll_interval_ms=config.worker_fallback_poll_interval_ms,
+            fair_scheduling=config.worker_fair_scheduling,
+            retain_coalesce_chars=config.worker_retain_coalesce_chars,
         )
 
         # Create the HTTP app for metrics/health
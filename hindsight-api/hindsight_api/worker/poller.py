@@ -3,6 +3,20 @@ Worker poller for distributed task execution.
 
 Polls PostgreSQL for pending tasks and executes them using
 FOR UPDATE SKIP LOCKED for safe concurrent claiming.
+
+Tasks run in slots: the poller keeps up to N tasks in flight and claims a
+replacement as soon as a slot frees, instead of waiting for a whole batch.
+Task types can get a dedicated slot pool, so that long mental model refreshes
+cannot occupy the slots that retain tasks need.
+
+With fair_scheduling=True tasks are claimed round-robin across banks, so one bank's
+bulk import cannot starve the others. With retain_coalesce_chars > 0, adjacent pending
+batch_retain tasks of a bank are merged into one retain execution; each original
+operation is still completed (or retried) individually.
+
+With listen=True the poller holds a LISTEN connection on TASK_NOTIFY_CHANNEL and
+claims as soon as a task is submitted; polling then only runs at the slow fallback
+interval, to pick up notifications missed while the connection was down.
 """
 
 import asyncio
@@ -10,13 +24,19 @@ import json
 import logging
 import traceback
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from ..engine.task_backend import COALESCED_RETAIN_TASK_TYPE, PAYLOAD_TABLE, TASK_NOTIFY_CHANNEL, CoalescedTaskError
+
 if TYPE_CHECKING:
     import asyncpg
 
 logger = logging.getLogger(__name__)
 
+# Most follow-up batch_retain tasks considered when coalescing one claimed retain
+COALESCE_MAX_TASKS = 50
+
 
 def fq_table(table: str, schema: str | None = None) -> str:
     """Get fully-qualified table name with optional schema prefix."""
@@ -25,6 +45,72 @@ def fq_table(table: str, schema: str | None = None) -> str:
     return table
 
 
+def parse_task_slots(value: str | None) -> dict[str, int]:
+    """
+    Parse dedicated slot pools from "task_type=slots,..." (e.g. "refresh_mental_models=2").
+
+    Raises:
+        ValueError: If an entry is malformed or has fewer than one slot
+    """
+    slots: dict[str, int] = {}
+    for entry in (value or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        task_type, sep, count = entry.partition("=")
+        if not sep or not task_type.strip() or not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"Invalid worker task slots entry '{entry}', expected task_type=slots (slots >= 1)")
+        slots[task_type.strip()] = int(count)
+    return slots
+
+
+@dataclass
+class SlotPool:
+    """Execution slots shared by some task types."""
+
+    name: str
+    size: int
+    # Task types this pool runs; None for the shared pool (every type without a dedicated pool)
+    task_types: list[str] | None = None
+    in_use: int = 0
+
+    @property
+    def free(self) -> int:
+        return max(self.size - self.in_use, 0)
+
+
+def _retain_chars(task_dict: dict[str, Any]) -> int:
+    return sum(len(item.get("content") or "") for item in task_dict.get("contents", []))
+
+
+def _retain_document_ids(task_dict: dict[str, Any]) -> set[str]:
+    return {item["document_id"] for item in task_dict.get("contents", []) if item.get("document_id")}
+
+
+def _can_coalesce(first: dict[str, Any], candidate: dict[str, Any], document_ids: set[str]) -> bool:
+    """
+    Check whether a batch_retain task can join a coalesced group started by `first`.
+
+    Tasks must retain with the same options, and must not write the same document: run one
+    after the other, the second would replace the first one's version of it. Tasks whose
+    contents are in the payload store are large and never coalesced.
+    """
+    return (
+        candidate.get("type") == "batch_retain"
+        and "contents_ref" not in candidate
+        and candidate.get("update_mode", "replace") == first.get("update_mode", "replace")
+        and candidate.get("document_tags") == first.get("document_tags")
+        and not (_retain_document_ids(candidate) & document_ids)
+    )
+
+
+def coalesced_operation_ids(task_dict: dict[str, Any]) -> list[str]:
+    """Operation IDs of the tasks merged into a coalesced task (empty for any other task)."""
+    if task_dict.get("type") != COALESCED_RETAIN_TASK_TYPE:
+        return []
+    return [task["operation_id"] for task in task_dict.get("tasks", [])]
+
+
 class WorkerPoller:
     """
     Polls PostgreSQL for pending tasks and executes them.
@@ -42,6 +128,11 @@ class WorkerPoller:
         batch_size: int = 10,
         max_retries: int = 3,
         schema: str | None = None,
+        task_slots: dict[str, int] | None = None,
+        listen: bool = False,
+        fallback_poll_interval_ms: int = 10_000,
+        fair_scheduling: bool = False,
+        retain_coalesce_chars: int = 0,
     ):
         """
         Initialize the worker poller.
@@ -51,9 +142,14 @@ class WorkerPoller:
             worker_id: Unique identifier for this worker
             executor: Async function to execute tasks (typically MemoryEngine.execute_task)
             poll_interval_ms: Interval between polls when no tasks found (milliseconds)
-            batch_size: Maximum number of tasks to claim per poll cycle
+            batch_size: Slots of the shared pool (max tasks in flight for types without a dedicated pool)
             max_retries: Maximum retry attempts before marking task as failed
             schema: Database schema for multi-tenant support (optional)
+            task_slots: Dedicated slot pools, task type -> slots (e.g. {"refresh_mental_models": 2})
+            listen: Wake up on task submit notifications (LISTEN/NOTIFY) instead of relying on polling
+            fallback_poll_interval_ms: Poll interval while the LISTEN connection is up (milliseconds)
+            fair_scheduling: Claim round-robin across banks instead of strictly oldest first
+            retain_coalesce_chars: Content budget for merging adjacent batch_retain tasks of a bank (0 = off)
         """
         self._pool = pool
         self._worker_id = worker_id
@@ -63,39 +159,104 @@ class WorkerPoller:
         self._max_retries = max_retries
         self._schema = schema
         self._shutdown = asyncio.Event()
+        # Set when a slot frees (or on shutdown) to claim a replacement without waiting for the poll interval
+        self._wakeup = asyncio.Event()
         self._current_tasks: set[asyncio.Task] = set()
         self._in_flight_count = 0
         self._in_flight_lock = asyncio.Lock()
-
-    async def claim_batch(self) -> list[tuple[str, dict[str, Any]]]:
+        self._listen = listen
+        self._fallback_poll_interval_ms = fallback_poll_interval_ms
+        self._fair_scheduling = fair_scheduling
+        self._retain_coalesce_chars = retain_coalesce_chars
+        # Pool connection held for LISTEN while listening (None: not listening, poll at poll_interval_ms)
+        self._listener_conn: "asyncpg.Connection | None" = None
+        # Event loop time before which LISTEN is not retried after a failure
+        self._listen_retry_at = 0.0
+
+        task_slots = task_slots or {}
+        self._slot_pools = [
+            SlotPool(name=task_type, size=size, task_types=[task_type]) for task_type, size in task_slots.items()
+        ]
+        self._slot_pools.append(SlotPool(name="shared", size=batch_size))
+
+    async def claim_batch(
+        self, limit: int | None = None, slot_pool: SlotPool | None = None
+    ) -> list[tuple[str, dict[str, Any]]]:
         """
-        Claim up to batch_size pending tasks atomically.
+        Claim up to `limit` pending tasks atomically.
 
         Uses FOR UPDATE SKIP LOCKED to ensure no conflicts with other workers.
+        With fair scheduling, each bank's oldest task comes before any bank's second
+        task. Coalesced retains count as one task (their follow-up tasks don't count
+        against `limit`).
+
+        Args:
+            limit: Maximum number of tasks to claim (default: batch_size)
+            slot_pool: Only claim task types run by this pool (default: any task type)
 
         Returns:
             List of tuples (operation_id, task_dict)
         """
         table = fq_table("async_operations", self._schema)
-
-        async with self._pool.acquire() as conn:
-            async with conn.transaction():
-                # Select and lock pending tasks
-                rows = await conn.fetch(
-                    f"""
-                    SELECT operation_id, task_payload
+        limit = self._batch_size if limit is None else limit
+
+        type_filter = ""
+        params: list[Any] = [limit]
+        if slot_pool is not None:
+            if slot_pool.task_types is not None:
+                type_filter = "AND task_payload->>'type' = ANY($2::text[])"
+                params.append(slot_pool.task_types)
+            else:
+                dedicated = [t for p in self._slot_pools if p.task_types is not None for t in p.task_types]
+                if dedicated:
+                    type_filter = "AND COALESCE(task_payload->>'type', '') <> ALL($2::text[])"
+                    params.append(dedicated)
+
+        if self._fair_scheduling:
+            # Lock each pending bank's oldest tasks through the (bank_id, created_at) index, then take
+            # the first task of every bank before any bank's second
+            query = f"""
+                SELECT t.operation_id, t.bank_id, t.created_at, t.task_payload,
+                       EXTRACT(EPOCH FROM now() - t.created_at) AS queue_age
+                FROM (
+                    SELECT DISTINCT bank_id
+                    FROM {table}
+                    WHERE status = 'pending' AND task_payload IS NOT NULL {type_filter}
+                ) b
+                CROSS JOIN LATERAL (
+                    SELECT operation_id, bank_id, created_at, task_payload
                     FROM {table}
-                    WHERE status = 'pending' AND task_payload IS NOT NULL
+                    WHERE bank_id = b.bank_id AND status = 'pending' AND task_payload IS NOT NULL {type_filter}
                     ORDER BY created_at
                     LIMIT $1
                     FOR UPDATE SKIP LOCKED
-                    """,
-                    self._batch_size,
-                )
+                ) t
+                ORDER BY row_number() OVER (PARTITION BY t.bank_id ORDER BY t.created_at), t.created_at
+                LIMIT $1
+            """
+        else:
+            query = f"""
+                SELECT operation_id, bank_id, created_at, task_payload,
+                       EXTRACT(EPOCH FROM now() - created_at) AS queue_age
+                FROM {table}
+                WHERE status = 'pending' AND task_payload IS NOT NULL {type_filter}
+                ORDER BY created_at
+                LIMIT $1
+                FOR UPDATE SKIP LOCKED
+            """
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                # Select and lock pending tasks
+                rows = list(await conn.fetch(query, *params))
 
                 if not rows:
                     return []
 
+                tasks = [(str(row["operation_id"]), json.loads(row["task_payload"])) for row in rows]
+                if self._retain_coalesce_chars > 0:
+                    tasks = await self._coalesce_retains(conn, table, rows, tasks)
+
                 # Claim the tasks by updating status and worker_id
                 operation_ids = [row["operation_id"] for row in rows]
                 await conn.execute(
@@ -108,17 +269,107 @@ class WorkerPoller:
                     operation_ids,
                 )
 
-                # Parse and return task payloads
-                return [(str(row["operation_id"]), json.loads(row["task_payload"])) for row in rows]
+        from ..metrics import get_metrics_collector
+
+        metrics = get_metrics_collector()
+        for row in rows:
+            task_type = json.loads(row["task_payload"]).get("type", "unknown")
+            metrics.record_task_claimed(task_type, float(row["queue_age"] or 0.0))
+        return tasks
+
+    async def _coalesce_retains(
+        self,
+        conn: "asyncpg.Connection",
+        table: str,
+        rows: list,
+        tasks: list[tuple[str, dict[str, Any]]],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """
+        Merge the first claimed task of each bank, if a batch_retain, with the bank's next pending batch_retain tasks.
+
+        Follow-up tasks are locked in the claim transaction and appended to `rows`, so they
+        are claimed with the rest. Only tasks queued before the bank's next claimed task are
+        merged, and that task and the bank's later claimed tasks pass through unmerged.
+        Merging stops at the first task that is incompatible or would exceed the content
+        budget, so tasks are never reordered within a bank.
+        """
+        claimed = list(rows)
+        claimed_ids = [row["operation_id"] for row in claimed]
+        seen_banks: set[str] = set()
+        result = []
+        for i, (row, (op_id, task_dict)) in enumerate(zip(claimed, tasks)):
+            first_of_bank = row["bank_id"] not in seen_banks
+            seen_banks.add(row["bank_id"])
+            chars = _retain_chars(task_dict)
+            if (
+                not first_of_bank
+                or task_dict.get("type") != "batch_retain"
+                or "contents_ref" in task_dict
+                or chars >= self._retain_coalesce_chars
+            ):
+                result.append((op_id, task_dict))
+                continue
+
+            next_claimed_at = next((r["created_at"] for r in claimed[i + 1 :] if r["bank_id"] == row["bank_id"]), None)
+            candidates = await conn.fetch(
+                f"""
+                SELECT operation_id, bank_id, created_at, task_payload,
+                       EXTRACT(EPOCH FROM now() - created_at) AS queue_age
+                FROM {table}
+                WHERE status = 'pending' AND task_payload IS NOT NULL
+                  AND bank_id = $1 AND task_payload->>'type' = 'batch_retain'
+                  AND created_at >= $2 AND operation_id <> ALL($3::uuid[])
+                  AND ($5::timestamptz IS NULL OR created_at < $5)
+                ORDER BY created_at
+                LIMIT $4
+                FOR UPDATE SKIP LOCKED
+                """,
+                row["bank_id"],
+                row["created_at"],
+                claimed_ids,
+                COALESCE_MAX_TASKS,
+                next_claimed_at,
+            )
+
+            group = [dict(task_dict, operation_id=op_id)]
+            document_ids = _retain_document_ids(task_dict)
+            for candidate in candidates:
+                candidate_dict = json.loads(candidate["task_payload"])
+                candidate_chars = _retain_chars(candidate_dict)
+                if chars + candidate_chars > self._retain_coalesce_chars or not _can_coalesce(
+                    task_dict, candidate_dict, document_ids
+                ):
+                    break
+                chars += candidate_chars
+                document_ids |= _retain_document_ids(candidate_dict)
+                group.append(dict(candidate_dict, operation_id=str(candidate["operation_id"])))
+                rows.append(candidate)
+                claimed_ids.append(candidate["operation_id"])
+
+            if len(group) == 1:
+                result.append((op_id, task_dict))
+                continue
+
+            logger.info(
+                f"Worker {self._worker_id} coalesced {len(group)} retain tasks for bank {row['bank_id']} "
+                f"({chars:,} chars)"
+            )
+            result.append((op_id, {"type": COALESCED_RETAIN_TASK_TYPE, "bank_id": row["bank_id"], "tasks": group}))
+        return result
 
     async def _mark_completed(self, operation_id: str):
-        """Mark a task as completed."""
+        """Mark a task as completed and drop its stored contents."""
         table = fq_table("async_operations", self._schema)
         await self._pool.execute(
             f"""
-            UPDATE {table}
-            SET status = 'completed', completed_at = now(), updated_at = now()
-            WHERE operation_id = $1
+            WITH completed AS (
+                UPDATE {table}
+                SET status = 'completed', completed_at = now(), updated_at = now()
+                WHERE operation_id = $1
+                RETURNING operation_id
+            )
+            DELETE FROM {fq_table(PAYLOAD_TABLE, self._schema)}
+            WHERE operation_id IN (SELECT operation_id FROM completed)
             """,
             operation_id,
         )
@@ -174,74 +425,156 @@ class WorkerPoller:
             logger.warning(f"Task {operation_id} failed, will retry (attempt {retry_count + 1}/{self._max_retries})")
 
     async def execute_task(self, operation_id: str, task_dict: dict[str, Any]):
-        """Execute a single task and update its status."""
+        """Execute a single (or coalesced) task and update the status of its operations."""
         task_type = task_dict.get("type", "unknown")
         bank_id = task_dict.get("bank_id", "unknown")
+        operation_ids = coalesced_operation_ids(task_dict) or [operation_id]
 
         try:
             logger.debug(f"Executing task {operation_id} (type={task_type}, bank={bank_id})")
             await self._executor(task_dict)
-            await self._mark_completed(operation_id)
+            for op_id in operation_ids:
+                await self._mark_completed(op_id)
             logger.debug(f"Task {operation_id} completed successfully")
+        except CoalescedTaskError as e:
+            logger.error(f"Task {operation_id} failed: {e}")
+            for op_id in operation_ids:
+                if op_id in e.failures:
+                    await self._retry_or_fail(op_id, e.failures[op_id])
+                else:
+                    await self._mark_completed(op_id)
         except Exception as e:
             error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
             logger.error(f"Task {operation_id} failed: {e}")
-            await self._retry_or_fail(operation_id, error_msg)
+            for op_id in operation_ids:
+                await self._retry_or_fail(op_id, error_msg)
+
+    async def _run_in_slot(self, slot_pool: SlotPool, operation_id: str, task_dict: dict[str, Any]):
+        """Execute a claimed task, then free its slot and wake the poll loop to claim a replacement."""
+        try:
+            await self.execute_task(operation_id, task_dict)
+        finally:
+            slot_pool.in_use -= 1
+            async with self._in_flight_lock:
+                self._in_flight_count -= 1
+            self._wakeup.set()
+
+    async def _fill_slots(self) -> int:
+        """Claim tasks for the free slots of every pool and start them. Returns the number started."""
+        started = 0
+        for slot_pool in self._slot_pools:
+            if slot_pool.free == 0:
+                continue
+            tasks = await self.claim_batch(limit=slot_pool.free, slot_pool=slot_pool)
+            if not tasks:
+                continue
+
+            task_types: dict[str, int] = {}
+            for _, task_dict in tasks:
+                t = task_dict.get("type", "unknown")
+                task_types[t] = task_types.get(t, 0) + 1
+            types_str = ", ".join(f"{k}:{v}" for k, v in task_types.items())
+            logger.info(
+                f"Worker {self._worker_id} claimed {len(tasks)} tasks ({slot_pool.name} slots "
+                f"{slot_pool.in_use + len(tasks)}/{slot_pool.size}): {types_str}"
+            )
+
+            slot_pool.in_use += len(tasks)
+            async with self._in_flight_lock:
+                self._in_flight_count += len(tasks)
+            for op_id, task_dict in tasks:
+                task = asyncio.create_task(self._run_in_slot(slot_pool, op_id, task_dict))
+                self._current_tasks.add(task)
+                task.add_done_callback(self._current_tasks.discard)
+            started += len(tasks)
+        return started
+
+    def _on_task_notification(self, _conn, _pid, _channel, _payload):
+        """LISTEN callback: a task was submitted, claim it now."""
+        self._wakeup.set()
+
+    async def _ensure_listener(self):
+        """Open the LISTEN connection if listening is enabled and it is not up (falls back to polling)."""
+        if not self._listen or self._shutdown.is_set():
+            return
+        if self._listener_conn is not None:
+            if not self._listener_conn.is_closed():
+                return
+            logger.warning(f"Worker {self._worker_id} lost its LISTEN connection, polling until it is restored")
+            await self._stop_listener()
+
+        loop_time = asyncio.get_running_loop().time()
+        if loop_time < self._listen_retry_at:
+            return
+
+        conn = None
+        try:
+            conn = await self._pool.acquire()
+            await conn.add_listener(TASK_NOTIFY_CHANNEL, self._on_task_notification)
+        except Exception as e:
+            logger.warning(f"Worker {self._worker_id} could not LISTEN on {TASK_NOTIFY_CHANNEL}, polling instead: {e}")
+            if conn is not None:
+                await self._pool.release(conn)
+            self._listen_retry_at = loop_time + self._fallback_poll_interval_ms / 1000
+            return
+
+        self._listener_conn = conn
+        logger.info(f"Worker {self._worker_id} listening on {TASK_NOTIFY_CHANNEL}")
+
+    async def _stop_listener(self):
+        """Stop listening and give the connection back to the pool."""
+        conn, self._listener_conn = self._listener_conn, None
+        if conn is None:
+            return
+        try:
+            if not conn.is_closed():
+                await conn.remove_listener(TASK_NOTIFY_CHANNEL, self._on_task_notification)
+        except Exception as e:
+            logger.debug(f"Worker {self._worker_id} error removing LISTEN: {e}")
+        finally:
+            await self._pool.release(conn)
+
+    def _current_poll_interval(self) -> float:
+        """Seconds to wait for a wakeup before polling again."""
+        if self._listener_conn is not None:
+            return self._fallback_poll_interval_ms / 1000
+        return self._poll_interval_ms / 1000
 
     async def run(self):
         """
         Main polling loop.
 
-        Continuously polls for pending tasks, claims them, and executes them
-        until shutdown is signaled.
+        Keeps every slot pool filled: claims tasks for free slots, then waits until a
+        slot frees, a task is submitted (when listening) or the poll interval elapses,
+        and claims again, until shutdown is signaled.
         """
-        logger.info(f"Worker {self._worker_id} starting polling loop")
-
-        while not self._shutdown.is_set():
-            try:
-                # Claim a batch of tasks
-                tasks = await self.claim_batch()
-
-                if tasks:
-                    # Log batch info
-                    task_types = {}
-                    for _, task_dict in tasks:
-                        t = task_dict.get("type", "unknown")
-                        task_types[t] = task_types.get(t, 0) + 1
-                    types_str = ", ".join(f"{k}:{v}" for k, v in task_types.items())
-                    logger.info(f"Worker {self._worker_id} claimed {len(tasks)} tasks: {types_str}")
-
-                    # Track in-flight tasks
-                    async with self._in_flight_lock:
-                        self._in_flight_count += len(tasks)
-
-                    # Execute tasks concurrently
-                    try:
-                        await asyncio.gather(
-                            *[self.execute_task(op_id, task_dict) for op_id, task_dict in tasks],
-                            return_exceptions=True,
-                        )
-                    finally:
-                        async with self._in_flight_lock:
-                            self._in_flight_count -= len(tasks)
-                else:
-                    # No tasks found, wait before polling again
+        slots_str = ", ".join(f"{p.name}={p.size}" for p in self._slot_pools)
+        logger.info(f"Worker {self._worker_id} starting polling loop (slots: {slots_str})")
+
+        try:
+            while not self._shutdown.is_set():
+                try:
+                    # Clear before claiming so that a slot freed (or a task submitted) during the claim is not missed
+                    self._wakeup.clear()
+                    await self._ensure_listener()
+                    await self._fill_slots()
+
+                    # Wait for a free slot, a new task, the next poll or shutdown
                     try:
-                        await asyncio.wait_for(
-                            self._shutdown.wait(),
-                            timeout=self._poll_interval_ms / 1000,
-                        )
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=self._current_poll_interval())
                     except asyncio.TimeoutError:
                         pass  # Normal timeout, continue polling
 
-            except asyncio.CancelledError:
-                logger.info(f"Worker {self._worker_id} polling loop cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Worker {self._worker_id} error in polling loop: {e}")
-                traceback.print_exc()
-                # Backoff on error
-                await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    logger.info(f"Worker {self._worker_id} polling loop cancelled")
+                    break
+                except Exception as e:
+                    logger.error(f"Worker {self._worker_id} error in polling loop: {e}")
+                    traceback.print_exc()
+                    # Backoff on error
+                    await asyncio.sleep(1)
+        finally:
+            await self._stop_listener()
 
         logger.info(f"Worker {self._worker_id} polling loop stopped")
 
@@ -254,6 +587,7 @@ class WorkerPoller:
         """
         logger.info(f"Worker {self._worker_id} initiating graceful shutdown")
         self._shutdown.set()
+        self._wakeup.set()
 
         # Wait for in-flight tasks to complete
         start_time = asyncio.get_event_loop().time()
@@ -275,6 +609,11 @@ class WorkerPoller:
         """Get the worker ID."""
         return self._worker_id
 
+    @property
+    def slot_pools(self) -> list[SlotPool]:
+        """Get the slot pools (dedicated pools first, then the shared pool)."""
+        return self._slot_pools
+
     @property
     def is_shutdown(self) -> bool:
         """Check if shutdown has been signaled."""
@@ -0,0 +1,142 @@
+"""
+Tests for adaptive recall (skipping or shrinking graph/temporal retrieval after semantic + BM25).
+"""
+
+import dataclasses
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hindsight_api.config import get_config
+from hindsight_api.engine.memory_engine import Budget
+from hindsight_api.engine.search.retrieval import plan_adaptive_retrieval, retrieve_all_fact_types_parallel
+from hindsight_api.engine.search.types import RetrievalResult
+
+
+def _semantic(ids_and_scores: list[tuple[str, float]]) -> list[RetrievalResult]:
+    return [
+        RetrievalResult(id=i, text="fact", fact_type="world", similarity=score, text_tokens=100)
+        for i, score in ids_and_scores
+    ]
+
+
+def _bm25(ids_and_scores: list[tuple[str, float]]) -> list[RetrievalResult]:
+    return [
+        RetrievalResult(id=i, text="fact", fact_type="world", bm25_score=score, text_tokens=100)
+        for i, score in ids_and_scores
+    ]
+
+
+def test_budget_is_scaled_to_max_tokens():
+    semantic = _semantic([(f"s{i}", 0.5 - i * 0.001) for i in range(50)])
+    bm25 = _bm25([(f"b{i}", 10.0 - i) for i in range(50)])
+
+    decision = plan_adaptive_retrieval({"world": (semantic, bm25)}, 300, 1000, min_overlap=0.5, min_score_gap=0.1)
+
+    # 100 tokens per fact -> 10 results fit -> 4 budget per result
+    assert decision.target_results == 10
+    assert not decision.stable
+    assert decision.graph_budget == 40
+    assert decision.temporal_budget == 40
+
+
+def test_graph_is_skipped_when_semantic_and_bm25_agree():
+    semantic = _semantic([(f"u{i}", 0.5 - i * 0.001) for i in range(50)])
+    bm25 = _bm25([(f"u{i}", 10.0 - i) for i in range(50)])
+
+    decision = plan_adaptive_retrieval({"world": (semantic, bm25)}, 300, 1000, min_overlap=0.5, min_score_gap=0.1)
+
+    assert decision.stable
+    assert decision.overlap == 1.0
+    assert decision.graph_budget == 0
+    # Temporal retrieval is only shrunk, never skipped
+    assert decision.temporal_budget == 40
+
+
+def test_graph_is_skipped_on_a_clear_score_gap():
+    top = [(f"s{i}", 0.9) for i in range(10)]
+    rest = [(f"s{i}", 0.4) for i in range(10, 50)]
+    semantic = _semantic(top + rest)
+    bm25 = _bm25([(f"b{i}", 10.0 - i) for i in range(5)])
+
+    decision = plan_adaptive_retrieval({"world": (semantic, bm25)}, 300, 1500, min_overlap=0.5, min_score_gap=0.1)
+
+    assert decision.overlap == 0.0
+    assert decision.score_gap == pytest.approx(0.5)
+    assert decision.stable
+    assert decision.graph_budget == 0
+
+
+def test_no_semantic_results_keeps_graph():
+    decision = plan_adaptive_retrieval({"world": ([], [])}, 100, 4096, min_overlap=0.5, min_score_gap=0.1)
+
+    assert not decision.stable
+    assert decision.graph_budget == 100
+
+
+@pytest.mark.asyncio
+async def test_temporal_retrieval_uses_the_adaptive_budget():
+    semantic = _semantic([(f"u{i}", 0.5 - i * 0.001) for i in range(50)])
+    bm25 = _bm25([(f"u{i}", 10.0 - i) for i in range(50)])
+    pool = MagicMock(acquire=AsyncMock(), release=AsyncMock())
+    constraint = (datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 2, 1, tzinfo=timezone.utc))
+
+    with (
+        patch("hindsight_api.engine.search.temporal_extraction.extract_temporal_constraint", return_value=constraint),
+        patch(
+            "hindsight_api.engine.search.retrieval.retrieve_temporal_combined", new=AsyncMock(return_value={})
+        ) as temporal,
+    ):
+        result = await retrieve_all_fact_types_parallel(
+            pool,
+            "what happened in january?",
+            "[0.1]",
+            "bank",
+            ["world"],
+            300,
+            graph_retriever=MagicMock(),
+            semantic_bm25_results={"world": (semantic, bm25)},
+            adaptive=True,
+            max_tokens=1000,
+        )
+
+    assert result.adaptive.temporal_budget == 40
+    assert temporal.await_args.kwargs["budget"] == 40
+
+
+@pytest.mark.asyncio
+async def test_adaptive_decision_is_traced(memory, request_context):
+    bank_id = f"test_adaptive_{datetime.now(timezone.utc).timestamp()}"
+    config = dataclasses.replace(get_config(), recall_adaptive=True, recall_adaptive_min_overlap=0.0)
+
+    try:
+        await memory.retain_async(
+            bank_id=bank_id,
+            content="Alice works at Google in Mountain View.",
+            context="team notes",
+            request_context=request_context,
+        )
+
+        with (
+            patch("hindsight_api.engine.memory_engine.get_config", return_value=config),
+            patch("hindsight_api.engine.search.retrieval.get_config", return_value=config),
+        ):
+            result = await memory.recall_async(
+                bank_id=bank_id,
+                query="Where does Alice work?",
+                fact_type=["world"],
+                budget=Budget.LOW,
+                max_tokens=512,
+                enable_trace=True,
+                request_context=request_context,
+            )
+
+        phases = {pm["phase_name"]: pm for pm in result.trace["summary"]["phase_metrics"]}
+        assert phases["adaptive_retrieval"]["details"]["stable"] is True
+        graph = [r for r in result.trace["retrieval_results"] if r["method_name"] == "graph"]
+        assert graph and graph[0]["metadata"]["budget"] == 0
+        assert graph[0]["results"] == []
+        assert len(result.results) > 0
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
@@ -0,0 +1,165 @@
+"""
+Tests for the HNSW (ANN) semantic retrieval path.
+
+Tests cover:
+1. compute_ann_ef_search - candidate list sizing from the requested limit
+2. should_use_ann - config gating, pgvector support, small-bank fallback and the decision cache
+3. retrieve_semantic_bm25_combined - ANN and exact paths agree on a small bank
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+import pytest
+
+from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.engine.search import retrieval
+from hindsight_api.engine.search.retrieval import (
+    compute_ann_ef_search,
+    retrieve_semantic_bm25_combined,
+    should_use_ann,
+)
+
+
+def _config(enabled: bool = True, min_bank_size: int = 100):
+    config = MagicMock()
+    config.recall_ann_enabled = enabled
+    config.recall_ann_min_bank_size = min_bank_size
+    return config
+
+
+class TestComputeAnnEfSearch:
+    def test_small_limit_uses_floor(self):
+        assert compute_ann_ef_search(5) == 40
+
+    def test_scales_with_limit(self):
+        assert compute_ann_ef_search(100) == 200
+        assert compute_ann_ef_search(300) == 600
+
+    def test_capped_at_pgvector_max(self):
+        assert compute_ann_ef_search(1000) == 1000
+
+
+class TestShouldUseAnn:
+    @pytest.fixture(autouse=True)
+    def iterative_scan(self):
+        """pgvector >= 0.8 unless a test says otherwise; no cached decisions between tests."""
+        retrieval._ann_decisions.clear()
+        with patch.object(retrieval, "supports_hnsw_iterative_scan", AsyncMock(return_value=True)) as supported:
+            yield supported
+        retrieval._ann_decisions.clear()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self):
+        conn = AsyncMock()
+        with patch.object(retrieval, "get_config", return_value=_config(enabled=False)):
+            assert await should_use_ann(conn, "bank", ["world"]) is False
+        conn.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unindexed_fact_type_uses_exact(self):
+        conn = AsyncMock()
+        with patch.object(retrieval, "get_config", return_value=_config()):
+            assert await should_use_ann(conn, "bank", ["world", "opinion"]) is False
+        conn.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_bank_uses_exact(self):
+        conn = AsyncMock()
+        conn.fetchval.return_value = 42
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=100)):
+            assert await should_use_ann(conn, "bank", ["world"]) is False
+
+    @pytest.mark.asyncio
+    async def test_large_bank_uses_ann(self):
+        conn = AsyncMock()
+        conn.fetchval.return_value = 100
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=100)):
+            assert await should_use_ann(conn, "bank", ["world", "experience"]) is True
+
+    @pytest.mark.asyncio
+    async def test_zero_threshold_skips_count(self):
+        conn = AsyncMock()
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=0)):
+            assert await should_use_ann(conn, "bank", ["world"]) is True
+        conn.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_iterative_scan_uses_exact(self, iterative_scan):
+        """Without iterative scans a filtered HNSW probe can return too few rows, so large banks stay exact."""
+        iterative_scan.return_value = False
+        conn = AsyncMock()
+        conn.fetchval.return_value = 100
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=100)):
+            assert await should_use_ann(conn, "bank", ["world"]) is False
+        conn.fetchval.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bank_size_decision_is_cached(self):
+        conn = AsyncMock()
+        conn.fetchval.return_value = 100
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=100)):
+            assert await should_use_ann(conn, "bank", ["world"]) is True
+            assert await should_use_ann(conn, "bank", ["world"]) is True
+            assert await should_use_ann(conn, "other-bank", ["world"]) is True
+        assert conn.fetchval.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_small_bank_decision_expires(self):
+        conn = AsyncMock()
+        conn.fetchval.return_value = 42
+        with patch.object(retrieval, "get_config", return_value=_config(min_bank_size=100)):
+            assert await should_use_ann(conn, "bank", ["world"]) is False
+            assert await should_use_ann(conn, "bank", ["world"]) is False
+            assert conn.fetchval.await_count == 1
+
+            conn.fetchval.return_value = 100
+            with patch.object(retrieval.time, "monotonic", return_value=retrieval.time.monotonic() + 301):
+                assert await should_use_ann(conn, "bank", ["world"]) is True
+        assert conn.fetchval.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ann_matches_exact_on_small_bank(pg0_db_url, embeddings):
+    """On a bank small enough to fit in the HNSW candidate list, ANN must match the exact path."""
+    bank_id = f"test-ann-{uuid.uuid4().hex[:8]}"
+    texts = [
+        "Alice is a software engineer who loves Python.",
+        "Bob works with Alice on the backend team.",
+        "The team uses PostgreSQL for their database.",
+        "Charlie went hiking in the Alps last summer.",
+        "The quarterly report is due next Friday.",
+    ]
+    vectors = embeddings.encode(texts)
+    query_vector = embeddings.encode(["Which database does the team use?"])[0]
+    query_emb_str = "[" + ",".join(str(x) for x in query_vector) + "]"
+
+    conn = await asyncpg.connect(pg0_db_url)
+    try:
+        for i, (text, vector) in enumerate(zip(texts, vectors)):
+            await conn.execute(
+                f"""INSERT INTO {fq_table("memory_units")}
+                    (bank_id, text, fact_type, embedding, event_date)
+                    VALUES ($1, $2, $3, $4::vector, NOW())""",
+                bank_id,
+                text,
+                "world" if i % 2 == 0 else "experience",
+                "[" + ",".join(str(x) for x in vector) + "]",
+            )
+
+        fact_types = ["world", "experience"]
+        exact = await retrieve_semantic_bm25_combined(
+            conn, query_emb_str, "database team", bank_id, fact_types, limit=10, use_ann=False
+        )
+        ann = await retrieve_semantic_bm25_combined(
+            conn, query_emb_str, "database team", bank_id, fact_types, limit=10, use_ann=True
+        )
+
+        for ft in fact_types:
+            assert [r.id for r in ann[ft][0]] == [r.id for r in exact[ft][0]]
+            assert {r.id for r in ann[ft][1]} == {r.id for r in exact[ft][1]}
+        assert ann["world"][0][0].text == "The team uses PostgreSQL for their database."
+    finally:
+        await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+        await conn.close()
@@ -0,0 +1,129 @@
+"""
+Tests for batch recall (shared embedding, retrieval, graph cache and reranking across queries).
+"""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+
+from hindsight_api.engine.memory_engine import Budget, fq_table
+from hindsight_api.engine.search.reranking import CrossEncoderReranker, RerankBatch
+from hindsight_api.engine.search.retrieval import retrieve_semantic_bm25_batch, retrieve_semantic_bm25_combined
+
+FACTS = [
+    "Alice maintains the billing service.",
+    "Bob prefers tea over coffee.",
+    "Carol moved to Lisbon last spring.",
+]
+QUERIES = ["Who maintains billing?", "What does Bob like to drink?", "Where did Carol move?"]
+
+
+def _vec(e) -> str:
+    return "[" + ",".join(str(x) for x in e) + "]"
+
+
+async def _insert_facts(conn, bank_id: str, embeddings) -> None:
+    for text, vector in zip(FACTS, embeddings.encode(FACTS)):
+        await conn.execute(
+            f"""INSERT INTO {fq_table("memory_units")} (bank_id, text, fact_type, embedding, event_date)
+                VALUES ($1, $2, 'world', $3::vector, NOW())""",
+            bank_id,
+            text,
+            _vec(vector),
+        )
+
+
+def _candidate(text: str):
+    candidate = MagicMock()
+    candidate.retrieval.text = text
+    candidate.retrieval.context = None
+    candidate.retrieval.occurred_start = None
+    return candidate
+
+
+@pytest.mark.asyncio
+async def test_batch_retrieval_matches_single_query_retrieval(pg0_db_url, embeddings):
+    bank_id = f"test-batch-recall-{uuid.uuid4().hex[:8]}"
+    query_embs = [_vec(e) for e in embeddings.encode(QUERIES)]
+
+    conn = await asyncpg.connect(pg0_db_url)
+    try:
+        await _insert_facts(conn, bank_id, embeddings)
+
+        batch = await retrieve_semantic_bm25_batch(conn, query_embs, QUERIES, bank_id, ["world"], limit=10)
+
+        assert len(batch) == len(QUERIES)
+        for query_emb, query, batch_results in zip(query_embs, QUERIES, batch):
+            single = await retrieve_semantic_bm25_combined(conn, query_emb, query, bank_id, ["world"], limit=10)
+            for ft in ("world",):
+                batch_semantic, batch_bm25 = batch_results[ft]
+                single_semantic, single_bm25 = single[ft]
+                assert [r.id for r in batch_semantic] == [r.id for r in single_semantic]
+                assert {r.id for r in batch_bm25} == {r.id for r in single_bm25}
+    finally:
+        await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+        await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_recall_batch_matches_individual_recalls(memory, embeddings, request_context):
+    bank_id = f"test-batch-recall-{uuid.uuid4().hex[:8]}"
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        await _insert_facts(conn, bank_id, embeddings)
+    try:
+        batch = await memory.recall_batch_async(
+            bank_id, QUERIES, fact_type=["world"], budget=Budget.LOW, request_context=request_context
+        )
+
+        assert len(batch) == len(QUERIES)
+        for query, batch_result in zip(QUERIES, batch):
+            single = await memory.recall_async(
+                bank_id, query, fact_type=["world"], budget=Budget.LOW, request_context=request_context
+            )
+            assert [f.id for f in batch_result.results] == [f.id for f in single.results]
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+
+
+class TestRerankBatch:
+    @pytest.mark.asyncio
+    async def test_participants_share_one_model_call(self):
+        cross_encoder = MagicMock()
+        cross_encoder.predict = AsyncMock(return_value=[0.0, 2.0, 1.0])
+        batch = RerankBatch(CrossEncoderReranker(cross_encoder=cross_encoder), participants=2)
+        a, b = _candidate("a"), _candidate("b")
+        c = _candidate("c")
+
+        async def run(query, candidates):
+            async with batch.participant() as reranker:
+                return await reranker.rerank(query, candidates)
+
+        first, second = await asyncio.gather(run("q1", [a, b]), run("q2", [c]))
+
+        cross_encoder.predict.assert_awaited_once_with([["q1", "a"], ["q1", "b"], ["q2", "c"]])
+        assert [r.candidate for r in first] == [b, a]
+        assert [r.candidate for r in second] == [c]
+
+    @pytest.mark.asyncio
+    async def test_participant_leaving_does_not_block_others(self):
+        cross_encoder = MagicMock()
+        cross_encoder.predict = AsyncMock(return_value=[1.0])
+        batch = RerankBatch(CrossEncoderReranker(cross_encoder=cross_encoder), participants=2)
+
+        async def failing():
+            async with batch.participant():
+                raise RuntimeError("retrieval failed")
+
+        async def reranking():
+            async with batch.participant() as reranker:
+                return await reranker.rerank("q", [_candidate("a")])
+
+        failed, scored = await asyncio.wait_for(asyncio.gather(failing(), reranking(), return_exceptions=True), 5)
+
+        assert isinstance(failed, RuntimeError)
+        assert len(scored) == 1
@@ -0,0 +1,72 @@
+"""
+Tests for retain duplicate detection (index-backed and exact modes).
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from hindsight_api.engine.memory_engine import MemoryEngine, fq_table
+
+
+def _vec(e) -> str:
+    return "[" + ",".join(str(x) for x in e) + "]"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["index", "exact"])
+async def test_duplicate_detection_modes(memory, embeddings, mode):
+    bank_id = f"test-dedup-{uuid.uuid4().hex[:8]}"
+    now = datetime.now(timezone.utc)
+    existing = "Alice started a new job at Google in March."
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        try:
+            # One stored fact inside the window, one identical fact far outside it
+            for text, event_date in [(existing, now), ("Bob adopted a cat named Milo.", now - timedelta(days=30))]:
+                await conn.execute(
+                    f"""INSERT INTO {fq_table("memory_units")} (bank_id, text, fact_type, embedding, event_date)
+                        VALUES ($1, $2, 'world', $3::vector, $4)""",
+                    bank_id,
+                    text,
+                    _vec(embeddings.encode([text])[0]),
+                    event_date,
+                )
+
+            texts = [existing, "Bob adopted a cat named Milo.", "The weather in Paris was rainy."]
+            new_embeddings = embeddings.encode(texts)
+
+            config = MagicMock(retain_dedup_mode=mode)
+            with patch("hindsight_api.engine.memory_engine.get_config", return_value=config):
+                async with conn.transaction():
+                    flags = await memory._find_duplicate_facts_batch(conn, bank_id, texts, new_embeddings, now)
+
+            assert flags == [True, False, False]
+        finally:
+            await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_transaction, iterative_scan", [(False, True), (True, False)])
+async def test_index_mode_falls_back_to_exact(in_transaction, iterative_scan):
+    """Without a transaction or pgvector iterative scans, the index probe could miss duplicates."""
+    engine = MagicMock(_find_duplicate_facts_indexed=AsyncMock())
+    conn = MagicMock(is_in_transaction=MagicMock(return_value=in_transaction), fetch=AsyncMock(return_value=[]))
+
+    with (
+        patch("hindsight_api.engine.memory_engine.get_config", return_value=MagicMock(retain_dedup_mode="index")),
+        patch(
+            "hindsight_api.engine.memory_engine.supports_hnsw_iterative_scan",
+            AsyncMock(return_value=iterative_scan),
+        ),
+    ):
+        flags = await MemoryEngine._find_duplicate_facts_batch(
+            engine, conn, "bank", ["fact"], [[0.1]], datetime.now(timezone.utc)
+        )
+
+    assert flags == [False]
+    engine._find_duplicate_facts_indexed.assert_not_called()
+    conn.fetch.assert_awaited_once()
@@ -0,0 +1,66 @@
+"""
+Tests for CachedEmbeddings (query embedding cache).
+"""
+
+from hindsight_api.engine.embeddings import CachedEmbeddings, Embeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Minimal Embeddings implementation that records every encode() call."""
+
+    def __init__(self, model_name: str = "test-model"):
+        self.model_name = model_name
+        self.calls: list[list[str]] = []
+
+    @property
+    def provider_name(self) -> str:
+        return "test"
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    async def initialize(self) -> None:
+        pass
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+def test_repeated_text_is_served_from_cache():
+    inner = CountingEmbeddings()
+    cache = CachedEmbeddings(inner)
+
+    first = cache.encode(["where does alice work?"])
+    second = cache.encode(["where does alice work?"])
+
+    assert first == second
+    assert inner.calls == [["where does alice work?"]]
+
+
+def test_only_misses_reach_the_model():
+    inner = CountingEmbeddings()
+    cache = CachedEmbeddings(inner)
+    cache.encode(["a"])
+
+    vectors = cache.encode(["a", "bb", "bb"])
+
+    assert vectors == [[1.0, 0.5], [2.0, 0.5], [2.0, 0.5]]
+    assert inner.calls == [["a"], ["bb"]]
+
+
+def test_get_cached_never_calls_the_model():
+    inner = CountingEmbeddings()
+    cache = CachedEmbeddings(inner)
+
+    assert cache.get_cached("a") is None
+    cache.encode(["a"])
+    assert cache.get_cached("a") == [1.0, 0.5]
+    assert inner.calls == [["a"]]
+
+
+def test_key_includes_model():
+    assert CachedEmbeddings(CountingEmbeddings("m1")).cache_key("a") != CachedEmbeddings(
+        CountingEmbeddings("m2")
+    ).cache_key("a")
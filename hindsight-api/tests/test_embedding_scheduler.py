@@ -0,0 +1,143 @@
+"""
+Tests for EmbeddingScheduler (process-wide micro-batching of embedding calls).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from hindsight_api.engine.retain.embedding_utils import EmbeddingScheduler
+
+
+class FakeEmbeddings:
+    """Records encode() calls and returns a vector derived from each text."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[str]] = []
+        self.threads: set[str] = set()
+        self.fail = fail
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return [[float(len(t)), 1.0] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_single_query_returns_vector():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingScheduler(backend, window_ms=1)
+
+    vector = await batcher.embed("hello")
+
+    assert vector == [5.0, 1.0]
+    assert backend.calls == [["hello"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_encode_call():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingScheduler(backend, window_ms=20)
+
+    texts = ["a", "bb", "ccc", "dddd"]
+    vectors = await asyncio.gather(*(batcher.embed(t) for t in texts))
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [3.0, 1.0], [4.0, 1.0]]
+    assert backend.calls == [texts]
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit_flushes_early():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingScheduler(backend, window_ms=10_000, max_batch_size=2)
+
+    vectors = await asyncio.wait_for(asyncio.gather(*(batcher.embed(t) for t in ["a", "bb", "ccc", "dddd"])), 5)
+
+    assert len(vectors) == 4
+    assert backend.calls == [["a", "bb"], ["ccc", "dddd"]]
+
+
+@pytest.mark.asyncio
+async def test_encode_runs_off_the_event_loop():
+    backend = FakeEmbeddings()
+    batcher = EmbeddingScheduler(backend, window_ms=1)
+
+    await batcher.embed("hello")
+
+    assert threading.current_thread().name not in backend.threads
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates_to_every_caller():
+    backend = FakeEmbeddings(fail=True)
+    batcher = EmbeddingScheduler(backend, window_ms=20)
+
+    results = await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    assert all(isinstance(r, Exception) for r in results)
+    assert "model exploded" in str(results[0])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_retains_share_encode_calls():
+    backend = FakeEmbeddings()
+    scheduler = EmbeddingScheduler(backend, window_ms=20, bulk_batch_size=8)
+
+    first, second = await asyncio.gather(scheduler.embed_many(["a", "bb"]), scheduler.embed_many(["ccc"]))
+
+    assert first == [[1.0, 1.0], [2.0, 1.0]]
+    assert second == [[3.0, 1.0]]
+    assert backend.calls == [["a", "bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_retain_batches_group_similar_lengths():
+    backend = FakeEmbeddings()
+    scheduler = EmbeddingScheduler(backend, window_ms=1, bulk_batch_size=2)
+    texts = ["x" * 50, "y", "z" * 51, "w" * 2]
+
+    vectors = await scheduler.embed_many(texts)
+
+    assert vectors == [[50.0, 1.0], [1.0, 1.0], [51.0, 1.0], [2.0, 1.0]]
+    assert sorted(sorted(len(t) for t in call) for call in backend.calls) == [[1, 2], [50, 51]]
+
+
+@pytest.mark.asyncio
+async def test_queries_are_dispatched_ahead_of_queued_retain_texts():
+    backend = FakeEmbeddings()
+    scheduler = EmbeddingScheduler(backend, window_ms=1, max_batch_size=4, bulk_batch_size=2)
+
+    retain = asyncio.ensure_future(scheduler.embed_many(["r1", "r2", "r3", "r4", "r5", "r6"]))
+    await asyncio.sleep(0)
+    query = await scheduler.embed("q")
+    await retain
+
+    assert query == [1.0, 1.0]
+    # The first retain batch was already running; the query went next
+    assert backend.calls[1] == ["q"]
+
+
+@pytest.mark.asyncio
+async def test_wrapped_backends_share_one_scheduler():
+    from hindsight_api.engine.embeddings import CachedEmbeddings
+    from hindsight_api.engine.retain.embedding_utils import get_embedding_scheduler
+
+    backend = FakeEmbeddings()
+    cached = CachedEmbeddings(backend)
+
+    assert get_embedding_scheduler(cached) is get_embedding_scheduler(backend)
+
+
+@pytest.mark.parametrize(("provider", "workers"), [("local", 1), ("openai", 8), ("tei", 8)])
+def test_default_workers_depend_on_provider(monkeypatch, provider, workers):
+    from hindsight_api.config import HindsightConfig
+
+    monkeypatch.setenv("HINDSIGHT_API_EMBEDDINGS_PROVIDER", provider)
+    monkeypatch.delenv("HINDSIGHT_API_EMBEDDINGS_WORKERS", raising=False)
+    assert HindsightConfig.from_env().embeddings_workers == workers
+
+    monkeypatch.setenv("HINDSIGHT_API_EMBEDDINGS_WORKERS", "3")
+    assert HindsightConfig.from_env().embeddings_workers == 3
@@ -0,0 +1,187 @@
+"""
+Tests for the per-bank entity resolution cache.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hindsight_api.engine.entity_cache import BankEntities, CachedEntity, EntityCache
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _bank(*names: str) -> tuple[BankEntities, dict[str, uuid.UUID]]:
+    bank = BankEntities()
+    ids = {}
+    for name in names:
+        ids[name] = uuid.uuid4()
+        bank.add_entity(ids[name], name, NOW)
+    return bank, ids
+
+
+def _cache(max_entries: int = 1000) -> EntityCache:
+    cache = EntityCache(max_entries)
+    cache._listener = MagicMock()  # pretend the LISTEN connection is up
+    return cache
+
+
+def _conn(entity_rows: list[dict], cooccurrence_rows: list[dict] | None = None):
+    conn = AsyncMock()
+    conn.fetch.side_effect = [entity_rows, cooccurrence_rows or []]
+    return conn
+
+
+def _notify(cache: EntityCache, conn) -> None:
+    """Deliver the NOTIFY sent on conn, as Postgres would on commit."""
+    _, channel, payload = conn.execute.call_args.args
+    cache._on_notification(None, 1, channel, payload)
+
+
+class TestBankEntities:
+    def test_candidates_match_equal_containing_and_contained_names(self):
+        bank, _ = _bank("Alice", "Alice Johnson", "Bob", "Google", "Mallory")
+
+        found = {e.canonical_name for e in bank.candidates(["alice", "Dr. Bob Smith", "ur"])}
+
+        assert found == {"Alice", "Alice Johnson", "Bob"}
+
+    def test_cooccurring_names(self):
+        bank, ids = _bank("Alice", "Bob", "Google")
+        bank.add_cooccurrence(ids["Alice"], ids["Google"])
+
+        assert bank.cooccurring_names(ids["Alice"]) == {"google"}
+        assert bank.cooccurring_names(ids["Google"]) == {"alice"}
+        assert bank.cooccurring_names(ids["Bob"]) == set()
+
+    def test_size_counts_entities_and_pairs_once(self):
+        bank, ids = _bank("Alice", "Bob")
+        bank.add_entity(ids["Alice"], "Alice", NOW)
+        bank.add_cooccurrence(ids["Alice"], ids["Bob"])
+        bank.add_cooccurrence(ids["Bob"], ids["Alice"])
+
+        assert bank.size == 3
+
+
+class TestEntityCache:
+    @pytest.mark.asyncio
+    async def test_loads_once_then_serves_from_memory(self):
+        cache = _cache()
+        alice = uuid.uuid4()
+        conn = _conn([{"id": alice, "canonical_name": "Alice", "last_seen": NOW}])
+
+        first = await cache.get_or_load(conn, "bank")
+        second = await cache.get_or_load(conn, "bank")
+
+        assert first is second
+        assert [e.id for e in first.candidates(["alice"])] == [alice]
+        assert conn.fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bank_larger_than_budget_is_not_cached(self):
+        cache = _cache(max_entries=1)
+        rows = [{"id": uuid.uuid4(), "canonical_name": n, "last_seen": NOW} for n in ("Alice", "Bob")]
+
+        assert await cache.get_or_load(_conn(rows), "bank") is None
+        conn = AsyncMock()
+        assert await cache.get_or_load(conn, "bank") is None
+        conn.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_listener(self):
+        cache = EntityCache(1000)
+        conn = AsyncMock()
+
+        assert await cache.get_or_load(conn, "bank") is None
+        conn.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_published_changes_apply_on_commit(self):
+        cache = _cache()
+        bank = await cache.get_or_load(_conn([]), "bank")
+        conn = AsyncMock()
+        alice, bob = uuid.uuid4(), uuid.uuid4()
+
+        await cache.publish(conn, "bank", entities=[CachedEntity(alice, "Alice", NOW), CachedEntity(bob, "Bob", NOW)])
+        assert bank.candidates(["alice"]) == []  # not committed yet
+        _notify(cache, conn)
+        await cache.publish(conn, "bank", cooccurrences=[(alice, bob)])
+        _notify(cache, conn)
+
+        assert [e.id for e in bank.candidates(["alice"])] == [alice]
+        assert bank.cooccurring_names(alice) == {"bob"}
+
+    @pytest.mark.asyncio
+    async def test_oversized_changes_apply_locally_and_invalidate_elsewhere(self):
+        writer, other = _cache(), _cache()
+        writer_bank = await writer.get_or_load(_conn([]), "bank")
+        await other.get_or_load(_conn([]), "bank")
+        entities = [CachedEntity(uuid.uuid4(), f"Entity number {i}", NOW) for i in range(200)]
+        conn = AsyncMock()
+
+        await writer.publish(conn, "bank", entities=entities)
+        payload = json.loads(conn.execute.call_args.args[2])
+        _notify(writer, conn)
+        _notify(other, conn)
+
+        assert "entities" not in payload
+        assert entities[199].id in {e.id for e in writer_bank.candidates(["entity number 199"])}
+        assert ("public", "bank") not in other._banks
+
+    @pytest.mark.asyncio
+    async def test_delete_notification_drops_bank(self):
+        cache = _cache()
+        await cache.get_or_load(_conn([]), "bank")
+
+        cache._on_notification(None, 1, "ch", json.dumps({"schema": "public", "bank_id": "bank"}))
+
+        assert ("public", "bank") not in cache._banks
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_respects_budget(self):
+        cache = _cache(max_entries=2)
+        for bank_id in ("a", "b", "c"):
+            row = {"id": uuid.uuid4(), "canonical_name": bank_id, "last_seen": NOW}
+            await cache.get_or_load(_conn([row]), bank_id)
+
+        assert [key[1] for key in cache._banks] == ["b", "c"]
+
+
+class TestDatabaseFallback:
+    @pytest.mark.asyncio
+    async def test_resolution_without_cache_queries_candidates(self):
+        from hindsight_api.engine.entity_resolver import EntityResolver
+
+        alice = uuid.uuid4()
+        conn = AsyncMock()
+        conn.fetch.side_effect = [
+            [{"id": alice, "canonical_name": "Alice", "metadata": None, "last_seen": NOW, "mention_count": 3}],
+            [],  # co-occurrences
+        ]
+        # A disabled cache (no LISTEN connection) resolves through the database
+        resolver = EntityResolver(pool=MagicMock(), cache=EntityCache(0))
+
+        ids = await resolver.resolve_entities_batch(
+            "bank", [{"text": "Alice", "nearby_entities": []}], context="", unit_event_date=NOW, conn=conn
+        )
+
+        assert ids == [alice]
+        # Mention texts are LIKE-escaped for the containment probe
+        _, bank_id, substrings, patterns = conn.fetch.call_args_list[0].args
+        assert bank_id == "bank" and "alice" in substrings
+        assert patterns == ["%alice%"]
+        conn.executemany.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_like_wildcards_in_mentions_are_escaped(self):
+        from hindsight_api.engine.entity_resolver import fetch_entity_candidates
+
+        conn = AsyncMock()
+        conn.fetch.return_value = []
+
+        await fetch_entity_candidates(conn, "bank", ["100%_sure"])
+
+        assert conn.fetch.call_args.args[3] == ["%100\\%\\_sure%"]
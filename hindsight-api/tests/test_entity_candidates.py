@@ -0,0 +1,44 @@
+"""
+Tests for the index-backed entity candidate lookup used by batch entity resolution.
+"""
+
+import uuid
+
+import asyncpg
+import pytest
+
+from hindsight_api.engine.entity_resolver import fetch_entity_candidates
+from hindsight_api.engine.memory_engine import fq_table
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_limited_to_matching_names(pg0_db_url):
+    bank_id = f"test-entity-candidates-{uuid.uuid4().hex[:8]}"
+    names = ["Alice", "Alice Johnson", "Bob", "Google", "Mallory", "100%_Pure"]
+
+    conn = await asyncpg.connect(pg0_db_url)
+    try:
+        await conn.execute(
+            f"""INSERT INTO {fq_table("entities")} (bank_id, canonical_name, first_seen, last_seen, mention_count)
+                SELECT $1, name, NOW(), NOW(), 1 FROM unnest($2::text[]) AS t(name)""",
+            bank_id,
+            names,
+        )
+
+        rows = await fetch_entity_candidates(conn, bank_id, ["alice", "Dr. Bob Smith", "ur"])
+        found = {row["canonical_name"] for row in rows}
+
+        # "alice" is contained in two names, "bob" is contained in the mention,
+        # and the two-letter mention "ur" is too short for a trigram probe
+        assert found == {"Alice", "Alice Johnson", "Bob"}
+
+        # LIKE wildcards in a mention are matched literally
+        rows = await fetch_entity_candidates(conn, bank_id, ["0%_pu"])
+        assert {row["canonical_name"] for row in rows} == {"100%_Pure"}
+        rows = await fetch_entity_candidates(conn, bank_id, ["l_ce"])
+        assert rows == []
+
+        assert await fetch_entity_candidates(conn, bank_id, []) == []
+    finally:
+        await conn.execute(f"DELETE FROM {fq_table('entities')} WHERE bank_id = $1", bank_id)
+        await conn.close()
@@ -0,0 +1,106 @@
+"""
+Tests for incremental document re-ingestion (update_mode="incremental").
+"""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.engine.response_models import TokenUsage
+from hindsight_api.engine.retain.chunk_storage import store_chunks_batch
+from hindsight_api.engine.retain.fact_extraction import Fact
+from hindsight_api.engine.retain.incremental import IncrementalPlan
+from hindsight_api.engine.retain.types import ChunkMetadata
+
+PARAGRAPHS = [
+    "Alice maintains the billing service and reviews every change to invoicing.",
+    "The office moved to a new building next to the central train station.",
+    "Carol adopted a rescue dog named Biscuit last spring.",
+]
+
+
+def _items(paragraphs: list[str], document_id: str) -> list[dict]:
+    return [{"content": text, "document_id": document_id} for text in paragraphs]
+
+
+async def _unit_texts(memory, bank_id: str, document_id: str) -> set[str]:
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            f"SELECT text FROM {fq_table('memory_units')} WHERE bank_id = $1 AND document_id = $2",
+            bank_id,
+            document_id,
+        )
+    return {row["text"] for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_incremental_retain_reprocesses_only_changed_chunks(memory, request_context):
+    bank_id = f"test-incremental-{uuid.uuid4().hex[:8]}"
+    document_id = "wiki-page"
+    extracted_chunks = []
+
+    async def extract(chunk, **kwargs):
+        extracted_chunks.append(chunk)
+        return [Fact(fact=chunk, fact_type="world")], TokenUsage()
+
+    try:
+        with patch("hindsight_api.engine.retain.fact_extraction._extract_facts_with_auto_split", side_effect=extract):
+            await memory.retain_batch_async(bank_id, _items(PARAGRAPHS, document_id), request_context=request_context)
+            assert len(extracted_chunks) == 3
+
+            # Unchanged document: nothing to do
+            extracted_chunks.clear()
+            result = await memory.retain_batch_async(
+                bank_id,
+                _items(PARAGRAPHS, document_id),
+                request_context=request_context,
+                update_mode="incremental",
+            )
+            assert extracted_chunks == []
+            assert result == [[], [], []]
+
+            # One paragraph changed: only it is extracted, and the old one's facts are gone
+            changed = "The office is now in a converted warehouse by the river."
+            extracted_chunks.clear()
+            result = await memory.retain_batch_async(
+                bank_id,
+                _items([PARAGRAPHS[0], changed, PARAGRAPHS[2]], document_id),
+                request_context=request_context,
+                update_mode="incremental",
+            )
+            assert extracted_chunks == [changed]
+            assert [len(unit_ids) for unit_ids in result] == [0, 1, 0]
+
+        texts = await _unit_texts(memory, bank_id, document_id)
+        assert any(changed in text for text in texts)
+        assert not any(PARAGRAPHS[1] in text for text in texts)
+        assert any(PARAGRAPHS[0] in text for text in texts)
+        assert any(PARAGRAPHS[2] in text for text in texts)
+    finally:
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {fq_table('documents')} WHERE bank_id = $1", bank_id)
+            await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+
+
+def test_expand_results_maps_back_to_all_contents():
+    plan = IncrementalPlan(content_indices=[1, 3])
+
+    assert plan.expand_results([["a"], ["b", "c"]], 4) == [[], ["a"], [], ["b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_new_chunks_do_not_reuse_kept_chunk_ids():
+    conn = AsyncMock()
+    conn.fetchval.return_value = 1
+    # The chunk stored at index 0 moved to index 1; a new chunk now sits at index 0
+    chunks = [ChunkMetadata("new", 1, 0, 0), ChunkMetadata("kept", 0, 0, 1)]
+
+    chunk_ids = await store_chunks_batch(conn, "bank", "doc", chunks, kept_chunk_ids={1: "bank_doc_0"})
+
+    assert chunk_ids == {0: "bank_doc_0_1", 1: "bank_doc_0"}
+    inserted_ids = conn.execute.call_args.args[1]
+    assert inserted_ids == ["bank_doc_0_1"]
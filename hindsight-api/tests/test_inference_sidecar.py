@@ -0,0 +1,107 @@
+"""
+Tests for the local inference sidecar (hindsight-inference).
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from hindsight_api.engine.cross_encoder import RemoteTEICrossEncoder, create_cross_encoder_from_env
+from hindsight_api.engine.embeddings import RemoteTEIEmbeddings, create_embeddings_from_env
+from hindsight_api.inference import InferenceService, create_inference_app
+
+
+class FakeEmbeddings:
+    """Stands in for LocalSTEmbeddings and records every encode() call."""
+
+    model_name = "fake-embedder"
+    dimension = 2
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FakeCrossEncoder:
+    """Stands in for LocalSTCrossEncoder and records every score() call."""
+
+    model_name = "fake-reranker"
+
+    def __init__(self):
+        self.calls: list[list[tuple[str, str]]] = []
+
+    async def initialize(self) -> None:
+        pass
+
+    def score(self, pairs: list[tuple[str, str]]) -> list[float]:
+        self.calls.append(list(pairs))
+        return [float(len(document)) for _, document in pairs]
+
+
+def _client(service: InferenceService) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=create_inference_app(service))
+    return httpx.AsyncClient(transport=transport, base_url="http://localhost")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_embed_requests_share_one_batch():
+    embeddings = FakeEmbeddings()
+    service = InferenceService(embeddings, None, window_ms=20)
+
+    async with _client(service) as client:
+        info = (await client.get("/embeddings/info")).json()
+        responses = await asyncio.gather(
+            client.post("/embeddings/embed", json={"inputs": ["a", "bb"]}),
+            client.post("/embeddings/embed", json={"inputs": "ccc"}),
+        )
+
+    assert info == {"model_id": "fake-embedder", "dimension": 2}
+    assert responses[0].json() == [[1.0, 1.0], [2.0, 1.0]]
+    assert responses[1].json() == [[3.0, 1.0]]
+    assert len(embeddings.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_tei_reranker_client_talks_to_the_sidecar():
+    cross_encoder = FakeCrossEncoder()
+    service = InferenceService(None, cross_encoder, window_ms=20)
+    client = RemoteTEICrossEncoder(base_url="http://localhost/reranker")
+    client._async_client = _client(service)
+
+    scores = await client.predict([("q", "aaa"), ("q", "b"), ("other", "cc")])
+
+    assert scores == [3.0, 1.0, 2.0]
+    # Both query groups were scored in one cross-encoder call
+    assert len(cross_encoder.calls) == 1
+    await client._async_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_missing_model_returns_404():
+    service = InferenceService(FakeEmbeddings(), None)
+
+    async with _client(service) as client:
+        response = await client.post("/reranker/rerank", json={"query": "q", "texts": ["a"]})
+
+    assert response.status_code == 404
+
+
+def test_sidecar_provider_uses_the_socket(monkeypatch):
+    monkeypatch.setenv("HINDSIGHT_API_EMBEDDINGS_PROVIDER", "sidecar")
+    monkeypatch.setenv("HINDSIGHT_API_RERANKER_PROVIDER", "sidecar")
+    monkeypatch.setenv("HINDSIGHT_API_INFERENCE_SOCKET", "/run/hindsight/inference.sock")
+
+    embeddings = create_embeddings_from_env()
+    cross_encoder = create_cross_encoder_from_env()
+
+    assert isinstance(embeddings, RemoteTEIEmbeddings)
+    assert embeddings.socket_path == "/run/hindsight/inference.sock"
+    assert isinstance(cross_encoder, RemoteTEICrossEncoder)
+    assert cross_encoder.socket_path == "/run/hindsight/inference.sock"
@@ -1,11 +1,16 @@
-"""Tests for link_utils datetime handling and temporal link computation."""
+"""Tests for link_utils datetime handling, temporal link computation and semantic linking."""
+import uuid
+
+import asyncpg
 import pytest
 from datetime import datetime, timezone, timedelta
 
+from hindsight_api.engine.memory_engine import fq_table
 from hindsight_api.engine.retain.link_utils import (
     _normalize_datetime,
     compute_temporal_links,
     compute_temporal_query_bounds,
+    create_semantic_links_batch,
 )
 
 
@@ -254,3 +259,57 @@ class TestComputeTemporalLinks:
 
         assert len(links) == 1
         assert links[0][3] >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_semantic_links_use_nearest_units_in_same_bank(pg0_db_url, embeddings):
+    """New units link to their nearest existing units in the bank (never other banks) and to each other."""
+    bank_id = f"test-semlinks-{uuid.uuid4().hex[:8]}"
+    other_bank_id = f"{bank_id}-other"
+
+    def vec(e):
+        return "[" + ",".join(str(x) for x in e) + "]"
+
+    async def insert(conn, bank, text, emb):
+        return str(
+            await conn.fetchval(
+                f"""INSERT INTO {fq_table("memory_units")} (bank_id, text, fact_type, embedding, event_date)
+                    VALUES ($1, $2, 'world', $3::vector, NOW()) RETURNING id""",
+                bank,
+                text,
+                vec(emb),
+            )
+        )
+
+    existing_texts = ["Alice loves hiking in the mountains.", "The stock market fell sharply today."]
+    new_texts = ["Alice enjoys mountain hikes.", "Alice goes hiking every weekend in the mountains."]
+    existing_embs = embeddings.encode(existing_texts)
+    new_embs = embeddings.encode(new_texts)
+
+    conn = await asyncpg.connect(pg0_db_url)
+    try:
+        existing_ids = [await insert(conn, bank_id, t, e) for t, e in zip(existing_texts, existing_embs)]
+        # Identical text in another bank must never be linked
+        other_id = await insert(conn, other_bank_id, existing_texts[0], existing_embs[0])
+        new_ids = [await insert(conn, bank_id, t, e) for t, e in zip(new_texts, new_embs)]
+
+        async with conn.transaction():
+            count = await create_semantic_links_batch(conn, bank_id, new_ids, new_embs, top_k=5, threshold=0.7)
+
+        links = await conn.fetch(
+            f"""SELECT from_unit_id::text AS f, to_unit_id::text AS t FROM {fq_table("memory_links")}
+                WHERE link_type = 'semantic' AND from_unit_id = ANY($1::uuid[])""",
+            new_ids,
+        )
+        targets = {(r["f"], r["t"]) for r in links}
+
+        assert count == len(links)
+        assert (new_ids[0], existing_ids[0]) in targets
+        assert (new_ids[0], new_ids[1]) in targets
+        assert all(t != other_id for _, t in targets)
+        assert all(t != existing_ids[1] for _, t in targets)
+    finally:
+        await conn.execute(
+            f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = ANY($1::text[])", [bank_id, other_bank_id]
+        )
+        await conn.close()
@@ -0,0 +1,148 @@
+"""
+Tests for the priority-aware LLM request scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from hindsight_api.engine.llm_scheduler import (
+    LLMQueueTimeoutError,
+    LLMScheduler,
+    estimate_prompt_tokens,
+    parse_provider_limits,
+    parse_queue_timeouts,
+    priority_class,
+)
+
+
+async def _queue(scheduler: LLMScheduler, scope: str, order: list[str], tokens: int = 0):
+    async with scheduler.slot(scope, tokens):
+        order.append(scope)
+
+
+def test_priority_classes_follow_scopes():
+    assert priority_class("reflect_agent") == "interactive"
+    assert priority_class("memory_think") == "interactive"
+    assert priority_class("memory_extract_facts") == "ingest"
+    assert priority_class("mm_reflect_seed") == "background"
+    assert priority_class("mental_model_mission_filter") == "background"
+    assert priority_class("memory") == "default"
+
+
+def test_parse_limits():
+    assert parse_provider_limits("ollama=1, Groq=64:300000") == {"ollama": (1, 0), "groq": (64, 300000)}
+    assert parse_queue_timeouts("interactive=30,background=0") == {"interactive": 30.0, "background": 0.0}
+    assert parse_provider_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_provider_limits("ollama=0")
+    with pytest.raises(ValueError):
+        parse_queue_timeouts("urgent=5")
+
+
+def test_prompt_tokens_are_estimated_from_contents():
+    messages = [{"role": "system", "content": "x" * 400}, {"role": "user", "content": [{"text": "y" * 400}]}]
+    assert estimate_prompt_tokens(messages) == 201
+
+
+async def test_interactive_requests_are_admitted_first():
+    scheduler = LLMScheduler("test", max_concurrent=1)
+    order: list[str] = []
+
+    blocker = await scheduler.acquire("memory_extract_facts")
+    tasks = [
+        asyncio.create_task(_queue(scheduler, scope, order)) for scope in ("mm_reflect_seed", "memory_extract_facts")
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_queue(scheduler, "reflect_agent", order)))
+    await asyncio.sleep(0)
+    assert scheduler.queued == 3
+
+    scheduler._release()
+    assert blocker == 0.0
+    await asyncio.gather(*tasks)
+
+    assert order == ["reflect_agent", "memory_extract_facts", "mm_reflect_seed"]
+    assert scheduler.in_flight == 0
+
+
+async def test_aging_lets_background_requests_through():
+    scheduler = LLMScheduler("test", max_concurrent=1, aging_seconds=0.01)
+    order: list[str] = []
+
+    await scheduler.acquire("memory_extract_facts")
+    background = asyncio.create_task(_queue(scheduler, "mm_reflect_seed", order))
+    await asyncio.sleep(0.05)
+    ingest = asyncio.create_task(_queue(scheduler, "memory_extract_facts", order))
+    await asyncio.sleep(0)
+
+    scheduler._release()
+    await asyncio.gather(background, ingest)
+
+    assert order == ["mm_reflect_seed", "memory_extract_facts"]
+
+
+async def test_aged_backlog_never_outranks_interactive():
+    scheduler = LLMScheduler("test", max_concurrent=1, aging_seconds=0.01)
+    order: list[str] = []
+
+    await scheduler.acquire("memory_extract_facts")
+    backlog = [
+        asyncio.create_task(_queue(scheduler, scope, order))
+        for scope in ("memory", "memory_extract_facts", "mm_reflect_seed")
+    ]
+    # Waited many aging intervals, but aging moves a request one class at most
+    await asyncio.sleep(0.1)
+    interactive = asyncio.create_task(_queue(scheduler, "reflect_agent", order))
+    await asyncio.sleep(0)
+
+    scheduler._release()
+    await asyncio.gather(*backlog, interactive)
+
+    assert order == ["reflect_agent", "memory", "memory_extract_facts", "mm_reflect_seed"]
+
+
+async def test_token_budget_delays_admission():
+    # 6000 tokens/min = 100 tokens/s
+    scheduler = LLMScheduler("test", max_concurrent=10, tokens_per_minute=6000)
+    order: list[str] = []
+
+    await _queue(scheduler, "memory_extract_facts", order, tokens=6000)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await _queue(scheduler, "memory_extract_facts", order, tokens=10)
+
+    assert loop.time() - start >= 0.05
+    assert scheduler.in_flight == 0
+
+
+async def test_queue_timeout_rejects_request():
+    scheduler = LLMScheduler("test", max_concurrent=1, queue_timeouts={"background": 0.05})
+
+    await scheduler.acquire("reflect_agent")
+    with pytest.raises(LLMQueueTimeoutError):
+        await scheduler.acquire("mm_reflect_seed")
+    assert scheduler.queued == 0
+
+    # A per-call timeout overrides the class default
+    with pytest.raises(LLMQueueTimeoutError):
+        await scheduler.acquire("reflect_agent", queue_timeout=0.01)
+
+    scheduler._release()
+    assert scheduler.in_flight == 0
+
+
+async def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = LLMScheduler("test", max_concurrent=1)
+
+    await scheduler.acquire("memory")
+    waiter = asyncio.create_task(scheduler.acquire("memory"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler._release()
+    assert scheduler.in_flight == 0
+    assert scheduler.queued == 0
+    assert await scheduler.acquire("memory") == 0.0
@@ -0,0 +1,112 @@
+"""
+Tests for the ONNX Runtime backend of the local embedding and reranker providers.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from hindsight_api.engine.cross_encoder import LocalSTCrossEncoder, create_cross_encoder_from_env
+from hindsight_api.engine.embeddings import LocalSTEmbeddings, create_embeddings_from_env
+from hindsight_api.engine.local_onnx import _export, _onnx_file_name, artifact_dir
+
+PAIRS = [
+    ("Where does Alice work?", "Alice works at Google as a software engineer."),
+    ("Where does Alice work?", "Bob prefers tea over coffee."),
+    ("Where does Alice work?", "Alice joined the Mountain View office of Google in 2021."),
+    ("Where does Alice work?", "The weather was sunny all week."),
+]
+
+
+def test_factories_select_the_onnx_backend(monkeypatch, tmp_path):
+    monkeypatch.setenv("HINDSIGHT_API_EMBEDDINGS_PROVIDER", "local")
+    monkeypatch.setenv("HINDSIGHT_API_EMBEDDINGS_LOCAL_BACKEND", "onnx")
+    monkeypatch.setenv("HINDSIGHT_API_RERANKER_PROVIDER", "local")
+    monkeypatch.setenv("HINDSIGHT_API_RERANKER_LOCAL_BACKEND", "ONNX-INT8")
+    monkeypatch.setenv("HINDSIGHT_API_LOCAL_ONNX_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("HINDSIGHT_API_LOCAL_ONNX_THREADS", "2")
+
+    embeddings = create_embeddings_from_env()
+    cross_encoder = create_cross_encoder_from_env()
+
+    assert isinstance(embeddings, LocalSTEmbeddings)
+    assert (embeddings.backend, embeddings.onnx_cache_dir, embeddings.onnx_threads) == ("onnx", str(tmp_path), 2)
+    assert isinstance(cross_encoder, LocalSTCrossEncoder)
+    assert cross_encoder.backend == "onnx-int8"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown local inference backend"):
+        LocalSTCrossEncoder(backend="tensorrt")
+
+
+def test_artifact_dir_is_per_model_and_backend(tmp_path):
+    path = artifact_dir(str(tmp_path), "cross-encoder/ms-marco-MiniLM-L-6-v2", "onnx-int8")
+
+    assert path == tmp_path / "cross-encoder--ms-marco-MiniLM-L-6-v2" / "onnx-int8"
+    assert artifact_dir(str(tmp_path), "cross-encoder/ms-marco-MiniLM-L-6-v2", "onnx") != path
+
+
+def test_int8_export_writes_the_file_that_is_loaded(monkeypatch, tmp_path):
+    def export_dynamic_quantized_onnx_model(model, quantization_config, model_name_or_path, file_suffix):
+        # Where sentence-transformers saves the quantized model
+        path = Path(model_name_or_path) / "onnx" / f"model_{file_suffix}.onnx"
+        path.parent.mkdir(parents=True)
+        path.touch()
+
+    monkeypatch.setitem(
+        sys.modules,
+        "sentence_transformers",
+        SimpleNamespace(export_dynamic_quantized_onnx_model=export_dynamic_quantized_onnx_model),
+    )
+    target = tmp_path / "model" / "onnx-int8"
+
+    _export(MagicMock(), "model", "onnx-int8", target)
+
+    assert (target / _onnx_file_name("onnx-int8")).exists()
+
+
+@pytest.mark.asyncio
+async def test_onnx_reranker_scores_match_torch(tmp_path):
+    pytest.importorskip("optimum.onnxruntime")
+
+    torch_encoder = LocalSTCrossEncoder()
+    await torch_encoder.initialize()
+    expected = await torch_encoder.predict(PAIRS)
+
+    onnx_encoder = LocalSTCrossEncoder(backend="onnx", onnx_cache_dir=str(tmp_path))
+    await onnx_encoder.initialize()
+    assert (tmp_path / "cross-encoder--ms-marco-MiniLM-L-6-v2" / "onnx" / "onnx" / "model.onnx").exists()
+    assert await onnx_encoder.predict(PAIRS) == pytest.approx(expected, abs=1e-3)
+
+    # The cached artifact is reused on the next startup
+    reloaded = LocalSTCrossEncoder(backend="onnx", onnx_cache_dir=str(tmp_path))
+    await reloaded.initialize()
+    assert await reloaded.predict(PAIRS) == pytest.approx(expected, abs=1e-3)
+
+    # int8 shifts scores slightly but keeps the ranking
+    int8_encoder = LocalSTCrossEncoder(backend="onnx-int8", onnx_cache_dir=str(tmp_path))
+    await int8_encoder.initialize()
+    quantized = await int8_encoder.predict(PAIRS)
+    assert (
+        sorted(range(len(PAIRS)), key=lambda i: -quantized[i])[:2]
+        == sorted(range(len(PAIRS)), key=lambda i: -expected[i])[:2]
+    )
+
+
+@pytest.mark.asyncio
+async def test_onnx_embeddings_match_torch(tmp_path):
+    pytest.importorskip("optimum.onnxruntime")
+    texts = [document for _, document in PAIRS]
+
+    torch_embeddings = LocalSTEmbeddings()
+    await torch_embeddings.initialize()
+    onnx_embeddings = LocalSTEmbeddings(backend="onnx", onnx_cache_dir=str(tmp_path))
+    await onnx_embeddings.initialize()
+
+    assert onnx_embeddings.dimension == torch_embeddings.dimension
+    for expected, actual in zip(torch_embeddings.encode(texts), onnx_embeddings.encode(texts)):
+        assert actual == pytest.approx(expected, abs=1e-3)
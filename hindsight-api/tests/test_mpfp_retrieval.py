@@ -13,6 +13,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
+from hindsight_api.engine.search.edge_cache import SharedEdgeCache
 from hindsight_api.engine.search.mpfp_retrieval import (
     EdgeCache,
     EdgeTarget,
@@ -129,6 +130,99 @@ class TestEdgeCache:
         assert temporal_neighbors[0].node_id == "node-3"
 
 
+def _shared_cache(max_edges: int = 1000) -> SharedEdgeCache:
+    cache = SharedEdgeCache(max_edges)
+    cache._listener = MagicMock()  # pretend the LISTEN connection is up
+    return cache
+
+
+class TestSharedEdgeCache:
+    """Tests for the process-wide adjacency cache behind EdgeCache."""
+
+    @pytest.mark.asyncio
+    async def test_second_recall_serves_nodes_from_shared_cache(self):
+        """Nodes loaded by one recall should not be queried again by the next."""
+        shared = _shared_cache()
+        edges = {"semantic": {"node-1": [EdgeTarget("node-2", 0.9)]}}
+
+        with patch(
+            "hindsight_api.engine.search.mpfp_retrieval.load_all_edges_for_frontier",
+            new_callable=AsyncMock,
+            return_value=edges,
+        ) as load:
+            first = EdgeCache(shared=shared, bank_id="bank")
+            await first.load(MagicMock(), ["node-1"], 20)
+            second = EdgeCache(shared=shared, bank_id="bank")
+            await second.load(MagicMock(), ["node-1"], 20)
+
+        assert load.await_count == 1
+        assert (first.db_queries, first.shared_hits) == (1, 0)
+        assert (second.db_queries, second.shared_hits) == (0, 1)
+        assert second.get_neighbors("semantic", "node-1")[0].node_id == "node-2"
+
+    @pytest.mark.asyncio
+    async def test_only_cold_nodes_are_queried(self):
+        """A frontier mixing cached and cold nodes should query just the cold ones."""
+        shared = _shared_cache()
+        token = (await shared.lookup("bank", ["node-1"], 20))[2]
+        shared.store("bank", {}, ["node-1"], 20, token)
+
+        with patch(
+            "hindsight_api.engine.search.mpfp_retrieval.load_all_edges_for_frontier",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as load:
+            cache = EdgeCache(shared=shared, bank_id="bank")
+            await cache.load(MagicMock(), ["node-1", "node-2"], 20)
+
+        assert load.await_args.args[1] == ["node-2"]
+        assert cache.is_fully_loaded("node-1") and cache.is_fully_loaded("node-2")
+
+    @pytest.mark.asyncio
+    async def test_link_notification_drops_bank(self):
+        """A link change notification should drop only that bank's nodes."""
+        shared = _shared_cache()
+        for bank_id in ("bank-a", "bank-b"):
+            token = (await shared.lookup(bank_id, ["node-1"], 20))[2]
+            shared.store(bank_id, {}, ["node-1"], 20, token)
+
+        shared._on_notification(None, 1, "ch", '{"schema": "public", "bank_id": "bank-a"}')
+
+        assert (await shared.lookup("bank-a", ["node-1"], 20))[1] == []
+        assert (await shared.lookup("bank-b", ["node-1"], 20))[1] == ["node-1"]
+
+    @pytest.mark.asyncio
+    async def test_load_racing_with_invalidation_is_not_stored(self):
+        """Edges loaded before a link change committed must not be cached."""
+        shared = _shared_cache()
+        token = (await shared.lookup("bank", ["node-1"], 20))[2]
+        shared.invalidate("bank", "public")
+        shared.store("bank", {}, ["node-1"], 20, token)
+
+        assert (await shared.lookup("bank", ["node-1"], 20))[1] == []
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_edge_count(self):
+        """The least recently used nodes should be evicted once the edge budget is exceeded."""
+        shared = _shared_cache(max_edges=2)
+        edges = {"semantic": {n: [EdgeTarget("x", 1.0)] for n in ("n1", "n2", "n3")}}
+        for node_id in ("n1", "n2", "n3"):
+            token = (await shared.lookup("bank", [node_id], 20))[2]
+            shared.store("bank", edges, [node_id], 20, token)
+
+        assert (await shared.lookup("bank", ["n1", "n2", "n3"], 20))[1] == ["n2", "n3"]
+
+    @pytest.mark.asyncio
+    async def test_entries_loaded_with_smaller_top_k_are_not_served(self):
+        """Entries cached with fewer edges per type than requested should be reloaded."""
+        shared = _shared_cache()
+        token = (await shared.lookup("bank", ["node-1"], 5))[2]
+        shared.store("bank", {}, ["node-1"], 5, token)
+
+        assert (await shared.lookup("bank", ["node-1"], 20))[1] == []
+        assert (await shared.lookup("bank", ["node-1"], 3))[1] == ["node-1"]
+
+
 class TestRRFFusion:
     """Tests for RRF (Reciprocal Rank Fusion)."""
 
@@ -200,6 +200,29 @@ class TestMockLLMProvider:
         result = asyncio.get_event_loop().run_until_complete(make_call())
         assert result == {"custom": "response"}
 
+    def test_mock_provider_calls_callable_response(self):
+        """Test that a callable mock response is computed from the messages."""
+        from hindsight_api.engine.llm_wrapper import LLMProvider
+
+        provider = LLMProvider(
+            provider="mock",
+            api_key="",
+            base_url="",
+            model="test-model",
+        )
+
+        provider.set_mock_response(lambda messages: {"echo": messages[-1]["content"]})
+
+        import asyncio
+
+        async def make_call():
+            return await provider.call(
+                messages=[{"role": "user", "content": "first"}],
+            )
+
+        result = asyncio.get_event_loop().run_until_complete(make_call())
+        assert result == {"echo": "first"}
+
     def test_mock_provider_returns_usage_when_requested(self):
         """Test that mock provider returns token usage."""
         from hindsight_api.engine.llm_wrapper import LLMProvider
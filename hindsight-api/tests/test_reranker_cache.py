@@ -0,0 +1,44 @@
+"""
+Tests for CachedCrossEncoder (cross-encoder score cache).
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hindsight_api.engine.cross_encoder import CachedCrossEncoder
+
+
+def _inner() -> MagicMock:
+    """Cross-encoder whose score for a pair is the length of its document."""
+    inner = MagicMock(model_name="test-model", provider_name="test")
+    inner.predict = AsyncMock(side_effect=lambda pairs: [float(len(document)) for _, document in pairs])
+    return inner
+
+
+@pytest.mark.asyncio
+async def test_only_uncached_pairs_reach_the_model():
+    inner = _inner()
+    cache = CachedCrossEncoder(inner)
+    await cache.predict([("who is alice?", "a")])
+
+    scores = await cache.predict([("who is alice?", "a"), ("who is alice?", "bb"), ("who is alice?", "bb")])
+
+    assert scores == [1.0, 2.0, 2.0]
+    assert [call.args[0] for call in inner.predict.await_args_list] == [
+        [("who is alice?", "a")],
+        [("who is alice?", "bb")],
+    ]
+    assert cache.get_cached("who is alice?", "bb") == 2.0
+
+
+@pytest.mark.asyncio
+async def test_query_whitespace_is_normalized():
+    inner = _inner()
+    cache = CachedCrossEncoder(inner)
+
+    await cache.predict([("who is alice?", "a")])
+    await cache.predict([("  who is\n alice? ", "a")])
+
+    assert inner.predict.await_count == 1
+    assert cache.cache_key("who is alice?", "a") != cache.cache_key("who is bob?", "a")
@@ -0,0 +1,76 @@
+"""
+Tests for ResultCache (two-tier cache behind the query embedding and reranker score caches).
+"""
+
+from unittest.mock import MagicMock, patch
+
+from hindsight_api.engine.result_cache import ResultCache
+
+
+def _cache(**kwargs) -> ResultCache[float]:
+    return ResultCache("test", serialize=repr, deserialize=float, **{"max_entries": 10, **kwargs})
+
+
+def test_lru_eviction():
+    cache = _cache(max_entries=2)
+
+    cache.put_many({"a": 1.0})
+    cache.put_many({"b": 2.0})
+    assert cache.get("a") == 1.0  # refresh "a"
+    cache.put_many({"c": 3.0})  # evicts "b"
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1.0, "c": 3.0}
+
+
+def test_ttl_expiry():
+    cache = _cache(ttl_seconds=10)
+
+    with patch("hindsight_api.engine.result_cache.time.monotonic", return_value=100.0):
+        cache.put_many({"a": 1.0})
+    with patch("hindsight_api.engine.result_cache.time.monotonic", return_value=105.0):
+        assert cache.get("a") == 1.0
+    with patch("hindsight_api.engine.result_cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+
+
+def test_shared_hits_are_cached_in_process():
+    client = MagicMock()
+    client.mget.return_value = [b"0.5", None]
+    cache = _cache(shared_url="redis://localhost:6379/0")
+    cache._shared = client
+
+    assert cache.get_shared_many(["a", "b"]) == {"a": 0.5}
+    assert cache.get("a") == 0.5
+
+    cache.put_many({"b": 2.0})
+    client.pipeline.return_value.set.assert_called_once_with("b", "2.0", ex=3600)
+
+
+def test_shared_cache_is_bypassed_after_an_error():
+    client = MagicMock()
+    client.mget.side_effect = ConnectionError("redis down")
+    cache = _cache(shared_url="redis://localhost:6379/0")
+    cache._shared = client
+
+    with patch("hindsight_api.engine.result_cache.time.monotonic", return_value=100.0):
+        assert cache.get_shared_many(["a"]) == {}
+        cache.put_many({"a": 1.0})
+        assert cache.get_shared_many(["b"]) == {}
+    # One failed lookup; the write and the next lookup skip Redis during the backoff
+    assert client.mget.call_count == 1
+    assert client.pipeline.call_count == 0
+
+    client.mget.side_effect = None
+    client.mget.return_value = [None]
+    with patch("hindsight_api.engine.result_cache.time.monotonic", return_value=200.0):
+        cache.get_shared_many(["c"])
+    assert client.mget.call_count == 2
+
+
+def test_hits_and_misses_are_recorded():
+    collector = MagicMock()
+
+    with patch("hindsight_api.metrics.get_metrics_collector", return_value=collector):
+        _cache().record(hits=1, misses=2)
+
+    collector.record_cache_access.assert_called_once_with("test", hits=1, misses=2)
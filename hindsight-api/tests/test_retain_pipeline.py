@@ -0,0 +1,101 @@
+"""
+Tests for the pipelined retain mode (HINDSIGHT_API_RETAIN_PIPELINE).
+"""
+
+import dataclasses
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from hindsight_api.config import get_config
+from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.engine.response_models import TokenUsage
+from hindsight_api.engine.retain.fact_extraction import Fact
+
+CONTENTS = [
+    "Alice maintains the billing service and reviews every change to invoicing.",
+    "The office moved to a new building next to the central train station.",
+    "Carol adopted a rescue dog named Biscuit last spring.",
+]
+
+
+async def _extract(chunk, **kwargs):
+    return [Fact(fact=chunk, fact_type="world"), Fact(fact=f"Noted: {chunk}", fact_type="world")], TokenUsage()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_retain_stores_and_links_all_facts(memory, request_context):
+    bank_id = f"test-pipeline-{uuid.uuid4().hex[:8]}"
+    config = dataclasses.replace(get_config(), retain_pipeline=True, retain_pipeline_queue_size=1)
+    try:
+        with (
+            patch("hindsight_api.engine.retain.orchestrator.get_config", return_value=config),
+            patch("hindsight_api.engine.retain.fact_extraction._extract_facts_with_auto_split", side_effect=_extract),
+        ):
+            result = await memory.retain_batch_async(
+                bank_id,
+                [{"content": text, "document_id": f"doc-{i}"} for i, text in enumerate(CONTENTS)],
+                request_context=request_context,
+            )
+
+        assert [len(unit_ids) for unit_ids in result] == [2, 2, 2]
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"SELECT id, text, document_id, chunk_id, enrichment_pending FROM {fq_table('memory_units')} "
+                f"WHERE bank_id = $1",
+                bank_id,
+            )
+        by_id = {str(row["id"]): row for row in rows}
+        for i, unit_ids in enumerate(result):
+            for unit_id in unit_ids:
+                assert CONTENTS[i] in by_id[unit_id]["text"]
+                assert by_id[unit_id]["document_id"] == f"doc-{i}"
+                assert by_id[unit_id]["chunk_id"] is not None
+        assert not any(row["enrichment_pending"] for row in rows)
+    finally:
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {fq_table('documents')} WHERE bank_id = $1", bank_id)
+            await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+async def test_pipelined_retain_discards_stored_facts_on_failure(memory, request_context):
+    bank_id = f"test-pipeline-{uuid.uuid4().hex[:8]}"
+    config = dataclasses.replace(get_config(), retain_pipeline=True, retain_pipeline_queue_size=1)
+
+    async def extract_then_fail(chunk, **kwargs):
+        if chunk == CONTENTS[-1]:
+            raise RuntimeError("LLM unavailable")
+        return await _extract(chunk)
+
+    try:
+        with (
+            patch("hindsight_api.engine.retain.orchestrator.get_config", return_value=config),
+            patch(
+                "hindsight_api.engine.retain.fact_extraction._extract_facts_with_auto_split",
+                side_effect=extract_then_fail,
+            ),
+        ):
+            with pytest.raises(RuntimeError, match="LLM unavailable"):
+                await memory.retain_batch_async(
+                    bank_id,
+                    [{"content": text, "document_id": "doc"} for text in CONTENTS],
+                    request_context=request_context,
+                )
+
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            unit_count = await conn.fetchval(
+                f"SELECT COUNT(*) FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id
+            )
+            chunk_count = await conn.fetchval(f"SELECT COUNT(*) FROM {fq_table('chunks')} WHERE bank_id = $1", bank_id)
+        assert unit_count == 0
+        assert chunk_count == 0
+    finally:
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {fq_table('documents')} WHERE bank_id = $1", bank_id)
+            await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
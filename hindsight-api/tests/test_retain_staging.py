@@ -0,0 +1,162 @@
+"""
+Tests for the staged retain commit: facts first, then entity and link enrichment.
+"""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.engine.retain import orchestrator
+
+
+async def _units(memory, bank_id: str) -> list:
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetch(
+            f"SELECT id, enrichment_pending FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id
+        )
+
+
+async def _cleanup(memory, bank_id: str) -> None:
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(f"DELETE FROM {fq_table('documents')} WHERE bank_id = $1", bank_id)
+        await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+async def test_retained_units_are_marked_enriched(memory, request_context):
+    bank_id = f"test-staging-{uuid.uuid4().hex[:8]}"
+    try:
+        result = await memory.retain_async(
+            bank_id=bank_id,
+            content="Alice moved to Berlin in 2021 and works on the payments team.",
+            request_context=request_context,
+        )
+        assert result
+
+        units = await _units(memory, bank_id)
+        assert units
+        assert not any(row["enrichment_pending"] for row in units)
+    finally:
+        await _cleanup(memory, bank_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_enrichment_discards_committed_facts(memory, request_context):
+    bank_id = f"test-staging-{uuid.uuid4().hex[:8]}"
+    document_id = "notes"
+    content = "Bob adopted a cat named Miso. Miso sleeps on the office printer."
+    try:
+        with patch(
+            "hindsight_api.engine.retain.link_creation.create_semantic_links_batch",
+            side_effect=RuntimeError("link creation failed"),
+        ):
+            with pytest.raises(RuntimeError, match="link creation failed"):
+                await memory.retain_async(
+                    bank_id=bank_id, content=content, document_id=document_id, request_context=request_context
+                )
+
+        assert await _units(memory, bank_id) == []
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            chunk_count = await conn.fetchval(f"SELECT COUNT(*) FROM {fq_table('chunks')} WHERE bank_id = $1", bank_id)
+            doc_hash = await conn.fetchval(
+                f"SELECT content_hash FROM {fq_table('documents')} WHERE bank_id = $1 AND id = $2",
+                bank_id,
+                document_id,
+            )
+        assert chunk_count == 0
+        assert doc_hash is None
+
+        # Retrying the same content runs the whole pipeline again
+        await memory.retain_batch_async(
+            bank_id,
+            [{"content": content, "document_id": document_id}],
+            request_context=request_context,
+            update_mode="incremental",
+        )
+        units = await _units(memory, bank_id)
+        assert units
+        assert not any(row["enrichment_pending"] for row in units)
+    finally:
+        await _cleanup(memory, bank_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_enrichment_keeps_replaced_memories(memory, request_context):
+    bank_id = f"test-staging-{uuid.uuid4().hex[:8]}"
+    document_id = "notes"
+    try:
+        await memory.retain_async(
+            bank_id=bank_id,
+            content="Carol runs the Tuesday book club at the library.",
+            document_id=document_id,
+            request_context=request_context,
+        )
+        original_ids = {row["id"] for row in await _units(memory, bank_id)}
+        assert original_ids
+
+        with patch(
+            "hindsight_api.engine.retain.link_creation.create_semantic_links_batch",
+            side_effect=RuntimeError("link creation failed"),
+        ):
+            with pytest.raises(RuntimeError, match="link creation failed"):
+                await memory.retain_async(
+                    bank_id=bank_id,
+                    content="Carol moved the book club to Thursdays at the community center.",
+                    document_id=document_id,
+                    request_context=request_context,
+                )
+
+        # The replacement rolled back, so the document still has its original memories
+        units = await _units(memory, bank_id)
+        assert {row["id"] for row in units} == original_ids
+        assert not any(row["enrichment_pending"] for row in units)
+    finally:
+        await _cleanup(memory, bank_id)
+
+
+@pytest.mark.asyncio
+async def test_pending_enrichment_of_dead_retain_is_resumed(memory, request_context):
+    bank_id = f"test-staging-{uuid.uuid4().hex[:8]}"
+    try:
+        await memory.retain_async(
+            bank_id=bank_id,
+            content="Dana maintains the billing service and mentors new engineers.",
+            request_context=request_context,
+        )
+        unit_ids = [row["id"] for row in await _units(memory, bank_id)]
+        assert unit_ids
+
+        # Simulate a retain that died after committing its facts
+        pool = await memory._get_pool()
+        state = '{"retain": "dead", "entities": [{"text": "Dana", "type": "PERSON"}]}'
+        async with pool.acquire() as conn:
+            await conn.execute(f"DELETE FROM {fq_table('unit_entities')} WHERE unit_id = ANY($1::uuid[])", unit_ids)
+            await conn.execute(
+                f"UPDATE {fq_table('memory_units')} SET enrichment_pending = TRUE, enrichment_state = $2::jsonb "
+                "WHERE id = ANY($1::uuid[])",
+                unit_ids,
+                state,
+            )
+
+        # Not resumed while the retain's lock is held
+        async with pool.acquire() as lock_conn:
+            await lock_conn.execute("SELECT pg_advisory_lock($1)", orchestrator._retain_lock_id("dead"))
+            await orchestrator.resume_pending_enrichment(pool, memory.entity_resolver)
+            assert all(row["enrichment_pending"] for row in await _units(memory, bank_id))
+            await lock_conn.execute("SELECT pg_advisory_unlock($1)", orchestrator._retain_lock_id("dead"))
+
+        assert await orchestrator.resume_pending_enrichment(pool, memory.entity_resolver, batch_size=1) >= len(unit_ids)
+        assert not any(row["enrichment_pending"] for row in await _units(memory, bank_id))
+        async with pool.acquire() as conn:
+            linked = await conn.fetchval(
+                f"SELECT COUNT(DISTINCT unit_id) FROM {fq_table('unit_entities')} WHERE unit_id = ANY($1::uuid[])",
+                unit_ids,
+            )
+        assert linked == len(unit_ids)
+    finally:
+        await _cleanup(memory, bank_id)
@@ -0,0 +1,44 @@
+"""
+Tests for the lean recall candidate projection (no embedding vectors in recall rows).
+"""
+
+import uuid
+
+import asyncpg
+import pytest
+
+from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.engine.search.retrieval import retrieve_semantic_bm25_combined
+
+
+@pytest.mark.asyncio
+async def test_recall_rows_omit_embeddings(pg0_db_url, embeddings):
+    bank_id = f"test-projection-{uuid.uuid4().hex[:8]}"
+    texts = ["Alice maintains the billing service.", "Bob prefers tea over coffee."]
+    vectors = embeddings.encode(texts)
+    query_emb_str = "[" + ",".join(str(x) for x in embeddings.encode(["Who maintains billing?"])[0]) + "]"
+
+    conn = await asyncpg.connect(pg0_db_url)
+    try:
+        for text, vector in zip(texts, vectors):
+            await conn.execute(
+                f"""INSERT INTO {fq_table("memory_units")}
+                    (bank_id, text, fact_type, embedding, event_date)
+                    VALUES ($1, $2, 'world', $3::vector, NOW())""",
+                bank_id,
+                text,
+                "[" + ",".join(str(x) for x in vector) + "]",
+            )
+
+        results = await retrieve_semantic_bm25_combined(
+            conn, query_emb_str, "billing service", bank_id, ["world"], limit=10
+        )
+        semantic, bm25 = results["world"]
+        candidates = semantic + bm25
+        assert candidates
+        assert all(r.embedding is None for r in candidates)
+        # Similarity is still computed in SQL
+        assert all(r.similarity is not None for r in semantic)
+    finally:
+        await conn.execute(f"DELETE FROM {fq_table('memory_units')} WHERE bank_id = $1", bank_id)
+        await conn.close()
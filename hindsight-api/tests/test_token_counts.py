@@ -0,0 +1,84 @@
+"""
+Tests for token counts stored at retain time and used by recall's token budgets.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from hindsight_api.engine.memory_engine import MemoryEngine, fq_table
+from hindsight_api.engine.retain.chunk_storage import store_chunks_batch
+from hindsight_api.engine.retain.fact_storage import handle_document_tracking, insert_facts_batch
+from hindsight_api.engine.retain.types import ChunkMetadata, ProcessedFact
+from hindsight_api.engine.search.types import MergedCandidate, RetrievalResult, ScoredResult
+from hindsight_api.engine.tokens import count_tokens
+
+
+def _scored(text: str, text_tokens: int | None) -> ScoredResult:
+    retrieval = RetrievalResult(id=str(uuid.uuid4()), text=text, fact_type="world", text_tokens=text_tokens)
+    return ScoredResult(candidate=MergedCandidate(retrieval=retrieval, rrf_score=0.0))
+
+
+def test_count_tokens_treats_special_tokens_as_text():
+    assert count_tokens([]) == []
+    assert count_tokens(["hello world", "<|endoftext|>"])[0] == 2
+    assert count_tokens(["<|endoftext|>"])[0] > 1
+
+
+def test_token_budget_uses_stored_counts():
+    results = [_scored("first", 40), _scored("second", 50), _scored("third", 30)]
+
+    filtered, total = MemoryEngine._filter_by_token_budget(None, results, max_tokens=100)
+
+    assert filtered == results[:2]
+    assert total == 90
+
+
+def test_token_budget_counts_rows_without_stored_counts():
+    results = [_scored("one two three", None), _scored("four", 1)]
+
+    filtered, total = MemoryEngine._filter_by_token_budget(None, results, max_tokens=100)
+
+    assert filtered == results
+    assert total == count_tokens(["one two three"])[0] + 1
+
+
+@pytest.mark.asyncio
+async def test_retain_storage_persists_token_counts(memory, embeddings):
+    bank_id = f"test-tokens-{uuid.uuid4().hex[:8]}"
+    document_id = "doc"
+    chunk_text = "Alice maintains the billing service. Bob prefers tea over coffee."
+    fact_text = "Alice maintains the billing service."
+
+    pool = await memory._get_pool()
+    async with pool.acquire() as conn:
+        try:
+            await handle_document_tracking(conn, bank_id, document_id, chunk_text, is_first_batch=True)
+            chunk_ids = await store_chunks_batch(
+                conn, bank_id, document_id, [ChunkMetadata(chunk_text, fact_count=1, content_index=0, chunk_index=0)]
+            )
+            fact = ProcessedFact(
+                fact_text=fact_text,
+                fact_type="world",
+                embedding=embeddings.encode([fact_text])[0],
+                occurred_start=None,
+                occurred_end=None,
+                mentioned_at=datetime.now(timezone.utc),
+                context="",
+                metadata={},
+                chunk_id=chunk_ids[0],
+                document_id=document_id,
+            )
+            [unit_id] = await insert_facts_batch(conn, bank_id, [fact])
+
+            chunk_tokens = await conn.fetchval(
+                f"SELECT chunk_tokens FROM {fq_table('chunks')} WHERE chunk_id = $1", chunk_ids[0]
+            )
+            text_tokens = await conn.fetchval(
+                f"SELECT text_tokens FROM {fq_table('memory_units')} WHERE id = $1", uuid.UUID(unit_id)
+            )
+            assert chunk_tokens == count_tokens([chunk_text])[0]
+            assert text_tokens == count_tokens([fact_text])[0]
+        finally:
+            await conn.execute(f"DELETE FROM {fq_table('documents')} WHERE bank_id = $1", bank_id)
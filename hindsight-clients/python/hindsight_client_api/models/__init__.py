@@ -21,6 +21,8 @@ from hindsight_client_api.models.bank_list_item import BankListItem
 from hindsight_client_api.models.bank_list_response import BankListResponse
 from hindsight_client_api.models.bank_profile_response import BankProfileResponse
 from hindsight_client_api.models.bank_stats_response import BankStatsResponse
+from hindsight_client_api.models.batch_recall_request import BatchRecallRequest
+from hindsight_client_api.models.batch_recall_response import BatchRecallResponse
 from hindsight_client_api.models.budget import Budget
 from hindsight_client_api.models.cancel_operation_response import CancelOperationResponse
 from hindsight_client_api.models.chunk_data import ChunkData
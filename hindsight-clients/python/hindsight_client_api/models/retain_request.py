@@ -17,7 +17,7 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, field_validator
 from typing import Any, ClassVar, Dict, List, Optional
 from hindsight_client_api.models.memory_item import MemoryItem
 from typing import Optional, Set
@@ -30,7 +30,18 @@ class RetainRequest(BaseModel):
     items: List[MemoryItem]
     var_async: Optional[StrictBool] = Field(default=False, description="If true, process asynchronously in background. If false, wait for completion (default: false)", alias="async")
     document_tags: Optional[List[StrictStr]] = None
-    __properties: ClassVar[List[str]] = ["items", "async", "document_tags"]
+    update_mode: Optional[StrictStr] = Field(default='replace', description="How items with the document_id of an existing document update it. 'replace' deletes the document and its memories and processes the new content from scratch. 'incremental' skips documents whose content is unchanged, extracts facts only from added or changed chunks, and deletes the memories of removed chunks.")
+    __properties: ClassVar[List[str]] = ["items", "async", "document_tags", "update_mode"]
+
+    @field_validator('update_mode')
+    def update_mode_validate_enum(cls, value):
+        """Validates the enum"""
+        if value is None:
+            return value
+
+        if value not in set(['replace', 'incremental']):
+            raise ValueError("must be one of enum values ('replace', 'incremental')")
+        return value
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -97,7 +108,8 @@ class RetainRequest(BaseModel):
         _obj = cls.model_validate({
             "items": [MemoryItem.from_dict(_item) for _item in obj["items"]] if obj.get("items") is not None else None,
             "async": obj.get("async") if obj.get("async") is not None else False,
-            "document_tags": obj.get("document_tags")
+            "document_tags": obj.get("document_tags"),
+            "update_mode": obj.get("update_mode") if obj.get("update_mode") is not None else 'replace'
         })
         return _obj
 
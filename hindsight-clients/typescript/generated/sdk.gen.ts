@@ -85,6 +85,9 @@ import type {
   ListTagsResponses,
   MetricsEndpointMetricsGetData,
   MetricsEndpointMetricsGetResponses,
+  RecallMemoriesBatchData,
+  RecallMemoriesBatchErrors,
+  RecallMemoriesBatchResponses,
   RecallMemoriesData,
   RecallMemoriesErrors,
   RecallMemoriesResponses,
@@ -229,6 +232,29 @@ export const recallMemories = <ThrowOnError extends boolean = false>(
     },
   });
 
+/**
+ * Recall memory for several queries
+ *
+ * Run several recalls against the same bank in one request.
+ *
+ * Each query returns the same results as `recall`, but the queries share retrieval work: they are embedded together, their semantic and keyword searches run in one database round-trip, graph traversal reuses loaded edges, and reranking scores all queries in one model call.
+ */
+export const recallMemoriesBatch = <ThrowOnError extends boolean = false>(
+  options: Options<RecallMemoriesBatchData, ThrowOnError>,
+) =>
+  (options.client ?? client).post<
+    RecallMemoriesBatchResponses,
+    RecallMemoriesBatchErrors,
+    ThrowOnError
+  >({
+    url: "/v1/default/banks/{bank_id}/memories/recall/batch",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options.headers,
+    },
+  });
+
 /**
  * Reflect and generate answer
  *
@@ -778,7 +804,7 @@ export const clearBankMemories = <ThrowOnError extends boolean = false>(
  *
  * **When `async=false` (default):** Waits for processing to complete.
  *
- * **Note:** If a memory item has a `document_id` that already exists, the old document and its memory units will be deleted before creating new ones (upsert behavior).
+ * **Note:** If a memory item has a `document_id` that already exists, the old document and its memory units will be deleted before creating new ones (upsert behavior). With `update_mode=incremental`, unchanged documents are skipped and only added or changed chunks are re-processed.
  */
 export const retainMemories = <ThrowOnError extends boolean = false>(
   options: Options<RetainMemoriesData, ThrowOnError>,
@@ -187,6 +187,71 @@ export type BankStatsResponse = {
   failed_operations: number;
 };
 
+/**
+ * BatchRecallRequest
+ *
+ * Request model for batch recall endpoint.
+ */
+export type BatchRecallRequest = {
+  /**
+   * Queries
+   *
+   * Queries to recall for. All other options apply to every query.
+   */
+  queries: Array<string>;
+  /**
+   * Types
+   *
+   * List of fact types to recall: 'world', 'experience'. Defaults to both if not specified. Note: 'opinion' is accepted but ignored (opinions are excluded from recall).
+   */
+  types?: Array<string> | null;
+  budget?: Budget;
+  /**
+   * Max Tokens
+   */
+  max_tokens?: number;
+  /**
+   * Trace
+   */
+  trace?: boolean;
+  /**
+   * Query Timestamp
+   *
+   * ISO format date string (e.g., '2023-05-30T23:40:00')
+   */
+  query_timestamp?: string | null;
+  /**
+   * Options for including additional data (entities are included by default)
+   */
+  include?: IncludeOptions;
+  /**
+   * Tags
+   *
+   * Filter memories by tags. If not specified, all memories are returned.
+   */
+  tags?: Array<string> | null;
+  /**
+   * Tags Match
+   *
+   * How to match tags: 'any' (OR, includes untagged), 'all' (AND, includes untagged), 'any_strict' (OR, excludes untagged), 'all_strict' (AND, excludes untagged).
+   */
+  tags_match?: "any" | "all" | "any_strict" | "all_strict";
+};
+
+/**
+ * BatchRecallResponse
+ *
+ * Response model for batch recall endpoint.
+ */
+export type BatchRecallResponse = {
+  /**
+   * Results
+   *
+   * One recall response per query, in request order
+   */
+  results: Array<RecallResponse>;
+};
+
 /**
  * Budget
  *
@@ -1618,6 +1683,12 @@ export type RetainRequest = {
    * Tags applied to all items in this request. These are merged with any item-level tags.
    */
   document_tags?: Array<string> | null;
+  /**
+   * Update Mode
+   *
+   * How items with the document_id of an existing document update it. 'replace' deletes the document and its memories and processes the new content from scratch. 'incremental' skips documents whose content is unchanged, extracts facts only from added or changed chunks, and deletes the memories of removed chunks.
+   */
+  update_mode?: "replace" | "incremental";
 };
 
 /**
@@ -1969,6 +2040,44 @@ export type RecallMemoriesResponses = {
 export type RecallMemoriesResponse =
   RecallMemoriesResponses[keyof RecallMemoriesResponses];
 
+export type RecallMemoriesBatchData = {
+  body: BatchRecallRequest;
+  headers?: {
+    /**
+     * Authorization
+     */
+    authorization?: string | null;
+  };
+  path: {
+    /**
+     * Bank Id
+     */
+    bank_id: string;
+  };
+  query?: never;
+  url: "/v1/default/banks/{bank_id}/memories/recall/batch";
+};
+
+export type RecallMemoriesBatchErrors = {
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type RecallMemoriesBatchError =
+  RecallMemoriesBatchErrors[keyof RecallMemoriesBatchErrors];
+
+export type RecallMemoriesBatchResponses = {
+  /**
+   * Successful Response
+   */
+  200: BatchRecallResponse;
+};
+
+export type RecallMemoriesBatchResponse =
+  RecallMemoriesBatchResponses[keyof RecallMemoriesBatchResponses];
+
 export type ReflectData = {
   body: ReflectRequest;
   headers?: {
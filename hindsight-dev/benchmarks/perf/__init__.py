@@ -0,0 +1 @@
+"""Recall and retain performance benchmark."""
@@ -0,0 +1,425 @@
+"""
+Recall and retain latency/throughput benchmark.
+
+Unlike LoComo and LongMemEval, this benchmark measures speed rather than answer quality:
+
+1. Generates a synthetic bank of the requested size (no LLM or embedding calls)
+2. Drives recall_async at each concurrency level with queries over the bank's entities
+3. Drives retain_batch_async with the mock LLM provider (one fact per sentence)
+4. Reports throughput and per-phase p50/p95/p99 from the engine's own phase timings
+5. Saves the results as a baseline and/or diffs them against a saved baseline
+
+Embeddings of queries and retained facts, and reranking, use the configured models
+(HINDSIGHT_API_EMBEDDINGS_*, HINDSIGHT_API_RERANKER_*), as in production.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from hindsight_api import MemoryEngine
+from hindsight_api.config import get_config
+from hindsight_api.engine.memory_engine import Budget
+from hindsight_api.models import RequestContext
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.perf.synthetic_bank import (
+    SyntheticBankSpec,
+    generate_bank,
+    mock_extract_facts,
+    sample_queries,
+    sample_retain_contents,
+)
+from benchmarks.perf.timings import PhaseTimingCollector, summarize
+
+console = Console()
+
+RESULTS_DIR = Path(__file__).parent / "results"
+BASELINES_DIR = RESULTS_DIR / "baselines"
+
+# Phase changes smaller than this are noise whatever their relative size
+NOISE_FLOOR_MS = 1.0
+
+
+async def create_benchmark_engine() -> MemoryEngine:
+    """MemoryEngine on HINDSIGHT_API_DATABASE_URL with the mock LLM provider for every operation."""
+    memory = MemoryEngine(
+        db_url=os.getenv("HINDSIGHT_API_DATABASE_URL", "pg0"),
+        memory_llm_provider="mock",
+        memory_llm_model="mock",
+        retain_llm_provider="mock",
+        retain_llm_model="mock",
+        reflect_llm_provider="mock",
+        reflect_llm_model="mock",
+        skip_llm_verification=True,
+    )
+    await memory.initialize()
+    memory._retain_llm_config.set_mock_response(mock_extract_facts)
+    return memory
+
+
+async def _run_concurrently(operations: list, concurrency: int) -> tuple[list[float], float]:
+    """Run coroutine factories with at most `concurrency` in flight; returns client latencies and wall time."""
+    queue: asyncio.Queue = asyncio.Queue()
+    for operation in operations:
+        queue.put_nowait(operation)
+    latencies: list[float] = []
+
+    async def worker():
+        while not queue.empty():
+            operation = queue.get_nowait()
+            start = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - start)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - wall_start
+
+
+async def benchmark_recall(
+    memory: MemoryEngine,
+    collector: PhaseTimingCollector,
+    bank_id: str,
+    queries: list[str],
+    concurrency: int,
+    budget: Budget,
+    max_tokens: int,
+    fact_types: list[str],
+) -> dict:
+    """Run every query at the given concurrency; returns throughput and per-phase percentiles."""
+
+    def recall(query: str):
+        return lambda: memory.recall_async(
+            bank_id=bank_id,
+            query=query,
+            budget=budget,
+            max_tokens=max_tokens,
+            fact_type=fact_types,
+            request_context=RequestContext(),
+        )
+
+    collector.reset()
+    latencies, wall_seconds = await _run_concurrently([recall(query) for query in queries], concurrency)
+    return {
+        "operations": len(latencies),
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_s": round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        "phases": summarize({"client": latencies, **collector.recall}),
+    }
+
+
+async def benchmark_retain(
+    memory: MemoryEngine,
+    collector: PhaseTimingCollector,
+    bank_id: str,
+    batches: list[list[dict]],
+    concurrency: int,
+) -> dict:
+    """Retain every batch at the given concurrency; returns throughput and per-phase percentiles."""
+
+    def retain(contents: list[dict]):
+        return lambda: memory.retain_batch_async(bank_id=bank_id, contents=contents, request_context=RequestContext())
+
+    collector.reset()
+    latencies, wall_seconds = await _run_concurrently([retain(batch) for batch in batches], concurrency)
+    items = sum(len(batch) for batch in batches)
+    return {
+        "operations": len(latencies),
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_s": round(items / wall_seconds, 2) if wall_seconds else 0.0,
+        "phases": summarize({"client": latencies, **collector.retain}),
+    }
+
+
+def print_results(operation: str, results: dict[str, dict]) -> None:
+    """One table per concurrency level: p50/p95/p99 of every phase."""
+    for level, result in results.items():
+        unit = "queries/s" if operation == "recall" else "items/s"
+        table = Table(
+            title=f"{operation} @ concurrency {level}: {result['throughput_per_s']} {unit} "
+            f"({result['operations']} operations in {result['wall_seconds']}s)"
+        )
+        table.add_column("Phase", style="cyan")
+        for column in ("count", "p50 ms", "p95 ms", "p99 ms"):
+            table.add_column(column, justify="right")
+        for phase, stats in result["phases"].items():
+            table.add_row(
+                phase, str(stats["count"]), f"{stats['p50_ms']:.1f}", f"{stats['p95_ms']:.1f}", f"{stats['p99_ms']:.1f}"
+            )
+        console.print(table)
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Print the p50/p95 deltas of every phase against a baseline.
+
+    Args:
+        results: Results of this run
+        baseline: Results of a previous run (same shape)
+        threshold: Relative p95 increase reported as a regression (0.2 = +20%)
+
+    Returns:
+        Descriptions of the phases that regressed
+    """
+    regressions = []
+    for operation in ("recall", "retain"):
+        for level, result in results.get(operation, {}).items():
+            base = baseline.get(operation, {}).get(level)
+            if not base:
+                continue
+            table = Table(title=f"{operation} @ concurrency {level} vs baseline")
+            table.add_column("Phase", style="cyan")
+            for column in ("p50 ms", "Δ p50", "p95 ms", "Δ p95"):
+                table.add_column(column, justify="right")
+            for phase, stats in result["phases"].items():
+                base_stats = base["phases"].get(phase)
+                if not base_stats:
+                    continue
+                deltas = []
+                for key in ("p50_ms", "p95_ms"):
+                    before, after = base_stats[key], stats[key]
+                    deltas.append((after - before) / before if before else 0.0)
+                regressed = deltas[1] > threshold and stats["p95_ms"] - base_stats["p95_ms"] > NOISE_FLOOR_MS
+                if regressed:
+                    regressions.append(
+                        f"{operation} c={level} {phase}: p95 {base_stats['p95_ms']:.1f}ms -> {stats['p95_ms']:.1f}ms"
+                    )
+                style = "red" if regressed else ("green" if deltas[1] < -threshold else "")
+                table.add_row(
+                    phase,
+                    f"{stats['p50_ms']:.1f}",
+                    f"{deltas[0]:+.0%}",
+                    f"{stats['p95_ms']:.1f}",
+                    f"[{style}]{deltas[1]:+.0%}[/{style}]" if style else f"{deltas[1]:+.0%}",
+                )
+            console.print(table)
+    return regressions
+
+
+def _baseline_path(name: str) -> Path:
+    """A bare name refers to results/baselines/<name>.json; anything else is a file path."""
+    path = Path(name)
+    if path.suffix == ".json" or len(path.parts) > 1:
+        return path
+    return BASELINES_DIR / f"{name}.json"
+
+
+async def run_benchmark(
+    spec: SyntheticBankSpec,
+    bank_id: str = "perf-bench",
+    skip_generation: bool = False,
+    mode: str = "all",
+    recall_queries: int = 200,
+    recall_concurrency: list[int] | None = None,
+    budget: str = "mid",
+    max_tokens: int = 4096,
+    fact_types: list[str] | None = None,
+    retain_batches: int = 20,
+    retain_batch_size: int = 10,
+    retain_concurrency: list[int] | None = None,
+    warmup: int = 5,
+    verbose: bool = False,
+) -> dict:
+    """
+    Run the performance benchmark.
+
+    Args:
+        spec: Shape of the synthetic bank used for recall
+        bank_id: Bank to generate and recall from
+        skip_generation: Reuse the bank from a previous run instead of regenerating it
+        mode: "recall", "retain" or "all"
+        recall_queries: Queries per concurrency level
+        recall_concurrency: Concurrency levels for recall
+        budget: Recall budget (low, mid, high)
+        max_tokens: Recall max_tokens
+        fact_types: Fact types to recall (default: the bank's fact types)
+        retain_batches: retain_batch_async calls per concurrency level
+        retain_batch_size: Content items per retain_batch_async call
+        retain_concurrency: Concurrency levels for retain
+        warmup: Recalls run (and discarded) before measuring, to load models and caches
+        verbose: Keep printing the engine's recall/retain logs
+    """
+    recall_concurrency = recall_concurrency or [1, 8, 32]
+    retain_concurrency = retain_concurrency or [1, 4]
+    fact_types = fact_types or list(spec.fact_types)
+
+    memory = await create_benchmark_engine()
+    collector = PhaseTimingCollector()
+    collector.attach(propagate=verbose)
+    results: dict = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "spec": asdict(spec),
+        "settings": {
+            "budget": budget,
+            "max_tokens": max_tokens,
+            "fact_types": fact_types,
+            "recall_queries": recall_queries,
+            "retain_batch_size": retain_batch_size,
+            "embeddings_provider": get_config().embeddings_provider,
+            "reranker_provider": get_config().reranker_provider,
+            "graph_retriever": get_config().graph_retriever,
+        },
+    }
+
+    try:
+        if mode in ("recall", "all"):
+            if not skip_generation:
+                await memory.delete_bank(bank_id, request_context=RequestContext())
+                console.print(f"[cyan]Generating bank '{bank_id}' ({spec.units:,} units)...[/cyan]")
+                generation = await generate_bank(
+                    memory,
+                    bank_id,
+                    spec,
+                    progress=lambda done, total: console.print(f"  {done:,}/{total:,} units", highlight=False),
+                )
+                results["generation"] = generation
+                console.print(f"[green]✓[/green] Generated in {generation['seconds']}s: {generation}")
+
+            queries = sample_queries(spec, recall_queries)
+            bench_budget = Budget(budget)
+            for query in sample_queries(spec, warmup, seed=0):
+                await memory.recall_async(
+                    bank_id=bank_id,
+                    query=query,
+                    budget=bench_budget,
+                    max_tokens=max_tokens,
+                    fact_type=fact_types,
+                    request_context=RequestContext(),
+                )
+
+            results["recall"] = {}
+            for concurrency in recall_concurrency:
+                console.print(f"[cyan]Recall: {len(queries)} queries at concurrency {concurrency}...[/cyan]")
+                results["recall"][str(concurrency)] = await benchmark_recall(
+                    memory, collector, bank_id, queries, concurrency, bench_budget, max_tokens, fact_types
+                )
+            print_results("recall", results["recall"])
+
+        if mode in ("retain", "all"):
+            retain_bank_id = f"{bank_id}-retain"
+            await memory.delete_bank(retain_bank_id, request_context=RequestContext())
+            results["retain"] = {}
+            for round_index, concurrency in enumerate(retain_concurrency):
+                contents = sample_retain_contents(
+                    spec, retain_batches * retain_batch_size, seed=spec.seed + 100 + round_index
+                )
+                batches = [contents[i : i + retain_batch_size] for i in range(0, len(contents), retain_batch_size)]
+                console.print(f"[cyan]Retain: {len(batches)} batches at concurrency {concurrency}...[/cyan]")
+                results["retain"][str(concurrency)] = await benchmark_retain(
+                    memory, collector, retain_bank_id, batches, concurrency
+                )
+            print_results("retain", results["retain"])
+            await memory.delete_bank(retain_bank_id, request_context=RequestContext())
+    finally:
+        collector.detach()
+        await memory.close()
+
+    return results
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    get_config().configure_logging()
+
+    parser = argparse.ArgumentParser(description="Run the recall/retain performance benchmark")
+    parser.add_argument("--bank-id", type=str, default="perf-bench", help="Bank to generate and recall from")
+    parser.add_argument("--skip-generation", action="store_true", help="Reuse the bank from a previous run")
+    parser.add_argument("--mode", choices=["recall", "retain", "all"], default="all", help="What to benchmark")
+
+    bank = parser.add_argument_group("synthetic bank")
+    bank.add_argument("--units", type=int, default=10_000, help="Memory units in the bank")
+    bank.add_argument("--entities", type=int, default=500, help="Distinct entities in the bank")
+    bank.add_argument("--entities-per-unit", type=int, default=2, help="Entities mentioned by each unit")
+    bank.add_argument(
+        "--entity-links-per-unit", type=int, default=5, help="Entity links to earlier units per shared entity"
+    )
+    bank.add_argument("--semantic-links-per-unit", type=int, default=5, help="Semantic links per unit (top-k)")
+    bank.add_argument("--seed", type=int, default=42, help="Random seed (same seed = same bank and queries)")
+
+    recall = parser.add_argument_group("recall")
+    recall.add_argument("--recall-queries", type=int, default=200, help="Queries per concurrency level")
+    recall.add_argument("--recall-concurrency", type=_int_list, default=[1, 8, 32], help="e.g. 1,8,32")
+    recall.add_argument("--budget", choices=["low", "mid", "high"], default="mid", help="Recall budget")
+    recall.add_argument("--max-tokens", type=int, default=4096, help="Recall max_tokens")
+    recall.add_argument("--warmup", type=int, default=5, help="Unmeasured recalls before the first level")
+
+    retain = parser.add_argument_group("retain")
+    retain.add_argument("--retain-batches", type=int, default=20, help="Batches per concurrency level")
+    retain.add_argument("--retain-batch-size", type=int, default=10, help="Content items per batch")
+    retain.add_argument("--retain-concurrency", type=_int_list, default=[1, 4], help="e.g. 1,4")
+
+    output = parser.add_argument_group("output")
+    output.add_argument(
+        "--output", type=str, default=str(RESULTS_DIR / "perf_results.json"), help="Where to write the results"
+    )
+    output.add_argument("--save-baseline", type=str, default=None, help="Also save the results as this baseline")
+    output.add_argument("--compare", type=str, default=None, help="Baseline to diff the results against")
+    output.add_argument(
+        "--regression-threshold", type=float, default=0.2, help="Relative p95 increase flagged as a regression"
+    )
+    output.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 when a phase regressed")
+    output.add_argument("--verbose", action="store_true", help="Keep printing the engine's recall/retain logs")
+
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run_benchmark(
+            SyntheticBankSpec(
+                units=args.units,
+                entities=args.entities,
+                entities_per_unit=args.entities_per_unit,
+                entity_links_per_unit=args.entity_links_per_unit,
+                semantic_links_per_unit=args.semantic_links_per_unit,
+                seed=args.seed,
+            ),
+            bank_id=args.bank_id,
+            skip_generation=args.skip_generation,
+            mode=args.mode,
+            recall_queries=args.recall_queries,
+            recall_concurrency=args.recall_concurrency,
+            budget=args.budget,
+            max_tokens=args.max_tokens,
+            retain_batches=args.retain_batches,
+            retain_batch_size=args.retain_batch_size,
+            retain_concurrency=args.retain_concurrency,
+            warmup=args.warmup,
+            verbose=args.verbose,
+        )
+    )
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2))
+    console.print(f"\n[green]✓[/green] Results saved to {output_path}")
+
+    if args.save_baseline:
+        baseline_path = _baseline_path(args.save_baseline)
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2))
+        console.print(f"[green]✓[/green] Baseline saved to {baseline_path}")
+
+    if args.compare:
+        baseline = json.loads(_baseline_path(args.compare).read_text())
+        if baseline.get("spec") != results["spec"] or baseline.get("settings") != results["settings"]:
+            console.print("[yellow]Warning: baseline was recorded with a different bank or settings[/yellow]")
+        regressions = compare_to_baseline(results, baseline, args.regression_threshold)
+        if regressions:
+            console.print(f"\n[red]{len(regressions)} phase(s) regressed:[/red]")
+            for regression in regressions:
+                console.print(f"  {regression}")
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            console.print("\n[green]No regressions against the baseline[/green]")
@@ -0,0 +1,251 @@
+"""
+Synthetic bank generator for the performance benchmark.
+
+Builds banks of a configurable size without any LLM or embedding calls: facts are written
+with the retain pipeline's own storage helpers (fact_storage, the entity resolver and the
+link helpers), so the stored rows, indexes and links have the same shape as retained data.
+
+Embeddings are random unit vectors clustered around the centroids of the unit's entities,
+so semantic neighbours, semantic links and entity links line up the way they do in real
+banks, and the HNSW index sees a realistic distribution.
+"""
+
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from hindsight_api import MemoryEngine
+from hindsight_api.engine.db_utils import acquire_with_retry
+from hindsight_api.engine.retain import fact_storage, link_utils
+from hindsight_api.engine.retain.types import EntityLink, ProcessedFact
+
+_FIRST_NAMES = [
+    "Alice", "Bob", "Carol", "David", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy",
+    "Mallory", "Niaj", "Olivia", "Peggy", "Rupert", "Sybil", "Trent", "Uma", "Victor", "Wendy",
+]  # fmt: skip
+_TOPICS = [
+    "hiking", "the quarterly report", "a trip to Lisbon", "the new espresso machine", "chess",
+    "the garden", "a marathon", "the database migration", "jazz piano", "the book club",
+    "a job offer", "the kitchen renovation", "sourdough baking", "the product launch", "tennis",
+]  # fmt: skip
+_VERBS = ["talked about", "is planning", "finished", "started", "complained about", "recommended", "asked about"]
+
+
+@dataclass
+class SyntheticBankSpec:
+    """Shape of a synthetic bank."""
+
+    units: int = 10_000
+    entities: int = 500
+    entities_per_unit: int = 2
+    # Link density: each unit gets entity links to this many earlier units per shared entity
+    entity_links_per_unit: int = 5
+    semantic_links_per_unit: int = 5
+    semantic_link_threshold: float = 0.7
+    temporal_window_hours: int = 24
+    time_span_days: int = 365
+    fact_types: tuple[str, ...] = ("world", "experience")
+    # Spread of unit embeddings around their entities' centroids (higher = fewer semantic links)
+    noise: float = 0.35
+    batch_size: int = 1_000
+    seed: int = 42
+
+
+def entity_names(count: int) -> list[str]:
+    """Deterministic, unique entity names ("Alice", ..., "Alice 2", ...)."""
+    names = []
+    for i in range(count):
+        base = _FIRST_NAMES[i % len(_FIRST_NAMES)]
+        names.append(base if i < len(_FIRST_NAMES) else f"{base} {i // len(_FIRST_NAMES) + 1}")
+    return names
+
+
+def sample_queries(spec: SyntheticBankSpec, count: int, seed: int | None = None) -> list[str]:
+    """Queries mentioning the bank's entities and topics, so every retrieval method has work to do."""
+    rng = random.Random(spec.seed + 1 if seed is None else seed)
+    names = entity_names(spec.entities)
+    templates = [
+        "What did {name} say about {topic}?",
+        "When did {name} last mention {topic}?",
+        "What is {name} planning?",
+        "Who talked about {topic} last month?",
+    ]
+    return [rng.choice(templates).format(name=rng.choice(names), topic=rng.choice(_TOPICS)) for _ in range(count)]
+
+
+def sample_retain_contents(
+    spec: SyntheticBankSpec, count: int, sentences: int = 6, seed: int | None = None
+) -> list[dict]:
+    """Conversation-like content items for retain_batch_async (one fact per sentence with mock_extract_facts)."""
+    rng = random.Random(spec.seed + 2 if seed is None else seed)
+    names = entity_names(spec.entities)
+    now = datetime.now(UTC)
+    contents = []
+    for _ in range(count):
+        lines = []
+        for _ in range(sentences):
+            first, second = rng.sample(names, 2)
+            lines.append(
+                f"{first} {rng.choice(_VERBS)} {rng.choice(_TOPICS)} with {second} ({rng.getrandbits(32):08x})"
+            )
+        contents.append(
+            {
+                "content": ". ".join(lines) + ".",
+                "context": "synthetic conversation",
+                "event_date": now - timedelta(minutes=rng.randrange(60 * 24 * 30)),
+            }
+        )
+    return contents
+
+
+_TEXT_MARKER = "\nText:\n"
+_NAME_RE = re.compile(rf"\b(?:{'|'.join(_FIRST_NAMES)})(?: \d+)?\b")
+
+
+def mock_extract_facts(messages: list[dict]) -> dict:
+    """
+    Mock LLM response for fact extraction: one fact per sentence of the chunk.
+
+    Set on the mock retain LLM with set_mock_response(), so retain runs its full pipeline
+    (embeddings, deduplication, entities, links) on distinct facts without LLM latency.
+    Every other prompt gets an empty response.
+    """
+    user_message = messages[-1]["content"]
+    if not user_message.startswith("Extract facts") or _TEXT_MARKER not in user_message:
+        return {}
+    text = user_message.split(_TEXT_MARKER, 1)[1]
+    return {
+        "facts": [
+            {
+                "what": sentence,
+                "fact_type": "world",
+                "fact_kind": "conversation",
+                "entities": [{"text": name} for name in dict.fromkeys(_NAME_RE.findall(sentence))],
+            }
+            for sentence in (part.strip().rstrip(".") for part in text.split(". "))
+            if sentence
+        ]
+    }
+
+
+def _unit_vector(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector, axis=-1, keepdims=True)
+
+
+async def generate_bank(
+    memory: MemoryEngine,
+    bank_id: str,
+    spec: SyntheticBankSpec,
+    progress=None,
+) -> dict[str, float]:
+    """
+    Populate a bank with synthetic units, entities and links.
+
+    Args:
+        memory: Initialized MemoryEngine (only its pool, entity resolver and embedding dimension are used)
+        bank_id: Bank to populate (created if missing)
+        spec: Size and link density of the bank
+        progress: Optional callable(units_done, units_total)
+
+    Returns:
+        Counts and timings of the generation
+    """
+    rng = random.Random(spec.seed)
+    np_rng = np.random.default_rng(spec.seed)
+    dimension = memory.embeddings.dimension
+    names = entity_names(spec.entities)
+    centroids = _unit_vector(np_rng.standard_normal((spec.entities, dimension)).astype(np.float32))
+    span_start = datetime.now(UTC) - timedelta(days=spec.time_span_days)
+
+    stats = {"units": 0, "entity_links": 0, "temporal_links": 0, "semantic_links": 0}
+    generation_start = time.time()
+    pool = await memory._get_pool()
+
+    async with acquire_with_retry(pool) as conn:
+        async with conn.transaction():
+            await fact_storage.ensure_bank_exists(conn, bank_id)
+            entity_ids = await memory.entity_resolver.resolve_entities_batch(
+                bank_id,
+                [{"text": name, "type": "PERSON", "nearby_entities": []} for name in names],
+                context="",
+                unit_event_date=span_start,
+                conn=conn,
+            )
+
+    # Most recent units per entity, for entity links (like the retain pipeline's MAX_LINKS_PER_ENTITY)
+    recent_units: dict[int, list[uuid.UUID]] = {i: [] for i in range(spec.entities)}
+
+    for batch_start in range(0, spec.units, spec.batch_size):
+        batch_size = min(spec.batch_size, spec.units - batch_start)
+        unit_entities = [rng.sample(range(spec.entities), spec.entities_per_unit) for _ in range(batch_size)]
+        noise = np_rng.standard_normal((batch_size, dimension)).astype(np.float32) * spec.noise / np.sqrt(dimension)
+        embeddings = _unit_vector(
+            np.stack([centroids[indices].sum(axis=0) for indices in unit_entities]) / spec.entities_per_unit + noise
+        )
+
+        facts = []
+        for offset, indices in enumerate(unit_entities):
+            position = (batch_start + offset) / max(spec.units, 1)
+            mentioned_at = span_start + timedelta(days=spec.time_span_days * position)
+            people = [names[i] for i in indices]
+            fact_text = f"{people[0]} {rng.choice(_VERBS)} {rng.choice(_TOPICS)}"
+            if len(people) > 1:
+                fact_text += f" with {' and '.join(people[1:])}"
+            facts.append(
+                ProcessedFact(
+                    fact_text=fact_text,
+                    fact_type=rng.choice(spec.fact_types),
+                    embedding=embeddings[offset].tolist(),
+                    occurred_start=mentioned_at,
+                    occurred_end=mentioned_at,
+                    mentioned_at=mentioned_at,
+                    context="synthetic",
+                    metadata={},
+                )
+            )
+
+        async with acquire_with_retry(pool) as conn:
+            async with conn.transaction():
+                unit_ids = await fact_storage.insert_facts_batch(conn, bank_id, facts)
+
+                pairs = [(unit_id, entity_ids[i]) for unit_id, indices in zip(unit_ids, unit_entities) for i in indices]
+                await memory.entity_resolver.link_units_to_entities_batch(pairs, conn=conn, bank_id=bank_id)
+
+                links = []
+                for unit_id, indices in zip(map(uuid.UUID, unit_ids), unit_entities):
+                    for i in indices:
+                        for other in recent_units[i]:
+                            links.append(EntityLink(from_unit_id=unit_id, to_unit_id=other, entity_id=entity_ids[i]))
+                            links.append(EntityLink(from_unit_id=other, to_unit_id=unit_id, entity_id=entity_ids[i]))
+                        if spec.entity_links_per_unit:
+                            recent_units[i] = (recent_units[i] + [unit_id])[-spec.entity_links_per_unit :]
+                await link_utils.insert_entity_links_batch(conn, links)
+                stats["entity_links"] += len(links)
+
+                stats["temporal_links"] += await link_utils.create_temporal_links_batch_per_fact(
+                    conn, bank_id, unit_ids, time_window_hours=spec.temporal_window_hours
+                )
+                stats["semantic_links"] += await link_utils.create_semantic_links_batch(
+                    conn,
+                    bank_id,
+                    unit_ids,
+                    [fact.embedding for fact in facts],
+                    top_k=spec.semantic_links_per_unit,
+                    threshold=spec.semantic_link_threshold,
+                )
+                await fact_storage.mark_units_enriched(conn, unit_ids)
+
+        stats["units"] += len(unit_ids)
+        if progress:
+            progress(stats["units"], spec.units)
+
+    async with acquire_with_retry(pool) as conn:
+        # Fresh planner statistics, as autovacuum would eventually produce on a real bank
+        await conn.execute("ANALYZE")
+
+    stats["seconds"] = round(time.time() - generation_start, 3)
+    return stats
@@ -0,0 +1,168 @@
+"""
+Per-phase timing collection for the performance benchmark.
+
+Recall and retain already time every phase into a log buffer which is logged as one record
+per operation. PhaseTimingCollector is a logging handler that parses those records, so the
+benchmark measures exactly what the engine reports in production logs, including the graph
+retriever breakdown built from MPFPTimings, without instrumenting the engine further.
+"""
+
+import logging
+import re
+import threading
+from collections import defaultdict
+
+RECALL_LOGGER = "hindsight_api.engine.memory_engine"
+RETAIN_LOGGER = "hindsight_api.engine.retain.orchestrator"
+
+# "  [3] RRF merge: 40 unique candidates in 0.002s" / "[5] Insert facts: 12 units in 0.020s"
+_STEP_RE = re.compile(r"^\s*\[(\d+(?:\.\d+)*)\] ([^:]+):(.*)$")
+# "semantic=40(0.012s)" in the parallel retrieval line
+_METHOD_RE = re.compile(r"(\w+)=\d+\((\d+\.\d+)s\)")
+# "temporal_extraction=0.001s", "edge_load=0.004s", "sem=0.020s"
+_KEY_SECONDS_RE = re.compile(r"(\w+)=(\d+\.\d+)s\b")
+# "      [MPFP] db_queries=3, cache_hits=2, edge_load=0.004s, ..."
+_RETRIEVER_RE = re.compile(r"^\s*\[([A-Z_]+)\] (.*)$")
+_SECONDS_RE = re.compile(r"(\d+\.\d+)s\b")
+_RECALL_COMPLETE_RE = re.compile(r"\[RECALL [^\]]+\] Complete: .* \| (\d+\.\d+)s(?: \| waits: (.*))?$")
+_RETAIN_COMPLETE_RE = re.compile(r"RETAIN_BATCH COMPLETE: \d+ units in (\d+\.\d+)s")
+
+
+def _phase_name(label: str) -> str:
+    """Normalize a step label ("Parallel retrieval (2 fact_types)") to a metric name."""
+    label = re.sub(r"\(.*?\)|\b\d+\b", "", label)
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+
+def _step_seconds(rest: str) -> float | None:
+    """Duration of a step line: the value after " in ", else the last seconds value."""
+    if " in " in rest:
+        match = _SECONDS_RE.search(rest.rsplit(" in ", 1)[1])
+        if match:
+            return float(match.group(1))
+    values = _SECONDS_RE.findall(rest)
+    return float(values[-1]) if values else None
+
+
+def parse_recall_log(message: str) -> dict[str, float]:
+    """
+    Extract phase timings (seconds) from one recall log block.
+
+    Returns:
+        Dict of metric name -> seconds, e.g. {"total": 0.12, "parallel_retrieval": 0.05,
+        "parallel_retrieval.semantic": 0.01, "mpfp.edge_load": 0.004, "wait.conn": 0.02}
+    """
+    timings: dict[str, float] = {}
+    for line in message.splitlines():
+        complete = _RECALL_COMPLETE_RE.search(line)
+        if complete:
+            timings["total"] = float(complete.group(1))
+            for key, seconds in _KEY_SECONDS_RE.findall(complete.group(2) or ""):
+                timings[f"wait.{key}"] = float(seconds)
+            continue
+
+        step = _STEP_RE.match(line)
+        if step:
+            name = _phase_name(step.group(2))
+            seconds = _step_seconds(step.group(3))
+            if seconds is not None:
+                timings[name] = seconds
+            if name == "parallel_retrieval":
+                for method, method_seconds in _METHOD_RE.findall(step.group(3)):
+                    timings[f"{name}.{method}"] = float(method_seconds)
+                for key, key_seconds in _KEY_SECONDS_RE.findall(step.group(3)):
+                    timings.setdefault(f"{name}.{key}", float(key_seconds))
+            continue
+
+        retriever = _RETRIEVER_RE.match(line)
+        if retriever and retriever.group(1) not in ("RECALL", "ADAPTIVE"):
+            prefix = retriever.group(1).lower()
+            for key, seconds in _KEY_SECONDS_RE.findall(retriever.group(2)):
+                timings[f"{prefix}.{key}"] = float(seconds)
+    return timings
+
+
+def parse_retain_log(message: str) -> dict[str, float]:
+    """Extract phase timings (seconds) from one retain batch log block."""
+    timings: dict[str, float] = {}
+    for line in message.splitlines():
+        complete = _RETAIN_COMPLETE_RE.search(line)
+        if complete:
+            timings["total"] = float(complete.group(1))
+            continue
+        step = _STEP_RE.match(line)
+        if step:
+            seconds = _step_seconds(step.group(3))
+            if seconds is not None:
+                timings[_phase_name(step.group(2))] = seconds
+    return timings
+
+
+class PhaseTimingCollector(logging.Handler):
+    """Collects the per-phase timings of every recall and retain logged while attached."""
+
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self._lock = threading.Lock()
+        self.recall: dict[str, list[float]] = defaultdict(list)
+        self.retain: dict[str, list[float]] = defaultdict(list)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if "[RECALL " in message and "] Complete:" in message:
+            target, timings = self.recall, parse_recall_log(message)
+        elif "RETAIN_BATCH COMPLETE" in message:
+            target, timings = self.retain, parse_retain_log(message)
+        else:
+            return
+        with self._lock:
+            for name, seconds in timings.items():
+                target[name].append(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.recall.clear()
+            self.retain.clear()
+
+    def attach(self, propagate: bool = False) -> None:
+        """
+        Attach to the recall and retain loggers.
+
+        Args:
+            propagate: Keep passing the records to the root handlers (console output)
+        """
+        for name in (RECALL_LOGGER, RETAIN_LOGGER):
+            engine_logger = logging.getLogger(name)
+            engine_logger.setLevel(logging.INFO)
+            engine_logger.propagate = propagate
+            engine_logger.addHandler(self)
+
+    def detach(self) -> None:
+        for name in (RECALL_LOGGER, RETAIN_LOGGER):
+            engine_logger = logging.getLogger(name)
+            engine_logger.removeHandler(self)
+            engine_logger.propagate = True
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Linear-interpolated percentile (p in [0, 100])."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    """Per-phase count and p50/p95/p99 in milliseconds."""
+    return {
+        name: {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+        }
+        for name, values in samples.items()
+    }
@@ -0,0 +1,21 @@
+#!/bin/bash
+set -e
+
+cd "$(dirname "$0")/../.."
+
+ARGS=("$@")
+ENV_FILE=".env"
+
+echo "🚀 Starting Performance Benchmark"
+
+# No LLM keys are needed (the mock provider is used), but the env file may point to the
+# database and embedding/reranker models to benchmark
+if [ -f "$ENV_FILE" ]; then
+  echo "📄 Loading environment from $ENV_FILE"
+  set -a
+  source "$ENV_FILE"
+  set +a
+fi
+echo ""
+
+uv run python hindsight-dev/benchmarks/perf/perf_benchmark.py "${ARGS[@]}"